@@ -0,0 +1,6 @@
+"""
+Benchmarks of KGX on synthetic, Biolink-shaped knowledge graphs.
+
+Run with ``python -m benchmarks run``, and compare runs with ``python -m benchmarks compare``.
+
+"""
@@ -0,0 +1,83 @@
+import json
+import os
+import sys
+from typing import List, Optional
+
+import click
+
+from benchmarks.suite import compare, get_commit, run_revision, run_suite
+
+DEFAULT_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+DEFAULT_RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+@click.group()
+def cli():
+    """
+    Benchmarks of KGX on synthetic knowledge graphs.
+    """
+    pass
+
+
+@cli.command('run')
+@click.option('--edges', type=int, default=10000, help='Number of edges of the synthetic graph (1000 to 10000000)')
+@click.option('--seed', type=int, default=0, help='Seed of the synthetic graph')
+@click.option('--format', 'formats', multiple=True, help='Format to parse and save (all formats, by default)')
+@click.option('--benchmark', 'names', multiple=True, help='Benchmark to run, like parse:tsv or merge_all_graphs (all benchmarks, by default)')
+@click.option('--timeout', type=float, default=None, help='Maximum time, in seconds, of each benchmark')
+@click.option('--data-dir', type=click.Path(), default=DEFAULT_DATA_DIR, help='Where to keep the synthetic data')
+@click.option('--output', type=click.Path(), default=None, help='File to write the results to (results/<commit>-<edges>.json, by default)')
+@click.option('--revision', 'revisions', multiple=True, help='Git revision of KGX to run the benchmarks against, instead of this checkout')
+def run(edges: int, seed: int, formats: List[str], names: List[str], timeout: Optional[float], data_dir: str, output: Optional[str], revisions: List[str]):
+    """
+    Run the benchmarks, and write the results as JSON.
+    """
+    data_dir = os.path.abspath(data_dir)
+    if revisions:
+        args = ['--edges', str(edges), '--seed', str(seed), '--data-dir', data_dir]
+        args += [f"--format={x}" for x in formats] + [f"--benchmark={x}" for x in names]
+        if timeout:
+            args += ['--timeout', str(timeout)]
+        os.makedirs(DEFAULT_RESULTS_DIR, exist_ok=True)
+        outputs = []
+        for revision in revisions:
+            outputs.append(os.path.join(DEFAULT_RESULTS_DIR, f"{revision.replace('/', '_')}-{edges}.json"))
+            run_revision(revision, outputs[-1], args)
+        for a, b in zip(outputs, outputs[1:]):
+            _compare(a, b, 0.1)
+        return
+    results = run_suite(data_dir, edges, seed, list(formats) or None, list(names) or None, timeout)
+    if not output:
+        os.makedirs(DEFAULT_RESULTS_DIR, exist_ok=True)
+        output = os.path.join(DEFAULT_RESULTS_DIR, f"{get_commit() or 'unknown'}-{edges}.json")
+    with open(output, 'w') as FH:
+        json.dump(results, FH, indent=2)
+    click.echo(f"Results written to {output}")
+
+
+@cli.command('compare')
+@click.argument('base', type=click.Path(exists=True))
+@click.argument('head', type=click.Path(exists=True))
+@click.option('--threshold', type=float, default=0.1, help='Relative increase of time or memory that is a regression')
+def compare_wrapper(base: str, head: str, threshold: float):
+    """
+    Compare the results of two runs, and exit with status 1 if any benchmark regressed.
+    """
+    if _compare(base, head, threshold):
+        sys.exit(1)
+
+
+def _compare(base: str, head: str, threshold: float) -> List[str]:
+    with open(base) as FH:
+        a = json.load(FH)
+    with open(head) as FH:
+        b = json.load(FH)
+    if (a['nodes'], a['edges'], a['seed']) != (b['nodes'], b['edges'], b['seed']):
+        click.echo('Warning: the runs are not on the same synthetic graph', err=True)
+    lines, regressions = compare(a, b, threshold)
+    click.echo('\n'.join(lines))
+    return regressions
+
+
+if __name__ == '__main__':
+    cli()
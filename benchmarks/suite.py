@@ -0,0 +1,484 @@
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+"""
+Benchmarks of KGX, run on a synthetic knowledge graph.
+
+Each benchmark runs in a fresh process, so that its peak memory is not
+affected by earlier benchmarks. A benchmark has a setup, which is not timed,
+and a run, whose wall time and increase of peak resident memory are recorded,
+together with the number of records (nodes and edges) that it processed.
+
+"""
+
+# formats that are saved with a compression, and parsed as another format
+_format_options: Dict[str, Dict[str, Any]] = {
+    'tar': {'format': 'tsv', 'compression': 'tar'},
+}
+
+# formats that KGX can write, but not read
+_write_only_formats = {'tsv:neo4j'}
+
+
+class Benchmark(object):
+    """
+    A benchmark.
+
+    Parameters
+    ----------
+    name: str
+        The name of the benchmark
+    run: Callable
+        The function that is timed. It takes the value returned by ``setup``,
+        and returns the number of records processed
+    setup: Optional[Callable]
+        The function that prepares the input of ``run``. It takes the
+        path of the synthetic data, and the output directory
+
+    """
+
+    def __init__(self, name: str, run: Callable, setup: Optional[Callable] = None):
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+
+def get_data_path(data_dir: str, edges: int, seed: int) -> str:
+    """
+    Get the path of the synthetic data of a scale and a seed.
+    """
+    return os.path.join(data_dir, f"synthetic-{edges}-{seed}")
+
+
+def prepare_data(data_dir: str, edges: int, seed: int = 0, formats: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Generate a synthetic graph and save it in each format, unless it was saved before.
+
+    Parameters
+    ----------
+    data_dir: str
+        The directory of the synthetic data
+    edges: int
+        The number of edges
+    seed: int
+        The seed of the synthetic graph
+    formats: Optional[List[str]]
+        The formats to save (all formats that KGX can read and write, by default)
+
+    Returns
+    -------
+    Dict[str, Any]
+        The number of nodes and edges, and the error for each format that could not be saved
+
+    """
+    from benchmarks.synthetic import SyntheticGraph
+    from kgx.cli.cli_utils import get_file_types, get_transformer
+
+    path = get_data_path(data_dir, edges, seed)
+    info_file = os.path.join(path, 'info.json')
+    info: Dict[str, Any] = {}
+    if os.path.exists(info_file):
+        with open(info_file) as FH:
+            info = json.load(FH)
+    formats = list(formats) if formats else list(get_file_types())
+    missing = [x for x in formats if x not in info.get('formats', {})]
+    if not missing:
+        return info
+
+    graph = SyntheticGraph(edges, seed=seed).load()
+    info['nodes'] = graph.number_of_nodes()
+    info['edges'] = graph.number_of_edges()
+    info.setdefault('formats', {})
+    for f in missing:
+        options = _format_options.get(f, {'format': f, 'compression': None})
+        directory = os.path.join(path, f.replace(':', '-'))
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+        try:
+            get_transformer(f)(graph).save(os.path.join(directory, 'graph'), output_format=options['format'], compression=options['compression'])
+            info['formats'][f] = {'error': None}
+        except Exception as e:
+            info['formats'][f] = {'error': f"{type(e).__name__}: {e}"}
+    with open(info_file, 'w') as FH:
+        json.dump(info, FH, indent=2)
+    return info
+
+
+def get_input_files(path: str, file_format: str) -> List[str]:
+    """
+    Get the files of the synthetic data in a format, with node files first.
+    """
+    directory = os.path.join(path, file_format.replace(':', '-'))
+    # only use what every revision of kgx has, so that revisions can be compared
+    return sorted((os.path.join(directory, x) for x in os.listdir(directory)), key=lambda x: ('_nodes.' not in x, x))
+
+
+def load_graph(path: str) -> Any:
+    """
+    Load the synthetic data, from TSV, into a graph.
+    """
+    from kgx import PandasTransformer
+    t = PandasTransformer()
+    for f in get_input_files(path, 'tsv'):
+        t.parse(f, input_format='tsv')
+    return t.graph
+
+
+def count(graph: Any) -> int:
+    """
+    Get the number of records of a graph.
+    """
+    return graph.number_of_nodes() + graph.number_of_edges()
+
+
+def parse_benchmark(file_format: str) -> Benchmark:
+    """
+    Get a benchmark of parsing the synthetic data in a format.
+    """
+    def setup(path: str, output_dir: str) -> List[str]:
+        from kgx.cli.cli_utils import get_transformer
+        return [get_transformer(file_format), get_input_files(path, file_format)]
+
+    def run(args: Tuple) -> int:
+        cls, files = args
+        options = _format_options.get(file_format, {'format': file_format, 'compression': None})
+        t = cls()
+        for f in files:
+            t.parse(f, input_format=options['format'], compression=options['compression'])
+        return count(t.graph)
+
+    return Benchmark(f"parse:{file_format}", run, setup)
+
+
+def save_benchmark(file_format: str) -> Benchmark:
+    """
+    Get a benchmark of saving a graph in a format.
+    """
+    def setup(path: str, output_dir: str) -> Tuple:
+        from kgx.cli.cli_utils import get_transformer
+        graph = load_graph(path)
+        return get_transformer(file_format)(graph), os.path.join(output_dir, 'graph')
+
+    def run(args: Tuple) -> int:
+        t, filename = args
+        options = _format_options.get(file_format, {'format': file_format, 'compression': None})
+        t.save(filename, output_format=options['format'], compression=options['compression'])
+        return count(t.graph)
+
+    return Benchmark(f"save:{file_format}", run, setup)
+
+
+def merge_all_graphs_benchmark() -> Benchmark:
+    """
+    Get a benchmark of merging two copies of a graph.
+    """
+    def setup(path: str, output_dir: str) -> List:
+        return [load_graph(path), load_graph(path)]
+
+    def run(graphs: List) -> int:
+        from kgx.operations.graph_merge import merge_all_graphs
+        records = sum(count(x) for x in graphs)
+        merge_all_graphs(graphs)
+        return records
+
+    return Benchmark('merge_all_graphs', run, setup)
+
+
+def clique_merge_benchmark() -> Benchmark:
+    """
+    Get a benchmark of merging the ``same_as`` cliques of a graph.
+    """
+    def run(graph: Any) -> int:
+        from kgx.operations.clique_merge import clique_merge
+        records = count(graph)
+        clique_merge(target_graph=graph)
+        return records
+
+    return Benchmark('clique_merge', run, lambda path, output_dir: load_graph(path))
+
+
+def summarize_graph_benchmark() -> Benchmark:
+    """
+    Get a benchmark of summarizing a graph.
+    """
+    def run(graph: Any) -> int:
+        from kgx.operations.summarize_graph import summarize_graph
+        summarize_graph(graph)
+        return count(graph)
+
+    return Benchmark('summarize_graph', run, lambda path, output_dir: load_graph(path))
+
+
+def validate_benchmark() -> Benchmark:
+    """
+    Get a benchmark of validating a graph.
+    """
+    def setup(path: str, output_dir: str) -> Tuple:
+        from kgx import Validator
+        return Validator(), load_graph(path)
+
+    def run(args: Tuple) -> int:
+        validator, graph = args
+        validator.validate(graph)
+        return count(graph)
+
+    return Benchmark('validate', run, setup)
+
+
+def get_benchmarks(formats: Optional[List[str]] = None) -> List[Benchmark]:
+    """
+    Get all benchmarks.
+
+    Parameters
+    ----------
+    formats: Optional[List[str]]
+        The formats to parse and save (all formats that KGX can read and write, by default)
+
+    Returns
+    -------
+    List[Benchmark]
+        The benchmarks
+    """
+    from kgx.cli.cli_utils import get_file_types
+    formats = list(formats) if formats else list(get_file_types())
+    benchmarks = [parse_benchmark(x) for x in formats if x not in _write_only_formats]
+    benchmarks.extend([save_benchmark(x) for x in formats])
+    benchmarks.extend([
+        merge_all_graphs_benchmark(),
+        clique_merge_benchmark(),
+        summarize_graph_benchmark(),
+        validate_benchmark(),
+    ])
+    return benchmarks
+
+
+def get_peak_memory() -> int:
+    """
+    Get the peak resident memory of the current process, in bytes.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, and bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_benchmark(benchmark: Benchmark, path: str) -> Dict[str, Any]:
+    """
+    Run a benchmark in the current process.
+
+    Parameters
+    ----------
+    benchmark: Benchmark
+        The benchmark
+    path: str
+        The path of the synthetic data
+
+    Returns
+    -------
+    Dict[str, Any]
+        The wall time, in seconds, the number of records, the rate, in records
+        per second, the increase of peak resident memory, in bytes, during the run,
+        and the error, if the benchmark failed
+
+    """
+    output_dir = tempfile.mkdtemp(prefix='kgx-benchmark-')
+    try:
+        args = benchmark.setup(path, output_dir) if benchmark.setup else path
+        memory = get_peak_memory()
+        start = time.perf_counter()
+        records = benchmark.run(args)
+        seconds = time.perf_counter() - start
+        return {
+            'seconds': seconds,
+            'records': records,
+            'records_per_second': records / seconds if seconds else None,
+            'peak_memory': get_peak_memory() - memory,
+            'error': None,
+        }
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}", 'traceback': traceback.format_exc()}
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def _run_in_child(name: str, path: str, formats: Optional[List[str]], queue: Any) -> None:
+    """
+    Run a benchmark, by name, in a child process.
+    """
+    benchmark = next(x for x in get_benchmarks(formats) if x.name == name)
+    queue.put(run_benchmark(benchmark, path))
+
+
+def run_suite(data_dir: str, edges: int, seed: int = 0, formats: Optional[List[str]] = None, names: Optional[List[str]] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Run the benchmarks, each in a fresh process, on a synthetic graph.
+
+    Parameters
+    ----------
+    data_dir: str
+        The directory of the synthetic data
+    edges: int
+        The number of edges of the synthetic graph
+    seed: int
+        The seed of the synthetic graph
+    formats: Optional[List[str]]
+        The formats to parse and save (all formats that KGX can read and write, by default)
+    names: Optional[List[str]]
+        The names of the benchmarks to run (all benchmarks, by default)
+    timeout: Optional[float]
+        The maximum wall time, in seconds, of each benchmark, including its setup
+
+    Returns
+    -------
+    Dict[str, Any]
+        The commit, environment and scale of the run, and the result of each benchmark
+
+    """
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        info = pool.apply(prepare_data, (data_dir, edges, seed, formats))
+    path = get_data_path(data_dir, edges, seed)
+    results = {}
+    for benchmark in get_benchmarks(formats):
+        if names and benchmark.name not in names:
+            continue
+        error = info['formats'].get(benchmark.name.split(':', 1)[-1], {}).get('error')
+        if benchmark.name.startswith('parse:') and error:
+            results[benchmark.name] = {'error': f"Data could not be saved: {error}"}
+        else:
+            queue = context.Queue()
+            process = context.Process(target=_run_in_child, args=(benchmark.name, path, formats, queue))
+            process.start()
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+                results[benchmark.name] = {'error': f"Timed out after {timeout} seconds"}
+            elif process.exitcode:
+                results[benchmark.name] = {'error': f"Exited with status {process.exitcode}"}
+            else:
+                results[benchmark.name] = queue.get()
+        print(format_result(benchmark.name, results[benchmark.name]), flush=True)
+    return {
+        'commit': get_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'nodes': info['nodes'],
+        'edges': info['edges'],
+        'results': results,
+    }
+
+
+def get_commit(directory: Optional[str] = None) -> Optional[str]:
+    """
+    Get the commit of the KGX that is benchmarked, and whether it has uncommitted changes.
+    """
+    import kgx
+    directory = directory if directory else os.path.dirname(os.path.dirname(os.path.abspath(kgx.__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=directory, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no', 'kgx'], cwd=directory, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if dirty else commit
+
+
+def format_result(name: str, result: Dict[str, Any]) -> str:
+    """
+    Format the result of a benchmark as a line of text.
+    """
+    if result.get('error'):
+        return f"{name:<24} error: {result['error'].splitlines()[0][:100]}"
+    rate = result['records_per_second']
+    return (
+        f"{name:<24} {result['seconds']:>10.3f} s {rate if rate else 0:>12,.0f} records/s "
+        f"{result['peak_memory'] / (1 << 20):>10.1f} MiB"
+    )
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float = 0.1) -> Tuple[List[str], List[str]]:
+    """
+    Compare the results of two runs.
+
+    Parameters
+    ----------
+    base: Dict[str, Any]
+        The results of the base run
+    head: Dict[str, Any]
+        The results of the run to compare with the base
+    threshold: float
+        The relative increase of time, or of peak memory, that is a regression
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        The lines of a comparison table, and the names of the benchmarks that regressed
+
+    """
+    lines = [
+        f"{'benchmark':<24} {base.get('commit') or 'base':>12} {head.get('commit') or 'head':>12} {'time':>8} {'memory':>8}"
+    ]
+    regressions = []
+    for name in sorted(set(base['results']) | set(head['results'])):
+        a = base['results'].get(name)
+        b = head['results'].get(name)
+        if not a or not b or a.get('error') or b.get('error'):
+            lines.append(f"{name:<24} {_format_seconds(a):>12} {_format_seconds(b):>12}")
+            continue
+        time_ratio = b['seconds'] / a['seconds'] if a['seconds'] else 1.0
+        memory_ratio = (b['peak_memory'] + 1) / (a['peak_memory'] + 1)
+        flag = ''
+        if time_ratio > 1 + threshold or memory_ratio > 1 + threshold:
+            regressions.append(name)
+            flag = ' regression'
+        lines.append(f"{name:<24} {a['seconds']:>12.3f} {b['seconds']:>12.3f} {time_ratio:>7.2f}x {memory_ratio:>7.2f}x{flag}")
+    return lines, regressions
+
+
+def _format_seconds(result: Optional[Dict[str, Any]]) -> str:
+    if not result:
+        return '-'
+    if result.get('error'):
+        return 'error'
+    return f"{result['seconds']:.3f}"
+
+
+def run_revision(revision: str, output: str, args: List[str]) -> None:
+    """
+    Run the suite against a revision of KGX, in a temporary git worktree.
+
+    The benchmarks of this checkout are used, so that older revisions,
+    which do not have benchmarks, can be compared with newer ones.
+
+    Parameters
+    ----------
+    revision: str
+        The git revision. For example, ``HEAD~1`` or ``master``
+    output: str
+        The file to write the results to
+    args: List[str]
+        The arguments of ``python -m benchmarks run``
+
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    worktree = tempfile.mkdtemp(prefix='kgx-benchmark-worktree-')
+    subprocess.run(['git', 'worktree', 'add', '--detach', worktree, revision], cwd=root, check=True)
+    try:
+        # kgx is imported from the worktree, which is the working directory,
+        # and benchmarks from this checkout, unless the worktree has its own
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([worktree, root]))
+        subprocess.run([sys.executable, '-m', 'benchmarks', 'run', *args, '--output', output], cwd=worktree, env=env, check=True)
+    finally:
+        subprocess.run(['git', 'worktree', 'remove', '--force', worktree], cwd=root)
@@ -0,0 +1,215 @@
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from kgx.graph.base_graph import BaseGraph
+
+"""
+A deterministic generator of synthetic, Biolink-shaped knowledge graphs.
+
+Nodes and edges are drawn from fixed distributions of categories and predicates,
+with a skewed node degree, ``same_as`` cliques of equivalent nodes from different
+namespaces, and multivalued properties like ``provided_by``, ``publications``
+and ``synonym``. The same scale and seed always generate the same graph.
+
+"""
+
+# category, the prefixes of its identifiers, and its relative weight
+CATEGORIES: List[Tuple[str, List[str], int]] = [
+    ('biolink:Gene', ['HGNC', 'NCBIGene', 'ENSEMBL'], 30),
+    ('biolink:Protein', ['UniProtKB'], 12),
+    ('biolink:Disease', ['MONDO', 'DOID', 'OMIM'], 12),
+    ('biolink:PhenotypicFeature', ['HP', 'MP'], 12),
+    ('biolink:ChemicalSubstance', ['CHEBI', 'DRUGBANK'], 10),
+    ('biolink:BiologicalProcess', ['GO'], 8),
+    ('biolink:AnatomicalEntity', ['UBERON'], 6),
+    ('biolink:Pathway', ['REACT'], 4),
+    ('biolink:Publication', ['PMID'], 6),
+]
+
+# predicate, relation, subject categories, object categories, and its relative weight
+PREDICATES: List[Tuple[str, str, List[str], List[str], int]] = [
+    ('biolink:interacts_with', 'RO:0002434', ['biolink:Gene', 'biolink:Protein'], ['biolink:Gene', 'biolink:Protein'], 25),
+    ('biolink:gene_associated_with_condition', 'RO:0003302', ['biolink:Gene'], ['biolink:Disease'], 15),
+    ('biolink:has_phenotype', 'RO:0002200', ['biolink:Disease', 'biolink:Gene'], ['biolink:PhenotypicFeature'], 15),
+    ('biolink:participates_in', 'RO:0000056', ['biolink:Gene', 'biolink:Protein'], ['biolink:BiologicalProcess', 'biolink:Pathway'], 12),
+    ('biolink:treats', 'RO:0002606', ['biolink:ChemicalSubstance'], ['biolink:Disease'], 6),
+    ('biolink:expressed_in', 'RO:0002206', ['biolink:Gene'], ['biolink:AnatomicalEntity'], 6),
+    ('biolink:subclass_of', 'rdfs:subClassOf', ['biolink:Disease', 'biolink:PhenotypicFeature'], ['biolink:Disease', 'biolink:PhenotypicFeature'], 8),
+    ('biolink:related_to', 'RO:0003304', [x[0] for x in CATEGORIES], [x[0] for x in CATEGORIES], 5),
+]
+
+SOURCES = ['infores:monarch', 'infores:ctd', 'infores:string', 'infores:go', 'infores:hpo', 'infores:chembl']
+
+# ratio of edges to nodes
+DEFAULT_DEGREE = 5
+# fraction of nodes that are in a same_as clique
+DEFAULT_CLIQUE_FRACTION = 0.05
+
+
+class SyntheticGraph(object):
+    """
+    A synthetic knowledge graph with a given number of edges.
+
+    Parameters
+    ----------
+    edges: int
+        The number of edges, including ``same_as`` edges
+    nodes: Optional[int]
+        The number of nodes (``edges / DEFAULT_DEGREE``, by default)
+    seed: int
+        The seed of the random number generator
+    clique_fraction: float
+        The fraction of nodes that are in a ``same_as`` clique
+
+    """
+
+    def __init__(self, edges: int, nodes: Optional[int] = None, seed: int = 0, clique_fraction: float = DEFAULT_CLIQUE_FRACTION):
+        self.edge_count = edges
+        self.node_count = nodes if nodes else max(10, edges // DEFAULT_DEGREE)
+        if self.node_count < 2:
+            raise ValueError(f"A synthetic graph needs at least 2 nodes, not {self.node_count}")
+        self.seed = seed
+        self.clique_fraction = clique_fraction
+        self._ids: List[str] = []
+        self._categories: List[str] = []
+        self._by_category: Dict[str, List[int]] = {}
+        self._cliques: List[List[int]] = []
+        self._assign_identifiers()
+
+    def _assign_identifiers(self) -> None:
+        """
+        Assign an identifier and a category to each node, and group nodes into cliques.
+        """
+        rng = random.Random(self.seed)
+        categories = [x[0] for x in CATEGORIES]
+        prefixes = {x[0]: x[1] for x in CATEGORIES}
+        weights = [x[2] for x in CATEGORIES]
+        counters: Dict[str, int] = {}
+        while len(self._ids) < self.node_count:
+            category = rng.choices(categories, weights)[0]
+            size = 1
+            if len(prefixes[category]) > 1 and rng.random() < self.clique_fraction:
+                size = min(rng.randint(2, len(prefixes[category])), self.node_count - len(self._ids))
+            clique = []
+            for prefix in prefixes[category][:size] if size > 1 else [rng.choice(prefixes[category])]:
+                counters[prefix] = counters.get(prefix, 0) + 1
+                clique.append(len(self._ids))
+                self._by_category.setdefault(category, []).append(len(self._ids))
+                self._ids.append(f"{prefix}:{counters[prefix]:07d}")
+                self._categories.append(category)
+            if len(clique) > 1:
+                self._cliques.append(clique)
+
+    def nodes(self) -> Iterator[Dict]:
+        """
+        Generate the nodes of the graph.
+
+        Returns
+        -------
+        Iterator[Dict]
+            The nodes
+        """
+        rng = random.Random(self.seed + 1)
+        same_as: Dict[int, List[str]] = {}
+        for clique in self._cliques:
+            for i in clique:
+                same_as[i] = [self._ids[j] for j in clique if j != i]
+        for i, (n, category) in enumerate(zip(self._ids, self._categories)):
+            node = {
+                'id': n,
+                'name': f"{category.split(':')[1].lower()} {i}",
+                'category': [category],
+                'provided_by': rng.sample(SOURCES, rng.randint(1, 3)),
+            }
+            if rng.random() < 0.4:
+                node['synonym'] = [f"{node['name']} synonym {j}" for j in range(rng.randint(1, 3))]
+            if rng.random() < 0.3:
+                node['xrefs'] = [f"XREF:{rng.randrange(10 ** 7)}" for _ in range(rng.randint(1, 2))]
+            if i in same_as:
+                node['same_as'] = same_as[i]
+            yield node
+
+    def edges(self) -> Iterator[Dict]:
+        """
+        Generate the edges of the graph, starting with the ``same_as`` edges of cliques.
+
+        Returns
+        -------
+        Iterator[Dict]
+            The edges
+        """
+        rng = random.Random(self.seed + 2)
+        count = 0
+        for clique in self._cliques:
+            for j in clique[1:]:
+                if count == self.edge_count:
+                    return
+                yield self._edge(count, clique[0], j, 'biolink:same_as', 'owl:equivalentClass', rng)
+                count += 1
+        # each subject, predicate and object is used once, as an int, since edges with
+        # the same subject, predicate and object are merged when they are loaded
+        seen = set()
+        indices = range(len(PREDICATES))
+        weights = [x[4] for x in PREDICATES]
+        attempts = 0
+        while count < self.edge_count:
+            attempts += 1
+            if attempts > 100 * self.edge_count:
+                raise ValueError(f"Cannot generate {self.edge_count} distinct edges between {self.node_count} nodes")
+            i = rng.choices(indices, weights)[0]
+            predicate, relation, subjects, objects, _ = PREDICATES[i]
+            s = self._pick(rng, subjects)
+            o = self._pick(rng, objects)
+            if s is None or o is None or s == o:
+                continue
+            key = (s * self.node_count + o) * len(PREDICATES) + i
+            if key in seen:
+                continue
+            seen.add(key)
+            yield self._edge(count, s, o, predicate, relation, rng)
+            count += 1
+
+    def _pick(self, rng: random.Random, categories: List[str]) -> Optional[int]:
+        """
+        Pick a node of one of the categories, skewed towards the first nodes of the
+        category, so that node degrees follow a long-tailed distribution.
+        """
+        candidates = self._by_category.get(rng.choice(categories))
+        if not candidates:
+            return None
+        return candidates[int(len(candidates) * rng.random() ** 3)]
+
+    def _edge(self, count: int, s: int, o: int, predicate: str, relation: str, rng: random.Random) -> Dict:
+        edge = {
+            'id': f"urn:uuid:{self.seed:08x}-0000-4000-8000-{count:012x}",
+            'subject': self._ids[s],
+            'predicate': predicate,
+            'object': self._ids[o],
+            'relation': relation,
+            'provided_by': rng.sample(SOURCES, rng.randint(1, 2)),
+        }
+        if rng.random() < 0.5:
+            edge['publications'] = [f"PMID:{rng.randrange(10 ** 8)}" for _ in range(rng.randint(1, 4))]
+        return edge
+
+    def load(self, graph: Optional[BaseGraph] = None) -> BaseGraph:
+        """
+        Load the nodes and edges into a graph, as they would be loaded from a file.
+
+        Parameters
+        ----------
+        graph: Optional[kgx.graph.base_graph.BaseGraph]
+            The graph to load into (a new graph, by default)
+
+        Returns
+        -------
+        kgx.graph.base_graph.BaseGraph
+            The graph
+        """
+        from kgx import PandasTransformer
+        t = PandasTransformer(graph)
+        for node in self.nodes():
+            t.load_node(node)
+        for edge in self.edges():
+            t.load_edge(edge)
+        return t.graph
@@ -1,15 +1,40 @@
-from kgx.transformers.pandas_transformer import PandasTransformer
-from kgx.transformers.rdf_transformer import RdfTransformer, ObanRdfTransformer, RdfOwlTransformer
-from kgx.transformers.nt_transformer import NtTransformer
-from kgx.transformers.sparql_transformer import SparqlTransformer, RedSparqlTransformer
-from kgx.transformers.json_transformer import JsonTransformer, ObographJsonTransformer
-from kgx.transformers.jsonl_transformer import JsonlTransformer
-from kgx.transformers.rsa_transformer import RsaTransformer
-from kgx.transformers.neo_transformer import NeoTransformer
-from kgx.transformers.transformer import Transformer
-from kgx.validator import Validator
-from kgx.prefix_manager import PrefixManager
-from kgx.config import get_config
+import importlib
+from typing import Any, List
 
 __version__ = '0.3.0'
 
+# Public classes and functions, and the module they are defined in.
+# They are imported on first access, so that importing kgx (and running
+# the kgx command line) does not import every transformer and its dependencies.
+_lazy_attributes = {
+    'PandasTransformer': 'kgx.transformers.pandas_transformer',
+    'RdfTransformer': 'kgx.transformers.rdf_transformer',
+    'ObanRdfTransformer': 'kgx.transformers.rdf_transformer',
+    'RdfOwlTransformer': 'kgx.transformers.rdf_transformer',
+    'NtTransformer': 'kgx.transformers.nt_transformer',
+    'SparqlTransformer': 'kgx.transformers.sparql_transformer',
+    'RedSparqlTransformer': 'kgx.transformers.sparql_transformer',
+    'JsonTransformer': 'kgx.transformers.json_transformer',
+    'ObographJsonTransformer': 'kgx.transformers.json_transformer',
+    'JsonlTransformer': 'kgx.transformers.jsonl_transformer',
+    'RsaTransformer': 'kgx.transformers.rsa_transformer',
+    'NeoTransformer': 'kgx.transformers.neo_transformer',
+    'Transformer': 'kgx.transformers.transformer',
+    'Validator': 'kgx.validator',
+    'PrefixManager': 'kgx.prefix_manager',
+    'get_config': 'kgx.config',
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_lazy_attributes))
@@ -2,12 +2,12 @@ import kgx
 import click
 from typing import List, Tuple, Optional, Set
 
-from kgx.config import get_logger, get_config
+from kgx.config import get_logger
+from kgx.utils.metrics_utils import get_metrics
 from kgx.cli.cli_utils import get_file_types, get_transformer, parse_source, apply_operations, graph_summary, validate, \
     neo4j_download, neo4j_upload, transform, merge
 
 log = get_logger()
-config = get_config()
 
 
 def error(msg):
@@ -15,25 +15,71 @@ def error(msg):
     quit()
 
 
+def write_metrics(metrics: Optional[str], trace: Optional[str]) -> None:
+    """
+    Write the metrics recorded while running a command.
+
+    Parameters
+    ----------
+    metrics: Optional[str]
+        File to write the metrics to, as JSON
+    trace: Optional[str]
+        File to write the metrics to, as Chrome trace events
+
+    """
+    if metrics:
+        get_metrics().write(metrics)
+        log.info(f"Metrics written to {metrics}")
+    if trace:
+        get_metrics().write_trace(trace)
+        log.info(f"Trace written to {trace}")
+
+
 @click.group()
 @click.version_option(version=kgx.__version__, prog_name=kgx.__name__)
-def cli():
+@click.option('--profile', required=False, type=click.Choice(['cpu', 'memory']), help='Profile the command, with cProfile (cpu) or tracemalloc snapshots at the end of each stage (memory)')
+@click.option('--profile-output', required=False, type=str, help='Prefix of the profile files (kgx_<command>, by default)')
+@click.option('--progress/--no-progress', default=None, help='Report the progress of parsing, merging and writing (the progress entry of the KGX config, by default)')
+@click.pass_context
+def cli(ctx: click.Context, profile: Optional[str], profile_output: Optional[str], progress: Optional[bool]):
     """
     Knowledge Graph Exchange CLI entrypoint.
     \f
 
+    Parameters
+    ----------
+    ctx: click.Context
+        The context of the command
+    profile: Optional[str]
+        The profile mode. One of ``cpu`` or ``memory``
+    profile_output: Optional[str]
+        The prefix of the profile files
+    progress: Optional[bool]
+        Whether progress is reported
+
     """
-    pass
+    if progress is not None:
+        from kgx.utils.progress_utils import set_progress_enabled
+        set_progress_enabled(progress)
+    if profile:
+        from kgx.utils.profile_utils import start_profiler, stop_profiler
+        start_profiler(profile, profile_output or f"kgx_{ctx.invoked_subcommand}")
+        ctx.call_on_close(stop_profiler)
 
 
 @cli.command('graph-summary')
 @click.argument('inputs', required=True, type=click.Path(exists=True), nargs=-1)
 @click.option('--input-format', required=True, help=f'The input format. Can be one of {get_file_types()}')
-@click.option('--input-compression', required=False, help='The input compression type')
+@click.option('--input-compression', required=False, help='The input compression type (gz, bz2, xz, zstd or lz4; tar, tar.gz, tar.bz2 or tar.xz for TSV/CSV)')
 @click.option('--output', required=True, type=click.Path(exists=False))
 @click.option('--node-facet-properties', required=False, multiple=True, help='A list of node properties from which to generate counts per value for those properties')
 @click.option('--edge-facet-properties', required=False, multiple=True, help='A list of edge properties from which to generate counts per value for those properties')
-def graph_summary_wrapper(inputs: List[str], input_format: str, input_compression: str, output: str, node_facet_properties: Optional[Set], edge_facet_properties: Optional[Set]):
+@click.option('--knowledge-map', required=False, type=click.Path(exists=False), help='File to write the TRAPI knowledge map to')
+@click.option('--stream', is_flag=True, help='Summarize while parsing, without loading the graph into memory')
+@click.option('--processes', required=False, type=int, default=1, help='Number of processes to use when streaming')
+@click.option('--approximate', is_flag=True, help='Estimate facet counts with fixed size sketches, for high-cardinality facets')
+@click.option('--top-k', required=False, type=int, default=10, help='Number of most frequent values to report per facet, when approximating')
+def graph_summary_wrapper(inputs: List[str], input_format: str, input_compression: str, output: str, node_facet_properties: Optional[Set], edge_facet_properties: Optional[Set], knowledge_map: Optional[str], stream: bool, processes: int, approximate: bool, top_k: int):
     """
     Loads and summarizes a knowledge graph from a set of input files.
     \f
@@ -52,16 +98,30 @@ def graph_summary_wrapper(inputs: List[str], input_format: str, input_compressio
         A list of node properties from which to generate counts per value for those properties. For example, ``['provided_by']``
     edge_facet_properties: Optional[Set]
         A list of edge properties from which to generate counts per value for those properties. For example, ``['provided_by']``
+    knowledge_map: Optional[str]
+        Where to write the TRAPI knowledge map for the graph, if any
+    stream: bool
+        Whether to summarize the inputs while parsing, without loading them into a graph
+    processes: int
+        Number of processes to use when streaming
+    approximate: bool
+        Whether to estimate facet counts with fixed size sketches
+    top_k: int
+        Number of most frequent values to report per facet, when approximating
     """
-    graph_summary(inputs, input_format, input_compression, output, node_facet_properties=list(node_facet_properties), edge_facet_properties=list(edge_facet_properties))
+    graph_summary(inputs, input_format, input_compression, output, node_facet_properties=list(node_facet_properties), edge_facet_properties=list(edge_facet_properties), knowledge_map=knowledge_map, stream=stream, processes=processes, approximate=approximate, top_k=top_k)
 
 
 @cli.command('validate')
 @click.argument('inputs',  required=True, type=click.Path(exists=True), nargs=-1)
 @click.option('--input-format', required=True, help=f'The input format. Can be one of {get_file_types()}')
-@click.option('--input-compression', required=False, help='The input compression type')
+@click.option('--input-compression', required=False, help='The input compression type (gz, bz2, xz, zstd or lz4; tar, tar.gz, tar.bz2 or tar.xz for TSV/CSV)')
 @click.option('--output', required=False, type=click.Path(exists=False), help='File to write validation reports to')
-def validate_wrapper(inputs: List[str], input_format: str, input_compression: str, output: str):
+@click.option('--processes', required=False, type=int, default=1, help='Number of processes to use')
+@click.option('--stream', is_flag=True, help='Validate while parsing, without loading the graph into memory')
+@click.option('--summary', is_flag=True, help='Report each distinct error once, with a count and a sample of entities')
+@click.option('--error-records', required=False, type=click.Path(exists=False), help='File to write every error to, as JSON lines')
+def validate_wrapper(inputs: List[str], input_format: str, input_compression: str, output: str, processes: int, stream: bool, summary: bool, error_records: Optional[str]):
     """
     Run KGX validator on an input file to check for Biolink Model compliance.
     \f
@@ -76,9 +136,17 @@ def validate_wrapper(inputs: List[str], input_format: str, input_compression: st
         The input compression type
     output: str
         Path to output file
+    processes: int
+        Number of processes to use
+    stream: bool
+        Whether to validate while parsing, without loading the graph into memory
+    summary: bool
+        Whether to report each distinct error once, with a count and a sample of entities
+    error_records: Optional[str]
+        File to write every error to, as JSON lines
 
     """
-    validate(inputs, input_format, input_compression, output)
+    validate(inputs, input_format, input_compression, output, processes, stream, summary, error_records)
 
 
 @cli.command(name='neo4j-download')
@@ -87,7 +155,7 @@ def validate_wrapper(inputs: List[str], input_format: str, input_compression: st
 @click.option('--password', required=True, type=str, help='Neo4j password')
 @click.option('--output', required=True, type=click.Path(exists=False), help='Output')
 @click.option('--output-format', required=True, help=f'The output format. Can be one of {get_file_types()}')
-@click.option('--output-compression', required=False, help='The output compression type')
+@click.option('--output-compression', required=False, help='The output compression type (gz, bz2, xz, zstd or lz4; tar, tar.gz, tar.bz2 or tar.xz for TSV/CSV)')
 @click.option('--node-filters', required=False, type=click.Tuple([str, str]), multiple=True, help=f'Filters for filtering nodes from the input graph')
 @click.option('--edge-filters', required=False, type=click.Tuple([str, str]), multiple=True, help=f'Filters for filtering edges from the input graph')
 def neo4j_download_wrapper(uri: str, username: str, password: str, output: str, output_format: str, output_compression: str, node_filters: Tuple, edge_filters: Tuple):
@@ -121,7 +189,7 @@ def neo4j_download_wrapper(uri: str, username: str, password: str, output: str,
 @cli.command(name='neo4j-upload')
 @click.argument('inputs',  required=True, type=click.Path(exists=True), nargs=-1)
 @click.option('--input-format', required=True, help=f'The input format. Can be one of {get_file_types()}')
-@click.option('--input-compression', required=False, help='The input compression type')
+@click.option('--input-compression', required=False, help='The input compression type (gz, bz2, xz, zstd or lz4; tar, tar.gz, tar.bz2 or tar.xz for TSV/CSV)')
 @click.option('--uri', required=True, type=str, help='Neo4j URI to upload to. For example, https://localhost:7474')
 @click.option('--username', required=True, type=str, help='Neo4j username')
 @click.option('--password', required=True, type=str, help='Neo4j password')
@@ -158,16 +226,20 @@ def neo4j_upload_wrapper(inputs: List[str], input_format: str, input_compression
 @cli.command('transform')
 @click.argument('inputs',  required=False, type=click.Path(exists=True), nargs=-1)
 @click.option('--input-format', required=False, help=f'The input format. Can be one of {get_file_types()}')
-@click.option('--input-compression', required=False, help='The input compression type')
+@click.option('--input-compression', required=False, help='The input compression type (gz, bz2, xz, zstd or lz4; tar, tar.gz, tar.bz2 or tar.xz for TSV/CSV)')
 @click.option('--output', required=False, type=click.Path(exists=False), help='Output')
 @click.option('--output-format', required=False, help=f'The output format. Can be one of {get_file_types()}')
-@click.option('--output-compression', required=False, help='The output compression type')
+@click.option('--output-compression', required=False, help='The output compression type (gz, bz2, xz, zstd or lz4; tar, tar.gz, tar.bz2 or tar.xz for TSV/CSV)')
 @click.option('--node-filters', required=False, type=click.Tuple([str, str]), multiple=True, help=f'Filters for filtering nodes from the input graph')
 @click.option('--edge-filters', required=False, type=click.Tuple([str, str]), multiple=True, help=f'Filters for filtering edges from the input graph')
+@click.option('--node-properties', required=False, type=str, multiple=True, help=f'Node properties to load from the input graph (all properties, by default)')
+@click.option('--edge-properties', required=False, type=str, multiple=True, help=f'Edge properties to load from the input graph (all properties, by default)')
 @click.option('--transform-config', required=False, type=str, help=f'Transform config YAML')
 @click.option('--source', required=False, type=str, multiple=True, help='Source(s) from the YAML to process')
 @click.option('--processes', required=False, type=int, default=1, help='Number of processes to use')
-def transform_wrapper(inputs: List[str], input_format: str, input_compression: str, output: str, output_format: str, output_compression: str, node_filters: Tuple, edge_filters: Tuple, transform_config: str, source: List, processes: int):
+@click.option('--metrics', required=False, type=click.Path(exists=False), help='File to write the wall time, records, bytes and memory of each stage to, as JSON')
+@click.option('--trace', required=False, type=click.Path(exists=False), help='File to write the stages to, as Chrome trace events')
+def transform_wrapper(inputs: List[str], input_format: str, input_compression: str, output: str, output_format: str, output_compression: str, node_filters: Tuple, edge_filters: Tuple, node_properties: Tuple, edge_properties: Tuple, transform_config: str, source: List, processes: int, metrics: Optional[str], trace: Optional[str]):
     """
     Transform a Knowledge Graph from one serialization form to another.
     \f
@@ -190,15 +262,26 @@ def transform_wrapper(inputs: List[str], input_format: str, input_compression: s
         Node filters
     edge_filters: Tuple[str, str]
         Edge filters
+    node_properties: Tuple[str]
+        Node properties to load
+    edge_properties: Tuple[str]
+        Edge properties to load
     merge_config: str
         Merge config YAML
     source: List
         A list of source(s) to load from the YAML
     processes: int
         Number of processes to use
+    metrics: Optional[str]
+        File to write metrics to, as JSON
+    trace: Optional[str]
+        File to write metrics to, as Chrome trace events
 
     """
-    transform(inputs, input_format, input_compression, output, output_format, output_compression, node_filters, edge_filters, transform_config, source, processes=processes)
+    if metrics or trace:
+        get_metrics().enable()
+    transform(inputs, input_format, input_compression, output, output_format, output_compression, node_filters, edge_filters, transform_config, source, processes=processes, node_projection=list(node_properties) or None, edge_projection=list(edge_properties) or None)
+    write_metrics(metrics, trace)
 
 
 @cli.command(name='merge')
@@ -206,7 +289,10 @@ def transform_wrapper(inputs: List[str], input_format: str, input_compression: s
 @click.option('--source', required=False, type=str, multiple=True, help='Source(s) from the YAML to process')
 @click.option('--destination', required=False, type=str, multiple=True, help='Destination(s) from the YAML to process')
 @click.option('--processes', required=False, type=int, default=1, help='Number of processes to use')
-def merge_wrapper(merge_config: str, source: List, destination: List, processes: int):
+@click.option('--metrics', required=False, type=click.Path(exists=False), help='File to write the wall time, records, bytes and memory of each stage to, as JSON')
+@click.option('--trace', required=False, type=click.Path(exists=False), help='File to write the stages to, as Chrome trace events')
+@click.option('--resume', is_flag=True, help='Resume from the checkpoint of a previous merge, skipping the stages that completed')
+def merge_wrapper(merge_config: str, source: List, destination: List, processes: int, metrics: Optional[str], trace: Optional[str], resume: bool):
     """
     Load nodes and edges from files and KGs, as defined in a config YAML, and merge them into a single graph.
     The merged graph can then be written to a local/remote Neo4j instance OR be serialized into a file.
@@ -225,7 +311,16 @@ def merge_wrapper(merge_config: str, source: List, destination: List, processes:
         A list of destination to write to, as defined in the YAML
     processes: int
         Number of processes to use
+    metrics: Optional[str]
+        File to write metrics to, as JSON
+    trace: Optional[str]
+        File to write metrics to, as Chrome trace events
+    resume: bool
+        Whether to resume from the checkpoint of a previous merge
 
     """
-    merge(merge_config, source, destination, processes)
+    if metrics or trace:
+        get_metrics().enable()
+    merge(merge_config, source, destination, processes, resume)
+    write_metrics(metrics, trace)
 
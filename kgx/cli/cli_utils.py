@@ -1,31 +1,40 @@
+from __future__ import annotations
+
+import glob
 import importlib
+import json
 import os
+import re
 import sys
 from multiprocessing import Pool
-from typing import List, Tuple, Any, Optional, Dict, Set
+from typing import List, Tuple, Any, Optional, Dict, Set, Callable
 
 import yaml
 
 import kgx
-from kgx import PandasTransformer, NeoTransformer, Validator, RdfTransformer
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
-from kgx.operations.graph_merge import merge_all_graphs
-from kgx.operations.summarize_graph import summarize_graph
-
+from kgx.utils.checkpoint_utils import MergeCheckpoint, run_with_snapshot
+from kgx.utils.intern_utils import log_report
+from kgx.utils.metrics_utils import get_file_size, get_metrics, run_with_metrics, span
+from kgx.utils.profile_utils import get_profiler, run_with_profile
+from kgx.utils.progress_utils import WorkerProgress
+
+# Transformer class for each format, by name.
+# Classes are only imported when a transformer for the format is requested.
 _transformers = {
-    'tar': kgx.PandasTransformer,
-    'csv': kgx.PandasTransformer,
-    'tsv': kgx.PandasTransformer,
-    'tsv:neo4j': kgx.PandasTransformer,
-    'nt': kgx.NtTransformer,
-    'ttl': kgx.RdfTransformer,
-    'json': kgx.JsonTransformer,
-    'jsonl': kgx.JsonlTransformer,
-    'obojson': kgx.ObographJsonTransformer,
-    # 'rq': kgx.SparqlTransformer,
-    'owl': kgx.RdfOwlTransformer,
-    'rsa': kgx.RsaTransformer
+    'tar': 'PandasTransformer',
+    'csv': 'PandasTransformer',
+    'tsv': 'PandasTransformer',
+    'tsv:neo4j': 'PandasTransformer',
+    'nt': 'NtTransformer',
+    'ttl': 'RdfTransformer',
+    'json': 'JsonTransformer',
+    'jsonl': 'JsonlTransformer',
+    'obojson': 'ObographJsonTransformer',
+    # 'rq': 'SparqlTransformer',
+    'owl': 'RdfOwlTransformer',
+    'rsa': 'RsaTransformer'
 }
 
 log = get_logger()
@@ -54,7 +63,7 @@ def get_transformer(file_format: str) -> Any:
     t = _transformers.get(file_format)
     if not t:
         raise TypeError(f"format '{file_format}' is not a supported file type.")
-    return t
+    return getattr(kgx, t)
 
 
 def get_file_types() -> Tuple:
@@ -70,7 +79,7 @@ def get_file_types() -> Tuple:
     return tuple(_transformers.keys())
 
 
-def graph_summary(inputs: List[str], input_format: str, input_compression: Optional[str], output: Optional[str], node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None) -> Dict:
+def graph_summary(inputs: List[str], input_format: str, input_compression: Optional[str], output: Optional[str], node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None, knowledge_map: Optional[str] = None, stream: bool = False, processes: int = 1, approximate: bool = False, top_k: int = 10) -> Dict:
     """
     Loads and summarizes a knowledge graph from a set of input files.
 
@@ -88,6 +97,16 @@ def graph_summary(inputs: List[str], input_format: str, input_compression: Optio
         A list of node properties from which to generate counts per value for those properties. For example, ``['provided_by']``
     edge_facet_properties: Optional[List]
         A list of edge properties from which to generate counts per value for those properties. For example, ``['provided_by']``
+    knowledge_map: Optional[str]
+        Where to write the TRAPI knowledge map for the graph, if any
+    stream: bool
+        Whether to summarize the inputs while parsing, without loading them into a graph
+    processes: int
+        Number of processes to use when streaming
+    approximate: bool
+        Whether to estimate facet counts with fixed size sketches, instead of counting every value
+    top_k: int
+        Number of most frequent values to report per facet, when approximating
 
     Returns
     -------
@@ -95,23 +114,49 @@ def graph_summary(inputs: List[str], input_format: str, input_compression: Optio
         A dictionary with the graph stats
 
     """
-    transformer = get_transformer(input_format)()
-    for file in inputs:
-        transformer.parse(file, input_format=input_format, compression=input_compression)
-
-    stats = summarize_graph(transformer.graph, name='Graph', node_facet_properties=node_facet_properties, edge_facet_properties=edge_facet_properties)
+    from kgx.operations.columnar_summary import ColumnarSummary
+    from kgx.operations.streaming_summary import summarize_files
+    from kgx.operations.summarize_graph import summarize_graph
+
+    summary: Optional[ColumnarSummary] = None
+    if stream:
+        if knowledge_map:
+            raise ValueError("Cannot generate a knowledge map when streaming")
+        stats = summarize_files(inputs, input_format, input_compression, node_facet_properties, edge_facet_properties, processes, approximate=approximate, top_k=top_k).graph_stats(name='Graph')
+    else:
+        transformer = get_transformer(input_format)()
+        for file in inputs:
+            transformer.parse(file, input_format=input_format, compression=input_compression)
+        if approximate:
+            stats = summarize_graph(transformer.graph, 'Graph', node_facet_properties, edge_facet_properties, approximate=True, top_k=top_k)
+            summary = ColumnarSummary(transformer.graph) if knowledge_map else None
+        else:
+            summary = ColumnarSummary(transformer.graph, node_facet_properties=node_facet_properties, edge_facet_properties=edge_facet_properties)
+            stats = summary.graph_stats(name='Graph')
     if output:
         WH = open(output, 'w')
         WH.write(yaml.dump(stats))
     else:
         print(yaml.dump(stats))
+    if knowledge_map and summary:
+        # the knowledge map is rendered from the same scan of the graph
+        with open(knowledge_map, 'w') as WH:
+            json.dump(summary.knowledge_map(name='Graph'), WH, indent=4)
     return stats
 
 
-def validate(inputs: List[str], input_format: str, input_compression: Optional[str], output: Optional[str]) -> List:
+def validate(inputs: List[str], input_format: str, input_compression: Optional[str], output: Optional[str], processes: int = 1, stream: bool = False, summary: bool = False, error_records: Optional[str] = None) -> List:
     """
     Run KGX validator on an input file to check for Biolink Model compliance.
 
+    When streaming, nodes and edges are validated as they are parsed and errors
+    are written as they are found. Formats whose records are only complete once the
+    whole file is parsed (like RDF) are validated one input file at a time.
+
+    .. note::
+        When streaming, a node or an edge that appears in more than one record
+        is validated, and reported, once per record.
+
     Parameters
     ----------
     inputs: List[str]
@@ -122,23 +167,71 @@ def validate(inputs: List[str], input_format: str, input_compression: Optional[s
         The input compression type
     output: Optional[str]
         Path to output file (stdout, by default)
+    processes: int
+        Number of processes to use
+    stream: bool
+        Whether to validate the inputs while parsing, without loading them into a graph
+    summary: bool
+        Whether to report each distinct error once, with a count and a sample of entities,
+        instead of reporting every error for every entity
+    error_records: Optional[str]
+        Path to a file to write every error to, as JSON lines
 
     Returns
     -------
     List
-        Returns a list of errors, if any
+        Returns a list of errors, if any, or a summary of aggregated errors when streaming or summarizing
 
     """
-    transformer = get_transformer(input_format)()
-    for file in inputs:
-        transformer.parse(file, input_format=input_format, compression=input_compression)
+    from kgx.operations.streaming_summary import STREAMING_FORMATS
+    from kgx.validator import ErrorAggregator, ValidationGraph
+
+    validator = kgx.Validator()
+    outstream = open(output, 'w') if output else sys.stdout
+    records = open(error_records, 'w') if error_records else None
+    aggregator = ErrorAggregator(records=records)
+
+    def write_errors(errors: List) -> None:
+        aggregator.add_all(errors)
+        if not summary:
+            validator.write_report(errors, outstream)
+
+    errors = []
+    if stream:
+        for file in inputs:
+            if input_format in STREAMING_FORMATS:
+                if summary:
+                    graph = ValidationGraph(validator, aggregator=aggregator)
+                else:
+                    graph = ValidationGraph(validator, write_errors)
+                transformer = get_transformer(input_format)(graph)
+                transformer.parse(file, input_format=input_format, compression=input_compression)
+            else:
+                transformer = get_transformer(input_format)()
+                transformer.parse(file, input_format=input_format, compression=input_compression)
+                if summary:
+                    validator.validate(transformer.graph, processes=processes, aggregator=aggregator)
+                else:
+                    write_errors(validator.validate(transformer.graph, processes=processes))
+    else:
+        transformer = get_transformer(input_format)()
+        for file in inputs:
+            transformer.parse(file, input_format=input_format, compression=input_compression)
+        if summary:
+            validator.validate(transformer.graph, processes=processes, aggregator=aggregator)
+        else:
+            errors = validator.validate(transformer.graph, processes=processes)
+            write_errors(errors)
 
-    validator = Validator()
-    errors = validator.validate(transformer.graph)
+    if summary:
+        validator.write_report(aggregator, outstream)
     if output:
-        validator.write_report(errors, open(output, 'w'))
-    else:
-        validator.write_report(errors, sys.stdout)
+        outstream.close()
+    if records:
+        records.close()
+    log.info(f"Found {aggregator.total} validation errors")
+    if stream or summary:
+        return aggregator.summary()
     return errors
 
 
@@ -171,7 +264,7 @@ def neo4j_download(uri: str, username: str, password: str, output: str, output_f
         The NeoTransformer
 
     """
-    transformer = NeoTransformer(uri=uri, username=username, password=password)
+    transformer = kgx.NeoTransformer(uri=uri, username=username, password=password)
     if node_filters:
         for n in node_filters:
             transformer.set_node_filter(n[0], n[1])
@@ -226,12 +319,12 @@ def neo4j_upload(inputs: List[str], input_format: str, input_compression: Option
         for e in edge_filters:
             transformer.set_edge_filter(e[0], e[1])
 
-    neo_transformer = NeoTransformer(transformer.graph, uri=uri, username=username, password=password)
+    neo_transformer = kgx.NeoTransformer(transformer.graph, uri=uri, username=username, password=password)
     neo_transformer.save()
     return neo_transformer
 
 
-def transform(inputs: Optional[List[str]], input_format: Optional[str] = None, input_compression: Optional[str] = None, output: Optional[str] = None, output_format: Optional[str] = None, output_compression: Optional[str] = None, node_filters: Optional[Tuple] = None, edge_filters: Optional[Tuple] = None, transform_config: str = None, source: Optional[List] = None, destination: Optional[List] = None, processes: int = 1) -> None:
+def transform(inputs: Optional[List[str]], input_format: Optional[str] = None, input_compression: Optional[str] = None, output: Optional[str] = None, output_format: Optional[str] = None, output_compression: Optional[str] = None, node_filters: Optional[Tuple] = None, edge_filters: Optional[Tuple] = None, transform_config: str = None, source: Optional[List] = None, destination: Optional[List] = None, processes: int = 1, node_projection: Optional[List] = None, edge_projection: Optional[List] = None) -> None:
     """
     Transform a Knowledge Graph from one serialization form to another.
 
@@ -261,6 +354,10 @@ def transform(inputs: Optional[List[str]], input_format: Optional[str] = None, i
         A list of destination to write to, as defined in the YAML
     processes: int
         Number of processes to use
+    node_projection: Optional[List]
+        Node properties to load (all properties, by default)
+    edge_projection: Optional[List]
+        Edge properties to load (all properties, by default)
 
     """
     if transform_config and inputs:
@@ -310,20 +407,32 @@ def transform(inputs: Optional[List[str]], input_format: Optional[str] = None, i
                 source_to_parse[key] = val
 
         results = []
-        pool = Pool(processes=processes)
-        for k, v in source_to_parse.items():
-            log.info(f"Spawning process for '{k}'")
-            name = v['name'] if 'name' in v else k
-            result = pool.apply_async(transform_source, (name, v, output_directory, curie_map, node_properties, predicate_mappings, property_types, checkpoint, False))
-            results.append(result)
-        pool.close()
-        pool.join()
+        metrics = get_metrics()
+        with WorkerProgress('Transforming sources') as worker_progress:
+            pool = Pool(processes=processes, initializer=worker_progress.initializer, initargs=worker_progress.initargs)
+            for k, v in source_to_parse.items():
+                log.info(f"Spawning process for '{k}'")
+                name = v['name'] if 'name' in v else k
+                args = (name, v, output_directory, curie_map, node_properties, predicate_mappings, property_types, checkpoint, False)
+                result = pool.apply_async(*get_worker_task(transform_source, name, args))
+                results.append(result)
+            pool.close()
+            pool.join()
+        if metrics.enabled:
+            for result in results:
+                try:
+                    metrics.merge(result.get()[1])
+                except Exception as e:
+                    log.error(f"Cannot record metrics of a source that failed: {e}")
     else:
         source_dict: Dict = {
             'input': {
                 'format': input_format,
                 'compression': input_compression,
                 'filename': inputs,
+                'node_columns': node_projection,
+                'edge_columns': edge_projection,
+                'processes': processes,
             },
             'output': {
                 'format': output_format,
@@ -335,11 +444,16 @@ def transform(inputs: Optional[List[str]], input_format: Optional[str] = None, i
         transform_source(name, source_dict, None)
 
 
-def merge(merge_config: str, source: Optional[List] = None, destination: Optional[List] = None, processes: int = 1) -> BaseGraph:
+def merge(merge_config: str, source: Optional[List] = None, destination: Optional[List] = None, processes: int = 1, resume: bool = False) -> BaseGraph:
     """
     Load nodes and edges from files and KGs, as defined in a config YAML, and merge them into a single graph.
     The merged graph can then be written to a local/remote Neo4j instance OR be serialized into a file.
 
+    If ``checkpoint`` is set in the ``configuration`` of the YAML, or if ``resume`` is set,
+    then the parsed sources, the merged graph after each operation, and the written destinations
+    are recorded in a checkpoint, in the ``checkpoint`` directory of the output directory.
+    See ``kgx.utils.checkpoint_utils.MergeCheckpoint``.
+
     Parameters
     ----------
     merge_config: str
@@ -350,6 +464,9 @@ def merge(merge_config: str, source: Optional[List] = None, destination: Optiona
         A list of destination to write to, as defined in the YAML
     processes: int
         Number of processes to use
+    resume: bool
+        Whether to resume from the checkpoint of a previous merge, skipping
+        the stages that completed
 
     Returns
     -------
@@ -357,6 +474,8 @@ def merge(merge_config: str, source: Optional[List] = None, destination: Optiona
         The merged graph
 
     """
+    from kgx.operations.graph_merge import merge_all_graphs
+
     with open(merge_config, 'r') as YML:
         cfg = yaml.load(YML, Loader=yaml.FullLoader)
 
@@ -403,23 +522,34 @@ def merge(merge_config: str, source: Optional[List] = None, destination: Optiona
     for key in cfg['merged_graph']['source']:
         if key in source:
             sources_to_parse[key] = cfg['merged_graph']['source'][key]
-
-    results = []
-    pool = Pool(processes=processes)
-    for k, v in sources_to_parse.items():
-        log.info(f"Spawning process for '{k}'")
-        name = v['name'] if 'name' in v else k
-        result = pool.apply_async(parse_source, (name, v, output_directory, curie_map, node_properties, predicate_mappings, checkpoint))
-        results.append(result)
-    pool.close()
-    pool.join()
-    graphs = [r.get() for r in results]
-    merged_graph = merge_all_graphs(graphs)
-
-    if 'name' in cfg['merged_graph']:
-        merged_graph.name = cfg['merged_graph']['name']
-    if 'operations' in cfg['merged_graph']:
-        apply_operations(cfg['merged_graph'], merged_graph)
+    operations = cfg['merged_graph'].get('operations') or []
+
+    merge_checkpoint = None
+    merged_graph = None
+    if checkpoint or resume:
+        merge_checkpoint = MergeCheckpoint(os.path.join(output_directory, 'checkpoint'), cfg.get('configuration'))
+        if resume and merge_checkpoint.load():
+            merged_graph = merge_checkpoint.get_merged(sources_to_parse, operations)
+        else:
+            merge_checkpoint.reset()
+
+    completed_operations = 0
+    if merged_graph is None:
+        graphs = parse_sources(sources_to_parse, output_directory, curie_map, node_properties, predicate_mappings, checkpoint, processes, merge_checkpoint)
+        merged_graph = merge_all_graphs(graphs)
+        if 'name' in cfg['merged_graph']:
+            merged_graph.name = cfg['merged_graph']['name']
+        if merge_checkpoint:
+            merge_checkpoint.add_merged(merged_graph, sources_to_parse)
+    elif merge_checkpoint:
+        completed_operations = merge_checkpoint.get_completed_operations()
+
+    if operations:
+        callback = None
+        if merge_checkpoint:
+            # a snapshot of the merged graph is written after each operation
+            callback = lambda n: merge_checkpoint.add_merged(merged_graph, sources_to_parse, operations[:n]) # type: ignore
+        apply_operations(cfg['merged_graph'], merged_graph, completed_operations, callback)
 
     destination_to_write: Dict[str, Dict] = {}
     for d in destination:
@@ -431,9 +561,12 @@ def merge(merge_config: str, source: Optional[List] = None, destination: Optiona
     # write the merged graph
     if destination_to_write:
         for key, destination_info in destination_to_write.items():
+            if merge_checkpoint and merge_checkpoint.is_destination_written(key, destination_info):
+                log.info(f"Skipping {key}, which was written before the merge was resumed")
+                continue
             log.info(f"Writing merged graph to {key}")
             if destination_info['format'] == 'neo4j':
-                destination_transformer = NeoTransformer(
+                destination_transformer = kgx.NeoTransformer(
                     source_graph=merged_graph,
                     uri=destination_info['uri'],
                     username=destination_info['username'],
@@ -446,22 +579,105 @@ def merge(merge_config: str, source: Optional[List] = None, destination: Optiona
                 if isinstance(filename, list):
                     filename = filename[0]
                 destination_filename = f"{output_directory}/{filename}"
-                if destination_info['format'] == 'nt' and isinstance(destination_transformer, RdfTransformer):
+                if destination_info['format'] == 'nt' and isinstance(destination_transformer, kgx.RdfTransformer):
                     destination_transformer.set_predicate_mapping(predicate_mappings)
                     destination_transformer.set_property_types(property_types)
-                compression = destination_info['compression'] if 'compression' in destination_info else None
-                destination_transformer.save(
-                    filename=destination_filename,
-                    output_format=destination_info['format'],
-                    compression=compression
-                ) # type: ignore
+                compression = get_compression(destination_info)
+                with span('save', destination=key, filename=destination_filename, format=destination_info['format']) as s:
+                    destination_transformer.save(
+                        filename=destination_filename,
+                        output_format=destination_info['format'],
+                        compression=compression,
+                        **get_shard_options(destination_info, processes)
+                    ) # type: ignore
+                    if s.recording:
+                        s.add(records=count_records(merged_graph), bytes_written=get_output_size(destination_filename))
             else:
                 log.error(f"type {destination_info['format']} not yet supported for KGX merge operation.")
+                continue
+            if merge_checkpoint:
+                merge_checkpoint.add_destination(key, destination_info)
     else:
         log.warning(f"No destination provided in {merge_config}. The merged graph will not be persisted.")
     return merged_graph
 
 
+def parse_sources(sources: Dict[str, Dict], output_directory: str, curie_map: Dict[str, str], node_properties: List[str], predicate_mappings: Dict[str, str], checkpoint: bool, processes: int, merge_checkpoint: Optional[MergeCheckpoint] = None) -> List[BaseGraph]:
+    """
+    Parse the sources of a merge, with worker processes.
+
+    Sources that were parsed before a merge was resumed are read from
+    the checkpoint of the merge, if given. Each other source is recorded
+    in the checkpoint once it is parsed, even if another source fails.
+
+    Parameters
+    ----------
+    sources: Dict[str, Dict]
+        The sources, from the merge config YAML
+    output_directory: str
+        Location to write output to
+    curie_map: Dict[str, str]
+        Non-canonical CURIE mappings
+    node_properties: List[str]
+        A set of predicates that ought to be treated as node properties (This is applicable for RDF)
+    predicate_mappings: Dict[str, str]
+        A mapping of predicate IRIs to property names (This is applicable for RDF)
+    checkpoint: bool
+        Whether to serialize each individual source to a TSV
+    processes: int
+        Number of processes to use
+    merge_checkpoint: Optional[kgx.utils.checkpoint_utils.MergeCheckpoint]
+        The checkpoint of the merge
+
+    Returns
+    -------
+    List[kgx.graph.base_graph.BaseGraph]
+        The graphs of the sources, in the order of the sources
+
+    """
+    graphs: Dict[str, BaseGraph] = {}
+    results = []
+    metrics = get_metrics()
+    with WorkerProgress('Parsing sources') as worker_progress:
+        pool = Pool(processes=processes, initializer=worker_progress.initializer, initargs=worker_progress.initargs)
+        parsed = []
+        for k, v in sources.items():
+            if merge_checkpoint and merge_checkpoint.is_source_parsed(k, v):
+                parsed.append(k)
+                continue
+            log.info(f"Spawning process for '{k}'")
+            name = v['name'] if 'name' in v else k
+            f: Callable[..., Any] = parse_source
+            args: Tuple[Any, ...] = (name, v, output_directory, curie_map, node_properties, predicate_mappings, checkpoint)
+            callback = None
+            if merge_checkpoint:
+                f, args = run_with_snapshot, (merge_checkpoint.get_source_snapshot(k), f, *args)
+                # recorded by the parent process, as soon as the source is parsed
+                callback = lambda x, k=k, v=v: merge_checkpoint.add_source(k, v) # type: ignore
+            result = pool.apply_async(*get_worker_task(f, name, args), callback=callback)
+            results.append((k, result))
+        pool.close()
+        # sources that were parsed before are read while the other sources are parsed
+        for k in parsed:
+            graphs[k] = merge_checkpoint.get_source(k, sources[k]) # type: ignore
+        pool.join()
+    error = None
+    for k, r in results:
+        try:
+            if metrics.enabled:
+                graph, worker_metrics = r.get()
+                metrics.merge(worker_metrics)
+                graphs[k] = graph
+            else:
+                graphs[k] = r.get()
+        except Exception as e:
+            log.error(f"Cannot parse source '{k}': {e}")
+            error = error or e
+    if error:
+        raise error
+    return [graphs[k] for k in sources]
+
+
 def parse_source(key: str, source: dict, output_directory: str, curie_map: Dict[str, str] = None, node_properties: Set[str] = None, predicate_mappings: Dict[str, str] = None, checkpoint: bool = False):
     """
     Parse a source from a merge config YAML.
@@ -528,7 +744,7 @@ def transform_source(key: str, source: Dict, output_directory: Optional[str], cu
     """
     log.info(f"Processing source '{key}'")
     output_format = source['output']['format']
-    output_compression = source['output']['compression'] if 'compression' in source['output'] else None
+    output_compression = get_compression(source['output'])
     output_filename = source['output']['filename'] if 'filename' in source['output'] else key
     if isinstance(output_filename, list):
         output = output_filename[0]
@@ -540,7 +756,7 @@ def transform_source(key: str, source: Dict, output_directory: Optional[str], cu
     if output_directory and not output.startswith(output_directory):
         output = os.path.join(output_directory, output)
     if output_format == 'neo4j':
-        output_transformer = NeoTransformer(
+        output_transformer = kgx.NeoTransformer(
             source_graph=transformer.graph,
             uri=source['output']['uri'],
             username=source['output']['username'],
@@ -549,10 +765,13 @@ def transform_source(key: str, source: Dict, output_directory: Optional[str], cu
         output_transformer.save()
     elif output_format in get_file_types():
         output_transformer = get_transformer(output_format)(transformer.graph)
-        if output_format == 'nt' and isinstance(output_transformer, RdfTransformer):
+        if output_format == 'nt' and isinstance(output_transformer, kgx.RdfTransformer):
             if property_types:
                 output_transformer.set_property_types(property_types)
-        output_transformer.save(output, output_format=output_format, compression=output_compression) # type: ignore
+        with span('save', source=key, filename=output, format=output_format) as s:
+            output_transformer.save(output, output_format=output_format, compression=output_compression, **get_shard_options(source['output'])) # type: ignore
+            if s.recording:
+                s.add(records=count_records(transformer.graph), bytes_written=get_output_size(output))
     else:
         raise ValueError(f"type {output_format} not yet supported for output")
     if not preserve_graph:
@@ -560,6 +779,118 @@ def transform_source(key: str, source: Dict, output_directory: Optional[str], cu
     return output_transformer.graph
 
 
+def get_worker_task(f: Callable, name: str, args: Tuple) -> Tuple[Callable, Tuple]:
+    """
+    Get the function, and its arguments, to run a source in a worker process.
+    The source is profiled if the current process is being profiled, and records
+    metrics if the current process records metrics.
+
+    Parameters
+    ----------
+    f: Callable
+        The function that parses the source
+    name: str
+        The name of the source
+    args: Tuple
+        The arguments of the function
+
+    Returns
+    -------
+    Tuple[Callable, Tuple]
+        The function and its arguments, for ``Pool.apply_async``
+
+    """
+    profiler = get_profiler()
+    if profiler:
+        f, args = run_with_profile, (profiler.mode, profiler.get_worker_prefix(name), f, *args)
+    if get_metrics().enabled:
+        f, args = run_with_metrics, (f, *args)
+    return f, args
+
+
+def parse_file(transformer: kgx.Transformer, key: Optional[str], filename: str, input_format: str, **kwargs: Any) -> None:
+    """
+    Parse a file of a source, recording the parse as a ``parse`` span.
+
+    Parameters
+    ----------
+    transformer: kgx.Transformer
+        The transformer to parse with
+    key: Optional[str]
+        Source key
+    filename: str
+        The file to parse
+    input_format: str
+        The input format
+    kwargs: Any
+        Any additional arguments for the ``parse`` method of the transformer
+
+    """
+    with span('parse', source=key, filename=filename, format=input_format) as s:
+        records = count_records(transformer.graph) if s.recording else 0
+        transformer.parse(filename=filename, input_format=input_format, **kwargs)
+        if s.recording:
+            s.add(records=count_records(transformer.graph) - records, bytes_read=get_file_size(filename))
+
+
+def count_records(graph: BaseGraph) -> int:
+    """
+    Get the number of records, nodes and edges, in a graph.
+
+    Parameters
+    ----------
+    graph: kgx.graph.base_graph.BaseGraph
+        The graph
+
+    Returns
+    -------
+    int
+        The number of nodes and edges
+
+    """
+    return graph.number_of_nodes() + graph.number_of_edges()
+
+
+def get_output_size(filename: str) -> int:
+    """
+    Get the total size, in bytes, of the files written for an output filename.
+    Transformers add suffixes, like ``_nodes.tsv``, or a compression extension,
+    to the filename of an output.
+
+    Parameters
+    ----------
+    filename: str
+        The filename of the output
+
+    Returns
+    -------
+    int
+        The total size of the files
+
+    """
+    return get_file_size(*glob.glob(f"{glob.escape(filename)}*"))
+
+
+def order_node_files(inputs: List[str], input_format: str) -> List[str]:
+    """
+    Order a list of input files so that node files come before all other files.
+
+    Parameters
+    ----------
+    inputs: List[str]
+        The input files
+    input_format: str
+        The input format
+
+    Returns
+    -------
+    List[str]
+        The input files, with node files first
+
+    """
+    return sorted(inputs, key=lambda x: not re.search(f'nodes.{input_format}', os.path.basename(x)))
+
+
 def parse_source_input(key: Optional[str], source: Dict, output_directory: Optional[str], curie_map: Dict[str, str] = None, node_properties: Set[str] = None, predicate_mappings: Dict[str, str] = None, property_types = None, checkpoint: bool = False) -> kgx.Transformer:
     """
     Parse a source's input from a transform config YAML.
@@ -594,11 +925,13 @@ def parse_source_input(key: Optional[str], source: Dict, output_directory: Optio
         key = os.path.basename(source['input']['filename'][0])
     source_name = source['input']['name'] if 'name' in source['input'] else key
     input_format = source['input']['format']
-    input_compression = source['input']['compression'] if 'compression' in source['input'] else None
+    input_compression = get_compression(source['input'])
     inputs = source['input']['filename']
     filters = source['input']['filters'] if 'filters' in source['input'] and source['input']['filters'] is not None else {}
     node_filters = filters['node_filters'] if 'node_filters' in filters else {}
     edge_filters = filters['edge_filters'] if 'edge_filters' in filters else {}
+    node_projection = source['input']['node_columns'] if 'node_columns' in source['input'] else None
+    edge_projection = source['input']['edge_columns'] if 'edge_columns' in source['input'] else None
     operations = source['input']['operations'] if 'operations' in source['input'] and source['input']['filters'] is not None else {}
     source_curie_map = source['curie_map'] if 'curie_map' in source and source['curie_map'] is not None else {}
     if curie_map:
@@ -619,7 +952,9 @@ def parse_source_input(key: Optional[str], source: Dict, output_directory: Optio
         if filters:
             apply_filters(transformer, node_filters, edge_filters)
         for f in inputs:
-            transformer.parse(
+            parse_file(
+                transformer,
+                key,
                 filename=f,
                 input_format=input_format,
                 compression=input_compression,
@@ -634,18 +969,29 @@ def parse_source_input(key: Optional[str], source: Dict, output_directory: Optio
         transformer.graph.name = key
         if filters:
             apply_filters(transformer, node_filters, edge_filters)
+        transformer.set_node_properties(node_projection)
+        transformer.set_edge_properties(edge_projection)
+        parse_kwargs = {}
+        if input_format == 'jsonl' and source['input'].get('processes'):
+            parse_kwargs['processes'] = source['input']['processes']
+        if 'subject_category' in transformer.edge_filters or 'object_category' in transformer.edge_filters:
+            # edges are checked against the categories of nodes that are already loaded
+            inputs = order_node_files(inputs, input_format)
         for f in inputs:
-            transformer.parse(
+            parse_file(
+                transformer,
+                key,
                 filename=f,
                 input_format=input_format,
                 compression=input_compression,
-                provided_by=source_name
+                provided_by=source_name,
+                **parse_kwargs
             )
         if operations:
             apply_operations(source['input'], transformer.graph)
     elif input_format == 'neo4j':
         # Parse Neo4j
-        transformer = NeoTransformer(
+        transformer = kgx.NeoTransformer(
             source_graph=None,
             uri=source['uri'],
             username=source['username'],
@@ -654,22 +1000,70 @@ def parse_source_input(key: Optional[str], source: Dict, output_directory: Optio
         transformer.graph.name = key
         if filters:
             apply_filters(transformer, node_filters, edge_filters)
-        transformer.load(provided_by=source_name)
+        with span('parse', source=key, format=input_format) as s:
+            transformer.load(provided_by=source_name)
+            if s.recording:
+                s.add(records=count_records(transformer.graph))
         if operations:
             apply_operations(source['input'], transformer.graph)
         transformer.graph.name = key
     else:
         raise TypeError(f"type {input_format} not yet supported")
+    log_report(key)
 
     if checkpoint:
         log.info(f"Writing checkpoint for source '{key}'")
-        pt = PandasTransformer(transformer.graph)
+        pt = kgx.PandasTransformer(transformer.graph)
         checkpoint_output = f"{output_directory}/{key}" if output_directory else key
         pt.save(filename=checkpoint_output, output_format='tsv', compression=None)
 
     return transformer
 
 
+def get_shard_options(info: Dict, processes: int = 1) -> Dict[str, Any]:
+    """
+    Get the options of a sharded Neo4j export of an output, or a destination,
+    in a YAML configuration.
+
+    Parameters
+    ----------
+    info: Dict
+        The output, or destination, configuration
+    processes: int
+        Number of processes to use
+
+    Returns
+    -------
+    Dict[str, Any]
+        The ``shard_size`` and ``processes`` arguments for ``PandasTransformer.save``,
+        or no arguments if ``shard_size`` is not defined
+
+    """
+    if not info.get('shard_size'):
+        return {}
+    return {'shard_size': int(info['shard_size']), 'processes': int(info.get('processes', processes))}
+
+
+def get_compression(info: Dict) -> Optional[str]:
+    """
+    Get the compression of an input, or an output, in a YAML configuration.
+
+    Parameters
+    ----------
+    info: Dict
+        The ``input`` or ``output`` of a source, or a destination
+
+    Returns
+    -------
+    Optional[str]
+        The compression, or ``None`` if the compression is not
+        defined or is ``None`` (which YAML reads as a string)
+
+    """
+    compression = info.get('compression')
+    return None if compression in {None, '', 'None'} else compression
+
+
 def apply_filters(transformer: kgx.Transformer, node_filters: Optional[Dict], edge_filters: Optional[Dict]) -> kgx.Transformer:
     """
     Apply filters to the given transformer.
@@ -700,7 +1094,7 @@ def apply_filters(transformer: kgx.Transformer, node_filters: Optional[Dict], ed
     return transformer
 
 
-def apply_operations(source: dict, graph: BaseGraph) -> BaseGraph:
+def apply_operations(source: dict, graph: BaseGraph, start: int = 0, callback: Optional[Callable[[int], None]] = None) -> BaseGraph:
     """
     Apply operations as defined in the YAML.
 
@@ -710,6 +1104,10 @@ def apply_operations(source: dict, graph: BaseGraph) -> BaseGraph:
         The source from the YAML
     graph: kgx.graph.base_graph.BaseGraph
         The graph corresponding to the source
+    start: int
+        The number of operations to skip, that were already applied to the graph
+    callback: Optional[Callable[[int], None]]
+        A function that is called after each operation, with the number of operations applied
 
     Returns
     -------
@@ -718,12 +1116,20 @@ def apply_operations(source: dict, graph: BaseGraph) -> BaseGraph:
 
     """
     operations = source['operations']
-    for operation in operations:
+    for i, operation in enumerate(operations):
+        if i < start:
+            log.info(f"Skipping operation {operation['name']}, which was applied before the merge was resumed")
+            continue
         op_name = operation['name']
         op_args = operation['args']
         module_name = '.'.join(op_name.split('.')[0:-1])
         function_name = op_name.split('.')[-1]
         f = getattr(importlib.import_module(module_name), function_name)
         log.info(f"Applying operation {op_name} with args: {op_args}")
-        f(graph, **op_args)
+        with span('operation', operation=op_name) as s:
+            f(graph, **op_args)
+            if s.recording:
+                s.add(records=count_records(graph))
+        if callback:
+            callback(i + 1)
     return graph
@@ -1,11 +1,12 @@
+import hashlib
 import importlib
 import logging
+import os
 import sys
 from os import path
 import json
 from typing import Dict, Any, Optional
 
-import requests
 import yaml
 
 from kgx.graph.base_graph import BaseGraph
@@ -43,6 +44,16 @@ def get_jsonld_context(name: str = "biolink"):
     """
     Get contents of a JSON-LD context.
 
+    The location of each context is defined in the config. Relative paths
+    refer to the snapshots that are shipped with KGX, in ``kgx/contexts``,
+    so that no network access is needed. URLs are downloaded once, and
+    cached in the ``jsonld-context-directory`` defined in the config.
+
+    Parameters
+    ----------
+    name: str
+        The name of the JSON-LD context, as defined in the config
+
     Returns
     -------
     dict
@@ -53,15 +64,15 @@ def get_jsonld_context(name: str = "biolink"):
     if name in jsonld_context_map:
         content = jsonld_context_map[name]
     else:
-        filepath = config['jsonld-context'][name] # type: ignore
+        filepath = get_config()['jsonld-context'][name]
         if filepath.startswith('http'):
-            try:
-                content = requests.get(filepath).json()
-            except ConnectionError:
-                raise Exception(f'Unable to download JSON-LD context from {filepath}')
+            content = _get_remote_jsonld_context(name, filepath)
         else:
+            if not path.isabs(filepath):
+                filepath = path.join(path.dirname(CONFIG_FILENAME), filepath)
             if path.exists(filepath):
-                content = json.load(open(filepath))
+                with open(filepath) as FH:
+                    content = json.load(FH)
 
         if '@context' in content:
             content = content['@context']
@@ -69,6 +80,35 @@ def get_jsonld_context(name: str = "biolink"):
     return content
 
 
+def _get_remote_jsonld_context(name: str, url: str) -> dict:
+    """
+    Download a JSON-LD context, unless it is already cached.
+
+    Contexts are cached by URL, and never invalidated, so URLs in the config
+    should point to a fixed version of a context.
+    """
+    directory = path.expanduser(get_config().get('jsonld-context-directory', '~/.cache/kgx/contexts'))
+    filename = path.join(directory, f"{name}-{hashlib.sha256(url.encode('utf-8')).hexdigest()[:16]}.context.jsonld")
+    if path.exists(filename):
+        with open(filename) as FH:
+            return json.load(FH)
+    import requests
+    try:
+        response = requests.get(url)
+        response.raise_for_status()
+        content = response.json()
+    except (requests.exceptions.RequestException, ValueError):
+        raise Exception(f'Unable to download JSON-LD context from {url}')
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(f"{filename}.tmp", 'w') as FH:
+            json.dump(content, FH)
+        os.replace(f"{filename}.tmp", filename)
+    except OSError:
+        pass
+    return content
+
+
 def get_logger(name: str = 'KGX') -> logging.Logger:
     """
     Get an instance of logger.
@@ -1,54 +1,382 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import time
+from collections import ChainMap
+from typing import Dict, Iterable, List, Optional, Iterator, Mapping
+
 import networkx as nx
 import rdflib
 from kgx.config import get_logger, get_config
-from kgx.utils.kgx_utils import generate_edge_key, contract
+from kgx.utils.kgx_utils import contract
 
 CURIE_MAP = {
     'BFO:0000054': 'realized_in',
     'RO:0000091': 'has_disposition'
 }
 
+DEFAULT_INDEX_DIRECTORY = os.path.join('~', '.cache', 'kgx', 'ontologies')
+DEFAULT_INDEX_TTL = 7 * 24 * 60 * 60
+BATCH_SIZE = 500
+
 log = get_logger()
 
 
+class OntologyIndex(Mapping[str, str]):
+    """
+    A persistent, read-only index of the labels and ``subClassOf``
+    relationships of an ontology, stored in SQLite.
+
+    The index is compiled once, by parsing the ontology, and is keyed by
+    the hash of the ontology file. Subsequent instances, including those
+    in worker processes, open the existing index without parsing the ontology.
+
+    The index of an ontology that is read from a URL is keyed by the URL,
+    and records the ``ETag`` or ``Last-Modified`` header of the ontology.
+    Once the index is older than ``ontology-index-ttl`` seconds, as defined
+    in the config, these are checked again and the index is rebuilt if the
+    ontology has changed.
+
+    Parameters
+    ----------
+    ontology: str
+        Path or URL of the ontology
+    index_directory: Optional[str]
+        Directory where the index is stored
+
+    """
+
+    def __init__(self, ontology: str, index_directory: Optional[str] = None):
+        self.ontology = ontology
+        self.index_directory: str = os.path.expanduser(
+            index_directory or get_config().get('ontology-index-directory', DEFAULT_INDEX_DIRECTORY)
+        )
+        self.filename = os.path.join(self.index_directory, f"{OntologyIndex.get_ontology_hash(ontology)}.sqlite")
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        if not os.path.exists(self.filename):
+            self.build()
+        elif not os.path.exists(ontology):
+            ttl = get_config().get('ontology-index-ttl', DEFAULT_INDEX_TTL)
+            if time.time() - os.path.getmtime(self.filename) > ttl:
+                self.refresh()
+
+    def __getstate__(self) -> Dict:
+        return {'ontology': self.ontology, 'index_directory': self.index_directory, 'filename': self.filename}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        A read-only connection to the index.
+
+        A new connection is opened in each process, since
+        SQLite connections must not be shared across a fork.
+        """
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(f"file:{self.filename}?mode=ro", uri=True, check_same_thread=False)
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def get_ontology_hash(ontology: str) -> str:
+        """
+        Get the hash that identifies an ontology.
+
+        For a local file, this is the hash of its contents. For a URL, this is
+        the hash of the URL itself, since the ontology is not downloaded unless
+        the index needs to be built.
+
+        Parameters
+        ----------
+        ontology: str
+            Path or URL of the ontology
+
+        Returns
+        -------
+        str
+            The SHA-256 hex digest
+
+        """
+        h = hashlib.sha256()
+        if os.path.exists(ontology):
+            with open(ontology, 'rb') as FH:
+                for block in iter(lambda: FH.read(1 << 20), b''):
+                    h.update(block)
+        else:
+            h.update(ontology.encode('utf-8'))
+        return h.hexdigest()
+
+    def build(self) -> None:
+        """
+        Parse the ontology and compile its index.
+
+        The index is written to a temporary file which is then moved into place,
+        so that concurrent processes never read a partially written index.
+        """
+        log.info(f"Building ontology index for {self.ontology} in {self.filename}")
+        version = None if os.path.exists(self.ontology) else get_remote_version(self.ontology)
+        rdfgraph = rdflib.Graph()
+        rdfgraph.parse(self.ontology, format=rdflib.util.guess_format(self.ontology))
+        os.makedirs(self.index_directory, exist_ok=True)
+        fd, tmp_filename = tempfile.mkstemp(suffix='.sqlite', dir=self.index_directory)
+        os.close(fd)
+        connection = sqlite3.connect(tmp_filename)
+        try:
+            connection.execute('CREATE TABLE labels (curie TEXT PRIMARY KEY, label TEXT NOT NULL)')
+            connection.execute('CREATE TABLE subclass_of (subject TEXT NOT NULL, object TEXT NOT NULL, PRIMARY KEY (subject, object))')
+            connection.execute('CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT)')
+            connection.execute("INSERT INTO metadata VALUES ('version', ?)", (version,))
+            connection.executemany(
+                'INSERT OR REPLACE INTO labels VALUES (?, ?)',
+                ((contract(s), o.value.replace(' ', '_')) for s, p, o in rdfgraph.triples((None, rdflib.RDFS.label, None)))
+            )
+            connection.executemany(
+                'INSERT OR IGNORE INTO subclass_of VALUES (?, ?)',
+                (
+                    (contract(s), contract(o))
+                    for s, p, o in rdfgraph.triples((None, rdflib.RDFS.subClassOf, None))
+                    if isinstance(s, rdflib.URIRef) and isinstance(o, rdflib.URIRef)
+                )
+            )
+            connection.commit()
+            connection.close()
+            os.replace(tmp_filename, self.filename)
+        except Exception:
+            connection.close()
+            os.remove(tmp_filename)
+            raise
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get_version(self) -> Optional[str]:
+        """
+        Get the ``ETag`` or ``Last-Modified`` header of the ontology
+        when the index was built, if it was read from a URL.
+
+        Returns
+        -------
+        Optional[str]
+            The version of the ontology
+
+        """
+        try:
+            row = self.connection.execute("SELECT value FROM metadata WHERE key = 'version'").fetchone()
+        except sqlite3.OperationalError:
+            # an index built before versions were recorded
+            return None
+        return row[0] if row else None
+
+    def refresh(self) -> None:
+        """
+        Rebuild the index of an ontology that is read from a URL, if the
+        ontology has changed since the index was built.
+
+        The existing index is kept if the URL cannot be reached.
+        """
+        version = get_remote_version(self.ontology)
+        if version is None:
+            log.warning(f"Unable to check whether {self.ontology} has changed; using the existing index in {self.filename}")
+        elif version != self.get_version():
+            self.build()
+        else:
+            os.utime(self.filename)
+
+    def __getitem__(self, curie: str) -> str:
+        row = self.connection.execute('SELECT label FROM labels WHERE curie = ?', (curie,)).fetchone()
+        if row is None:
+            raise KeyError(curie)
+        return row[0]
+
+    def __contains__(self, curie) -> bool:
+        return self.connection.execute('SELECT 1 FROM labels WHERE curie = ?', (curie,)).fetchone() is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (x[0] for x in self.connection.execute('SELECT curie FROM labels'))
+
+    def __len__(self) -> int:
+        return self.connection.execute('SELECT COUNT(*) FROM labels').fetchone()[0]
+
+    def get_labels(self, curies: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the labels for a batch of CURIEs.
+
+        Parameters
+        ----------
+        curies: Iterable[str]
+            The CURIEs
+
+        Returns
+        -------
+        Dict[str, str]
+            A dictionary of CURIE to label, for the CURIEs that have a label
+
+        """
+        return self._select('SELECT curie, label FROM labels WHERE curie IN ({})', curies, lambda r, x: r.update(x))
+
+    def get_superclasses(self, curies: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Get the direct superclasses for a batch of CURIEs.
+
+        Parameters
+        ----------
+        curies: Iterable[str]
+            The CURIEs
+
+        Returns
+        -------
+        Dict[str, List[str]]
+            A dictionary of CURIE to its direct superclasses, for the CURIEs that have a superclass
+
+        """
+        def add(result, rows):
+            for s, o in rows:
+                result.setdefault(s, []).append(o)
+        return self._select('SELECT subject, object FROM subclass_of WHERE subject IN ({})', curies, add)
+
+    def get_subclass_edges(self) -> Iterator:
+        """
+        Get all ``subClassOf`` relationships in the ontology.
+
+        Returns
+        -------
+        Iterator
+            An iterator of (subject, object) tuples
+
+        """
+        return iter(self.connection.execute('SELECT subject, object FROM subclass_of'))
+
+    def _select(self, query: str, curies: Iterable[str], add) -> Dict:
+        """
+        Run a query for batches of CURIEs and accumulate the results.
+        """
+        result: Dict = {}
+        curies = list(curies)
+        for i in range(0, len(curies), BATCH_SIZE):
+            batch = curies[i:i + BATCH_SIZE]
+            add(result, self.connection.execute(query.format(','.join('?' * len(batch))), batch))
+        return result
+
+
+def get_remote_version(url: str) -> Optional[str]:
+    """
+    Get the ``ETag``, or else the ``Last-Modified`` header, of a URL.
+
+    Parameters
+    ----------
+    url: str
+        The URL
+
+    Returns
+    -------
+    Optional[str]
+        The version of the resource, or None if the URL cannot be reached,
+        or has neither header
+
+    """
+    import requests
+    try:
+        response = requests.head(url, allow_redirects=True, timeout=30)
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        return None
+    return response.headers.get('ETag') or response.headers.get('Last-Modified')
+
+
 class CurieLookupService(object):
     """
     A service to lookup label for a given CURIE.
+
+    Labels are read from persistent ontology indexes, which are compiled
+    the first time an ontology is used. See ``kgx.curie_lookup_service.OntologyIndex``.
+
+    Parameters
+    ----------
+    curie_map: dict
+        Additional CURIE to label mappings
+    ontologies: Optional[Dict[str, str]]
+        Ontologies to use, as a dictionary of name to path or URL
+        (defaults to ``ontologies`` in the config)
+    index_directory: Optional[str]
+        Directory where ontology indexes are stored
+        (defaults to ``ontology-index-directory`` in the config)
+
     """
     config = get_config()
     ontologies = config['ontologies']
-    ontology_graph = None
 
-    def __init__(self, curie_map: dict = None):
+    def __init__(self, curie_map: Optional[dict] = None, ontologies: Optional[Dict[str, str]] = None, index_directory: Optional[str] = None):
+        if ontologies:
+            self.ontologies = ontologies
+        self.indexes = [OntologyIndex(x, index_directory) for x in self.ontologies.values()]
+        self.custom_curie_map = dict(CURIE_MAP)
         if curie_map:
-            self.curie_map = CURIE_MAP
-            self.curie_map.update(curie_map)
-        else:
-            self.curie_map = CURIE_MAP
-        self.ontology_graph = nx.MultiDiGraph()
-        self.load_ontologies()
+            self.custom_curie_map.update(curie_map)
+        # reads fall through to the ontology indexes, that are read-only
+        self.curie_map: Mapping[str, str] = ChainMap(self.custom_curie_map, *reversed(self.indexes))  # type: ignore
+        self._ontology_graph: Optional[nx.MultiDiGraph] = None
+        self._ancestor_index = None
+
+    def get_labels(self, curies: Iterable[str]) -> Dict[str, str]:
+        """
+        Get the labels for a batch of CURIEs.
+
+        Parameters
+        ----------
+        curies: Iterable[str]
+            The CURIEs
+
+        Returns
+        -------
+        Dict[str, str]
+            A dictionary of CURIE to label, for the CURIEs that have a label
+
+        """
+        curies = set(curies)
+        labels: Dict[str, str] = {}
+        for index in reversed(self.indexes):
+            labels.update(index.get_labels(curies))
+        labels.update({x: self.custom_curie_map[x] for x in curies if x in self.custom_curie_map})
+        return labels
+
+    @property
+    def ontology_graph(self) -> nx.MultiDiGraph:
+        """
+        A graph with a node, and its ``name``, for each labelled CURIE in the ontologies.
+
+        The graph is only built, from the ontology indexes, when it is first accessed.
+        """
+        if self._ontology_graph is None:
+            self._ontology_graph = nx.MultiDiGraph()
+            for index in self.indexes:
+                for curie, label in index.connection.execute('SELECT curie, label FROM labels'):
+                    self._ontology_graph.add_node(curie, name=label)
+        return self._ontology_graph
+
+    @property
+    def ancestor_index(self):
+        """
+        An ancestor index over the ``subClassOf`` relationships in the ontologies.
+
+        See ``kgx.utils.graph_utils.AncestorIndex``.
+        """
+        if self._ancestor_index is None:
+            from kgx.utils.graph_utils import AncestorIndex
+            self._ancestor_index = AncestorIndex(x for index in self.indexes for x in index.get_subclass_edges())
+        return self._ancestor_index
 
     def load_ontologies(self):
         """
         Load all required ontologies.
+
+        Labels are looked up from the ontology indexes, so this only
+        builds the in-memory ``ontology_graph``.
         """
-        for ontology in self.ontologies.values():
-            rdfgraph = rdflib.Graph()
-            input_format = rdflib.util.guess_format(ontology)
-            rdfgraph.parse(ontology, format=input_format)
-            #triples = rdfgraph.triples((None, rdflib.RDFS.subClassOf, None))
-            # for s,p,o in triples:
-            #     subject_curie = contract(s)
-            #     object_curie = contract(o)
-            #     self.ontology_graph.add_node(subject_curie)
-            #     self.ontology_graph.add_node(object_curie)
-            #     key = generate_edge_key(subject_curie, 'subclass_of', object_curie)
-            #     self.ontology_graph.add_edge(subject_curie, object_curie, key, **{'predicate': 'subclass_of', 'relation': 'rdfs:subClassOf'})
-
-            triples = rdfgraph.triples((None, rdflib.RDFS.label, None))
-            for s, p, o in triples:
-                key = contract(s)
-                value = o.value
-                value = value.replace(' ', '_')
-                self.curie_map[key] = value
-                self.ontology_graph.add_node(key, name=value)
+        self._ontology_graph = None
+        return self.ontology_graph
@@ -1,4 +1,7 @@
-from typing import Dict, Optional, List, Generator, Any
+from typing import Dict, Optional, List, Generator, Any, Tuple, Union
+
+# the key of an edge, as generated by kgx.utils.kgx_utils.generate_edge_key
+EdgeKey = Union[str, Tuple[str, str, str], int]
 
 
 class BaseGraph(object):
@@ -26,7 +29,7 @@ class BaseGraph(object):
         """
         pass
 
-    def add_edge(self, subject_node: str, object_node: str, edge_key: Optional[str] = None, **kwargs: Any) -> Any:
+    def add_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None, **kwargs: Any) -> Any:
         """
         Add an edge to the graph.
 
@@ -36,7 +39,7 @@ class BaseGraph(object):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
         kwargs: Any
             Any additional edge properties
@@ -68,7 +71,7 @@ class BaseGraph(object):
         """
         pass
 
-    def add_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[str], attr_key: str, attr_value: Any) -> Any:
+    def add_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey], attr_key: str, attr_value: Any) -> Any:
         """
         Add an attribute to a given edge.
 
@@ -78,7 +81,7 @@ class BaseGraph(object):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
         attr_key: str
             The attribute key
@@ -113,7 +116,7 @@ class BaseGraph(object):
         """
         pass
 
-    def update_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[str], attr_key: str, attr_value: Any) -> Dict:
+    def update_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey], attr_key: str, attr_value: Any) -> Dict:
         """
         Update an attribute of a given edge.
 
@@ -123,7 +126,7 @@ class BaseGraph(object):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
         attr_key: str
             The attribute key
@@ -155,7 +158,7 @@ class BaseGraph(object):
         """
         pass
 
-    def get_edge(self, subject_node: str, object_node: str, edge_key: Optional[str]) -> Dict:
+    def get_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey]) -> Dict:
         """
         Get an edge and its properties.
 
@@ -165,7 +168,7 @@ class BaseGraph(object):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
 
         Returns
@@ -295,7 +298,7 @@ class BaseGraph(object):
         """
         pass
 
-    def remove_edge(self, subject_node: str, object_node: str, edge_key: Optional[str] = None) -> Any:
+    def remove_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None) -> Any:
         """
         Remove a given edge from the graph.
 
@@ -305,7 +308,7 @@ class BaseGraph(object):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
 
         Returns
@@ -332,7 +335,7 @@ class BaseGraph(object):
         """
         pass
 
-    def has_edge(self, subject_node: str, object_node: str, edge_key: Optional[str] = None) -> bool:
+    def has_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None) -> bool:
         """
         Check whether a given edge exists in the graph.
 
@@ -342,7 +345,7 @@ class BaseGraph(object):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
 
         Returns
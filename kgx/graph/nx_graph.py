@@ -1,6 +1,6 @@
 from typing import Dict, Any, Optional, List, Generator
 
-from kgx.graph.base_graph import BaseGraph
+from kgx.graph.base_graph import BaseGraph, EdgeKey
 from networkx import MultiDiGraph, set_node_attributes, relabel_nodes, set_edge_attributes, get_node_attributes, \
     get_edge_attributes
 
@@ -37,7 +37,7 @@ class NxGraph(BaseGraph):
             data = kwargs
         self.graph.add_node(node, **data)
 
-    def add_edge(self, subject_node: str, object_node: str, edge_key: str = None, **kwargs: Any) -> None:
+    def add_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None, **kwargs: Any) -> None:
         """
         Add an edge to the graph.
 
@@ -47,7 +47,7 @@ class NxGraph(BaseGraph):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
         kwargs: Any
             Any additional edge properties
@@ -75,7 +75,7 @@ class NxGraph(BaseGraph):
         """
         self.graph.add_node(node, **{attr_key: attr_value})
 
-    def add_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[str], attr_key: str, attr_value: Any) -> None:
+    def add_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey], attr_key: str, attr_value: Any) -> None:
         """
         Add an attribute to a given edge.
 
@@ -85,7 +85,7 @@ class NxGraph(BaseGraph):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
         attr_key: str
             The attribute key
@@ -121,7 +121,7 @@ class NxGraph(BaseGraph):
         self.graph.add_node(node, **updated)
         return updated
 
-    def update_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[str], attr_key: str, attr_value: Any, preserve: bool = False) -> Dict:
+    def update_edge_attribute(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey], attr_key: str, attr_value: Any, preserve: bool = False) -> Dict:
         """
         Update an attribute of a given edge.
 
@@ -131,7 +131,7 @@ class NxGraph(BaseGraph):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
         attr_key: str
             The attribute key
@@ -170,7 +170,7 @@ class NxGraph(BaseGraph):
             n = self.graph.nodes[node]
         return n
 
-    def get_edge(self, subject_node: str, object_node: str, edge_key: Optional[str] = None) -> Dict:
+    def get_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None) -> Dict:
         """
         Get an edge and its properties.
 
@@ -180,7 +180,7 @@ class NxGraph(BaseGraph):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
 
         Returns
@@ -312,7 +312,7 @@ class NxGraph(BaseGraph):
         """
         self.graph.remove_node(node)
 
-    def remove_edge(self, subject_node: str, object_node: str, edge_key: Optional[str] = None) -> None:
+    def remove_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None) -> None:
         """
         Remove a given edge from the graph.
 
@@ -322,7 +322,7 @@ class NxGraph(BaseGraph):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
 
         """
@@ -345,7 +345,7 @@ class NxGraph(BaseGraph):
         """
         return self.graph.has_node(node)
 
-    def has_edge(self, subject_node: str, object_node: str, edge_key: Optional[str] = None) -> bool:
+    def has_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None) -> bool:
         """
         Check whether a given edge exists in the graph.
 
@@ -355,7 +355,7 @@ class NxGraph(BaseGraph):
             The subject (source) node
         object_node: str
             The object (target) node
-        edge_key: Optional[str]
+        edge_key: Optional[EdgeKey]
             The edge key
 
         Returns
@@ -6,6 +6,7 @@ from ordered_set import OrderedSet
 
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
+from kgx.utils.metrics_utils import span
 from kgx.utils.kgx_utils import get_prefix_prioritization_map, get_biolink_element, get_biolink_ancestors, \
     current_time_in_millis, format_biolink_category, generate_edge_key
 
@@ -49,17 +50,24 @@ def clique_merge(target_graph: BaseGraph, leader_annotation: str = None, prefix_
         leader_annotation = LEADER_ANNOTATION
 
     start = current_time_in_millis()
-    clique_graph = build_cliques(target_graph)
+    with span('clique_merge.build_cliques') as s:
+        clique_graph = build_cliques(target_graph)
+        s.add(records=clique_graph.number_of_nodes())
     end = current_time_in_millis()
     log.info(f"Total time taken to build cliques: {end - start} ms")
 
     start = current_time_in_millis()
-    elect_leader(target_graph, clique_graph, leader_annotation, prefix_prioritization_map, category_mapping, strict)
+    with span('clique_merge.elect_leader') as s:
+        elect_leader(target_graph, clique_graph, leader_annotation, prefix_prioritization_map, category_mapping, strict)
+        s.add(records=clique_graph.number_of_nodes())
     end = current_time_in_millis()
     log.info(f"Total time taken to elect leaders for all cliques: {end - start} ms")
 
     start = current_time_in_millis()
-    graph = consolidate_edges(target_graph, clique_graph, leader_annotation)
+    with span('clique_merge.consolidate_edges') as s:
+        graph = consolidate_edges(target_graph, clique_graph, leader_annotation)
+        if s.recording:
+            s.add(records=graph.number_of_edges())
     end = current_time_in_millis()
     log.info(f"Total time taken to consolidate edges in target graph: {end - start} ms")
     return graph, clique_graph
@@ -211,12 +219,11 @@ def consolidate_edges(target_graph: BaseGraph, clique_graph: nx.Graph, leader_an
             if node == leader:
                 continue
             log.info(f"Looking for in_edges for {node}")
-            in_edges = target_graph.in_edges(node, keys=False, data=True)
-            filtered_in_edges = [x for x in in_edges if x[2]['predicate'] != SAME_AS]
-            equiv_in_edges = [x for x in in_edges if x[2]['predicate'] == SAME_AS]
+            in_edges = target_graph.in_edges(node, keys=True, data=True)
+            filtered_in_edges = [x for x in in_edges if x[3]['predicate'] != SAME_AS]
+            equiv_in_edges = [x for x in in_edges if x[3]['predicate'] == SAME_AS]
             log.debug(f"Moving {len(in_edges)} in-edges from {node} to {leader}")
-            for u, v, edge_data in filtered_in_edges:
-                key = generate_edge_key(u, edge_data['predicate'], v)
+            for u, v, key, edge_data in filtered_in_edges:
                 target_graph.remove_edge(u, v, edge_key=key)
                 edge_data[ORIGINAL_SUBJECT_PROPERTY] = edge_data['subject']
                 edge_data[ORIGINAL_OBJECT_PROPERTY] = edge_data['object']
@@ -227,12 +234,11 @@ def consolidate_edges(target_graph: BaseGraph, clique_graph: nx.Graph, leader_an
                 target_graph.add_edge(edge_data['subject'], edge_data['object'], key, **edge_data)
 
             log.info(f"Looking for out_edges for {node}")
-            out_edges = target_graph.out_edges(node, keys=False, data=True)
-            filtered_out_edges = [x for x in out_edges if x[2]['predicate'] != SAME_AS]
-            equiv_out_edges = [x for x in out_edges if x[2]['predicate'] == SAME_AS]
+            out_edges = target_graph.out_edges(node, keys=True, data=True)
+            filtered_out_edges = [x for x in out_edges if x[3]['predicate'] != SAME_AS]
+            equiv_out_edges = [x for x in out_edges if x[3]['predicate'] == SAME_AS]
             log.debug(f"Moving {len(out_edges)} out-edges from {node} to {leader}")
-            for u, v, edge_data in filtered_out_edges:
-                key = generate_edge_key(u, edge_data['predicate'], v)
+            for u, v, key, edge_data in filtered_out_edges:
                 target_graph.remove_edge(u, v, edge_key=key)
                 edge_data[ORIGINAL_SUBJECT_PROPERTY] = edge_data['subject']
                 edge_data[ORIGINAL_OBJECT_PROPERTY] = edge_data['object']
@@ -244,22 +250,22 @@ def consolidate_edges(target_graph: BaseGraph, clique_graph: nx.Graph, leader_an
 
             log.debug(f"equiv out edges: {equiv_out_edges}")
             equivalent_identifiers = set()
-            for u, v, edge_data in equiv_in_edges:
+            for u, v, key, edge_data in equiv_in_edges:
                 if u != leader:
                     equivalent_identifiers.add(u)
                 if v != leader:
                     equivalent_identifiers.add(v)
-                target_graph.remove_edge(u, v, edge_key=generate_edge_key(u, SAME_AS, v))
+                target_graph.remove_edge(u, v, edge_key=key)
 
             log.debug(f"equiv out edges: {equiv_out_edges}")
-            for u, v, edge_data in equiv_out_edges:
+            for u, v, key, edge_data in equiv_out_edges:
                 if u != leader:
                     log.debug(f"{u} is an equivalent identifier of leader {leader}")
                     equivalent_identifiers.add(u)
                 if v != leader:
                     log.debug(f"{v} is an equivalent identifier of leader {leader}")
                     equivalent_identifiers.add(v)
-                target_graph.remove_edge(u, v, edge_key=generate_edge_key(u, SAME_AS, v))
+                target_graph.remove_edge(u, v, edge_key=key)
 
             leader_equivalent_identifiers.update(equivalent_identifiers)
 
@@ -0,0 +1,468 @@
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+import pandas as pd
+
+from kgx.graph.base_graph import BaseGraph
+
+"""
+A columnar engine for summarizing a graph.
+
+A single scan over the nodes and edges of a graph extracts categories, predicates,
+relations, sources and facet values into integer-coded arrays. All the counts are
+then computed via pandas group-bys on those arrays, and both the ``graph-summary``
+stats (see ``kgx.operations.summarize_graph``) and the TRAPI knowledge map
+(see ``kgx.operations.knowledge_map``) are rendered from the same scan.
+
+"""
+
+UNKNOWN = 'unknown'
+CURIE_PATTERN = r"^[^ <()>:]*:[^/ :]+$"
+
+
+class Codebook(object):
+    """
+    Interns values and assigns each distinct value an integer code,
+    in the order in which the values are first seen.
+    """
+
+    def __init__(self):
+        self.index: Dict[Any, int] = {}
+        self.values: List[Any] = []
+
+    def code(self, value: Any) -> int:
+        """
+        Get the integer code for a value, assigning a new code if the value
+        has not been seen before.
+
+        Parameters
+        ----------
+        value: Any
+            A hashable value
+
+        Returns
+        -------
+        int
+            The code for the value
+
+        """
+        c = self.index.get(value)
+        if c is None:
+            c = len(self.values)
+            self.index[value] = c
+            self.values.append(value)
+        return c
+
+    def decode(self, code: int) -> Any:
+        """
+        Get the value corresponding to a code.
+
+        Parameters
+        ----------
+        code: int
+            The code
+
+        Returns
+        -------
+        Any
+            The value
+
+        """
+        return self.values[code]
+
+
+class FacetColumn(object):
+    """
+    An exploded, integer-coded column for a facet property where each
+    row is a pair of (record position, value code).
+
+    A record that lacks the facet property contributes the code for ``unknown``,
+    a list-valued property contributes one row per element and a
+    single-valued property contributes a single row.
+    """
+
+    def __init__(self, codebook: Codebook):
+        self.codebook = codebook
+        self.rows: List[int] = []
+        self.codes: List[int] = []
+
+    def add(self, row: int, data: Dict, facet_property: str) -> None:
+        """
+        Add the facet values for a record.
+
+        Parameters
+        ----------
+        row: int
+            The position of the record
+        data: Dict
+            Node/edge data dictionary
+        facet_property: str
+            The property to facet on
+
+        """
+        if facet_property in data:
+            value = data[facet_property]
+            if isinstance(value, list):
+                for k in value:
+                    self.rows.append(row)
+                    self.codes.append(self.codebook.code(k))
+            else:
+                self.rows.append(row)
+                self.codes.append(self.codebook.code(value))
+        else:
+            self.rows.append(row)
+            self.codes.append(self.codebook.code(UNKNOWN))
+
+    def frame(self) -> pd.DataFrame:
+        """
+        Get the column as a pandas.DataFrame with columns ``row`` and ``value``.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The facet column
+
+        """
+        return pd.DataFrame({
+            'row': np.asarray(self.rows, dtype=np.int64),
+            'value': np.asarray(self.codes, dtype=np.int64)
+        })
+
+
+class ColumnarSummary(object):
+    """
+    Summarize a graph in a single scan over its nodes and edges.
+
+    Parameters
+    ----------
+    graph: kgx.graph.base_graph.BaseGraph
+        The graph
+    node_facet_properties: Optional[List]
+        A list of node properties to facet on. For example, ``['provided_by']``
+    edge_facet_properties: Optional[List]
+        A list of edge properties to facet on. For example, ``['provided_by']``
+
+    """
+
+    def __init__(self, graph: BaseGraph, node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None):
+        self.name = graph.name
+        self.node_facet_properties = list(node_facet_properties) if node_facet_properties else []
+        self.edge_facet_properties = list(edge_facet_properties) if edge_facet_properties else []
+        # categories and predicates share a codebook since
+        # count_by_spo keys are built from both
+        self.terms = Codebook()
+        self.sources = Codebook()
+        self.facet_values = Codebook()
+        self.unknown = self.terms.code(UNKNOWN)
+        self._scan_nodes(graph)
+        self._scan_edges(graph)
+
+    def _scan_nodes(self, graph: BaseGraph) -> None:
+        """
+        Extract node columns from the graph.
+
+        Parameters
+        ----------
+        graph: kgx.graph.base_graph.BaseGraph
+            The graph
+
+        """
+        terms = self.terms
+        sources = self.sources
+        ids = []
+        first_category: Dict[Any, int] = {}
+        category_rows: List[int] = []
+        category_codes: List[int] = []
+        source_rows: List[int] = []
+        source_codes: List[int] = []
+        facets = {x: FacetColumn(self.facet_values) for x in self.node_facet_properties}
+        missing_category = 0
+        missing_source = 0
+
+        for row, (n, data) in enumerate(graph.nodes(data=True)):
+            ids.append(n)
+            if 'provided_by' in data:
+                for s in data['provided_by']:
+                    source_rows.append(row)
+                    source_codes.append(sources.code(s))
+            else:
+                missing_source += 1
+
+            if 'category' not in data:
+                missing_category += 1
+                first_category[n] = self.unknown
+                continue
+            categories = data['category']
+            first_category[n] = terms.code(categories[0]) if categories else self.unknown
+            for category in categories:
+                category_rows.append(row)
+                category_codes.append(terms.code(category))
+            for facet_property, column in facets.items():
+                column.add(row, data, facet_property)
+
+        self.node_ids = ids
+        self.node_first_category = first_category
+        self.node_categories = pd.DataFrame({
+            'row': np.asarray(category_rows, dtype=np.int64),
+            'category': np.asarray(category_codes, dtype=np.int64)
+        })
+        self.node_sources = pd.DataFrame({
+            'row': np.asarray(source_rows, dtype=np.int64),
+            'source': np.asarray(source_codes, dtype=np.int64)
+        })
+        self.node_facets = {k: v.frame() for k, v in facets.items()}
+        self.nodes_missing_category = missing_category
+        self.nodes_missing_source = missing_source
+
+    def _scan_edges(self, graph: BaseGraph) -> None:
+        """
+        Extract edge columns from the graph.
+
+        Parameters
+        ----------
+        graph: kgx.graph.base_graph.BaseGraph
+            The graph
+
+        """
+        terms = self.terms
+        sources = self.sources
+        relations = Codebook()
+        first_category = self.node_first_category
+        unknown = self.unknown
+        subjects: List[int] = []
+        predicates: List[int] = []
+        objects: List[int] = []
+        has_predicate: List[bool] = []
+        relation_codes: List[int] = []
+        source_rows: List[int] = []
+        source_codes: List[int] = []
+        missing_source: List[bool] = []
+        facets = {x: FacetColumn(self.facet_values) for x in self.edge_facet_properties}
+
+        for row, (u, v, k, data) in enumerate(graph.edges(keys=True, data=True)):
+            subjects.append(first_category.get(u, unknown))
+            objects.append(first_category.get(v, unknown))
+            if 'predicate' in data:
+                predicates.append(terms.code(data['predicate']))
+                has_predicate.append(True)
+            else:
+                predicates.append(unknown)
+                has_predicate.append(False)
+            relation_codes.append(relations.code(data['relation']) if 'relation' in data else -1)
+            if 'provided_by' in data:
+                missing_source.append(False)
+                for s in data['provided_by']:
+                    source_rows.append(row)
+                    source_codes.append(sources.code(s))
+            else:
+                missing_source.append(True)
+            for facet_property, column in facets.items():
+                column.add(row, data, facet_property)
+
+        self.relations = relations
+        self.edges = pd.DataFrame({
+            'subject': np.asarray(subjects, dtype=np.int64),
+            'predicate': np.asarray(predicates, dtype=np.int64),
+            'object': np.asarray(objects, dtype=np.int64),
+            'has_predicate': np.asarray(has_predicate, dtype=bool),
+            'relation': np.asarray(relation_codes, dtype=np.int64),
+            'missing_source': np.asarray(missing_source, dtype=bool)
+        })
+        self.edge_sources = pd.DataFrame({
+            'row': np.asarray(source_rows, dtype=np.int64),
+            'source': np.asarray(source_codes, dtype=np.int64)
+        })
+        self.edge_facets = {k: v.frame() for k, v in facets.items()}
+
+    def graph_stats(self, name: Optional[str] = None) -> Dict:
+        """
+        Get the ``graph-summary`` stats for the graph.
+
+        Parameters
+        ----------
+        name: Optional[str]
+            Name for the graph
+
+        Returns
+        -------
+        Dict
+            The stats dictionary
+
+        """
+        return {
+            'graph_name': name if name else self.name,
+            'node_stats': self.node_stats(),
+            'edge_stats': self.edge_stats()
+        }
+
+    def node_stats(self) -> Dict:
+        """
+        Get the ``graph-summary`` stats for the nodes in the graph.
+
+        Returns
+        -------
+        Dict
+            The node stats
+
+        """
+        count_by_category: Dict = {UNKNOWN: {'count': self.nodes_missing_category}}
+        counts = self.node_categories.groupby('category', sort=False).size()
+        for code, count in counts.items():
+            _add_count(count_by_category, self.terms.decode(code), count)
+        stats: Dict = {
+            'total_nodes': len(self.node_ids),
+            'node_categories': sorted(self.terms.decode(x) for x in counts.index),
+            'count_by_category': count_by_category
+        }
+        for facet_property, facet in self.node_facets.items():
+            merged = self.node_categories.merge(facet, on='row')
+            stats[facet_property] = self._facet_counts(merged, ['category'], facet_property, count_by_category, lambda x: self.terms.decode(x[0]))
+        return stats
+
+    def edge_stats(self) -> Dict:
+        """
+        Get the ``graph-summary`` stats for the edges in the graph.
+
+        Returns
+        -------
+        Dict
+            The edge stats
+
+        """
+        edges = self.edges
+        with_predicate = edges[edges['has_predicate']]
+        count_by_predicates: Dict = {UNKNOWN: {'count': int(len(edges) - len(with_predicate))}}
+        counts = with_predicate.groupby('predicate', sort=False).size()
+        for code, count in counts.items():
+            _add_count(count_by_predicates, self.terms.decode(code), count)
+
+        count_by_spo: Dict = {}
+        spo_columns = ['subject', 'predicate', 'object']
+        for key, count in edges.groupby(spo_columns, sort=False).size().items():
+            _add_count(count_by_spo, self._spo_key(key), count)
+
+        stats: Dict = {
+            'total_edges': len(edges),
+            'predicates': sorted(self.terms.decode(x) for x in counts.index),
+            'count_by_predicates': count_by_predicates,
+            'count_by_spo': count_by_spo
+        }
+        for facet_property, facet in self.edge_facets.items():
+            values = set()
+            merged = with_predicate[['predicate']].merge(facet, left_index=True, right_on='row')
+            values.update(self._facet_counts(merged, ['predicate'], facet_property, count_by_predicates, lambda x: self.terms.decode(x[0])))
+            merged = edges[spo_columns].merge(facet, left_index=True, right_on='row')
+            values.update(self._facet_counts(merged, spo_columns, facet_property, count_by_spo, self._spo_key))
+            stats[facet_property] = sorted(values)
+        return stats
+
+    def _spo_key(self, key: Tuple[int, int, int]) -> str:
+        """
+        Get the ``count_by_spo`` key for a (subject category, predicate, object category) triple of codes.
+        """
+        return f"{self.terms.decode(key[0])}-{self.terms.decode(key[1])}-{self.terms.decode(key[2])}"
+
+    def _facet_counts(self, merged: pd.DataFrame, by: List[str], facet_property: str, counts: Dict, decode) -> List:
+        """
+        Record facet counts for ``counts[y][facet_property]`` where ``y`` is the
+        decoded group key, and return the facet values seen.
+        """
+        values = []
+        for key, count in merged.groupby(by + ['value'], sort=False).size().items():
+            value = self.facet_values.decode(key[-1])
+            y = decode(key[:-1])
+            if facet_property not in counts[y]:
+                counts[y][facet_property] = {}
+            _add_count(counts[y][facet_property], value, count)
+            values.append(value)
+        return sorted(set(values))
+
+    def knowledge_map(self, name: Optional[str] = None) -> Dict:
+        """
+        Get the TRAPI knowledge map for the graph.
+
+        Parameters
+        ----------
+        name: Optional[str]
+            Name for the graph
+
+        Returns
+        -------
+        Dict
+            A knowledge map dictionary corresponding to the graph
+
+        """
+        graph_stats: Dict = {
+            'knowledge_map': {
+                'nodes': self.knowledge_map_nodes(),
+                'edges': self.knowledge_map_edges()
+            }
+        }
+        if name:
+            graph_stats['name'] = name
+        return graph_stats
+
+    def knowledge_map_nodes(self) -> Dict:
+        """
+        Get the knowledge map summary for the nodes in the graph.
+
+        Returns
+        -------
+        Dict
+            The node stats
+
+        """
+        ids = pd.Series(self.node_ids, dtype=object)
+        is_curie = ids.map(lambda x: isinstance(x, str)) & ids.str.match(CURIE_PATTERN, na=False)
+        prefixes = ids[is_curie].str.split(':', n=1).str[0].unique().tolist()
+        if not is_curie.all():
+            prefixes.append(None)
+        count_by_source: Dict = {UNKNOWN: self.nodes_missing_source}
+        for code, count in self.node_sources.groupby('source', sort=False).size().items():
+            s = self.sources.decode(code)
+            count_by_source[s] = count_by_source.get(s, 0) + int(count)
+        return {
+            'id_prefixes': prefixes,
+            'count': len(self.node_ids),
+            'count_by_source': count_by_source
+        }
+
+    def knowledge_map_edges(self) -> List[Dict]:
+        """
+        Get the knowledge map summary for the edges in the graph.
+
+        Returns
+        -------
+        List[Dict]
+            The edge stats
+
+        """
+        edges = self.edges
+        spo_columns = ['subject', 'predicate', 'object']
+        association_map: Dict = {}
+        for key, group in edges.groupby(spo_columns, sort=False):
+            relations = group['relation']
+            association_map[key] = {
+                'subject': self.terms.decode(key[0]),
+                'predicate': self.terms.decode(key[1]),
+                'object': self.terms.decode(key[2]),
+                'relations': [self.relations.decode(x) for x in relations[relations >= 0].unique()],
+                'count': len(group),
+                'count_by_source': {UNKNOWN: int(group['missing_source'].sum())}
+            }
+        merged = edges[spo_columns].merge(self.edge_sources, left_index=True, right_on='row')
+        for key, count in merged.groupby(spo_columns + ['source'], sort=False).size().items():
+            count_by_source = association_map[key[:-1]]['count_by_source']
+            s = self.sources.decode(key[-1])
+            count_by_source[s] = count_by_source.get(s, 0) + int(count)
+        return list(association_map.values())
+
+
+def _add_count(counts: Dict, key: Any, count: int) -> None:
+    """
+    Add ``count`` to ``counts[key]['count']``.
+    """
+    if key in counts:
+        counts[key]['count'] += int(count)
+    else:
+        counts[key] = {'count': int(count)}
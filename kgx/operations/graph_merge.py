@@ -4,6 +4,8 @@ from typing import List
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
 from kgx.utils.kgx_utils import prepare_data_dict
+from kgx.utils.metrics_utils import span
+from kgx.utils.progress_utils import iter_progress
 
 
 log = get_logger()
@@ -47,10 +49,13 @@ def merge_all_graphs(graphs: List[BaseGraph], preserve: bool = True) -> BaseGrap
         The merged graph
 
     """
-    graph_size = [len(x.edges()) for x in graphs]
-    largest = graphs.pop(graph_size.index(max(graph_size)))
-    log.debug(f"Largest graph {largest.name} has {len(largest.nodes())} nodes and {len(largest.edges())} edges")
-    merged_graph = merge_graphs(largest, graphs, preserve)
+    with span('merge', graphs=len(graphs)) as s:
+        graph_size = [len(x.edges()) for x in graphs]
+        if s.recording:
+            s.add(records=sum(graph_size) + sum(len(x.nodes()) for x in graphs))
+        largest = graphs.pop(graph_size.index(max(graph_size)))
+        log.debug(f"Largest graph {largest.name} has {len(largest.nodes())} nodes and {len(largest.edges())} edges")
+        merged_graph = merge_graphs(largest, graphs, preserve)
     return merged_graph
 
 
@@ -102,7 +107,7 @@ def add_all_nodes(g1: BaseGraph, g2: BaseGraph, preserve: bool = True) -> int:
     """
     log.info(f"Adding {g2.number_of_nodes()} nodes from {g2.name} to {g1.name}")
     merge_count = 0
-    for n, data in g2.nodes(data=True):
+    for n, data in iter_progress(g2.nodes(data=True), f"Merging nodes of {g2.name}", g2.number_of_nodes):
         if n in g1.nodes():
             merge_node(g1, n, data, preserve)
             merge_count += 1
@@ -159,7 +164,7 @@ def add_all_edges(g1: BaseGraph, g2: BaseGraph, preserve: bool = True) -> int:
     """
     log.info(f"Adding {g2.number_of_edges()} edges from {g2} to {g1}")
     merge_count = 0
-    for u, v, key, data in g2.edges(keys=True, data=True):
+    for u, v, key, data in iter_progress(g2.edges(keys=True, data=True), f"Merging edges of {g2.name}", g2.number_of_edges):
         if g1.has_edge(u, v, key):
             merge_edge(g1, u, v, key, data, preserve)
             merge_count += 1
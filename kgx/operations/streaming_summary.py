@@ -0,0 +1,534 @@
+import re
+from collections import Counter
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+from kgx.config import get_logger
+from kgx.graph.base_graph import BaseGraph, EdgeKey
+from kgx.utils.sketch_utils import GroupedFacetSketch
+
+"""
+Summarize a graph while its files are being parsed, without loading the graph into memory.
+
+A first pass over node files builds a compact map of node identifier to its interned
+categories, and counts node facet values by category. A second pass over edge files
+looks up the first category of subject and object from this map and accumulates counts
+by predicate and by (subject category, predicate, object category).
+
+Partial summaries can be merged and thus multiple input files can be summarized
+in parallel worker processes.
+
+.. note::
+    Nodes are deduplicated by their identifier, where the categories of the last
+    record win. Node facet values are counted when a node is first seen in a file,
+    under the categories of that record, since only the categories of each node are
+    kept. Edges are counted per record. A file that has the same edge more than once
+    will thus have a higher edge count than the graph built from the same file, and
+    so will node facet counts for a node that is in more than one file.
+    As in the graph, subjects and objects of edges that are not in the node files
+    are counted as nodes without a category.
+
+In approximate mode, facet values are not counted exactly. Instead, each facet
+is tracked with a mergeable sketch (see ``kgx.utils.sketch_utils``) that estimates
+the number of distinct values and the most frequent values, for each category,
+predicate or (subject category, predicate, object category). Value frequencies
+are estimated with one fixed size sketch per facet, and each group only takes
+about 1 KiB, which keeps memory small for high-cardinality facets like
+``publications``.
+
+"""
+
+log = get_logger()
+
+UNKNOWN = 'unknown'
+
+# formats whose transformers hand off each record to the graph as it is parsed
+STREAMING_FORMATS = {'tsv', 'csv', 'tar', 'json', 'jsonl'}
+
+_node_categories: Optional[Dict[str, Optional[Tuple]]] = None
+
+
+def get_facet_values(data: Dict, facet_property: str) -> Tuple:
+    """
+    Get the values of ``facet_property`` to count for a node or an edge.
+
+    Parameters
+    ----------
+    data: Dict
+        Node/edge data dictionary
+    facet_property: str
+        The property to facet on
+
+    Returns
+    -------
+    Tuple
+        The facet values
+
+    """
+    if facet_property in data:
+        value = data[facet_property]
+        if isinstance(value, list):
+            return tuple(value)
+        return (value,)
+    return (UNKNOWN,)
+
+
+class StreamingSummary(object):
+    """
+    A mergeable summary that is built one node and one edge at a time.
+
+    Parameters
+    ----------
+    node_facet_properties: Optional[List]
+        A list of node properties to facet on. For example, ``['provided_by']``
+    edge_facet_properties: Optional[List]
+        A list of edge properties to facet on. For example, ``['provided_by']``
+    node_categories: Optional[Dict[str, Optional[Tuple]]]
+        A map of node identifier to node categories from a previous pass over node files
+    approximate: bool
+        Whether to estimate facet statistics with sketches instead of counting every value
+    top_k: int
+        Number of most frequent values to report per facet, in approximate mode
+
+    """
+
+    def __init__(self, node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None, node_categories: Optional[Dict[str, Optional[Tuple]]] = None, approximate: bool = False, top_k: int = 10):
+        self.node_facet_properties = list(node_facet_properties) if node_facet_properties else []
+        self.edge_facet_properties = list(edge_facet_properties) if edge_facet_properties else []
+        self.approximate = approximate
+        self.top_k = top_k
+        self.node_categories: Dict[str, Optional[Tuple]] = node_categories if node_categories is not None else {}
+        self.dangling_nodes: Set[str] = set()
+        self._interned: Dict[Tuple, Tuple] = {}
+        self.total_edges = 0
+        self.missing_predicate = 0
+        self.node_facets: Counter = Counter()
+        self.count_by_predicates: Counter = Counter()
+        self.count_by_spo: Counter = Counter()
+        self.predicate_facets: Counter = Counter()
+        self.spo_facets: Counter = Counter()
+        # a sketch for each facet property, of its values by category, predicate and (subject category, predicate, object category)
+        self.node_sketches: Dict[str, GroupedFacetSketch] = {}
+        self.predicate_sketches: Dict[str, GroupedFacetSketch] = {}
+        self.spo_sketches: Dict[str, GroupedFacetSketch] = {}
+
+    def _intern(self, categories: Optional[Tuple]) -> Optional[Tuple]:
+        """
+        Get the canonical instance of a tuple of node categories.
+        """
+        if categories is None:
+            return None
+        return self._interned.setdefault(categories, categories)
+
+    def add_node(self, node: str, data: Dict) -> None:
+        """
+        Add a node to the summary.
+
+        Parameters
+        ----------
+        node: str
+            Node identifier
+        data: Dict
+            Node properties
+
+        """
+        seen = node in self.node_categories
+        categories = self._intern(tuple(data['category']) if 'category' in data else None)
+        self.node_categories[node] = categories
+        if seen or not categories:
+            # facet values are counted for the first record of a node only
+            return
+        for facet_property in self.node_facet_properties:
+            values = get_facet_values(data, facet_property)
+            for category in categories:
+                if self.approximate:
+                    self._add_to_sketch(self.node_sketches, facet_property, category, values)
+                    continue
+                for v in values:
+                    self.node_facets[(category, facet_property, v)] += 1
+
+    def _add_to_sketch(self, sketches: Dict[str, GroupedFacetSketch], facet_property: str, group: str, values: Tuple) -> None:
+        """
+        Add facet values of a group to the sketch for ``facet_property``, creating the sketch if needed.
+        """
+        if facet_property not in sketches:
+            # the totals of edge facets are from the (subject category, predicate, object category) sketches
+            sketches[facet_property] = GroupedFacetSketch(self.top_k, total=sketches is not self.predicate_sketches)
+        sketch = sketches[facet_property]
+        for v in values:
+            sketch.add(group, v)
+
+    def first_category(self, node: str) -> str:
+        """
+        Get the first category for a node, from the node categories.
+
+        Parameters
+        ----------
+        node: str
+            Node identifier
+
+        Returns
+        -------
+        str
+            The first category, or ``unknown``
+
+        """
+        categories = self.node_categories.get(node)
+        if categories:
+            return categories[0]
+        return UNKNOWN
+
+    def add_edge(self, subject_node: str, object_node: str, data: Dict) -> None:
+        """
+        Add an edge to the summary.
+
+        Parameters
+        ----------
+        subject_node: str
+            The subject (source) node
+        object_node: str
+            The object (target) node
+        data: Dict
+            Edge properties
+
+        """
+        self.total_edges += 1
+        facets = [(x, get_facet_values(data, x)) for x in self.edge_facet_properties]
+        if 'predicate' in data:
+            edge_predicate = data['predicate']
+            self.count_by_predicates[edge_predicate] += 1
+            for facet_property, values in facets:
+                if self.approximate:
+                    self._add_to_sketch(self.predicate_sketches, facet_property, edge_predicate, values)
+                    continue
+                for v in values:
+                    self.predicate_facets[(edge_predicate, facet_property, v)] += 1
+        else:
+            edge_predicate = UNKNOWN
+            self.missing_predicate += 1
+
+        for node in (subject_node, object_node):
+            if node not in self.node_categories:
+                self.dangling_nodes.add(node)
+        spo = (self.first_category(subject_node), edge_predicate, self.first_category(object_node))
+        self.count_by_spo[spo] += 1
+        for facet_property, values in facets:
+            if self.approximate:
+                self._add_to_sketch(self.spo_sketches, facet_property, _spo_key(spo), values)
+                continue
+            for v in values:
+                self.spo_facets[(spo, facet_property, v)] += 1
+
+    def merge(self, other: 'StreamingSummary') -> 'StreamingSummary':
+        """
+        Merge another summary into this summary.
+
+        Node categories from ``other`` take precedence over existing categories
+        for the same node.
+
+        Parameters
+        ----------
+        other: kgx.operations.streaming_summary.StreamingSummary
+            The summary to merge
+
+        Returns
+        -------
+        kgx.operations.streaming_summary.StreamingSummary
+            This summary
+
+        """
+        if other.node_categories is not self.node_categories:
+            for n, categories in other.node_categories.items():
+                self.node_categories[n] = self._intern(categories)
+        self.node_facets.update(other.node_facets)
+        self.dangling_nodes.update(other.dangling_nodes)
+        self.total_edges += other.total_edges
+        self.missing_predicate += other.missing_predicate
+        self.count_by_predicates.update(other.count_by_predicates)
+        self.count_by_spo.update(other.count_by_spo)
+        self.predicate_facets.update(other.predicate_facets)
+        self.spo_facets.update(other.spo_facets)
+        for sketches, other_sketches in [
+            (self.node_sketches, other.node_sketches),
+            (self.predicate_sketches, other.predicate_sketches),
+            (self.spo_sketches, other.spo_sketches)
+        ]:
+            for key, sketch in other_sketches.items():
+                if key in sketches:
+                    sketches[key].merge(sketch)
+                else:
+                    sketches[key] = sketch
+        return self
+
+    def graph_stats(self, name: Optional[str] = None) -> Dict:
+        """
+        Get the ``graph-summary`` stats.
+
+        Parameters
+        ----------
+        name: Optional[str]
+            Name for the graph
+
+        Returns
+        -------
+        Dict
+            The stats dictionary
+
+        """
+        return {
+            'graph_name': name,
+            'node_stats': self.node_stats(),
+            'edge_stats': self.edge_stats()
+        }
+
+    def node_stats(self) -> Dict:
+        """
+        Get the ``graph-summary`` stats for nodes.
+
+        Returns
+        -------
+        Dict
+            The node stats
+
+        """
+        # nodes that are only referenced by edges have no category
+        dangling_nodes = len(self.dangling_nodes.difference(self.node_categories))
+        count_by_category: Dict = {UNKNOWN: {'count': dangling_nodes}}
+        for categories, count in Counter(self.node_categories.values()).items():
+            if categories is None:
+                count_by_category[UNKNOWN]['count'] += count
+                continue
+            for category in categories:
+                if category in count_by_category:
+                    count_by_category[category]['count'] += count
+                else:
+                    count_by_category[category] = {'count': count}
+        facet_values: Dict[str, set] = {x: set() for x in self.node_facet_properties}
+        for (category, facet_property, v), count in self.node_facets.items():
+            _add_facet_count(count_by_category[category], facet_property, v, count)
+            facet_values[facet_property].add(v)
+
+        stats: Dict = {
+            'total_nodes': len(self.node_categories) + dangling_nodes,
+            'node_categories': sorted({c for x in self.node_categories.values() if x for c in x}),
+            'count_by_category': count_by_category
+        }
+        for facet_property, values in facet_values.items():
+            stats[facet_property] = sorted(values)
+        if self.approximate:
+            _add_sketch_stats(count_by_category, self.node_sketches)
+            stats.update(_sketch_totals(self.node_sketches, self.node_facet_properties))
+        return stats
+
+    def edge_stats(self) -> Dict:
+        """
+        Get the ``graph-summary`` stats for edges.
+
+        Returns
+        -------
+        Dict
+            The edge stats
+
+        """
+        count_by_predicates: Dict = {UNKNOWN: {'count': self.missing_predicate}}
+        for p, count in self.count_by_predicates.items():
+            if p in count_by_predicates:
+                count_by_predicates[p]['count'] += count
+            else:
+                count_by_predicates[p] = {'count': count}
+        count_by_spo: Dict = {}
+        for spo, count in self.count_by_spo.items():
+            key = _spo_key(spo)
+            if key in count_by_spo:
+                count_by_spo[key]['count'] += count
+            else:
+                count_by_spo[key] = {'count': count}
+
+        facet_values: Dict[str, set] = {x: set() for x in self.edge_facet_properties}
+        for (p, facet_property, v), count in self.predicate_facets.items():
+            _add_facet_count(count_by_predicates[p], facet_property, v, count)
+            facet_values[facet_property].add(v)
+        for (spo, facet_property, v), count in self.spo_facets.items():
+            _add_facet_count(count_by_spo[_spo_key(spo)], facet_property, v, count)
+            facet_values[facet_property].add(v)
+
+        stats: Dict = {
+            'total_edges': self.total_edges,
+            'predicates': sorted(self.count_by_predicates.keys()),
+            'count_by_predicates': count_by_predicates,
+            'count_by_spo': count_by_spo
+        }
+        for facet_property, values in facet_values.items():
+            stats[facet_property] = sorted(values)
+        if self.approximate:
+            _add_sketch_stats(count_by_predicates, self.predicate_sketches)
+            _add_sketch_stats(count_by_spo, self.spo_sketches)
+            # every edge is counted towards exactly one (subject category, predicate, object category)
+            stats.update(_sketch_totals(self.spo_sketches, self.edge_facet_properties))
+        return stats
+
+
+class SummaryGraph(BaseGraph):
+    """
+    A write-only graph that hands off nodes and edges to a
+    StreamingSummary instead of storing them.
+
+    Parameters
+    ----------
+    summary: kgx.operations.streaming_summary.StreamingSummary
+        The summary to update
+    nodes: bool
+        Whether to add nodes to the summary
+    edges: bool
+        Whether to add edges to the summary
+
+    """
+
+    def __init__(self, summary: StreamingSummary, nodes: bool = True, edges: bool = True):
+        super().__init__()
+        self.summary = summary
+        self.accept_nodes = nodes
+        self.accept_edges = edges
+
+    def add_node(self, node: str, **kwargs: Any) -> None:
+        if self.accept_nodes:
+            self.summary.add_node(node, kwargs['data'] if 'data' in kwargs else kwargs)
+
+    def add_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None, **kwargs: Any) -> None:
+        if self.accept_edges:
+            self.summary.add_edge(subject_node, object_node, kwargs['data'] if 'data' in kwargs else kwargs)
+
+    def has_node(self, node: str) -> bool:
+        return node in self.summary.node_categories
+
+
+def summarize_files(inputs: List[str], input_format: str, input_compression: Optional[str] = None, node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None, processes: int = 1, approximate: bool = False, top_k: int = 10) -> StreamingSummary:
+    """
+    Summarize a set of input files without loading them into a graph.
+
+    Node files are summarized first, followed by edge files.
+    Files that contain both nodes and edges (like a ``tar`` archive or a ``json``)
+    are read once in each pass.
+
+    Parameters
+    ----------
+    inputs: List[str]
+        Input files
+    input_format: str
+        Input file format
+    input_compression: Optional[str]
+        The input compression type
+    node_facet_properties: Optional[List]
+        A list of node properties to facet on. For example, ``['provided_by']``
+    edge_facet_properties: Optional[List]
+        A list of edge properties to facet on. For example, ``['provided_by']``
+    processes: int
+        Number of processes to use
+    approximate: bool
+        Whether to estimate facet statistics with sketches instead of counting every value
+    top_k: int
+        Number of most frequent values to report per facet, in approximate mode
+
+    Returns
+    -------
+    kgx.operations.streaming_summary.StreamingSummary
+        The summary
+
+    """
+    if input_format not in STREAMING_FORMATS:
+        raise TypeError(f"format '{input_format}' does not support streaming summary")
+    extension = input_format.split(':')[0]
+    node_files = [x for x in inputs if not re.search(f'edges.{extension}', x)]
+    edge_files = [x for x in inputs if not re.search(f'nodes.{extension}', x)]
+
+    node_args = [(x, input_format, input_compression, node_facet_properties, edge_facet_properties, True, approximate, top_k) for x in node_files]
+    summary = StreamingSummary(node_facet_properties, edge_facet_properties, approximate=approximate, top_k=top_k)
+    for partial in _map(_summarize_file, node_args, processes):
+        summary.merge(partial)
+    log.info(f"Summarized {len(summary.node_categories)} nodes from {len(node_files)} file(s)")
+
+    edge_args = [(x, input_format, input_compression, node_facet_properties, edge_facet_properties, False, approximate, top_k) for x in edge_files]
+    for partial in _map(_summarize_file, edge_args, processes, summary.node_categories):
+        summary.merge(partial)
+    log.info(f"Summarized {summary.total_edges} edges from {len(edge_files)} file(s)")
+    return summary
+
+
+def _map(f, args: List[Tuple], processes: int, node_categories: Optional[Dict[str, Optional[Tuple]]] = None) -> List[StreamingSummary]:
+    """
+    Apply ``f`` on each of ``args``, in worker processes if ``processes`` is more than 1.
+    """
+    if processes > 1 and len(args) > 1:
+        pool = Pool(processes=processes, initializer=_set_node_categories, initargs=(node_categories,))
+        results = pool.starmap(f, args)
+        pool.close()
+        pool.join()
+    else:
+        _set_node_categories(node_categories)
+        results = [f(*x) for x in args]
+        _set_node_categories(None)
+    return results
+
+
+def _set_node_categories(node_categories: Optional[Dict[str, Optional[Tuple]]]) -> None:
+    """
+    Set the node categories used for looking up subject and object categories in a process.
+    """
+    global _node_categories
+    _node_categories = node_categories
+
+
+def _summarize_file(filename: str, input_format: str, input_compression: Optional[str], node_facet_properties: Optional[List], edge_facet_properties: Optional[List], nodes: bool, approximate: bool = False, top_k: int = 10) -> StreamingSummary:
+    """
+    Summarize either the nodes or the edges from a single file.
+    """
+    from kgx.cli.cli_utils import get_transformer
+    if nodes:
+        summary = StreamingSummary(node_facet_properties, edge_facet_properties, approximate=approximate, top_k=top_k)
+    else:
+        summary = StreamingSummary(node_facet_properties, edge_facet_properties, node_categories=_node_categories, approximate=approximate, top_k=top_k)
+    transformer = get_transformer(input_format)(SummaryGraph(summary, nodes=nodes, edges=not nodes))
+    transformer.parse(filename, input_format=input_format, compression=input_compression)
+    if not nodes:
+        # node categories are owned by the caller
+        summary.node_categories = {}
+    return summary
+
+
+def _spo_key(spo: Tuple) -> str:
+    """
+    Get the ``count_by_spo`` key for a (subject category, predicate, object category) triple.
+    """
+    return f"{spo[0]}-{spo[1]}-{spo[2]}"
+
+
+def _add_facet_count(stats: Dict, facet_property: str, value: Any, count: int) -> None:
+    """
+    Add ``count`` to ``stats[facet_property][value]['count']``.
+    """
+    if facet_property not in stats:
+        stats[facet_property] = {}
+    if value in stats[facet_property]:
+        stats[facet_property][value]['count'] += count
+    else:
+        stats[facet_property][value] = {'count': count}
+
+
+def _add_sketch_stats(stats: Dict, sketches: Dict[str, GroupedFacetSketch]) -> None:
+    """
+    Set ``stats[group][facet_property]`` from the sketch for each facet_property.
+    """
+    for facet_property, sketch in sketches.items():
+        for group in sketch.groups:
+            stats[group][facet_property] = sketch.as_dict(group)
+
+
+def _sketch_totals(sketches: Dict[str, GroupedFacetSketch], facet_properties: List) -> Dict:
+    """
+    Get the stats for each facet property across all groups.
+    """
+    totals = {}
+    for facet_property in facet_properties:
+        sketch = sketches.get(facet_property)
+        totals[facet_property] = sketch.total.as_dict() if sketch and sketch.total else {'distinct_values': 0, 'top_values': {}}
+    return totals
@@ -2,6 +2,8 @@ import yaml
 from typing import Dict, List, Optional
 
 from kgx.graph.base_graph import BaseGraph
+from kgx.operations.columnar_summary import ColumnarSummary
+from kgx.operations.streaming_summary import StreamingSummary
 
 TOTAL_NODES = 'total_nodes'
 NODE_CATEGORIES = 'node_categories'
@@ -38,10 +40,14 @@ def generate_graph_stats(graph: BaseGraph, graph_name: str, filename: str, node_
     yaml.dump(stats, WH)
 
 
-def summarize_graph(graph: BaseGraph, name: str = None, node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None) -> Dict:
+def summarize_graph(graph: BaseGraph, name: str = None, node_facet_properties: Optional[List] = None, edge_facet_properties: Optional[List] = None, approximate: bool = False, top_k: int = 10) -> Dict:
     """
     Summarize the entire graph.
 
+    In approximate mode, each facet is reported as the estimated number of
+    distinct values and the ``top_k`` most frequent values with their estimated counts,
+    using a fixed amount of memory per facet, and a small amount per category and predicate.
+
     Parameters
     ----------
     graph: kgx.graph.base_graph.BaseGraph
@@ -52,6 +58,10 @@ def summarize_graph(graph: BaseGraph, name: str = None, node_facet_properties: O
         A list of properties to facet on. For example, ``['provided_by']``
     edge_facet_properties: Optional[List]
         A list of properties to facet on. For example, ``['provided_by']``
+    approximate: bool
+        Whether to estimate facet statistics with sketches instead of counting every value
+    top_k: int
+        Number of most frequent values to report per facet, in approximate mode
 
     Returns
     -------
@@ -59,14 +69,15 @@ def summarize_graph(graph: BaseGraph, name: str = None, node_facet_properties: O
         The stats dictionary
 
     """
-    node_stats = summarize_nodes(graph, node_facet_properties)
-    edge_stats = summarize_edges(graph, edge_facet_properties)
-    stats = {
-        'graph_name': name if name else graph.name,
-        'node_stats': node_stats,
-        'edge_stats': edge_stats
-    }
-    return stats
+    if approximate:
+        streaming_summary = StreamingSummary(node_facet_properties, edge_facet_properties, approximate=True, top_k=top_k)
+        for n, data in graph.nodes(data=True):
+            streaming_summary.add_node(n, data)
+        for u, v, data in graph.edges(data=True):
+            streaming_summary.add_edge(u, v, data)
+        return streaming_summary.graph_stats(name)
+    summary = ColumnarSummary(graph, node_facet_properties, edge_facet_properties)
+    return summary.graph_stats(name)
 
 
 def summarize_nodes(graph: BaseGraph, facet_properties: Optional[List] = None) -> Dict:
@@ -86,38 +97,7 @@ def summarize_nodes(graph: BaseGraph, facet_properties: Optional[List] = None) -
         The node stats
 
     """
-    stats: Dict = {
-        TOTAL_NODES: 0,
-        NODE_CATEGORIES: set(),
-        COUNT_BY_CATEGORY: {'unknown': {'count': 0}}
-    }
-
-    stats[TOTAL_NODES] = len(graph.nodes())
-    if facet_properties:
-        for facet_property in facet_properties:
-            stats[facet_property] = set()
-
-    for n, data in graph.nodes(data=True):
-        if 'category' not in data:
-            stats[COUNT_BY_CATEGORY]['unknown']['count'] += 1
-            continue
-        categories = data['category']
-        stats[NODE_CATEGORIES].update(categories)
-        for category in categories:
-            if category in stats[COUNT_BY_CATEGORY]:
-                stats[COUNT_BY_CATEGORY][category]['count'] += 1
-            else:
-                stats[COUNT_BY_CATEGORY][category] = {'count': 1}
-
-            if facet_properties:
-                for facet_property in facet_properties:
-                    stats = get_facet_counts(data, stats, COUNT_BY_CATEGORY, category, facet_property)
-
-    stats[NODE_CATEGORIES] = sorted(list(stats[NODE_CATEGORIES]))
-    if facet_properties:
-        for facet_property in facet_properties:
-            stats[facet_property] = sorted(list(stats[facet_property]))
-    return stats
+    return ColumnarSummary(graph, node_facet_properties=facet_properties).node_stats()
 
 
 def summarize_edges(graph: BaseGraph, facet_properties: Optional[List] = None) -> Dict:
@@ -137,63 +117,7 @@ def summarize_edges(graph: BaseGraph, facet_properties: Optional[List] = None) -
         The edge stats
 
     """
-    stats: Dict = {
-        TOTAL_EDGES: 0,
-        EDGE_PREDICATES: set(),
-        COUNT_BY_EDGE_PREDICATES: {'unknown': {'count': 0}},
-        COUNT_BY_SPO: {}
-    }
-
-    stats[TOTAL_EDGES] = len(graph.edges())
-    if facet_properties:
-        for facet_property in facet_properties:
-            stats[facet_property] = set()
-
-    for u, v, k, data in graph.edges(keys=True, data=True):
-        if 'predicate' not in data:
-            stats[COUNT_BY_EDGE_PREDICATES]['unknown']['count'] += 1
-            edge_predicate = "unknown"
-        else:
-            edge_predicate = data['predicate']
-            stats[EDGE_PREDICATES].add(edge_predicate)
-            if edge_predicate in stats[COUNT_BY_EDGE_PREDICATES]:
-                stats[COUNT_BY_EDGE_PREDICATES][edge_predicate]['count'] += 1
-            else:
-                stats[COUNT_BY_EDGE_PREDICATES][edge_predicate] = {'count': 1}
-
-            if facet_properties:
-                for facet_property in facet_properties:
-                    stats = get_facet_counts(data, stats, COUNT_BY_EDGE_PREDICATES, edge_predicate, facet_property)
-
-        u_data = graph.nodes()[u]
-        v_data = graph.nodes()[v]
-
-        if 'category' in u_data:
-            u_category = u_data['category'][0]
-        else:
-            u_category = "unknown"
-
-        if 'category' in v_data:
-            v_category = v_data['category'][0]
-        else:
-            v_category = "unknown"
-
-        key = f"{u_category}-{edge_predicate}-{v_category}"
-        if key in stats[COUNT_BY_SPO]:
-            stats[COUNT_BY_SPO][key]['count'] += 1
-        else:
-            stats[COUNT_BY_SPO][key] = {'count': 1}
-
-        if facet_properties:
-            for facet_property in facet_properties:
-                stats = get_facet_counts(data, stats, COUNT_BY_SPO, key, facet_property)
-
-    stats[EDGE_PREDICATES] = sorted(list(stats[EDGE_PREDICATES]))
-    if facet_properties:
-        for facet_property in facet_properties:
-            stats[facet_property] = sorted(list(stats[facet_property]))
-
-    return stats
+    return ColumnarSummary(graph, edge_facet_properties=facet_properties).edge_stats()
 
 
 def get_facet_counts(data: Dict, stats: Dict, x: str, y: str, facet_property: str) -> Dict:
@@ -1,5 +1,6 @@
 import re
-from typing import Dict, Optional, Any
+from types import MappingProxyType
+from typing import Dict, Optional, Mapping
 
 import prefixcommons.curie_util as cu
 from cachetools import LRUCache, cached
@@ -8,6 +9,92 @@ from kgx.config import get_jsonld_context, get_logger
 from kgx.utils.kgx_utils import contract, expand
 
 log = get_logger()
+prefix_map_cache: Dict[str, 'PrefixMap'] = {}
+
+
+class PrefixMap(object):
+    """
+    An immutable prefix map, compiled from a JSON-LD context.
+
+    A compiled prefix map is shared by all instances of PrefixManager that
+    use the same JSON-LD context, instead of being rebuilt for every instance.
+    A prefix map compiled from a named context is pickled by name, which makes
+    it cheap to send to worker processes.
+
+    Parameters
+    ----------
+    prefix_map: Mapping[str, str]
+        Prefix to IRI mappings
+    name: Optional[str]
+        The name of the JSON-LD context, as defined in the config
+
+    """
+    __slots__ = ('name', 'prefix_map', 'reverse_prefix_map')
+
+    def __init__(self, prefix_map: Mapping[str, str], name: Optional[str] = None):
+        self.name = name
+        self.prefix_map: Mapping[str, str] = MappingProxyType(dict(prefix_map))
+        self.reverse_prefix_map: Mapping[str, str] = MappingProxyType({y: x for x, y in self.prefix_map.items()})
+
+    def __reduce__(self):
+        if self.name:
+            return get_prefix_map, (self.name,)
+        return PrefixMap, (dict(self.prefix_map),)
+
+    @staticmethod
+    def compile(m: Dict, name: Optional[str] = None) -> 'PrefixMap':
+        """
+        Compile a prefix map from a JSON-LD context.
+
+        Parameters
+        ----------
+        m: Dict
+            Dictionary of prefix to URI mappings
+        name: Optional[str]
+            The name of the JSON-LD context, as defined in the config
+
+        Returns
+        -------
+        kgx.prefix_manager.PrefixMap
+            The compiled prefix map
+
+        """
+        prefix_map = {}
+        for k, v in m.items():
+            if isinstance(v, str):
+                prefix_map[k] = v
+        if 'biolink' not in prefix_map:
+            prefix_map['biolink'] = prefix_map['@vocab'] if '@vocab' in prefix_map else 'https://w3id.org/biolink/vocab/'
+        if '@vocab' in prefix_map:
+            del prefix_map['@vocab']
+        if 'MONARCH' not in prefix_map:
+            prefix_map['MONARCH'] = 'https://monarchinitiative.org/'
+            prefix_map['MONARCH_NODE'] = 'https://monarchinitiative.org/MONARCH_'
+        if '' not in prefix_map:
+            prefix_map[''] = PrefixManager.DEFAULT_NAMESPACE
+        return PrefixMap(prefix_map, name)
+
+
+def get_prefix_map(name: str = 'biolink') -> PrefixMap:
+    """
+    Get the compiled prefix map for a JSON-LD context.
+
+    The prefix map is compiled once per process and context.
+
+    Parameters
+    ----------
+    name: str
+        The name of the JSON-LD context, as defined in the config
+
+    Returns
+    -------
+    kgx.prefix_manager.PrefixMap
+        The compiled prefix map
+
+    """
+    if name not in prefix_map_cache:
+        prefix_map_cache[name] = PrefixMap.compile(get_jsonld_context(name), name)
+    return prefix_map_cache[name]
 
 
 class PrefixManager(object):
@@ -18,10 +105,10 @@ class PrefixManager(object):
     biolink types such as Disease
     """
     DEFAULT_NAMESPACE = 'https://www.example.org/UNKNOWN/'
-    prefix_map: Dict[str, str]
-    reverse_prefix_map: Dict[str, str]
+    prefix_map: Mapping[str, str]
+    reverse_prefix_map: Mapping[str, str]
 
-    def __init__(self, url: str = None):
+    def __init__(self, url: str = None, prefix_map: Optional[PrefixMap] = None):
         """
         Initialize an instance of PrefixManager.
 
@@ -29,13 +116,39 @@ class PrefixManager(object):
         ----------
         url: str
             The URL from which to read a JSON-LD context for prefix mappings
+        prefix_map: Optional[kgx.prefix_manager.PrefixMap]
+            A compiled prefix map to use, instead of the Biolink Model JSON-LD context
 
         """
         if url:
-            context = cu.read_remote_jsonld_context(url)
+            self.set_prefix_map(cu.read_remote_jsonld_context(url))
         else:
-            context = get_jsonld_context()
-        self.set_prefix_map(context)
+            self.use_prefix_map(prefix_map if prefix_map else get_prefix_map())
+
+    def __getstate__(self) -> Dict:
+        if isinstance(self.prefix_map, MappingProxyType):
+            return {'compiled': self.compiled}
+        return {'compiled': self.compiled, 'prefix_map': self.prefix_map, 'reverse_prefix_map': self.reverse_prefix_map}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.use_prefix_map(state['compiled'])
+        if 'prefix_map' in state:
+            self.prefix_map = state['prefix_map']
+            self.reverse_prefix_map = state['reverse_prefix_map']
+
+    def use_prefix_map(self, prefix_map: PrefixMap) -> None:
+        """
+        Use a compiled prefix map, without copying it.
+
+        Parameters
+        ----------
+        prefix_map: kgx.prefix_manager.PrefixMap
+            The compiled prefix map
+
+        """
+        self.compiled = prefix_map
+        self.prefix_map = prefix_map.prefix_map
+        self.reverse_prefix_map = prefix_map.reverse_prefix_map
 
     def set_prefix_map(self, m: Dict) -> None:
         """
@@ -47,37 +160,27 @@ class PrefixManager(object):
             Dictionary of prefix to URI mappings
 
         """
-        self.prefix_map = {}
-        for k, v in m.items():
-            if isinstance(v, str):
-                self.prefix_map[k] = v
-        if 'biolink' not in self.prefix_map:
-            self.prefix_map['biolink'] = self.prefix_map['@vocab'] if '@vocab' in self.prefix_map else 'https://w3id.org/biolink/vocab/'
-        if '@vocab' in self.prefix_map:
-            del self.prefix_map['@vocab']
-        if 'MONARCH' not in self.prefix_map:
-            self.prefix_map['MONARCH'] = 'https://monarchinitiative.org/'
-            self.prefix_map['MONARCH_NODE'] = 'https://monarchinitiative.org/MONARCH_'
-        if '' in self.prefix_map:
-            log.info(f"Replacing default prefix mapping from {self.prefix_map['']} to 'www.example.org/UNKNOWN/'")
-        else:
-            self.prefix_map[''] = self.DEFAULT_NAMESPACE
-
-        self.reverse_prefix_map: Optional[Dict[str, Any]] = {y: x for x, y in self.prefix_map.items()}
+        self.use_prefix_map(PrefixMap.compile(m))
 
     def update_prefix_map(self, m: Dict[str, str]) -> None:
         """
         Update prefix maps with new mappings.
 
+        The shared, compiled prefix map is copied before the first update.
+
         Parameters
         ----------
         m: Dict
             New prefix to IRI mappings
 
         """
+        prefix_map = self.prefix_map if isinstance(self.prefix_map, dict) else dict(self.prefix_map)
+        reverse_prefix_map = self.reverse_prefix_map if isinstance(self.reverse_prefix_map, dict) else dict(self.reverse_prefix_map)
         for k, v in m.items():
-            self.prefix_map[k] = v
-            self.reverse_prefix_map[v] = k
+            prefix_map[k] = v
+            reverse_prefix_map[v] = k
+        self.prefix_map = prefix_map
+        self.reverse_prefix_map = reverse_prefix_map
 
     @cached(LRUCache(maxsize=1024))
     def expand(self, curie: str, fallback: bool = True) -> str:
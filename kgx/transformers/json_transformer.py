@@ -1,13 +1,14 @@
-import gzip
-import json
 import stringcase
 
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
 from kgx.prefix_manager import PrefixManager
 from kgx.transformers.pandas_transformer import PandasTransformer
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
+from kgx.utils.compression_utils import open_file
+from kgx.utils.progress_utils import read_progress
+from kgx.utils.json_utils import dumps, loads
 from kgx.utils.kgx_utils import get_toolkit, get_biolink_element, format_biolink_slots
 
 log = get_logger()
@@ -27,7 +28,7 @@ class JsonTransformer(PandasTransformer):
     def __init__(self, source_graph: Optional[BaseGraph] = None):
         super().__init__(source_graph)
 
-    def parse(self, filename: str, input_format: str = 'json', compression: Optional[str] = None, provided_by: Optional[str] = None, **kwargs) -> None:
+    def parse(self, filename: str, input_format: str = 'json', compression: Optional[str] = None, provided_by: Optional[str] = None, properties: Optional[Set[str]] = None, **kwargs) -> None:
         """
         Parse a JSON file of the format,
 
@@ -43,24 +44,23 @@ class JsonTransformer(PandasTransformer):
         input_format: str
             The input file format (``json``, by default)
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         provided_by: Optional[str]
             Define the source providing the input file
+        properties: Optional[Set[str]]
+            The node and edge properties to load (all properties, by default).
+            See ``set_node_properties`` and ``set_edge_properties``
         kwargs: dict
             Any additional arguments
 
         """
         log.info("Parsing {}".format(filename))
+        self.compile_projection(properties)
         if provided_by:
             self.graph_metadata['provided_by'] = [provided_by]
-        if compression == 'gz':
-            with gzip.open(filename, 'rb') as FH:
-                obj = json.load(FH)
-                self.load(obj)
-        else:
-            with open(filename, 'r') as FH:
-                obj = json.load(FH)
-                self.load(obj)
+        with open_file(filename, 'rb', compression) as FH, read_progress(FH, filename, compression) as PH:
+            obj = loads(PH.read())
+            self.load(obj)
 
     def load(self, obj: Dict[str, Any]) -> None:
         """
@@ -127,7 +127,7 @@ class JsonTransformer(PandasTransformer):
             'edges': edges
         }
 
-    def save(self, filename: str, output_format: str = 'json', compression: Optional[str] = None, **kwargs) -> str:
+    def save(self, filename: str, output_format: str = 'json', compression: Optional[str] = None, **kwargs: Any) -> str:
         """
         Write an instance of BaseGraph to a file as JSON.
 
@@ -138,9 +138,9 @@ class JsonTransformer(PandasTransformer):
         output_format: str
             The output file format (``json``, by default)
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         kwargs: dict
-            Any additional arguments
+            Any additional arguments. ``compact=True`` writes compact JSON, without indentation
 
         Returns
         -------
@@ -149,12 +149,8 @@ class JsonTransformer(PandasTransformer):
 
         """
         obj = self.export()
-        if compression == 'gz':
-            with gzip.open(filename, 'wb') as WH:
-                WH.write(json.dumps(obj, indent=4, sort_keys=True))
-        else:
-            with open(filename, 'w') as WH:
-                WH.write(json.dumps(obj, indent=4, sort_keys=True))
+        with open_file(filename, 'wb', compression) as WH:
+            WH.write(dumps(obj, indent=None if kwargs.get('compact') else 4, sort_keys=True))
         return filename
 
 
@@ -172,7 +168,7 @@ class ObographJsonTransformer(JsonTransformer):
         self.prefix_manager = PrefixManager()
         self.ecache: Dict = {}
 
-    def parse(self, filename: str, input_format: str = 'json', compression: Optional[str] = None, provided_by: Optional[str] = None, **kwargs) -> None:
+    def parse(self, filename: str, input_format: str = 'json', compression: Optional[str] = None, provided_by: Optional[str] = None, properties: Optional[Set[str]] = None, **kwargs) -> None:
         """
         Parse Obograph JSON file of the format,
 
@@ -206,24 +202,23 @@ class ObographJsonTransformer(JsonTransformer):
         input_format: str
             The input file format (``json``, by default)
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         provided_by: Optional[str]
             Define the source providing the input file
+        properties: Optional[Set[str]]
+            The node and edge properties to load (all properties, by default).
+            See ``set_node_properties`` and ``set_edge_properties``
         kwargs: dict
             Any additional arguments
 
         """
         log.info("Parsing {}".format(filename))
+        self.compile_projection(properties)
         if provided_by:
             self.graph_metadata['provided_by'] = [provided_by]
-        if compression == 'gz':
-            with gzip.open(filename, 'rb') as FH:
-                obj = json.load(FH)
-                self.load(obj['graphs'][0])
-        else:
-            with open(filename, 'r') as FH:
-                obj = json.load(FH)
-                self.load(obj['graphs'][0])
+        with open_file(filename, 'rb', compression) as FH, read_progress(FH, filename, compression) as PH:
+            obj = loads(PH.read())
+            self.load(obj['graphs'][0])
 
     def load_node(self, node: Dict) -> None:
         """
@@ -270,7 +265,7 @@ class ObographJsonTransformer(JsonTransformer):
             #     self.graph.add_edge(fixed_node['id'], n, **data)
         super().load_node(fixed_node)
 
-    def load_edge(self, edge: dict) -> None:
+    def load_edge(self, edge: dict, check_categories: bool = True) -> None:
         """
         Load an edge from Obograph JSON into an instance of BaseGraph
 
@@ -278,6 +273,8 @@ class ObographJsonTransformer(JsonTransformer):
         ----------
         edge : dict
             An edge
+        check_categories: bool
+            Whether to check the ``subject_category`` and ``object_category`` edge filters
 
         """
         fixed_edge = dict()
@@ -322,7 +319,7 @@ class ObographJsonTransformer(JsonTransformer):
         for x in edge.keys():
             if x not in {'sub', 'pred', 'obj'}:
                 fixed_edge[x] = edge[x]
-        super().load_edge(fixed_edge)
+        super().load_edge(fixed_edge, check_categories)
 
     def get_category(self, curie: str, node: dict) -> Optional[str]:
         """
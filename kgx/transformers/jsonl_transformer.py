@@ -1,15 +1,28 @@
-import gzip
+import os
 import re
-from typing import Optional
-import jsonlines as jsonlines
+from itertools import islice
+from multiprocessing import Pool, current_process
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from kgx import JsonTransformer
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
+from kgx.utils.compression_utils import get_extension, open_file
+from kgx.utils.progress_utils import iter_progress, progress
+from kgx.utils.json_utils import decode_lines, encode_lines
+from kgx.utils.metrics_utils import count
 
+# number of lines decoded, or encoded and written, as one batch
+JSONL_BATCH_SIZE = 10000
+
+# size, in bytes, of the line-aligned ranges of a file that are parsed by worker processes
+JSONL_RANGE_SIZE = 32 << 20
 
 log = get_logger()
 
+# the transformer used by a worker process to prepare nodes and edges
+_worker_transformer: Optional['JsonlTransformer'] = None
+
 
 class JsonlTransformer(JsonTransformer):
     """
@@ -25,7 +38,7 @@ class JsonlTransformer(JsonTransformer):
     def __init__(self, source_graph: Optional[BaseGraph] = None):
         super().__init__(source_graph)
 
-    def parse(self, filename: str, input_format: str = 'jsonl', compression: Optional[str] = None, provided_by: Optional[str] = None, **kwargs) -> None:
+    def parse(self, filename: str, input_format: str = 'jsonl', compression: Optional[str] = None, provided_by: Optional[str] = None, properties: Optional[Set[str]] = None, processes: int = 1, **kwargs) -> None:
         """
         Parse jsonl files.
 
@@ -40,32 +53,91 @@ class JsonlTransformer(JsonTransformer):
         input_format: str
             The input file format (``jsonl``, by default)
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         provided_by: Optional[str]
             Define the source providing the input file
+        properties: Optional[Set[str]]
+            The node and edge properties to load (all properties, by default).
+            See ``set_node_properties`` and ``set_edge_properties``
+        processes: int
+            The number of worker processes used to parse an uncompressed file.
+            See ``parse_parallel``
         kwargs: dict
             Any additional arguments
         """
         log.info("Parsing {}".format(filename))
+        self.compile_projection(properties)
         if provided_by:
             self.graph_metadata['provided_by'] = [provided_by]
         if re.search(f'nodes.{input_format}', filename):
+            nodes = True
             m = self.load_node # type: ignore
         elif re.search(f'edges.{input_format}', filename):
+            nodes = False
             m = self.load_edge # type: ignore
         else:
             raise TypeError(f"Unrecognized file: {filename}")
 
-        if compression == 'gz':
-            with gzip.open(filename, 'rb') as FH:
-                reader = jsonlines.Reader(FH)
-                for obj in reader:
-                    m(obj)
-        else:
-            with jsonlines.open(filename) as FH:
-                for obj in FH:
+        if processes > 1 and current_process().daemon:
+            # worker processes of a Pool cannot start worker processes of their own
+            log.debug(f"Parsing {filename} in a single process")
+            processes = 1
+        if processes > 1 and not compression and os.path.getsize(filename) > JSONL_RANGE_SIZE:
+            self.parse_parallel(filename, nodes, processes)
+            return
+
+        total = None if compression else os.path.getsize(filename)
+        with open_file(filename, 'rb', compression) as FH, progress(f"Reading {os.path.basename(filename)}", total, 'bytes') as p:
+            while True:
+                lines = list(islice(FH, JSONL_BATCH_SIZE))
+                if not lines:
+                    break
+                if p.enabled:
+                    p.update(sum(map(len, lines)))
+                for obj in decode_lines(lines):
                     m(obj)
 
+    def parse_parallel(self, filename: str, nodes: bool, processes: int) -> None:
+        """
+        Parse an uncompressed jsonl file with worker processes.
+
+        The file is split into line-aligned byte ranges of ``JSONL_RANGE_SIZE`` bytes.
+        Each range is decoded, filtered and sanitized by a worker process, which
+        returns a batch of prepared nodes or edges. The batches are added to the
+        graph in the order of the ranges, so the graph is the same as with a serial parse.
+
+        The ``subject_category`` and ``object_category`` edge filters depend on the
+        nodes that are already loaded, and are checked as each edge is added to the graph.
+        Node files must therefore be parsed before edge files.
+
+        Parameters
+        ----------
+        filename: str
+            The jsonl file to read from
+        nodes: bool
+            Whether the file has nodes, rather than edges
+        processes: int
+            The number of worker processes
+
+        """
+        category_filters = {'subject_category', 'object_category'}
+        edge_filters = {k: v for k, v in self.edge_filters.items() if k not in category_filters}
+        check_categories = not nodes and len(edge_filters) < len(self.edge_filters)
+        state = (self.node_filters, edge_filters, self._node_columns, self._edge_columns, self.graph_metadata)
+        tasks = [(filename, start, end, nodes) for start, end in get_line_ranges(filename, JSONL_RANGE_SIZE)]
+        log.debug(f"Parsing {len(tasks)} ranges of {filename} with {processes} processes")
+        insert = self.insert_node if nodes else self.insert_edge
+        with Pool(processes=processes, initializer=_set_worker_state, initargs=(state,)) as pool, \
+                progress(f"Reading {os.path.basename(filename)}", os.path.getsize(filename), 'bytes') as p:
+            for task, batch in zip(tasks, pool.imap(_prepare_range, tasks)):
+                p.update(task[2] - task[1])
+                for kwargs in batch:
+                    if check_categories and not self.check_edge_category_filter(kwargs):
+                        log.debug(f"Edge fails edge filters: {kwargs}")
+                        count('edges_filtered')
+                        continue
+                    insert(kwargs)
+
     def save(self, filename: str, output_format: str = 'jsonl', compression: Optional[str] = None, **kwargs) -> str:
         """
         Write kgx.graph.base_graph.BaseGraph to jsonl.
@@ -78,7 +150,7 @@ class JsonlTransformer(JsonTransformer):
         output_format: str
             The output file format (``jsonl``, by default)
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         kwargs: dict
             Any additional arguments
 
@@ -90,22 +162,132 @@ class JsonlTransformer(JsonTransformer):
         """
         nodes_filename = f"{filename}_nodes.jsonl"
         edges_filename = f"{filename}_edges.jsonl"
-        if compression == 'gz':
-            nodes_filename += f".{compression}"
-            edges_filename += f".{compression}"
-            with gzip.open(nodes_filename, 'wb') as WH:
-                writer = jsonlines.Writer(WH)
-                for n, data in self.graph.nodes(data=True):
-                    writer.write(data)
-            with gzip.open(edges_filename, 'wb') as WH:
-                writer = jsonlines.Writer(WH)
-                for u, v, k, data in self.graph.edges(data=True, keys=True):
-                    writer.write(data)
-        else:
-            with jsonlines.open(nodes_filename, 'w') as WH:
-                for n, data in self.graph.nodes(data=True):
-                    WH.write(data)
-            with jsonlines.open(edges_filename, 'w') as WH:
-                for u, v, k, data in self.graph.edges(data=True, keys=True):
-                    WH.write(data)
+        if compression:
+            nodes_filename += f".{get_extension(compression)}"
+            edges_filename += f".{get_extension(compression)}"
+        with open_file(nodes_filename, 'wb', compression) as WH:
+            nodes = (data for n, data in self.graph.nodes(data=True))
+            JsonlTransformer.write_objects(WH, iter_progress(nodes, f"Writing {os.path.basename(nodes_filename)}", self.graph.number_of_nodes))
+        with open_file(edges_filename, 'wb', compression) as WH:
+            edges = (data for u, v, k, data in self.graph.edges(data=True, keys=True))
+            JsonlTransformer.write_objects(WH, iter_progress(edges, f"Writing {os.path.basename(edges_filename)}", self.graph.number_of_edges))
         return filename
+
+    @staticmethod
+    def write_objects(fh: IO, objects: Iterable[Dict]) -> int:
+        """
+        Write objects as JSON lines, encoding and writing
+        ``JSONL_BATCH_SIZE`` objects at a time.
+
+        Parameters
+        ----------
+        fh: IO
+            The file handle, in binary mode
+        objects: Iterable[Dict]
+            The objects
+
+        Returns
+        -------
+        int
+            The number of objects written
+
+        """
+        count = 0
+        objects = iter(objects)
+        while True:
+            batch = list(islice(objects, JSONL_BATCH_SIZE))
+            if not batch:
+                break
+            fh.write(encode_lines(batch))
+            count += len(batch)
+        return count
+
+
+def get_line_ranges(filename: str, size: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges of about ``size`` bytes.
+
+    Ranges are not aligned to lines themselves; ``read_line_range`` reads
+    the lines that start within a range, so every line of the file is read
+    from exactly one range.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+    size: int
+        The size of each range, in bytes
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        The start and end offset of each range
+
+    """
+    total = os.path.getsize(filename)
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def read_line_range(fh: IO, start: int, end: int) -> Iterator[bytes]:
+    """
+    Read the lines of a file that start within a byte range.
+
+    Parameters
+    ----------
+    fh: IO
+        The file handle, in binary mode
+    start: int
+        The start offset of the range
+    end: int
+        The end offset of the range
+
+    Returns
+    -------
+    Iterator[bytes]
+        The lines
+
+    """
+    if start > 0:
+        # skip the end of a line that starts in the previous range
+        fh.seek(start - 1)
+        fh.readline()
+    else:
+        fh.seek(0)
+    position = fh.tell()
+    while position < end:
+        line = fh.readline()
+        if not line:
+            break
+        position += len(line)
+        yield line
+
+
+def _set_worker_state(state: Tuple) -> None:
+    """
+    Set the filters and projections of the transformer of a worker process.
+    """
+    global _worker_transformer
+    t = JsonlTransformer()
+    t.node_filters, t.edge_filters, t._node_columns, t._edge_columns, t.graph_metadata = state
+    _worker_transformer = t
+
+
+def _prepare_range(task: Tuple[str, int, int, bool]) -> List[Dict]:
+    """
+    Decode, filter and sanitize the nodes or edges in a byte range of a jsonl file.
+    """
+    filename, start, end, nodes = task
+    t = _worker_transformer
+    prepare = t.prepare_node if nodes else t.prepare_edge # type: ignore
+    batch = []
+    with open(filename, 'rb') as FH:
+        lines = read_line_range(FH, start, end)
+        while True:
+            chunk = list(islice(lines, JSONL_BATCH_SIZE))
+            if not chunk:
+                break
+            for obj in decode_lines(chunk):
+                kwargs = prepare(obj)
+                if kwargs is not None:
+                    batch.append(kwargs)
+    return batch
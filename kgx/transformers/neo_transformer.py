@@ -1,11 +1,12 @@
 import itertools
-import click
 from typing import Tuple, List, Dict, Union, Any, Iterator, Optional
 
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
 from kgx.transformers.transformer import Transformer
 from kgx.utils.kgx_utils import generate_edge_key, current_time_in_millis, generate_uuid
+from kgx.utils.intern_utils import intern_values
+from kgx.utils.progress_utils import progress
 from neo4jrestclient.client import GraphDatabase as http_gdb, Node, Relationship, GraphDatabase
 from neo4jrestclient.query import CypherException
 
@@ -63,12 +64,11 @@ class NeoTransformer(Transformer):
             self.graph_metadata['provided_by'] = [provided_by]
 
         kwargs = {'is_directed': is_directed}
-        with click.progressbar(length=count, label='Getting {:,} records from Neo4j'.format(count)) as bar:
+        with progress('Getting {:,} records from Neo4j'.format(count), count) as p:
             time_start = current_time_in_millis()
             for page in self.get_pages(self.get_edges, start, end, page_size=page_size, **kwargs):
                 self.load_edges(page)
-                bar.update(page_size)
-            bar.update(count)
+                p.update(len(page))
             time_end = current_time_in_millis()
             log.debug("time taken to load edges: {} ms".format(time_end - time_start))
 
@@ -144,7 +144,7 @@ class NeoTransformer(Transformer):
         """
         if 'provided_by' in self.graph_metadata and 'provided_by' not in node.keys():
             node['provided_by'] = self.graph_metadata['provided_by']
-        self.graph.add_node(node['id'], **node)
+        self.graph.add_node(node['id'], **intern_values(node))
 
     def load_edges(self, edges: List) -> None:
         """
@@ -192,7 +192,7 @@ class NeoTransformer(Transformer):
         if 'id' not in edge.keys():
             edge['id'] = generate_uuid()
         key = generate_edge_key(subject_node['id'], edge['predicate'], object_node['id'])
-        self.graph.add_edge(subject_node['id'], object_node['id'], key, **edge)
+        self.graph.add_edge(subject_node['id'], object_node['id'], key, **intern_values(edge))
 
     def get_pages(self, query_function, start: int = 0, end: Optional[int] = None, page_size: int = 50000, **kwargs: Any) -> Iterator:
         """
@@ -1,4 +1,3 @@
-import gzip
 import itertools
 from typing import Set, Optional, Dict
 
@@ -9,7 +8,9 @@ from rdflib.term import URIRef, Literal
 from kgx import RdfTransformer
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
-from kgx.utils.kgx_utils import current_time_in_millis, apply_filters, generate_edge_identifiers
+from kgx.utils.compression_utils import open_file
+from kgx.utils.progress_utils import read_progress
+from kgx.utils.kgx_utils import current_time_in_millis, generate_edge_identifiers
 
 log = get_logger()
 
@@ -41,7 +42,7 @@ class NtTransformer(RdfTransformer):
         input_format : Optional[str]
             The input file format. Must be ``nt``
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         provided_by : Optional[str]
             Define the source providing the input file.
         node_property_predicates: Optional[Set[str]]
@@ -56,14 +57,13 @@ class NtTransformer(RdfTransformer):
             self.graph_metadata['provided_by'] = [provided_by]
 
         self.start = current_time_in_millis()
-        if compression == 'gz':
-            p.parse(gzip.open(filename, 'rb'))
-        else:
-            p.parse(open(filename, 'rb'))
+        self.compile_filters()
+        with open_file(filename, 'rb', compression) as FH, read_progress(FH, filename, compression) as PH:
+            p.parse(PH)
 
         self.dereify(self.reified_nodes)
         log.info(f"Done parsing {filename}")
-        apply_filters(self.graph, self.node_filters, self.edge_filters)
+        self.apply_deferred_filters()
         generate_edge_identifiers(self.graph)
 
     def save(self, filename: str, output_format: str = 'nt', compression: str = None, reify_all_edges = False, **kwargs) -> None:
@@ -79,7 +79,7 @@ class NtTransformer(RdfTransformer):
         output_format: str
             The output format. Must be ``nt``
         compression: str
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         reify_all_edges: bool
             Whether to reify all edges in the graph
         kwargs: dict
@@ -90,8 +90,5 @@ class NtTransformer(RdfTransformer):
         edges_generator = self.export_edges(reify_all_edges)
         generator = itertools.chain(nodes_generator, edges_generator)
         serializer = NT11Serializer(generator)
-        if compression == 'gz':
-            f = gzip.open(filename, 'wb')
-        else:
-            f = open(filename, 'wb')
-        serializer.serialize(f)
+        with open_file(filename, 'wb', compression) as f:
+            serializer.serialize(f)
@@ -1,5 +1,13 @@
+import io
 import os
 import re
+import shlex
+import tempfile
+import time
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool, current_process
+
 import pandas as pd
 import numpy as np
 import tarfile
@@ -7,13 +15,31 @@ from ordered_set import OrderedSet
 
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
+from kgx.utils.category_index import CategoryIndex
+from kgx.utils.compression_utils import get_extension, open_file
+from kgx.utils.intern_utils import INTERNED_PROPERTIES, SharedList, intern_values
 from kgx.utils.kgx_utils import generate_edge_key, generate_uuid
+from kgx.utils.progress_utils import is_progress_enabled, iter_progress, read_progress
+from kgx.utils.metrics_utils import count
 from kgx.transformers.transformer import Transformer
 
-from typing import List, Dict, Optional, Any, Set
+from typing import List, Dict, Optional, Any, Set, Iterator, Iterable, IO, Tuple
 
 LIST_DELIMITER = '|'
 
+# number of lines formatted and written as one block on export
+EXPORT_BATCH_SIZE = 10000
+# size of the write buffer, in bytes, of exported files
+EXPORT_BUFFER_SIZE = 1 << 20
+# size, in bytes, up to which a member of an exported archive is kept in memory
+EXPORT_SPOOL_SIZE = 256 << 20
+# properties whose values repeat across nodes and edges, and are sanitized once per value on export
+_export_cached_properties = INTERNED_PROPERTIES
+# maximum number of rows in each data file of a sharded Neo4j export
+NEO4J_SHARD_SIZE = 1000000
+# the command that imports a sharded Neo4j export
+NEO4J_IMPORT_COMMAND = ['neo4j-admin', 'import']
+
 _column_types = {
     'publications': list,
     'qualifiers': list,
@@ -35,21 +61,25 @@ _extension_types = {
 _archive_read_mode = {
     'tar': 'r',
     'tar.gz': 'r:gz',
-    'tar.bz2': 'r:bz2'
+    'tar.bz2': 'r:bz2',
+    'tar.xz': 'r:xz'
 }
 _archive_write_mode = {
     'tar': 'w',
     'tar.gz': 'w:gz',
-    'tar.bz2': 'w:bz2'
+    'tar.bz2': 'w:bz2',
+    'tar.xz': 'w:xz'
 }
 
 _archive_format = {
     'r': 'tar',
     'r:gz': 'tar.gz',
     'r:bz2': 'tar.bz2',
+    'r:xz': 'tar.xz',
     'w': 'tar',
     'w:gz': 'tar.gz',
-    'w:bz2': 'tar.bz2'
+    'w:bz2': 'tar.bz2',
+    'w:xz': 'tar.xz'
 }
 
 log = get_logger()
@@ -71,15 +101,19 @@ class PandasTransformer(Transformer):
         super().__init__(source_graph)
         self._node_properties: Set = set()
         self._edge_properties: Set = set()
+        self.category_index: Optional[CategoryIndex] = None
+        self._node_columns: Optional[Set[str]] = None
+        self._edge_columns: Optional[Set[str]] = None
 
-    def parse(self, filename: str, input_format: str = 'tsv', compression: Optional[str] = None, provided_by: Optional[str] = None, **kwargs: Dict) -> None:
+    def parse(self, filename: str, input_format: str = 'tsv', compression: Optional[str] = None, provided_by: Optional[str] = None, properties: Optional[Set[str]] = None, **kwargs: Dict) -> None:
         """
         Parse a CSV/TSV (or plain text) file.
 
         The file can represent either nodes (nodes.tsv) or edges (edges.tsv) or both (data.tar),
         where the tar archive contains nodes.tsv and edges.tsv
 
-        The file can also be data.tar.gz or data.tar.bz2
+        The file can also be data.tar.gz, data.tar.bz2 or data.tar.xz, and
+        a nodes or edges file can be compressed. For example, nodes.tsv.zst
 
         Parameters
         ----------
@@ -88,13 +122,17 @@ class PandasTransformer(Transformer):
         input_format: str
             The input file format (``tsv``, by default)
         compression: Optional[str]
-            The compression. For example, ``tar``
+            The compression. For example, ``tar``, ``tar.gz`` or ``zstd``
         provided_by: Optional[str]
             Define the source providing the input file
+        properties: Optional[Set[str]]
+            The node and edge properties to load (all properties, by default).
+            See ``set_node_properties`` and ``set_edge_properties``
         kwargs: Dict
             Any additional arguments
 
         """
+        self.compile_projection(properties)
         if 'delimiter' not in kwargs:
             # infer delimiter from file format
             kwargs['delimiter'] = _extension_types[input_format] # type: ignore
@@ -111,27 +149,73 @@ class PandasTransformer(Transformer):
             kwargs['quoting'] = 3 # type: ignore
         if mode:
             with tarfile.open(filename, mode=mode) as tar:
-                for member in tar.getmembers():
-                    f = tar.extractfile(member)
-                    file_iter = pd.read_csv(f, dtype=str, chunksize=10000, low_memory=False, keep_default_na=False, **kwargs)
+                # read nodes before edges, so that edges can be filtered on the category of their nodes
+                members = sorted(tar.getmembers(), key=lambda x: not re.search(f'nodes.{input_format}', x.name))
+                for member in members:
                     if re.search(f'nodes.{input_format}', member.name):
-                        for chunk in file_iter:
-                            self.load_nodes(chunk)
+                        columns, load = self._node_columns, self.load_nodes
                     elif re.search(f'edges.{input_format}', member.name):
-                        for chunk in file_iter:
-                            self.load_edges(chunk)
+                        columns, load = self._edge_columns, self.load_edges
                     else:
                         raise Exception(f'Tar archive contains an unrecognized file: {member.name}')
+                    with read_progress(tar.extractfile(member), member.name, total=member.size) as FH: # type: ignore
+                        for chunk in self.read_csv(FH, columns, **kwargs):
+                            load(chunk)
         else:
-            file_iter = pd.read_csv(filename, dtype=str, chunksize=10000, low_memory=False, keep_default_na=False, **kwargs)
             if re.search(f'nodes.{input_format}', filename):
-                for chunk in file_iter:
-                    self.load_nodes(chunk)
+                columns, load = self._node_columns, self.load_nodes
             elif re.search(f'edges.{input_format}', filename):
-                for chunk in file_iter:
-                    self.load_edges(chunk)
+                columns, load = self._edge_columns, self.load_edges
             else:
                 raise Exception(f'Unrecognized file: {filename}')
+            if compression or is_progress_enabled():
+                with open_file(filename, 'rb', compression) as FH, read_progress(FH, filename, compression) as PH:
+                    for chunk in self.read_csv(PH, columns, **kwargs):
+                        load(chunk)
+            else:
+                for chunk in self.read_csv(filename, columns, **kwargs):
+                    load(chunk)
+
+    @staticmethod
+    def read_csv(f: Any, columns: Optional[Set[str]] = None, **kwargs: Any) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV/TSV file in chunks.
+
+        Parameters
+        ----------
+        f: Any
+            A filename or file object
+        columns: Optional[Set[str]]
+            The columns to read (all columns, by default).
+            Columns that are not in the file are ignored.
+        kwargs: Any
+            Any additional arguments to ``pandas.read_csv``
+
+        Returns
+        -------
+        Iterator[pandas.DataFrame]
+            An iterator of chunks
+
+        """
+        usecols = columns.__contains__ if columns is not None else None
+        return pd.read_csv(f, dtype=str, chunksize=10000, low_memory=False, keep_default_na=False, usecols=usecols, **kwargs)
+
+    def compile_projection(self, properties: Optional[Set[str]] = None) -> None:
+        """
+        Compile the node and edge properties to load when parsing.
+
+        Parameters
+        ----------
+        properties: Optional[Set[str]]
+            The node and edge properties to load. If defined, this
+            replaces properties set by ``set_node_properties`` and ``set_edge_properties``
+
+        """
+        if properties is not None:
+            self.set_node_properties(properties)
+            self.set_edge_properties(properties)
+        self._node_columns = self.get_node_projection()
+        self._edge_columns = self.get_edge_projection()
 
     def load_nodes(self, df: pd.DataFrame) -> None:
         """
@@ -197,19 +281,61 @@ class PandasTransformer(Transformer):
             A node
 
         """
+        kwargs = self.prepare_node(node)
+        if kwargs is not None:
+            self.insert_node(kwargs)
+
+    def prepare_node(self, node: Dict) -> Optional[Dict]:
+        """
+        Prepare a node to be loaded into an instance of BaseGraph, by
+        applying node filters, and sanitizing its properties.
+
+        This does not depend on the graph, so nodes can be prepared in worker processes.
+
+        Parameters
+        ----------
+        node : Dict
+            A node
+
+        Returns
+        -------
+        Optional[Dict]
+            The node properties, or ``None`` if the node is not to be loaded
+
+        """
+        if self._node_columns is not None:
+            node = {k: v for k, v in node.items() if k in self._node_columns}
         if self.check_node_filter(node):
             node = Transformer.validate_node(node)
             kwargs = PandasTransformer._build_kwargs(node.copy())
             if 'id' in kwargs:
-                n = kwargs['id']
                 if 'provided_by' in self.graph_metadata and 'provided_by' not in kwargs.keys():
                     kwargs['provided_by'] = self.graph_metadata['provided_by']
-                self.graph.add_node(n, **kwargs)
-                self._node_properties.update(list(kwargs.keys()))
+                return kwargs
             else:
                 log.info("Ignoring node with no 'id': {}".format(node))
         else:
             log.debug(f"Node fails node filters: {node}")
+            count('nodes_filtered')
+        return None
+
+    def insert_node(self, kwargs: Dict) -> None:
+        """
+        Add a node, prepared by ``prepare_node``, to an instance of BaseGraph.
+
+        Parameters
+        ----------
+        kwargs : Dict
+            The node properties
+
+        """
+        n = kwargs['id']
+        kwargs = intern_values(kwargs)
+        self.graph.add_node(n, **kwargs)
+        self._node_properties.update(list(kwargs.keys()))
+        category_index = self.get_category_index()
+        if category_index is not None:
+            category_index.add(n, kwargs.get('category', []))
 
     def load_edges(self, df: pd.DataFrame) -> None:
         """
@@ -221,10 +347,100 @@ class PandasTransformer(Transformer):
             Dataframe containing records that represent edges
 
         """
+        category_index = self.get_category_index()
+        if category_index is not None and len(df):
+            df = df[self.check_category_filters(df)]
+        # the category edge filters have been checked for the whole dataframe
         for obj in df.to_dict('records'):
-            self.load_edge(obj)
+            self.load_edge(obj, check_categories=False)
+
+    def get_category_index(self) -> Optional[CategoryIndex]:
+        """
+        Get the index of node categories, which is used to check
+        ``subject_category`` and ``object_category`` edge filters.
+
+        The index is only created if these edge filters are defined.
+
+        Returns
+        -------
+        Optional[kgx.utils.category_index.CategoryIndex]
+            The index of node categories
+
+        """
+        if self.category_index is None and self.edge_filters:
+            categories: Set = set()
+            for k in ['subject_category', 'object_category']:
+                if k in self.edge_filters:
+                    categories.update(self.edge_filters[k])
+            if categories:
+                self.category_index = CategoryIndex(categories)
+        return self.category_index
+
+    def check_category_filters(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Check if edges pass the ``subject_category`` and ``object_category``
+        edge filters, for all edges in a pandas.DataFrame at once.
 
-    def check_edge_filter(self, edge: Dict) -> bool:
+        Subjects and objects that are not in the category index
+        are checked with ``check_node_category``.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Dataframe containing records that represent edges
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array of whether each edge passes the filters
+
+        """
+        category_index = self.get_category_index()
+        passes = np.ones(len(df), dtype=bool)
+        if category_index is None:
+            return passes
+        for column, k in [('subject', 'subject_category'), ('object', 'object_category')]:
+            if k not in self.edge_filters:
+                continue
+            if column not in df.columns:
+                return np.zeros(len(df), dtype=bool)
+            positions = category_index.lookup(df[column].values)
+            column_passes = category_index.has_category(positions, category_index.mask(self.edge_filters[k]))
+            for i in np.flatnonzero(positions < 0):
+                column_passes[i] = self.check_node_category(df[column].iat[i], self.edge_filters[k])
+            passes &= column_passes
+        return passes
+
+    def check_node_category(self, node: str, categories: Set) -> bool:
+        """
+        Check if a node has any of the given categories.
+
+        The node is looked up in the category index and,
+        failing that, in the graph.
+
+        Parameters
+        ----------
+        node: str
+            The node
+        categories: Set
+            The categories
+
+        Returns
+        -------
+        bool
+            Whether the node has any of the given categories
+
+        """
+        category_index = self.get_category_index()
+        if category_index is not None and node in category_index:
+            positions = np.array([category_index.position[node]])
+            return bool(category_index.has_category(positions, category_index.mask(categories))[0])
+        if self.graph.has_node(node):
+            node_data = self.graph.nodes()[node]
+            return bool(node_data) and any(x in node_data.get('category', []) for x in categories)
+        return False
+
+    def check_edge_filter(self, edge: Dict, check_categories: bool = True) -> bool:
         """
         Check if an edge passes defined edge filters.
 
@@ -232,6 +448,8 @@ class PandasTransformer(Transformer):
         ----------
         edge: Dict
             An edge
+        check_categories: bool
+            Whether to check the ``subject_category`` and ``object_category`` edge filters
 
         Returns
         -------
@@ -263,45 +481,39 @@ class PandasTransformer(Transformer):
                     return False
 
             # Check for subject and object filter
-            if self.graph.has_node(edge['subject']):
-                subject_node = self.graph.nodes()[edge['subject']]
-            else:
-                subject_node = None
-
-            if self.graph.has_node(edge['object']):
-                object_node = self.graph.nodes()[edge['object']]
-            else:
-                object_node = None
-
-            if 'subject_category' in self.edge_filters:
-                f = self.edge_filters['subject_category']
-                if subject_node:
-                    # subject node exists in graph
-                    if any(x in subject_node['category'] for x in f):
-                        pass_filter = True
-                    else:
-                        return False
-                else:
-                    # subject node does not exist in graph
-                    return False
-
-            if 'object_category' in self.edge_filters:
-                f = self.edge_filters['object_category']
-                if object_node:
-                    # object node exists in graph
-                    if any(x in object_node['category'] for x in f):
-                        pass_filter = True
-                    else:
-                        return False
+            if 'subject_category' in self.edge_filters or 'object_category' in self.edge_filters:
+                if not check_categories or self.check_edge_category_filter(edge):
+                    pass_filter = True
                 else:
-                    # object node does not exist in graph
                     return False
         else:
             # no edge filters defined
             pass_filter = True
         return pass_filter
 
-    def load_edge(self, edge: Dict) -> None:
+    def check_edge_category_filter(self, edge: Dict) -> bool:
+        """
+        Check if an edge passes the ``subject_category``
+        and ``object_category`` edge filters.
+
+        Parameters
+        ----------
+        edge: Dict
+            An edge
+
+        Returns
+        -------
+        bool
+            Whether the given edge has passed the category edge filters
+
+        """
+        for column, k in [('subject', 'subject_category'), ('object', 'object_category')]:
+            if k in self.edge_filters:
+                if not self.check_node_category(edge[column], self.edge_filters[k]):
+                    return False
+        return True
+
+    def load_edge(self, edge: Dict, check_categories: bool = True) -> None:
         """
         Load an edge into an instance of BaseGraph
 
@@ -309,25 +521,71 @@ class PandasTransformer(Transformer):
         ----------
         edge : Dict
             An edge
+        check_categories: bool
+            Whether to check the ``subject_category`` and ``object_category`` edge filters
+
+        """
+        kwargs = self.prepare_edge(edge, check_categories)
+        if kwargs is not None:
+            self.insert_edge(kwargs)
 
+    def prepare_edge(self, edge: Dict, check_categories: bool = True) -> Optional[Dict]:
         """
-        if self.check_edge_filter(edge):
+        Prepare an edge to be loaded into an instance of BaseGraph, by
+        applying edge filters, and sanitizing its properties.
+
+        The ``subject_category`` and ``object_category`` edge filters are
+        checked against the nodes that are already loaded. Edges can only be
+        prepared in worker processes without these filters, which are then
+        checked with ``check_edge_category_filter``.
+
+        Parameters
+        ----------
+        edge : Dict
+            An edge
+        check_categories: bool
+            Whether to check the ``subject_category`` and ``object_category`` edge filters
+
+        Returns
+        -------
+        Optional[Dict]
+            The edge properties, or ``None`` if the edge is not to be loaded
+
+        """
+        if self._edge_columns is not None:
+            edge = {k: v for k, v in edge.items() if k in self._edge_columns}
+        if self.check_edge_filter(edge, check_categories):
             edge = Transformer.validate_edge(edge)
             kwargs = PandasTransformer._build_kwargs(edge.copy())
             if 'subject' in kwargs and 'object' in kwargs:
                 if 'id' not in kwargs:
                     kwargs['id'] = generate_uuid()
-                s = kwargs['subject']
-                o = kwargs['object']
                 if 'provided_by' in self.graph_metadata and 'provided_by' not in kwargs.keys():
                     kwargs['provided_by'] = self.graph_metadata['provided_by']
-                key = generate_edge_key(s, kwargs['predicate'], o)
-                self.graph.add_edge(s, o, key, **kwargs)
-                self._edge_properties.update(list(kwargs.keys()))
+                return kwargs
             else:
                 log.info("Ignoring edge with either a missing 'subject' or 'object': {}".format(kwargs))
         else:
             log.debug(f"Edge fails edge filters: {edge}")
+            count('edges_filtered')
+        return None
+
+    def insert_edge(self, kwargs: Dict) -> None:
+        """
+        Add an edge, prepared by ``prepare_edge``, to an instance of BaseGraph.
+
+        Parameters
+        ----------
+        kwargs : Dict
+            The edge properties
+
+        """
+        s = kwargs['subject']
+        o = kwargs['object']
+        key = generate_edge_key(s, kwargs['predicate'], o)
+        kwargs = intern_values(kwargs)
+        self.graph.add_edge(s, o, key, **kwargs)
+        self._edge_properties.update(list(kwargs.keys()))
 
     def export_nodes(self, filename: str, delimiter: str) -> None:
         """
@@ -341,21 +599,8 @@ class PandasTransformer(Transformer):
             The delimiter to use as a separator
 
         """
-        if not self._node_properties:
-            self._node_properties = PandasTransformer.get_all_node_properties(self.graph)
-        ordered_node_columns = PandasTransformer._order_node_columns(self._node_properties)
-        FH = open(filename, 'w')
-        FH.write(delimiter.join(ordered_node_columns) + '\n')
-        for n, data in self.graph.nodes(data=True):
-            row = PandasTransformer._build_export_row(data)
-            row['id'] = n
-            values = []
-            for c in ordered_node_columns:
-                if c in row:
-                    values.append(str(row[c]))
-                else:
-                    values.append("")
-            FH.write(delimiter.join(values) + '\n')
+        with open(filename, 'w', buffering=EXPORT_BUFFER_SIZE) as FH:
+            PandasTransformer.write_lines(FH, self.format_nodes(delimiter))
 
     def export_edges(self, filename: str, delimiter: str) -> None:
         """
@@ -369,25 +614,10 @@ class PandasTransformer(Transformer):
             The delimiter to use as a separator
 
         """
-        if not self._edge_properties:
-            self._edge_properties = PandasTransformer.get_all_edge_properties(self.graph)
-        ordered_edge_columns = PandasTransformer._order_edge_columns(self._edge_properties)
-        FH = open(filename, 'w')
-        FH.write(delimiter.join(ordered_edge_columns) + '\n')
-        for s, o, data in self.graph.edges(data=True):
-            data = self.validate_edge(data)
-            row = PandasTransformer._build_export_row(data)
-            row['subject'] = s
-            row['object'] = o
-            values = []
-            for c in ordered_edge_columns:
-                if c in row:
-                    values.append(str(row[c]))
-                else:
-                    values.append("")
-            FH.write(delimiter.join(values) + '\n')
+        with open(filename, 'w', buffering=EXPORT_BUFFER_SIZE) as FH:
+            PandasTransformer.write_lines(FH, self.format_edges(delimiter))
 
-    def save(self, filename: str, output_format: str = 'tsv', compression: Optional[str] = None, **kwargs: Dict) -> str:
+    def save(self, filename: str, output_format: str = 'tsv', compression: Optional[str] = None, *, shard_size: Optional[int] = None, processes: int = 1, **kwargs: Dict) -> str:
         """
         Writes two files representing the node set and edge set
         of an instance of BaseGraph and add them to a `.tar` archive.
@@ -403,7 +633,14 @@ class PandasTransformer(Transformer):
         output_format: str
             The output file format (``tsv``, by default)
         compression: Optional[str]
-            The compression. For example, `tar`
+            The compression. For example, ``tar``, ``tar.gz`` or ``zstd``.
+            An archive contains the nodes and edges files, and any other
+            compression applies to the nodes and edges files separately
+        shard_size: Optional[int]
+            For ``csv:neo4j`` and ``tsv:neo4j``, the maximum number of rows in each
+            data file of a sharded export. See ``export_neo4j_shards``
+        processes: int
+            The number of worker processes that write the data files of a sharded export
         kwargs: Dict
             Any additional arguments
 
@@ -415,6 +652,18 @@ class PandasTransformer(Transformer):
         """
         if output_format not in _extension_types:
             raise Exception('Unsupported output format: ' + output_format)
+        elif shard_size:
+            if output_format not in {'csv:neo4j', 'tsv:neo4j'}:
+                raise ValueError(f"Sharded export is only supported for csv:neo4j and tsv:neo4j, not {output_format}")
+            dirname = os.path.abspath(os.path.dirname(filename))
+            os.makedirs(dirname, exist_ok=True)
+            self.export_neo4j_shards(
+                os.path.join(dirname, os.path.basename(filename)),
+                _extension_types[output_format],
+                compression,
+                shard_size,
+                processes
+            )
         else:
             delimiter = _extension_types[output_format]
             dirname = os.path.abspath(os.path.dirname(filename))
@@ -429,23 +678,35 @@ class PandasTransformer(Transformer):
             nodes_file_name = os.path.join(dirname if dirname else '', nodes_file_basename)
             edges_file_name = os.path.join(dirname if dirname else '', edges_file_basename)
 
+            nodes_lines: Iterable[str]
+            edges_lines: Iterable[str]
             if output_format in {'csv:neo4j', 'tsv:neo4j'}:
-                self.export_neo4j_nodes(nodes_file_name, delimiter)
-                self.export_neo4j_edges(edges_file_name, delimiter)
+                nodes_lines = self.format_neo4j_nodes(delimiter)
+                edges_lines = self.format_neo4j_edges(delimiter)
             else:
-                self.export_nodes(nodes_file_name, delimiter)
-                self.export_edges(edges_file_name, delimiter)
+                nodes_lines = self.format_nodes(delimiter)
+                edges_lines = self.format_edges(delimiter)
+            # the header is counted as a line
+            nodes_lines = iter_progress(nodes_lines, f"Writing {nodes_file_basename}", lambda: self.graph.number_of_nodes() + 1, 'lines')
+            edges_lines = iter_progress(edges_lines, f"Writing {edges_file_basename}", lambda: self.graph.number_of_edges() + 1, 'lines')
 
             if mode:
                 archive_basename = f"{basename}.{_archive_format[mode]}"
                 archive_name = os.path.join(dirname if dirname else '', archive_basename)
                 with tarfile.open(name=archive_name, mode=mode) as tar:
-                    tar.add(nodes_file_name, arcname=nodes_file_basename)
-                    tar.add(edges_file_name, arcname=edges_file_basename)
-                    if os.path.isfile(nodes_file_name):
-                        os.remove(nodes_file_name)
-                    if os.path.isfile(edges_file_name):
-                        os.remove(edges_file_name)
+                    PandasTransformer.add_to_archive(tar, nodes_file_basename, nodes_lines)
+                    PandasTransformer.add_to_archive(tar, edges_file_basename, edges_lines)
+            elif compression:
+                extension = get_extension(compression)
+                with open_file(f"{nodes_file_name}.{extension}", 'wb', compression) as FH:
+                    PandasTransformer.write_lines(FH, nodes_lines)
+                with open_file(f"{edges_file_name}.{extension}", 'wb', compression) as FH:
+                    PandasTransformer.write_lines(FH, edges_lines)
+            else:
+                with open(nodes_file_name, 'w', buffering=EXPORT_BUFFER_SIZE) as FH:
+                    PandasTransformer.write_lines(FH, nodes_lines)
+                with open(edges_file_name, 'w', buffering=EXPORT_BUFFER_SIZE) as FH:
+                    PandasTransformer.write_lines(FH, edges_lines)
 
         return filename
 
@@ -462,32 +723,8 @@ class PandasTransformer(Transformer):
             The delimiter to use as a separator
 
         """
-        if not self._node_properties:
-            self._node_properties = PandasTransformer.get_all_node_properties(self.graph)
-        ordered_node_columns = PandasTransformer._order_node_columns(self._node_properties)
-        header = []
-        for x in ordered_node_columns:
-            if x == 'id':
-                header.append(f"{x}:ID")
-            elif x == 'category':
-                header.append(f"{x}:LABEL")
-            elif x in _column_types and _column_types[x] == list:
-                header.append(f"{x}:string[]")
-            else:
-                header.append(x)
-
-        FH = open(filename, 'w')
-        FH.write(delimiter.join(header) + '\n')
-        for n, data in self.graph.nodes(data=True):
-            row = PandasTransformer._build_export_row(data)
-            row['id'] = n
-            values = []
-            for c in ordered_node_columns:
-                if c in row:
-                    values.append(row[c])
-                else:
-                    values.append("")
-            FH.write(delimiter.join(values) + '\n')
+        with open(filename, 'w', buffering=EXPORT_BUFFER_SIZE) as FH:
+            PandasTransformer.write_lines(FH, self.format_neo4j_nodes(delimiter))
 
     def export_neo4j_edges(self, filename: str, delimiter: str) -> None:
         """
@@ -502,11 +739,269 @@ class PandasTransformer(Transformer):
             The delimiter to use as a separator
 
         """
-        if not self._edge_properties:
-            self._edge_properties = PandasTransformer.get_all_edge_properties(self.graph)
-        ordered_edge_columns = PandasTransformer._order_edge_columns(self._edge_properties)
+        with open(filename, 'w', buffering=EXPORT_BUFFER_SIZE) as FH:
+            PandasTransformer.write_lines(FH, self.format_neo4j_edges(delimiter))
+
+    def format_nodes(self, delimiter: str) -> Iterator[str]:
+        """
+        Format nodes from an instance of BaseGraph as lines of delimited text,
+        starting with the header.
+
+        Parameters
+        ----------
+        delimiter: str
+            The delimiter to use as a separator
+
+        Returns
+        -------
+        Iterator[str]
+            The lines, each terminated by a newline
+
+        """
+        columns = self._get_node_columns()
+        yield delimiter.join(columns) + '\n'
+        yield from PandasTransformer._format_node_rows(columns, delimiter, self.graph.nodes(data=True))
+
+    def format_edges(self, delimiter: str) -> Iterator[str]:
+        """
+        Format edges from an instance of BaseGraph as lines of delimited text,
+        starting with the header.
+
+        Parameters
+        ----------
+        delimiter: str
+            The delimiter to use as a separator
+
+        Returns
+        -------
+        Iterator[str]
+            The lines, each terminated by a newline
+
+        """
+        columns = self._get_edge_columns()
+        yield delimiter.join(columns) + '\n'
+        yield from PandasTransformer._format_edge_rows(columns, delimiter, self.graph.edges(data=True))
+
+    def format_neo4j_nodes(self, delimiter: str) -> Iterator[str]:
+        """
+        Format nodes from an instance of BaseGraph as lines of delimited text,
+        starting with a header for the ``neo4j-admin import`` tool.
+
+        Parameters
+        ----------
+        delimiter: str
+            The delimiter to use as a separator
+
+        Returns
+        -------
+        Iterator[str]
+            The lines, each terminated by a newline
+
+        """
+        columns = self._get_node_columns()
+        yield delimiter.join(PandasTransformer._get_neo4j_node_header(columns)) + '\n'
+        yield from PandasTransformer._format_node_rows(columns, delimiter, self.graph.nodes(data=True))
+
+    def format_neo4j_edges(self, delimiter: str) -> Iterator[str]:
+        """
+        Format edges from an instance of BaseGraph as lines of delimited text,
+        starting with a header for the ``neo4j-admin import`` tool.
+
+        Parameters
+        ----------
+        delimiter: str
+            The delimiter to use as a separator
+
+        Returns
+        -------
+        Iterator[str]
+            The lines, each terminated by a newline
+
+        """
+        columns = self._get_edge_columns()
+        yield delimiter.join(PandasTransformer._get_neo4j_edge_header(columns)) + '\n'
+        yield from PandasTransformer._format_edge_rows(columns, delimiter, self.graph.edges(data=True))
+
+    def export_neo4j_shards(self, filename: str, delimiter: str, compression: Optional[str] = None, shard_size: int = NEO4J_SHARD_SIZE, processes: int = 1) -> str:
+        """
+        Export nodes and edges from an instance of BaseGraph as sharded data files,
+        with separate header files, for the ``neo4j-admin import`` tool.
+
+        Nodes are sharded by their first category, and edges by their predicate,
+        with at most ``shard_size`` rows in each data file. For example,
+        ``{filename}_nodes_header.tsv``, ``{filename}_nodes_biolink_Gene_0000.tsv`` and
+        ``{filename}_edges_biolink_interacts_with_0000.tsv``. The data files are
+        written in parallel by worker processes.
+
+        Each worker is sent the rows of one shard at a time, along with the column
+        types, rather than the graph. At most ``2 * processes`` shards are in flight
+        at a time, so that only their rows are copied to the workers.
+
+        The ``neo4j-admin import`` command for the export is written to ``{filename}_import.sh``.
+
+        Parameters
+        ----------
+        filename: str
+            The prefix of the exported files
+        delimiter: str
+            The delimiter to use as a separator
+        compression: Optional[str]
+            ``gz`` to compress each data file, or ``None``
+        shard_size: int
+            The maximum number of rows in each data file
+        processes: int
+            The number of worker processes
+
+        Returns
+        -------
+        str
+            The ``neo4j-admin import`` command
+
+        """
+        if compression not in {None, 'gz'}:
+            raise ValueError(f"Unsupported compression '{compression}' for a sharded Neo4j export; expected gz")
+        extension = 'tsv' if delimiter == '\t' else 'csv'
+        suffix = f".{extension}.gz" if compression else f".{extension}"
+        node_columns = self._get_node_columns()
+        edge_columns = self._get_edge_columns()
+        nodes_header = f"{filename}_nodes_header.{extension}"
+        edges_header = f"{filename}_edges_header.{extension}"
+        with open(nodes_header, 'w') as FH:
+            FH.write(delimiter.join(PandasTransformer._get_neo4j_node_header(node_columns)) + '\n')
+        with open(edges_header, 'w') as FH:
+            FH.write(delimiter.join(PandasTransformer._get_neo4j_edge_header(edge_columns)) + '\n')
+
+        node_groups = PandasTransformer._get_shards(
+            ((n, data.get('category')) for n, data in self.graph.nodes(data=True)), shard_size
+        )
+        edge_groups = PandasTransformer._get_shards(
+            (((s, o, k), data.get('predicate')) for s, o, k, data in self.graph.edges(keys=True, data=True)), shard_size
+        )
+        shards = []
+        files: Dict[str, Dict[str, List[str]]] = {'nodes': {}, 'edges': {}}
+        for kind, groups, columns in [('nodes', node_groups, node_columns), ('edges', edge_groups, edge_columns)]:
+            for name, name_shards in groups.items():
+                for i, keys in enumerate(name_shards):
+                    shard_filename = f"{filename}_{kind}_{name}_{i:04d}{suffix}"
+                    files[kind].setdefault(name, []).append(shard_filename)
+                    shards.append((kind == 'nodes', shard_filename, keys, list(columns)))
+
+        column_types = dict(_column_types)
+        tasks = (
+            (nodes, shard_filename, self._get_shard_rows(nodes, keys), columns, delimiter, compression, column_types)
+            for nodes, shard_filename, keys, columns in shards
+        )
+        if processes > 1 and len(shards) > 1 and not current_process().daemon:
+            log.debug(f"Writing {len(shards)} shards with {processes} processes")
+            with Pool(processes=processes) as pool:
+                pending: deque = deque()
+                for task in tasks:
+                    pending.append(pool.apply_async(_write_shard, (task,)))
+                    if len(pending) >= 2 * processes:
+                        pending.popleft().get()
+                while pending:
+                    pending.popleft().get()
+        else:
+            for task in tasks:
+                PandasTransformer.write_shard(*task)
+
+        args = list(NEO4J_IMPORT_COMMAND)
+        args.append(f"--delimiter={'TAB' if extension == 'tsv' else delimiter}")
+        args.append(f"--array-delimiter={LIST_DELIMITER}")
+        args.extend([f"--nodes={','.join([nodes_header] + x)}" for x in files['nodes'].values()])
+        args.extend([f"--relationships={','.join([edges_header] + x)}" for x in files['edges'].values()])
+        command = ' '.join([shlex.quote(x) for x in args])
+        script = f"{filename}_import.sh"
+        with open(script, 'w') as FH:
+            FH.write(f"#!/bin/sh\n{command}\n")
+        os.chmod(script, 0o755)
+        log.info(f"Import with: {command}")
+        return command
+
+    def _get_shard_rows(self, nodes: bool, keys: List) -> List[Tuple]:
+        """
+        Get the nodes, as ``(node, data)``, or the edges, as ``(subject, object, data)``,
+        of a shard from their keys.
+        """
+        if nodes:
+            return [(n, self.graph.get_node(n)) for n in keys]
+        return [(s, o, self.graph.get_edge(s, o, k)) for s, o, k in keys]
+
+    @staticmethod
+    def write_shard(nodes: bool, filename: str, rows: List[Tuple], columns: List[str], delimiter: str, compression: Optional[str] = None, column_types: Optional[Dict[str, type]] = None) -> int:
+        """
+        Write a data file, without a header, of a sharded Neo4j export.
+
+        Parameters
+        ----------
+        nodes: bool
+            Whether ``rows`` are nodes, as ``(node, data)``, rather than
+            edges, as ``(subject, object, data)``
+        filename: str
+            The filename
+        rows: List[Tuple]
+            The nodes, or edges, to write
+        columns: List[str]
+            The columns
+        delimiter: str
+            The delimiter to use as a separator
+        compression: Optional[str]
+            The compression. For example, ``gz``
+        column_types: Optional[Dict[str, type]]
+            The types of columns, from the process that started the export
+
+        Returns
+        -------
+        int
+            The number of rows written
+
+        """
+        if column_types:
+            _column_types.update(column_types)
+        if nodes:
+            lines = PandasTransformer._format_node_rows(columns, delimiter, rows)
+        else:
+            lines = PandasTransformer._format_edge_rows(columns, delimiter, rows)
+        # shards are compressed in parallel by worker processes, so each uses one thread
+        with open_file(filename, 'wb', compression, threads=1) as FH:
+            return PandasTransformer.write_lines(FH, lines)
+
+    @staticmethod
+    def _get_shards(items: Iterable[Tuple[Any, Any]], shard_size: int) -> Dict[str, List[List]]:
+        """
+        Group keys by a value, as a name that is safe to use in a filename,
+        and split each group into shards of at most ``shard_size`` keys.
+        For a list value, like ``category``, the first element is used.
+        """
+        groups: Dict[str, List[List]] = {}
+        for key, value in items:
+            if isinstance(value, list):
+                value = value[0] if value else None
+            name = re.sub(r'[^\w.-]', '_', str(value)) if value else 'unknown'
+            shards = groups.setdefault(name, [[]])
+            if len(shards[-1]) >= shard_size:
+                shards.append([])
+            shards[-1].append(key)
+        return groups
+
+    @staticmethod
+    def _get_neo4j_node_header(columns: Iterable[str]) -> List[str]:
+        header = []
+        for x in columns:
+            if x == 'id':
+                header.append(f"{x}:ID")
+            elif x == 'category':
+                header.append(f"{x}:LABEL")
+            elif x in _column_types and _column_types[x] == list:
+                header.append(f"{x}:string[]")
+            else:
+                header.append(x)
+        return header
+
+    @staticmethod
+    def _get_neo4j_edge_header(columns: Iterable[str]) -> List[str]:
         header = []
-        for x in ordered_edge_columns:
+        for x in columns:
             if x == 'subject':
                 header.append(f"{x}:START_ID")
             elif x == 'object':
@@ -517,21 +1012,106 @@ class PandasTransformer(Transformer):
                 header.append(f"{x}:string[]")
             else:
                 header.append(x)
+        return header
 
-        FH = open(filename, 'w')
-        FH.write(delimiter.join(header) + '\n')
-        for s, o, data in self.graph.edges(data=True):
-            data = self.validate_edge(data)
-            row = PandasTransformer._build_export_row(data)
+    def _get_node_columns(self) -> OrderedSet:
+        if not self._node_properties:
+            self._node_properties = PandasTransformer.get_all_node_properties(self.graph)
+        return PandasTransformer._order_node_columns(self._node_properties)
+
+    def _get_edge_columns(self) -> OrderedSet:
+        if not self._edge_properties:
+            self._edge_properties = PandasTransformer.get_all_edge_properties(self.graph)
+        return PandasTransformer._order_edge_columns(self._edge_properties)
+
+    @staticmethod
+    def _format_node_rows(columns: Iterable[str], delimiter: str, nodes: Iterable[Tuple[str, Dict]]) -> Iterator[str]:
+        columns = list(columns)
+        build_export_row = PandasTransformer._build_export_row
+        cache: Dict = {}
+        join = delimiter.join
+        for n, data in nodes:
+            row = build_export_row(data, cache)
+            row['id'] = n
+            yield join([str(row[c]) if c in row else '' for c in columns]) + '\n'
+
+    @staticmethod
+    def _format_edge_rows(columns: Iterable[str], delimiter: str, edges: Iterable[Tuple[str, str, Dict]]) -> Iterator[str]:
+        columns = list(columns)
+        build_export_row = PandasTransformer._build_export_row
+        cache: Dict = {}
+        join = delimiter.join
+        for s, o, data in edges:
+            data = Transformer.validate_edge(data)
+            row = build_export_row(data, cache)
             row['subject'] = s
             row['object'] = o
-            values = []
-            for c in ordered_edge_columns:
-                if c in row:
-                    values.append(str(row[c]))
-                else:
-                    values.append("")
-            FH.write(delimiter.join(values) + '\n')
+            yield join([str(row[c]) if c in row else '' for c in columns]) + '\n'
+
+    @staticmethod
+    def write_lines(fh: IO, lines: Iterable[str], batch_size: int = EXPORT_BATCH_SIZE) -> int:
+        """
+        Write lines to a file handle, in blocks of ``batch_size`` lines.
+
+        Lines are joined into one string per block, so that there is one
+        call to ``write`` per block rather than one per line. If the file
+        handle is not a text file handle then each block is encoded as UTF-8.
+
+        Parameters
+        ----------
+        fh: IO
+            The file handle, in text or binary mode
+        lines: Iterable[str]
+            The lines, each terminated by a newline
+        batch_size: int
+            The number of lines per block
+
+        Returns
+        -------
+        int
+            The number of lines written
+
+        """
+        binary = not isinstance(fh, io.TextIOBase)
+        count = 0
+        lines = iter(lines)
+        while True:
+            batch = list(islice(lines, batch_size))
+            if not batch:
+                break
+            block = ''.join(batch)
+            fh.write(block.encode('utf-8') if binary else block)
+            count += len(batch)
+        return count
+
+    @staticmethod
+    def add_to_archive(tar: tarfile.TarFile, arcname: str, lines: Iterable[str]) -> None:
+        """
+        Add a member, with the given lines as its content, to a tar archive.
+
+        A tar header records the size of a member ahead of its content, so
+        the content is written in blocks to a spooled buffer that is kept in
+        memory up to ``EXPORT_SPOOL_SIZE`` bytes, and rolls over to an anonymous
+        temporary file beyond that. No file is written next to the archive.
+
+        Parameters
+        ----------
+        tar: tarfile.TarFile
+            The tar archive, opened for writing
+        arcname: str
+            The name of the member in the archive
+        lines: Iterable[str]
+            The lines, each terminated by a newline
+
+        """
+        with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_SIZE, mode='w+b') as spool:
+            PandasTransformer.write_lines(spool, lines)
+            info = tarfile.TarInfo(name=arcname)
+            info.size = spool.tell()
+            info.mtime = int(time.time())
+            info.mode = 0o644
+            spool.seek(0)
+            tar.addfile(info, spool)
 
     @staticmethod
     def _build_kwargs(data: Dict) -> Dict:
@@ -557,7 +1137,7 @@ class PandasTransformer(Transformer):
         return tidy_data
 
     @staticmethod
-    def _build_export_row(data: Dict) -> Dict:
+    def _build_export_row(data: Dict, cache: Optional[Dict] = None) -> Dict:
         """
         Casts all values to primitive types like str or bool according to the
         specified type in ``_column_types``. Lists become pipe delimited strings.
@@ -566,6 +1146,9 @@ class PandasTransformer(Transformer):
         ----------
         data: Dict
             A dictionary containing key-value pairs
+        cache: Optional[Dict]
+            A cache of sanitized values, for properties whose values
+            repeat across many nodes and edges, like ``category``
 
         Returns
         -------
@@ -575,6 +1158,27 @@ class PandasTransformer(Transformer):
         """
         tidy_data = {}
         for key, value in data.items():
+            if cache is not None and key in _export_cached_properties:
+                cache_key: Optional[Tuple[str, Optional[type], Any]]
+                if isinstance(value, str):
+                    cache_key = (key, _column_types.get(key), value)
+                elif isinstance(value, SharedList):
+                    # shared lists are immutable, and the cache keeps a reference to each of them
+                    # so that their id is not reused by another list while it is cached
+                    cache_key = (key, _column_types.get(key), id(value))
+                else:
+                    cache_key = None
+                if cache_key is not None:
+                    entry = cache.get(cache_key)
+                    if entry is not None and entry[0] is value:
+                        new_value = entry[1]
+                    else:
+                        new_value = PandasTransformer._remove_null(value)
+                        new_value = PandasTransformer._sanitize_export(key, new_value) if new_value else None
+                        cache[cache_key] = (value, new_value)
+                    if new_value is not None:
+                        tidy_data[key] = new_value
+                    continue
             new_value = PandasTransformer._remove_null(value)
             if new_value:
                 tidy_data[key] = PandasTransformer._sanitize_export(key, new_value)
@@ -853,3 +1457,10 @@ class PandasTransformer(Transformer):
         """
         null_values = {np.nan, pd.NA, pd.NaT, None, "", " "}
         return item in null_values
+
+
+def _write_shard(task: Tuple) -> int:
+    """
+    Write a data file of a sharded Neo4j export in a worker process.
+    """
+    return PandasTransformer.write_shard(*task)
@@ -4,12 +4,13 @@ from biolinkml.meta import SlotDefinition, ClassDefinition, Element
 from rdflib import URIRef, Namespace
 
 from kgx.config import get_logger, get_graph_store_class
-from kgx.graph.base_graph import BaseGraph
+from kgx.graph.base_graph import BaseGraph, EdgeKey
 from kgx.graph.nx_graph import NxGraph
 from kgx.utils.graph_utils import curie_lookup
 from kgx.utils.rdf_utils import property_mapping, is_property_multivalued, reverse_property_mapping
 from kgx.utils.kgx_utils import generate_edge_key, get_toolkit, sentencecase_to_camelcase, sentencecase_to_snakecase, \
     get_biolink_ancestors
+from kgx.utils.intern_utils import intern_values
 from kgx.prefix_manager import PrefixManager
 
 log = get_logger()
@@ -102,13 +103,7 @@ class RdfGraphMixin(object):
             The node data
 
         """
-        n = self.prefix_manager.contract(str(iri))
-        if n == iri:
-            if self.prefix_manager.has_urlfragment(iri):
-                n = rdflib.namespace.urldefrag(iri).fragment
-
-        if not n:
-            n = iri
+        n = self.get_node_id(iri)
         if self.graph.has_node(n):
             node_data = self.update_node(n, data)
         else:
@@ -120,15 +115,40 @@ class RdfGraphMixin(object):
 
             if 'category' in node_data:
                 if 'biolink:NamedThing' not in set(node_data['category']):
-                    node_data['category'].append('biolink:NamedThing')
+                    node_data['category'] = list(node_data['category']) + ['biolink:NamedThing']
             else:
                 node_data['category'] = ["biolink:NamedThing"]
 
             if 'provided_by' in self.graph_metadata and 'provided_by' not in node_data:
                 node_data['provided_by'] = self.graph_metadata['provided_by']
+            node_data = intern_values(node_data)
             self.graph.add_node(n, **node_data)
         return node_data
 
+    def get_node_id(self, iri: Union[URIRef, str]) -> str:
+        """
+        Get the identifier of the node for an IRI, as used in the kgx.graph.base_graph.BaseGraph.
+
+        Parameters
+        ----------
+        iri: Union[rdflib.URIRef, str]
+            IRI of a node
+
+        Returns
+        -------
+        str
+            The node identifier
+
+        """
+        n = self.prefix_manager.contract(str(iri))
+        if n == iri:
+            if self.prefix_manager.has_urlfragment(iri):
+                n = rdflib.namespace.urldefrag(iri).fragment
+
+        if not n:
+            n = iri
+        return n
+
     def update_node(self, n: Union[URIRef, str], data: Optional[Dict] = None) -> Dict:
         """
         Update a node with properties.
@@ -175,25 +195,9 @@ class RdfGraphMixin(object):
             The edge data
 
         """
-        (element_uri, canonical_uri, predicate, property_name) = self.process_predicate(predicate_iri)
         subject_node = self.add_node(subject_iri)
         object_node = self.add_node(object_iri)
-        edge_predicate = element_uri if element_uri else predicate
-        if not edge_predicate:
-            edge_predicate = property_name
-
-        if ' ' in edge_predicate:
-            log.debug(f"predicate IRI '{predicate_iri}' yields edge_predicate '{edge_predicate}' that not in snake_case form; replacing ' ' with '_'")
-        edge_predicate_prefix = self.prefix_manager.get_prefix(edge_predicate)
-        if edge_predicate_prefix not in {'biolink', 'rdf', 'rdfs', 'skos', 'owl'}:
-            if PrefixManager.is_curie(edge_predicate):
-                # name = curie_lookup(edge_predicate)
-                # if name:
-                #     log.debug(f"predicate IRI '{predicate_iri}' yields edge_predicate '{edge_predicate}' that is actually a CURIE; Using its mapping instead: {name}")
-                #     edge_predicate = f"{edge_predicate_prefix}:{name}"
-                # else:
-                #     log.debug(f"predicate IRI '{predicate_iri}' yields edge_predicate '{edge_predicate}' that is actually a CURIE; defaulting back to {self.DEFAULT_EDGE_PREDICATE}")
-                edge_predicate = self.DEFAULT_EDGE_PREDICATE
+        edge_predicate, predicate = self.get_edge_predicate(predicate_iri)
 
         edge_key = generate_edge_key(subject_node['id'], edge_predicate, object_node['id'])
         if self.graph.has_edge(subject_node['id'], object_node['id'], edge_key=edge_key):
@@ -212,11 +216,46 @@ class RdfGraphMixin(object):
 
             if 'provided_by' in self.graph_metadata and 'provided_by' not in edge_data:
                 edge_data['provided_by'] = self.graph_metadata['provided_by']
+            edge_data = intern_values(edge_data)
             self.graph.add_edge(subject_node['id'], object_node['id'], edge_key=edge_key, **edge_data)
 
         return edge_data
 
-    def update_edge(self, subject_curie: str, object_curie: str, edge_key: str, data: Optional[Dict[Any, Any]]) -> Dict:
+    def get_edge_predicate(self, predicate_iri: Union[URIRef, str]) -> Tuple[str, str]:
+        """
+        Get the edge predicate, and the relation, for a predicate IRI.
+
+        Parameters
+        ----------
+        predicate_iri: Union[rdflib.URIRef, str]
+            Predicate IRI for the predicate in a triple
+
+        Returns
+        -------
+        Tuple[str, str]
+            The edge predicate and the relation
+
+        """
+        (element_uri, canonical_uri, predicate, property_name) = self.process_predicate(predicate_iri)
+        edge_predicate = element_uri if element_uri else predicate
+        if not edge_predicate:
+            edge_predicate = property_name
+
+        if ' ' in edge_predicate:
+            log.debug(f"predicate IRI '{predicate_iri}' yields edge_predicate '{edge_predicate}' that not in snake_case form; replacing ' ' with '_'")
+        edge_predicate_prefix = self.prefix_manager.get_prefix(edge_predicate)
+        if edge_predicate_prefix not in {'biolink', 'rdf', 'rdfs', 'skos', 'owl'}:
+            if PrefixManager.is_curie(edge_predicate):
+                # name = curie_lookup(edge_predicate)
+                # if name:
+                #     log.debug(f"predicate IRI '{predicate_iri}' yields edge_predicate '{edge_predicate}' that is actually a CURIE; Using its mapping instead: {name}")
+                #     edge_predicate = f"{edge_predicate_prefix}:{name}"
+                # else:
+                #     log.debug(f"predicate IRI '{predicate_iri}' yields edge_predicate '{edge_predicate}' that is actually a CURIE; defaulting back to {self.DEFAULT_EDGE_PREDICATE}")
+                edge_predicate = self.DEFAULT_EDGE_PREDICATE
+        return edge_predicate, predicate
+
+    def update_edge(self, subject_curie: str, object_curie: str, edge_key: EdgeKey, data: Optional[Dict[Any, Any]]) -> Dict:
         """
         Update an edge with properties.
 
@@ -226,7 +265,7 @@ class RdfGraphMixin(object):
             Subject CURIE
         object_curie: str
             Object CURIE
-        edge_key: str
+        edge_key: EdgeKey
             Edge key
         data: Optional[Dict[Any, Any]]
             Edge properties
@@ -368,7 +407,7 @@ class RdfGraphMixin(object):
                         # key is in data
                         if isinstance(d1[key], list):
                             # existing key has value type list
-                            new_data[key] = d1[key]
+                            new_data[key] = list(d1[key])
                             if isinstance(new_value, (list, set, tuple)):
                                 new_data[key] += [x for x in new_value if x not in new_data[key]]
                             else:
@@ -395,7 +434,7 @@ class RdfGraphMixin(object):
                     # key is not multivalued; adding/replacing as-is
                     if key in d1:
                         if isinstance(d1[key], list):
-                            new_data[key] = d1[key]
+                            new_data[key] = list(d1[key])
                             if isinstance(new_value, (list, set, tuple)):
                                 new_data[key] += [x for x in new_value]
                             else:
@@ -416,7 +455,7 @@ class RdfGraphMixin(object):
                     else:
                         if isinstance(d1[key], list):
                             # existing key has value type list
-                            new_data[key] = d1[key]
+                            new_data[key] = list(d1[key])
                             if isinstance(new_value, (list, set, tuple)):
                                 new_data[key] += [x for x in new_value if x not in new_data[key]]
                             else:
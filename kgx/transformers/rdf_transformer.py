@@ -9,9 +9,11 @@ from kgx.graph.base_graph import BaseGraph
 from kgx.prefix_manager import PrefixManager
 from kgx.transformers.transformer import Transformer
 from kgx.transformers.rdf_graph_mixin import RdfGraphMixin
+from kgx.utils.compression_utils import open_file, strip_extension
+from kgx.utils.progress_utils import iter_progress, read_progress
 from kgx.utils.rdf_utils import property_mapping, reverse_property_mapping
 from kgx.utils.kgx_utils import get_toolkit, current_time_in_millis, \
-    get_biolink_property_types, apply_filters, generate_edge_identifiers, generate_uuid
+    get_biolink_property_types, generate_edge_identifiers, generate_uuid
 
 log = get_logger()
 
@@ -51,6 +53,8 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         self.property_types: Dict = get_biolink_property_types()
         self.node_filters: Dict[str, Union[str, Set]] = {}
         self.edge_filters: Dict[str, Union[str, Set]] = {}
+        self.edge_filter_verdicts: Dict = {}
+        self.deferred_edges: Optional[List] = None
 
     def set_predicate_mapping(self, m: Dict) -> None:
         """
@@ -107,7 +111,7 @@ class RdfTransformer(RdfGraphMixin, Transformer):
             The input file format.
             If ``None`` is provided then the format is guessed using ``rdflib.util.guess_format()``
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         provided_by : Optional[str]
             Define the source providing the input file.
         node_property_predicates: Optional[Set[str]]
@@ -118,22 +122,25 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         if node_property_predicates:
             self.node_properties.update([URIRef(self.prefix_manager.expand(x)) for x in node_property_predicates])
 
-        if compression:
-            log.warning(f"compression mode '{compression}' not supported by RdfTransformer")
         if input_format is None:
-            input_format = rdflib.util.guess_format(filename)
+            input_format = rdflib.util.guess_format(strip_extension(filename, compression))
 
         log.info("Parsing {} with '{}' format".format(filename, input_format))
-        rdfgraph.parse(filename, format=input_format)
+        if compression:
+            with open_file(filename, 'rb', compression) as FH, read_progress(FH, filename, compression) as PH:
+                rdfgraph.parse(PH, format=input_format)
+        else:
+            rdfgraph.parse(filename, format=input_format)
         log.info("{} parsed with {} triples".format(filename, len(rdfgraph)))
 
         if provided_by:
             self.graph_metadata['provided_by'] = [provided_by]
 
         self.start = current_time_in_millis()
+        self.compile_filters()
         self.load_graph(rdfgraph)
         log.info(f"Done parsing {filename}")
-        apply_filters(self.graph, self.node_filters, self.edge_filters)
+        self.apply_deferred_filters()
         generate_edge_identifiers(self.graph)
 
     def load_graph(self, rdfgraph: rdflib.Graph, predicates: Optional[Set[URIRef]] = None, **kwargs: Dict) -> None:
@@ -151,7 +158,7 @@ class RdfTransformer(RdfGraphMixin, Transformer):
 
         """
         self.reified_nodes.clear()
-        for s, p, o in rdfgraph.triples((None, None, None)):
+        for s, p, o in iter_progress(rdfgraph.triples((None, None, None)), 'Loading triples', rdfgraph.__len__, 'triples'):
             self.triple(s, p, o)
         self.dereify(self.reified_nodes)
 
@@ -208,12 +215,146 @@ class RdfTransformer(RdfGraphMixin, Transformer):
             self.add_node_attribute(s, key=prop_uri, value=o)
         else:
             # treating predicate as an edge
-            self.add_edge(s, o, p)
+            self.add_filtered_edge(s, o, p)
 
         if self.count % 1000 == 0:
             log.debug(f"Parsed {self.count} triples; time taken: {current_time_in_millis() - self.start} ms")
             self.start = current_time_in_millis()
 
+    def compile_filters(self) -> None:
+        """
+        Prepare node and edge filters to be applied while parsing.
+
+        Edge filters on ``predicate``, ``relation`` and ``provided_by`` are checked
+        for each edge before it is added, and the verdict for each predicate IRI
+        is cached. Node filters, on ``category`` and ``provided_by``, can only be checked
+        once all the triples for a node are parsed. Edges are therefore deferred until
+        the nodes are filtered, in ``apply_deferred_filters``.
+        """
+        self.edge_filter_verdicts.clear()
+        self.deferred_edges = [] if self.node_filters else None
+
+    def check_edge_filters(self, predicate_iri: Union[URIRef, str], data: Optional[Dict] = None) -> bool:
+        """
+        Check whether an edge passes the edge filters on ``predicate``,
+        ``relation`` and ``provided_by``.
+
+        Parameters
+        ----------
+        predicate_iri: Union[rdflib.URIRef, str]
+            Predicate IRI for the predicate in a triple
+        data: Optional[Dict]
+            Additional edge properties
+
+        Returns
+        -------
+        bool
+            Whether or not the edge passes the edge filters
+
+        """
+        if not self.edge_filters:
+            return True
+        if data and ('relation' in data or 'provided_by' in data):
+            return self._check_edge_filters(predicate_iri, data.get('relation'), data.get('provided_by'))
+        if predicate_iri not in self.edge_filter_verdicts:
+            self.edge_filter_verdicts[predicate_iri] = self._check_edge_filters(predicate_iri)
+        return self.edge_filter_verdicts[predicate_iri]
+
+    def _check_edge_filters(self, predicate_iri: Union[URIRef, str], relation: Optional[str] = None, provided_by: Optional[List] = None) -> bool:
+        """
+        Check an edge against the edge filters on ``predicate``, ``relation`` and ``provided_by``.
+        """
+        edge_predicate, predicate = self.get_edge_predicate(predicate_iri)
+        if relation is None:
+            relation = predicate
+        if provided_by is None:
+            provided_by = self.graph_metadata.get('provided_by', [])
+        elif isinstance(provided_by, str):
+            provided_by = [provided_by]
+        if 'predicate' in self.edge_filters and edge_predicate not in self.edge_filters['predicate']:
+            return False
+        if 'relation' in self.edge_filters and relation not in self.edge_filters['relation']:
+            return False
+        if 'provided_by' in self.edge_filters and not any(x in self.edge_filters['provided_by'] for x in provided_by):
+            return False
+        return True
+
+    def check_node_filters(self, data: Dict) -> bool:
+        """
+        Check whether a node passes the node filters on ``category`` and ``provided_by``.
+
+        Parameters
+        ----------
+        data: Dict
+            Node properties
+
+        Returns
+        -------
+        bool
+            Whether or not the node passes the node filters
+
+        """
+        for k in ('category', 'provided_by'):
+            if k in self.node_filters:
+                value = data.get(k) or []
+                if isinstance(value, str):
+                    value = [value]
+                if not any(x in value for x in self.node_filters[k]):
+                    return False
+        return True
+
+    def add_filtered_edge(self, subject_iri: URIRef, object_iri: URIRef, predicate_iri: URIRef, data: Optional[Dict] = None) -> None:
+        """
+        Add an edge, if it passes the edge filters.
+
+        If there are node filters then the edge is deferred until
+        the nodes are filtered, in ``apply_deferred_filters``.
+
+        Parameters
+        ----------
+        subject_iri: rdflib.URIRef
+            Subject IRI for the subject in a triple
+        object_iri: rdflib.URIRef
+            Object IRI for the object in a triple
+        predicate_iri: rdflib.URIRef
+            Predicate IRI for the predicate in a triple
+        data: Optional[Dict]
+            Additional edge properties
+
+        """
+        if not self.check_edge_filters(predicate_iri, data):
+            return
+        if self.deferred_edges is None:
+            self.add_edge(subject_iri, object_iri, predicate_iri, data)
+        else:
+            self.deferred_edges.append((subject_iri, object_iri, predicate_iri, dict(data) if data else None))
+
+    def apply_deferred_filters(self) -> None:
+        """
+        Apply node filters, once all triples are parsed, and then
+        add the deferred edges whose subject and object pass the node filters.
+
+        A subject or object that is not in the graph would be added, by the edge,
+        as a ``biolink:NamedThing``, and is checked as such.
+        """
+        if self.deferred_edges is None:
+            return
+        nodes_to_remove = set(n for n, data in self.graph.nodes(data=True) if not self.check_node_filters(data))
+        for n in nodes_to_remove:
+            log.debug(f"Removing node {n}")
+            self.graph.remove_node(n)
+        default_node = {'category': ['biolink:NamedThing']}
+        if 'provided_by' in self.graph_metadata:
+            default_node['provided_by'] = self.graph_metadata['provided_by']
+        default_node_passes = self.check_node_filters(default_node)
+        deferred_edges, self.deferred_edges = self.deferred_edges, None
+        for subject_iri, object_iri, predicate_iri, data in deferred_edges:
+            for n in (self.get_node_id(subject_iri), self.get_node_id(object_iri)):
+                if n in nodes_to_remove or (not default_node_passes and not self.graph.has_node(n)):
+                    break
+            else:
+                self.add_edge(subject_iri, object_iri, predicate_iri, data)
+
     def dereify(self, nodes: Set[str]) -> None:
         """
         Dereify a set of nodes where each node has all the properties
@@ -237,7 +378,7 @@ class RdfTransformer(RdfGraphMixin, Transformer):
             if 'category' in node:
                 del node['category']
             if 'subject' in node and 'object' in node:
-                self.add_edge(node['subject'], node['object'], node['predicate'], node)
+                self.add_filtered_edge(node['subject'], node['object'], node['predicate'], node)
                 self.graph.remove_node(n_curie)
             else:
                 log.warning(f"Cannot dereify node {n} {node}")
@@ -294,7 +435,7 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         output_format: str
             The output format; default: ``turtle``
         compression: Optional[str]
-            The compression type. Not yet supported.
+            The compression type. For example, ``gz`` or ``zstd``
         reify_all_edges: bool
             Whether to reify all edges in the graph
         kwargs: Dict
@@ -313,7 +454,11 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         for t in generator:
             rdfgraph.add(t)
         # Serialize the graph into the file.
-        rdfgraph.serialize(destination=filename, format=output_format)
+        if compression:
+            with open_file(filename, 'wb', compression) as FH:
+                rdfgraph.serialize(destination=FH, format=output_format)
+        else:
+            rdfgraph.serialize(destination=filename, format=output_format)
 
     def export_nodes(self) -> Iterator:
         """
@@ -326,7 +471,7 @@ class RdfTransformer(RdfGraphMixin, Transformer):
             An iterator
 
         """
-        for n, data in self.graph.nodes(data=True):
+        for n, data in iter_progress(self.graph.nodes(data=True), 'Exporting nodes', self.graph.number_of_nodes):
             s = self.uriref(n)
             for k, v in data.items():
                 if k in {'id', 'iri'}:
@@ -371,7 +516,7 @@ class RdfTransformer(RdfGraphMixin, Transformer):
         ecache = []
         associations = set([self.prefix_manager.contract(x) for x in self.reification_types])
         associations.update([str(x) for x in set(self.toolkit.get_all_associations(formatted=True))])
-        for u, v, k, data in self.graph.edges(data=True, keys=True):
+        for u, v, k, data in iter_progress(self.graph.edges(data=True, keys=True), 'Exporting edges', self.graph.number_of_edges):
             if reify_all_edges:
                 reified_node = self.reify(u, v, k, data)
                 s = reified_node['subject']
@@ -621,7 +766,7 @@ class RdfOwlTransformer(RdfTransformer):
             The input file format.
             If ``None`` is provided then the format is guessed using ``rdflib.util.guess_format()``
         compression: Optional[str]
-            The compression type. For example, ``gz``
+            The compression type. For example, ``gz`` or ``zstd``
         provided_by : Optional[str]
             Define the source providing the input file.
         node_property_predicates: Optional[Set[str]]
@@ -632,16 +777,18 @@ class RdfOwlTransformer(RdfTransformer):
         if node_property_predicates:
             self.node_properties.update([URIRef(self.prefix_manager.expand(x)) for x in node_property_predicates])
 
-        if compression:
-            log.warning(f"compression mode '{compression}' not supported by RdfTransformer")
         if input_format is None:
-            input_format = rdflib.util.guess_format(filename)
+            input_format = rdflib.util.guess_format(strip_extension(filename, compression))
 
         if input_format == 'owl':
             input_format = 'xml'
 
         log.info("Parsing {} with '{}' format".format(filename, input_format))
-        rdfgraph.parse(filename, format=input_format)
+        if compression:
+            with open_file(filename, 'rb', compression) as FH, read_progress(FH, filename, compression) as PH:
+                rdfgraph.parse(PH, format=input_format)
+        else:
+            rdfgraph.parse(filename, format=input_format)
         log.info("{} parsed with {} triples".format(filename, len(rdfgraph)))
 
         if provided_by:
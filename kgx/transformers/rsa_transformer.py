@@ -61,7 +61,7 @@ class RsaTransformer(JsonTransformer):
             del node['type']
         super().load_node(node)
 
-    def load_edge(self, edge: Dict) -> None:
+    def load_edge(self, edge: Dict, check_categories: bool = True) -> None:
         """
         Load an edge into an instance of BaseGraph
 
@@ -72,6 +72,8 @@ class RsaTransformer(JsonTransformer):
         ----------
         edge : Dict
             An edge
+        check_categories: bool
+            Whether to check the ``subject_category`` and ``object_category`` edge filters
 
         """
         if 'source_id' in edge:
@@ -80,4 +82,4 @@ class RsaTransformer(JsonTransformer):
             edge['object'] = edge['target_id']
         if 'relation_label' in edge:
             edge['predicate'] = edge['relation_label'][0]
-        super().load_edge(edge)
+        super().load_edge(edge, check_categories)
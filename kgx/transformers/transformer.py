@@ -1,5 +1,5 @@
 import json
-from typing import Union, List, Dict, Tuple, Set, Any, Optional
+from typing import Union, List, Dict, Tuple, Set, Any, Optional, Iterable
 
 from kgx.config import get_logger, get_config, get_graph_store_class
 from kgx.graph.base_graph import BaseGraph
@@ -37,6 +37,8 @@ class Transformer(object):
     """
 
     DEFAULT_NODE_CATEGORY = 'biolink:NamedThing'
+    REQUIRED_NODE_PROPERTIES = {'id', 'category'}
+    REQUIRED_EDGE_PROPERTIES = {'id', 'subject', 'predicate', 'object'}
 
     def __init__(self, source_graph: Optional[BaseGraph] = None):
         if source_graph:
@@ -46,6 +48,8 @@ class Transformer(object):
 
         self.node_filters: Dict[str, Any] = {}
         self.edge_filters: Dict[str, Any] = {}
+        self.node_projection: Optional[Set[str]] = None
+        self.edge_projection: Optional[Set[str]] = None
         self.graph_metadata: Dict = {}
 
     def report(self) -> None:
@@ -138,6 +142,69 @@ class Transformer(object):
         else:
             self.edge_filters[key] = value
 
+    def set_node_properties(self, properties: Optional[Iterable[str]]) -> None:
+        """
+        Set the node properties to load from a source.
+        All other node properties are skipped when parsing.
+
+        .. note::
+            The properties in ``REQUIRED_NODE_PROPERTIES``, and the
+            properties used by node filters, are always loaded.
+
+        Parameters
+        ----------
+        properties: Optional[Iterable[str]]
+            The node properties to load, or ``None`` to load all node properties
+
+        """
+        self.node_projection = set(properties) if properties is not None else None
+
+    def set_edge_properties(self, properties: Optional[Iterable[str]]) -> None:
+        """
+        Set the edge properties to load from a source.
+        All other edge properties are skipped when parsing.
+
+        .. note::
+            The properties in ``REQUIRED_EDGE_PROPERTIES``, and the
+            properties used by edge filters, are always loaded.
+
+        Parameters
+        ----------
+        properties: Optional[Iterable[str]]
+            The edge properties to load, or ``None`` to load all edge properties
+
+        """
+        self.edge_projection = set(properties) if properties is not None else None
+
+    def get_node_projection(self) -> Optional[Set[str]]:
+        """
+        Get all the node properties to load from a source.
+
+        Returns
+        -------
+        Optional[Set[str]]
+            The node properties to load, or ``None`` if all node properties are to be loaded
+
+        """
+        if self.node_projection is None:
+            return None
+        return self.node_projection | self.REQUIRED_NODE_PROPERTIES | set(self.node_filters.keys())
+
+    def get_edge_projection(self) -> Optional[Set[str]]:
+        """
+        Get all the edge properties to load from a source.
+
+        Returns
+        -------
+        Optional[Set[str]]
+            The edge properties to load, or ``None`` if all edge properties are to be loaded
+
+        """
+        if self.edge_projection is None:
+            return None
+        filter_properties = set(self.edge_filters.keys()) - {'subject_category', 'object_category'}
+        return self.edge_projection | self.REQUIRED_EDGE_PROPERTIES | filter_properties
+
     @staticmethod
     def validate_node(node: dict) -> dict:
         """
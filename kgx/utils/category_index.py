@@ -0,0 +1,135 @@
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+"""
+A compact index of node categories, used to evaluate edge filters on
+``subject_category`` and ``object_category`` without loading nodes into a graph.
+
+"""
+
+WORD_SIZE = 64
+
+
+class CategoryIndex(object):
+    """
+    An index of node identifier to a bitmask of categories.
+
+    Only the categories of interest, typically the categories used in filters,
+    are indexed. Node identifiers are interned and each node is stored as a row
+    of a NumPy array, so the memory used is proportional to the number of nodes.
+
+    Parameters
+    ----------
+    categories: Iterable[str]
+        The categories to index
+
+    """
+
+    def __init__(self, categories: Iterable[str]):
+        self.categories: List[str] = sorted(set(categories))
+        self.bits: Dict[str, int] = {c: i for i, c in enumerate(self.categories)}
+        self.words = max(1, -(-len(self.categories) // WORD_SIZE))
+        self.position: Dict[str, int] = {}
+        self.masks = np.zeros((1024, self.words), dtype=np.uint64)
+        self._index: Optional[pd.Index] = None
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.position
+
+    def mask(self, categories: Iterable[str]) -> np.ndarray:
+        """
+        Get the bitmask for a set of categories.
+
+        Categories that are not indexed are ignored.
+
+        Parameters
+        ----------
+        categories: Iterable[str]
+            The categories
+
+        Returns
+        -------
+        numpy.ndarray
+            The bitmask
+
+        """
+        mask = np.zeros(self.words, dtype=np.uint64)
+        for c in categories:
+            if c in self.bits:
+                i = self.bits[c]
+                mask[i // WORD_SIZE] |= np.uint64(1 << (i % WORD_SIZE))
+        return mask
+
+    def add(self, node: str, categories: Iterable[str]) -> None:
+        """
+        Add a node, and its categories, to the index.
+
+        If the node is already in the index then its categories are added
+        to the categories already indexed for the node.
+
+        Parameters
+        ----------
+        node: str
+            The node identifier
+        categories: Iterable[str]
+            The categories of the node
+
+        """
+        if isinstance(categories, str):
+            categories = [categories]
+        if node in self.position:
+            i = self.position[node]
+        else:
+            i = len(self.position)
+            self.position[sys.intern(node)] = i
+            if i == len(self.masks):
+                self.masks = np.concatenate([self.masks, np.zeros_like(self.masks)])
+            self._index = None
+        self.masks[i] |= self.mask(categories)
+
+    def lookup(self, nodes: Sequence[str]) -> np.ndarray:
+        """
+        Get the positions of nodes in the index.
+
+        Parameters
+        ----------
+        nodes: Sequence[str]
+            The node identifiers
+
+        Returns
+        -------
+        numpy.ndarray
+            The position of each node, or ``-1`` for nodes that are not in the index
+
+        """
+        if self._index is None:
+            self._index = pd.Index(list(self.position))
+        return self._index.get_indexer(nodes)
+
+    def has_category(self, positions: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        """
+        Check whether nodes have any of the categories in a bitmask.
+
+        Parameters
+        ----------
+        positions: numpy.ndarray
+            The positions of nodes in the index, as returned by ``lookup``
+        mask: numpy.ndarray
+            The bitmask, as returned by ``mask``
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean array, which is ``False`` for nodes that are not in the index
+
+        """
+        result = np.zeros(len(positions), dtype=bool)
+        found = positions >= 0
+        result[found] = (self.masks[positions[found]] & mask).any(axis=1)
+        return result
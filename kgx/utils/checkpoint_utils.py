@@ -0,0 +1,385 @@
+import hashlib
+import json
+import os
+import pickle
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from kgx.config import get_logger
+from kgx.graph.base_graph import BaseGraph
+
+"""
+Checkpoints of a merge, from which a merge that failed can be resumed.
+
+A checkpoint is a directory with a manifest, ``manifest.json``, and binary
+snapshots of graphs. The manifest records the sources that were parsed, the
+merged graph, the operations that were applied to the merged graph, and the
+destinations that were written. Each of these is recorded with a fingerprint
+of its configuration, and of its input files, so that a stage is only skipped
+when a merge is resumed if neither has changed since the stage completed.
+
+Snapshots are pickled graphs. A snapshot, and then the manifest, is written to
+a temporary file that replaces the previous one, so that a checkpoint is always
+left in a consistent state, even if a merge is interrupted while it is written.
+Each snapshot of the merged graph has a new filename, so that the manifest
+refers to the previous snapshot until it is replaced, and the previous
+snapshot is only deleted after that.
+
+"""
+
+log = get_logger()
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+class MergeCheckpoint(object):
+    """
+    The checkpoint of a merge.
+
+    Parameters
+    ----------
+    directory: str
+        The directory of the checkpoint
+    configuration: Dict
+        The ``configuration`` of the merge config YAML. A checkpoint of
+        a merge with another configuration is discarded
+
+    """
+
+    def __init__(self, directory: str, configuration: Optional[Dict] = None):
+        self.directory = directory
+        self.manifest_filename = os.path.join(directory, MANIFEST_FILENAME)
+        self.configuration = get_fingerprint(configuration)
+        self.manifest: Dict[str, Any] = self._new_manifest()
+
+    def _new_manifest(self) -> Dict[str, Any]:
+        return {
+            'version': MANIFEST_VERSION,
+            'configuration': self.configuration,
+            'sources': {},
+            'merged': None,
+            'destinations': {},
+        }
+
+    def load(self) -> bool:
+        """
+        Load the manifest of the checkpoint, to resume a merge.
+
+        Returns
+        -------
+        bool
+            Whether there was a checkpoint of a merge with the same configuration
+
+        """
+        if not os.path.isfile(self.manifest_filename):
+            log.info(f"No checkpoint to resume from in {self.directory}")
+            return False
+        with open(self.manifest_filename) as FH:
+            manifest = json.load(FH)
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('configuration') != self.configuration:
+            log.warning(f"Discarding the checkpoint in {self.directory}, of a merge with another configuration")
+            return False
+        self.manifest = manifest
+        log.info(f"Resuming from the checkpoint in {self.directory}")
+        return True
+
+    def reset(self) -> None:
+        """
+        Start a new checkpoint, discarding any previous one.
+        """
+        self.manifest = self._new_manifest()
+        self._write_manifest()
+
+    def is_source_parsed(self, key: str, source: Dict) -> bool:
+        """
+        Get whether a source was parsed.
+
+        Parameters
+        ----------
+        key: str
+            The key of the source
+        source: Dict
+            The source, from the merge config YAML
+
+        Returns
+        -------
+        bool
+            Whether the source was parsed, and neither the source
+            nor its files have changed since it was parsed
+
+        """
+        entry = self.manifest['sources'].get(key)
+        return entry is not None and entry['fingerprint'] == get_source_fingerprint(source)
+
+    def get_source(self, key: str, source: Dict) -> Optional[BaseGraph]:
+        """
+        Get the snapshot of a source that was parsed.
+
+        Parameters
+        ----------
+        key: str
+            The key of the source
+        source: Dict
+            The source, from the merge config YAML
+
+        Returns
+        -------
+        Optional[kgx.graph.base_graph.BaseGraph]
+            The graph of the source, or ``None`` if it was not parsed, or
+            if the source, or its files, have changed since it was parsed
+
+        """
+        if not self.is_source_parsed(key, source):
+            return None
+        log.info(f"Loading source '{key}' from checkpoint")
+        return read_snapshot(os.path.join(self.directory, self.manifest['sources'][key]['snapshot']))
+
+    def get_source_snapshot(self, key: str) -> str:
+        """
+        Get the filename of the snapshot of a source.
+
+        Parameters
+        ----------
+        key: str
+            The key of the source
+
+        Returns
+        -------
+        str
+            The filename
+
+        """
+        return os.path.join(self.directory, 'sources', f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', key)}.pickle")
+
+    def add_source(self, key: str, source: Dict) -> None:
+        """
+        Record that a source was parsed, and that its snapshot was written.
+        See ``run_with_snapshot``.
+
+        Parameters
+        ----------
+        key: str
+            The key of the source
+        source: Dict
+            The source, from the merge config YAML
+
+        """
+        self.manifest['sources'][key] = {
+            'fingerprint': get_source_fingerprint(source),
+            'snapshot': os.path.relpath(self.get_source_snapshot(key), self.directory),
+        }
+        self._write_manifest()
+
+    def get_merged(self, sources: Dict[str, Dict], operations: List[Dict]) -> Optional[BaseGraph]:
+        """
+        Get the snapshot of the merged graph.
+
+        Parameters
+        ----------
+        sources: Dict[str, Dict]
+            The sources that are merged, from the merge config YAML
+        operations: List[Dict]
+            The operations that are applied to the merged graph
+
+        Returns
+        -------
+        Optional[kgx.graph.base_graph.BaseGraph]
+            The merged graph, with the operations of ``get_completed_operations``
+            applied, or ``None`` if the sources were not merged, or have changed
+
+        """
+        merged = self.manifest['merged']
+        if merged is None or merged['sources'] != {k: get_source_fingerprint(v) for k, v in sources.items()}:
+            return None
+        if merged['operations'] != [get_fingerprint(x) for x in operations[:len(merged['operations'])]]:
+            # an operation that was applied has changed
+            return None
+        log.info(f"Loading merged graph, with {len(merged['operations'])} operations applied, from checkpoint")
+        return read_snapshot(os.path.join(self.directory, merged['snapshot']))
+
+    def get_completed_operations(self) -> int:
+        """
+        Get the number of operations that were applied to the merged graph.
+
+        Returns
+        -------
+        int
+            The number of operations
+
+        """
+        merged = self.manifest['merged']
+        return len(merged['operations']) if merged else 0
+
+    def add_merged(self, graph: BaseGraph, sources: Dict[str, Dict], operations: Optional[List[Dict]] = None) -> None:
+        """
+        Write a snapshot of the merged graph, after it is merged, and after each operation.
+
+        Parameters
+        ----------
+        graph: kgx.graph.base_graph.BaseGraph
+            The merged graph
+        sources: Dict[str, Dict]
+            The sources that are merged, from the merge config YAML
+        operations: Optional[List[Dict]]
+            The operations that were applied to the merged graph
+
+        """
+        previous = self.manifest['merged']
+        generation = previous.get('generation', -1) + 1 if previous else 0
+        snapshot = f"merged-{generation}.pickle"
+        write_snapshot(graph, os.path.join(self.directory, snapshot))
+        self.manifest['merged'] = {
+            'sources': {k: get_source_fingerprint(v) for k, v in sources.items()},
+            'snapshot': snapshot,
+            'generation': generation,
+            'operations': [get_fingerprint(x) for x in operations or []],
+        }
+        # destinations are written from the final merged graph
+        self.manifest['destinations'] = {}
+        self._write_manifest()
+        if previous:
+            try:
+                os.remove(os.path.join(self.directory, previous['snapshot']))
+            except FileNotFoundError:
+                pass
+
+    def is_destination_written(self, key: str, destination: Dict) -> bool:
+        """
+        Get whether a destination was written.
+
+        Parameters
+        ----------
+        key: str
+            The key of the destination
+        destination: Dict
+            The destination, from the merge config YAML
+
+        Returns
+        -------
+        bool
+            Whether the destination was written, with the same configuration
+
+        """
+        return self.manifest['destinations'].get(key) == get_fingerprint(destination)
+
+    def add_destination(self, key: str, destination: Dict) -> None:
+        """
+        Record that a destination was written.
+
+        Parameters
+        ----------
+        key: str
+            The key of the destination
+        destination: Dict
+            The destination, from the merge config YAML
+
+        """
+        self.manifest['destinations'][key] = get_fingerprint(destination)
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(f"{self.manifest_filename}.tmp", 'w') as FH:
+            json.dump(self.manifest, FH, indent=2)
+        os.replace(f"{self.manifest_filename}.tmp", self.manifest_filename)
+
+
+def get_fingerprint(obj: Any) -> str:
+    """
+    Get a fingerprint of an object, from the merge config YAML.
+
+    Parameters
+    ----------
+    obj: Any
+        The object
+
+    Returns
+    -------
+    str
+        The fingerprint
+
+    """
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def get_source_fingerprint(source: Dict) -> str:
+    """
+    Get a fingerprint of a source, and of the size and modification time of its files.
+
+    Parameters
+    ----------
+    source: Dict
+        The source, from the merge config YAML
+
+    Returns
+    -------
+    str
+        The fingerprint
+
+    """
+    filenames = source.get('input', {}).get('filename') or []
+    files = [(f, os.path.getsize(f), os.path.getmtime(f)) for f in filenames if os.path.isfile(f)]
+    return get_fingerprint([source, files])
+
+
+def write_snapshot(graph: BaseGraph, filename: str) -> None:
+    """
+    Write a binary snapshot of a graph.
+
+    Parameters
+    ----------
+    graph: kgx.graph.base_graph.BaseGraph
+        The graph
+    filename: str
+        The filename of the snapshot
+
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    with open(f"{filename}.tmp", 'wb') as FH:
+        pickle.dump(graph, FH, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{filename}.tmp", filename)
+
+
+def read_snapshot(filename: str) -> BaseGraph:
+    """
+    Read a binary snapshot of a graph.
+
+    Parameters
+    ----------
+    filename: str
+        The filename of the snapshot
+
+    Returns
+    -------
+    kgx.graph.base_graph.BaseGraph
+        The graph
+
+    """
+    with open(filename, 'rb') as FH:
+        return pickle.load(FH)
+
+
+def run_with_snapshot(filename: str, f: Callable, *args: Any) -> BaseGraph:
+    """
+    Call a function that returns a graph, in a worker process, and write
+    a snapshot of the graph.
+
+    Parameters
+    ----------
+    filename: str
+        The filename of the snapshot
+    f: Callable
+        The function
+    args: Any
+        The arguments of the function
+
+    Returns
+    -------
+    kgx.graph.base_graph.BaseGraph
+        The graph
+
+    """
+    graph = f(*args)
+    write_snapshot(graph, filename)
+    return graph
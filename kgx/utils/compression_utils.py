@@ -0,0 +1,242 @@
+import importlib
+import io
+import os
+import shutil
+import signal
+import subprocess
+from typing import IO, Any, Dict, List, Optional
+
+from kgx.config import get_logger
+
+"""
+Reading and writing of compressed files, by compression name.
+
+Each compression is handled by a Python module or, when more than one thread is
+available, by a multithreaded command line tool that is found on the ``PATH``
+(``pigz``, ``pbzip2``, ``xz``, ``zstd``). The tool runs as a separate process,
+so compression and decompression also happen in parallel with parsing and export.
+
+"""
+
+log = get_logger()
+
+# size, in bytes, of the buffer of files that are read or written through a process
+PROCESS_BUFFER_SIZE = 1 << 20
+
+_codecs: Dict[str, Dict[str, Any]] = {
+    'gz': {
+        'extension': 'gz',
+        'module': 'gzip',
+        'command': lambda threads: ['pigz', '-c', '-p', str(threads)],
+        'decompress_command': lambda threads: ['pigz', '-d', '-c'],
+    },
+    'bz2': {
+        'extension': 'bz2',
+        'module': 'bz2',
+        'command': lambda threads: ['pbzip2', '-c', f"-p{threads}"],
+        'decompress_command': lambda threads: ['pbzip2', '-d', '-c', f"-p{threads}"],
+    },
+    'xz': {
+        'extension': 'xz',
+        'module': 'lzma',
+        'command': lambda threads: ['xz', '-c', f"-T{threads}"],
+        'decompress_command': lambda threads: ['xz', '-d', '-c', f"-T{threads}"],
+    },
+    'zstd': {
+        'extension': 'zst',
+        'module': 'zstandard',
+        'command': lambda threads: ['zstd', '-c', '-q', f"-T{threads}"],
+        'decompress_command': lambda threads: ['zstd', '-d', '-c', '-q'],
+    },
+    'lz4': {
+        'extension': 'lz4',
+        'module': 'lz4.frame',
+        'command': lambda threads: ['lz4', '-c', '-q'],
+        'decompress_command': lambda threads: ['lz4', '-d', '-c', '-q'],
+    },
+}
+
+COMPRESSION_TYPES = list(_codecs.keys())
+
+
+class ProcessFile(io.RawIOBase):
+    """
+    A file that is compressed, or decompressed, by a command line tool
+    running in a separate process.
+
+    Parameters
+    ----------
+    args: List[str]
+        The command, which reads from stdin and writes to stdout
+    filename: str
+        The file to read from, or write to
+    mode: str
+        ``rb`` or ``wb``
+
+    """
+
+    def __init__(self, args: List[str], filename: str, mode: str = 'rb'):
+        super().__init__()
+        self.args = args
+        self.name = filename
+        self.mode = mode
+        self._reading = 'r' in mode
+        self._file: IO[bytes]
+        if self._reading:
+            self._file = open(filename, 'rb')
+            self._process = subprocess.Popen(args, stdin=self._file, stdout=subprocess.PIPE)
+            self._pipe = self._process.stdout
+        else:
+            self._file = open(filename, 'wb')
+            self._process = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=self._file)
+            self._pipe = self._process.stdin
+
+    def readable(self) -> bool:
+        return self._reading
+
+    def writable(self) -> bool:
+        return not self._reading
+
+    def readinto(self, b: Any) -> int:
+        return self._pipe.readinto(b) # type: ignore
+
+    def write(self, b: Any) -> int:
+        self._pipe.write(b) # type: ignore
+        return len(b)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._pipe.close() # type: ignore
+            returncode = self._process.wait()
+        finally:
+            self._file.close()
+            super().close()
+        # a reader that is closed before the end of the file stops the process with SIGPIPE
+        if returncode and not (self._reading and returncode == -signal.SIGPIPE):
+            raise OSError(f"'{' '.join(self.args)}' exited with status {returncode} for {self.name}")
+
+
+def get_extension(compression: str) -> str:
+    """
+    Get the file extension for a compression.
+
+    Parameters
+    ----------
+    compression: str
+        The compression. For example, ``zstd``
+
+    Returns
+    -------
+    str
+        The file extension, without the leading ``.``. For example, ``zst``
+
+    """
+    return get_codec(compression)['extension']
+
+
+def get_codec(compression: str) -> Dict[str, Any]:
+    """
+    Get the codec for a compression.
+
+    Parameters
+    ----------
+    compression: str
+        The compression. One of ``gz``, ``bz2``, ``xz``, ``zstd`` or ``lz4``
+
+    Returns
+    -------
+    Dict[str, Any]
+        The codec
+
+    """
+    if compression not in _codecs:
+        raise ValueError(f"Unsupported compression '{compression}'; expected one of {', '.join(COMPRESSION_TYPES)}")
+    return _codecs[compression]
+
+
+def strip_extension(filename: str, compression: Optional[str]) -> str:
+    """
+    Remove the extension of a compression from a filename.
+
+    Parameters
+    ----------
+    filename: str
+        The filename. For example, ``graph.ttl.gz``
+    compression: Optional[str]
+        The compression. For example, ``gz``
+
+    Returns
+    -------
+    str
+        The filename without the extension. For example, ``graph.ttl``
+
+    """
+    if compression in _codecs:
+        extension = f".{_codecs[compression]['extension']}"
+        if filename.endswith(extension):
+            return filename[:-len(extension)]
+    return filename
+
+
+def open_file(filename: str, mode: str = 'rb', compression: Optional[str] = None, threads: Optional[int] = None) -> IO:
+    """
+    Open a file for reading or writing, with a compression.
+
+    Parameters
+    ----------
+    filename: str
+        The filename
+    mode: str
+        ``r``, ``rb``, ``rt``, ``w``, ``wb`` or ``wt``.
+        Text modes read and write UTF-8.
+    compression: Optional[str]
+        The compression (``gz``, ``bz2``, ``xz``, ``zstd`` or ``lz4``),
+        or ``None`` for an uncompressed file
+    threads: Optional[int]
+        The number of threads used to compress or decompress (all CPUs, by default).
+        With one thread, the Python module of the compression is used
+
+    Returns
+    -------
+    IO
+        A file object
+
+    """
+    binary = 'b' in mode
+    mode = mode.replace('b', '').replace('t', '')
+    if mode not in {'r', 'w'}:
+        raise ValueError(f"Unsupported mode '{mode}'; expected 'r' or 'w'")
+    if compression is None:
+        return open(filename, mode + ('b' if binary else ''), encoding=None if binary else 'utf-8')
+    fh = _open_binary(filename, mode, compression, threads if threads else os.cpu_count() or 1)
+    return fh if binary else io.TextIOWrapper(fh, encoding='utf-8')
+
+
+def _open_binary(filename: str, mode: str, compression: str, threads: int) -> IO:
+    codec = get_codec(compression)
+    module = _import(codec['module'])
+    if codec['module'] == 'zstandard' and module is not None:
+        cctx = module.ZstdCompressor(threads=threads) if mode == 'w' else None
+        return module.open(filename, mode + 'b', cctx=cctx)
+    command = codec['command'](threads) if mode == 'w' else codec['decompress_command'](threads)
+    if shutil.which(command[0]) and (threads > 1 or module is None):
+        log.debug(f"Using '{command[0]}' with {threads} threads for {filename}")
+        raw = ProcessFile(command, filename, mode + 'b')
+        if mode == 'r':
+            return io.BufferedReader(raw, PROCESS_BUFFER_SIZE)
+        return io.BufferedWriter(raw, PROCESS_BUFFER_SIZE)
+    if module is None:
+        raise ImportError(
+            f"Compression with '{compression}' requires the '{codec['module'].split('.')[0]}' package, "
+            f"or the '{command[0]}' command"
+        )
+    return module.open(filename, mode + 'b')
+
+
+def _import(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -1,18 +1,248 @@
-from typing import List, Set, Dict, Optional
+import weakref
+from typing import List, Set, Dict, Optional, Iterable, Tuple, Callable, Any, FrozenSet
 import stringcase
-from cachetools import cached
+from cachetools import LRUCache, cached
 
 from kgx.config import get_logger
 from kgx.graph.base_graph import BaseGraph
-from kgx.utils.kgx_utils import get_toolkit, get_cache, get_curie_lookup_service, generate_edge_key, CORE_NODE_PROPERTIES, CORE_EDGE_PROPERTIES
+from kgx.utils.kgx_utils import get_toolkit, get_curie_lookup_service, format_edge_key, CORE_NODE_PROPERTIES, CORE_EDGE_PROPERTIES
 from kgx.prefix_manager import PrefixManager
 
 ONTOLOGY_PREFIX_MAP: Dict = {}
 ONTOLOGY_GRAPH_CACHE: Dict = {}
+ANCESTOR_INDEX_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 log = get_logger()
 
 
+class AncestorIndex(object):
+    """
+    A precomputed transitive closure over parent relationships, like ``subclass_of``.
+
+    Nodes are numbered in topological order, with parents before their children,
+    and the ancestors of each node are stored as a set of their numbers. Memory
+    is proportional to the total number of (node, ancestor) pairs, which is small
+    for ontologies, where each node has few ancestors. Checking whether a node is
+    an ancestor of another is a single set lookup.
+
+    Parameters
+    ----------
+    edges: Iterable[Tuple[str, str]]
+        (child, parent) pairs
+
+    """
+
+    def __init__(self, edges: Iterable[Tuple[str, str]]):
+        self.parents: Dict[str, List[str]] = {}
+        for child, parent in edges:
+            if child == parent:
+                continue
+            parents = self.parents.setdefault(child, [])
+            if parent not in parents:
+                parents.append(parent)
+            self.parents.setdefault(parent, [])
+        self.order: List[str] = []
+        self.position: Dict[str, int] = {}
+        self.ancestor_sets: List[FrozenSet[int]] = []
+        self._nearest: Dict[Tuple[str, Callable], Optional[List[str]]] = {}
+        self._build()
+
+    def _build(self) -> None:
+        """
+        Number the nodes in topological order and compute the ancestor sets.
+        """
+        children: Dict[str, List[str]] = {x: [] for x in self.parents}
+        pending = {}
+        for child, parents in self.parents.items():
+            pending[child] = len(parents)
+            for parent in parents:
+                children[parent].append(child)
+        queue = [x for x, count in pending.items() if count == 0]
+        while queue:
+            node = queue.pop()
+            self.position[node] = len(self.order)
+            self.order.append(node)
+            for child in children[node]:
+                pending[child] -= 1
+                if pending[child] == 0:
+                    queue.append(child)
+        # nodes in a cycle are numbered last, in no particular order
+        for node in self.parents:
+            if node not in self.position:
+                self.position[node] = len(self.order)
+                self.order.append(node)
+
+        empty: FrozenSet[int] = frozenset()
+        self.ancestor_sets = [empty] * len(self.order)
+        for i, node in enumerate(self.order):
+            self.ancestor_sets[i] = self._union_parents(node)
+        if len(self.order) != sum(1 for x in pending.values() if x == 0):
+            # propagate ancestors around cycles until nothing changes
+            changed = True
+            while changed:
+                changed = False
+                for i, node in enumerate(self.order):
+                    ancestors = self._union_parents(node)
+                    if len(ancestors) != len(self.ancestor_sets[i]):
+                        self.ancestor_sets[i] = ancestors
+                        changed = True
+
+    def _union_parents(self, node: str) -> FrozenSet[int]:
+        """
+        Get the union of the parents of a node and their ancestor sets.
+        """
+        parents = self.parents[node]
+        if not parents:
+            return self.ancestor_sets[self.position[node]]
+        if len(parents) == 1:
+            j = self.position[parents[0]]
+            return self.ancestor_sets[j].union((j,))
+        ancestors: Set[int] = set()
+        for parent in parents:
+            j = self.position[parent]
+            ancestors.add(j)
+            ancestors.update(self.ancestor_sets[j])
+        return frozenset(ancestors)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self.position
+
+    def ancestors(self, node: str) -> List[str]:
+        """
+        Get all ancestors of a node.
+
+        Parameters
+        ----------
+        node: str
+            The node
+
+        Returns
+        -------
+        List[str]
+            The ancestors, with descendants listed before their ancestors
+
+        """
+        if node not in self.position:
+            return []
+        return [self.order[i] for i in sorted(self.ancestor_sets[self.position[node]], reverse=True)]
+
+    def is_ancestor(self, ancestor: str, node: str) -> bool:
+        """
+        Check whether a node is an ancestor of another node.
+
+        Parameters
+        ----------
+        ancestor: str
+            The candidate ancestor
+        node: str
+            The node
+
+        Returns
+        -------
+        bool
+            Whether or not ``ancestor`` is an ancestor of ``node``
+
+        """
+        if node not in self.position or ancestor not in self.position:
+            return False
+        return self.position[ancestor] in self.ancestor_sets[self.position[node]]
+
+    def roots(self, node: str) -> List[str]:
+        """
+        Get the ancestors of a node that have no parents.
+
+        Parameters
+        ----------
+        node: str
+            The node
+
+        Returns
+        -------
+        List[str]
+            The root ancestors
+
+        """
+        return [x for x in self.ancestors(node) if not self.parents[x]]
+
+    def nearest_ancestor(self, node: str, predicate: Callable[[str], Any]) -> Optional[List[str]]:
+        """
+        Find the nearest ancestor of a node that satisfies a predicate.
+
+        Ancestors are visited breadth-first, so the returned ancestor has the
+        fewest parent relationships between it and the node. Results are memoized.
+
+        Parameters
+        ----------
+        node: str
+            The node
+        predicate: Callable[[str], Any]
+            A function that is truthy for the ancestor to find
+
+        Returns
+        -------
+        Optional[List[str]]
+            The path of ancestors from the node (excluded) up to the nearest
+            ancestor that satisfies the predicate (included), or ``None``
+
+        """
+        key = (node, predicate)
+        if key not in self._nearest:
+            path = None
+            previous: Dict[str, str] = {node: node}
+            level = [node]
+            while level and path is None:
+                next_level = []
+                for n in level:
+                    for parent in self.parents.get(n, []):
+                        if parent in previous:
+                            continue
+                        previous[parent] = n
+                        if predicate(parent):
+                            path = [parent]
+                            while previous[path[-1]] != node:
+                                path.append(previous[path[-1]])
+                            path.reverse()
+                            break
+                        next_level.append(parent)
+                    if path is not None:
+                        break
+                level = next_level
+            self._nearest[key] = path
+        return self._nearest[key]
+
+
+def get_ancestor_index(graph: Any, relations: Optional[List[str]] = None) -> AncestorIndex:
+    """
+    Get an ancestor index over edges of a graph, filtered by ``relations``.
+
+    The index is built once per graph and reused, until nodes or edges are
+    added to or removed from the graph.
+
+    Parameters
+    ----------
+    graph: Any
+        A kgx.graph.base_graph.BaseGraph or a networkx graph
+    relations: Optional[List[str]]
+        Edge predicates to follow (all edges, by default)
+
+    Returns
+    -------
+    kgx.utils.graph_utils.AncestorIndex
+        The ancestor index
+
+    """
+    signature = (graph.number_of_nodes(), graph.number_of_edges())
+    key = tuple(relations) if relations is not None else None
+    indexes = ANCESTOR_INDEX_CACHE.setdefault(graph, {})
+    if key not in indexes or indexes[key][0] != signature:
+        edges = (
+            (s, o) for s, o, data in graph.edges(keys=False, data=True)
+            if relations is None or data.get('predicate') in relations
+        )
+        indexes[key] = (signature, AncestorIndex(edges))
+    return indexes[key][1]
+
+
 def get_parents(graph: BaseGraph, node: str, relations: List[str] = None) -> List[str]:
     """
     Return all direct `parents` of a specified node, filtered by ``relations``.
@@ -61,22 +291,44 @@ def get_ancestors(graph: BaseGraph, node: str, relations: List[str] = None) -> L
         A list of ancestor nodes
 
     """
-    seen = []
+    seen = set()
+    ancestors = []
     nextnodes = [node]
     while len(nextnodes) > 0:
         nn = nextnodes.pop()
         if nn not in seen:
-            seen.append(nn)
+            seen.add(nn)
+            ancestors.append(nn)
             nextnodes += get_parents(graph, nn, relations=relations)
-    seen.remove(node)
-    return seen
+    return ancestors[1:]
+
+@cached(LRUCache(maxsize=10000))
+def get_biolink_mapping(curie: str) -> Optional[str]:
+    """
+    Get the Biolink Model element that a CURIE is mapped to.
+
+    Parameters
+    ----------
+    curie: str
+        The CURIE
+
+    Returns
+    -------
+    Optional[str]
+        The name of the Biolink Model element, if any
+
+    """
+    return get_toolkit().get_by_mapping(curie)
+
 
-@cached(get_cache())
 def get_category_via_superclass(graph: BaseGraph, curie: str, load_ontology: bool = True) -> Set[str]:
     """
     Get category for a given CURIE by tracing its superclass, via ``subclass_of`` hierarchy,
     and getting the most appropriate category based on the superclass.
 
+    The category is based on the nearest superclass that is mapped to the Biolink Model,
+    found via an ancestor index that is built once per graph. See ``get_ancestor_index``.
+
     Parameters
     ----------
     graph: kgx.graph.base_graph.BaseGraph
@@ -95,28 +347,51 @@ def get_category_via_superclass(graph: BaseGraph, curie: str, load_ontology: boo
     """
     log.debug("curie: {}".format(curie))
     new_categories = []
-    toolkit = get_toolkit()
     if PrefixManager.is_curie(curie):
-        ancestors = get_ancestors(graph, curie, relations=['subclass_of'])
-        if len(ancestors) == 0 and load_ontology:
-            cls = get_curie_lookup_service()
-            ontology_graph = cls.ontology_graph
-            new_categories += [x for x in get_category_via_superclass(ontology_graph, curie, False)]
-        log.debug("Ancestors for CURIE {} via subClassOf: {}".format(curie, ancestors))
-        seen = []
-        for anc in ancestors:
-            mapping = toolkit.get_by_mapping(anc)
-            seen.append(anc)
-            if mapping:
-                # there is direct mapping to BioLink Model
-                log.debug("Ancestor {} mapped to {}".format(anc, mapping))
-                seen_labels = [graph.nodes()[x]['name'] for x in seen if 'name' in graph.nodes()[x]]
-                new_categories += [x for x in seen_labels]
-                new_categories += [x for x in toolkit.ancestors(mapping)]
-                break
+        index = get_ancestor_index(graph, relations=['subclass_of'])
+        if not index.parents.get(curie) and load_ontology:
+            new_categories += [x for x in get_category_via_ontology(curie)]
+        nodes = graph.nodes()
+        new_categories += _get_categories(index, curie, lambda x: nodes[x].get('name') if x in nodes else None)
     return set(new_categories)
 
 
+def get_category_via_ontology(curie: str) -> Set[str]:
+    """
+    Get category for a given CURIE by tracing its superclass, via ``subClassOf``
+    hierarchy of the ontologies used by ``kgx.curie_lookup_service.CurieLookupService``.
+
+    Parameters
+    ----------
+    curie: str
+        Input CURIE
+
+    Returns
+    -------
+    Set[str]
+        A set containing one (or more) category for the given CURIE
+
+    """
+    cls = get_curie_lookup_service()
+    return set(_get_categories(cls.ancestor_index, curie, cls.curie_map.get))
+
+
+def _get_categories(index: AncestorIndex, curie: str, get_label: Callable[[str], Optional[str]]) -> List[str]:
+    """
+    Get the labels of the superclasses of a CURIE, up to and including its nearest
+    superclass that is mapped to the Biolink Model, and the ancestors of that mapping.
+    """
+    categories = []
+    path = index.nearest_ancestor(curie, get_biolink_mapping)
+    log.debug("Superclasses for CURIE {} via subClassOf: {}".format(curie, path))
+    if path:
+        mapping = get_biolink_mapping(path[-1])
+        log.debug("Ancestor {} mapped to {}".format(path[-1], mapping))
+        categories += [x for x in (get_label(x) for x in path) if x]
+        categories += [x for x in get_toolkit().ancestors(mapping)]
+    return categories
+
+
 def curie_lookup(curie: str) -> Optional[str]:
     """
     Given a CURIE, find its label.
@@ -143,8 +418,6 @@ def curie_lookup(curie: str) -> Optional[str]:
         name = stringcase.snakecase(curie.split(':', 1)[1])
     elif curie in cls.curie_map:
         name = cls.curie_map[curie]
-    elif curie in cls.ontology_graph:
-        name = cls.ontology_graph.nodes()[curie]['name']
     return name
 
 
@@ -208,10 +481,10 @@ def remap_node_identifier(graph: BaseGraph, category: str, alternative_property:
     for u, v, k, edge_data in graph.edges(data=True, keys=True):
         if u is not edge_data['subject']:
             updated_subject_values[(u, v, k)] = {'subject': u}
-            update_edge_keys[(u, v, k)] = {'edge_key': generate_edge_key(u, edge_data['predicate'], v)}
+            update_edge_keys[(u, v, k)] = {'edge_key': format_edge_key(u, edge_data['predicate'], v)}
         if v is not edge_data['object']:
             updated_object_values[(u, v, k)] = {'object': v}
-            update_edge_keys[(u, v, k)] = {'edge_key': generate_edge_key(u, edge_data['predicate'], v)}
+            update_edge_keys[(u, v, k)] = {'edge_key': format_edge_key(u, edge_data['predicate'], v)}
 
     graph.set_edge_attributes(graph, attributes=updated_subject_values)
     graph.set_edge_attributes(graph, attributes=updated_object_values)
@@ -0,0 +1,292 @@
+import sys
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from kgx.config import get_logger, get_config
+
+"""
+Interning of property values that repeat across many nodes and edges.
+
+Strings are replaced by a canonical instance, and lists by a shared, immutable
+``SharedList``. Code that needs to modify a shared list must copy it first.
+
+Interning is disabled by default, and is enabled with ``intern-values`` in the config,
+or with ``set_interning``.
+
+"""
+
+log = get_logger()
+
+# identifiers are mostly distinct, so only properties with few distinct values are interned
+INTERNED_PROPERTIES = {
+    'predicate',
+    'relation',
+    'category',
+    'provided_by',
+    'knowledge_source',
+    'type',
+    'taxon',
+}
+
+value_table = None
+interning: Optional[bool] = None
+
+
+class SharedList(list):
+    """
+    An immutable list that is shared by all nodes and edges that have the same value.
+
+    ``SharedList`` is a subclass of ``list``, so it can be used wherever a list is expected,
+    but any attempt to modify it raises a ``TypeError``. A modified copy can be made
+    with ``list(shared_list)``.
+
+    """
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError(f"'{self.__class__.__name__}' is shared by other nodes or edges and cannot be modified; use a copy")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable # type: ignore
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable # type: ignore
+
+    def __copy__(self) -> 'SharedList':
+        return self
+
+    def __deepcopy__(self, memo: Dict) -> 'SharedList':
+        return self
+
+    def __reduce__(self) -> Tuple:
+        # share the list with the value table of the process that unpickles it
+        return get_shared_list, (tuple(self),)
+
+
+class ValueTable(object):
+    """
+    A table of canonical strings and shared lists, used to intern the
+    values of properties as nodes and edges are loaded into a graph.
+
+    Parameters
+    ----------
+    properties: Optional[Iterable[str]]
+        The properties whose values are interned (defaults to ``INTERNED_PROPERTIES``)
+
+    """
+
+    def __init__(self, properties: Optional[Iterable[str]] = None):
+        self.properties = set(properties) if properties is not None else set(INTERNED_PROPERTIES)
+        self.strings: Dict[str, str] = {}
+        self.lists: Dict[Tuple, SharedList] = {}
+        self.references = 0
+        self.bytes_saved = 0
+
+    def intern(self, data: Dict) -> Dict:
+        """
+        Intern the keys, and the values of interned properties, of a node or an edge.
+
+        Parameters
+        ----------
+        data: Dict
+            The node or edge properties
+
+        Returns
+        -------
+        Dict
+            The node or edge properties with interned keys and values
+
+        """
+        interned = {}
+        for key, value in data.items():
+            if key in self.properties:
+                if isinstance(value, str):
+                    value = self.intern_string(value)
+                elif isinstance(value, list):
+                    value = self.share(value)
+            interned[sys.intern(key)] = value
+        return interned
+
+    def intern_string(self, value: str) -> str:
+        """
+        Get the canonical instance of a string.
+
+        Parameters
+        ----------
+        value: str
+            The string
+
+        Returns
+        -------
+        str
+            The canonical instance of the string
+
+        """
+        self.references += 1
+        canonical = self.strings.setdefault(value, value)
+        if canonical is not value:
+            self.bytes_saved += sys.getsizeof(value)
+        return canonical
+
+    def share(self, values: Iterable) -> SharedList:
+        """
+        Get the shared list for a list of values.
+
+        Parameters
+        ----------
+        values: Iterable
+            The values
+
+        Returns
+        -------
+        SharedList
+            The shared list, with interned strings
+
+        """
+        if isinstance(values, SharedList):
+            return values
+        key = tuple(self.intern_string(x) if isinstance(x, str) else x for x in values)
+        try:
+            shared = self.lists.get(key)
+        except TypeError:
+            # values that are not hashable are not shared
+            return SharedList(key)
+        if shared is None:
+            shared = self.lists[key] = SharedList(key)
+        elif shared is not values:
+            self.bytes_saved += sys.getsizeof(values)
+        return shared
+
+    def report(self) -> Dict[str, int]:
+        """
+        Get a report of the interned values, and of the memory saved by interning.
+
+        Returns
+        -------
+        Dict[str, int]
+            The number of distinct strings and lists, the number of interned
+            values, and an estimate of the number of bytes saved
+
+        """
+        return {
+            'strings': len(self.strings),
+            'lists': len(self.lists),
+            'references': self.references,
+            'bytes_saved': self.bytes_saved,
+        }
+
+
+def get_value_table() -> ValueTable:
+    """
+    Get the value table of the current process.
+    If there is no value table, then one is instantiated and returned.
+
+    Returns
+    -------
+    kgx.utils.intern_utils.ValueTable
+        The value table
+
+    """
+    global value_table
+    if value_table is None:
+        value_table = ValueTable()
+    return value_table
+
+
+def is_interning_enabled() -> bool:
+    """
+    Check whether the values of nodes and edges are interned.
+
+    This is read from ``intern-values`` in the config, unless it
+    has been set with ``set_interning``.
+
+    Returns
+    -------
+    bool
+        Whether values are interned
+
+    """
+    global interning
+    if interning is None:
+        set_interning(get_config().get('intern-values', False))
+    return bool(interning)
+
+
+def set_interning(enabled: bool) -> None:
+    """
+    Enable, or disable, the interning of the values of nodes and edges.
+
+    Parameters
+    ----------
+    enabled: bool
+        Whether values are interned
+
+    """
+    global interning
+    interning = enabled
+
+
+def get_shared_list(values: Iterable) -> SharedList:
+    """
+    Get the shared list for a list of values, from the value table of the current process.
+
+    A new list is returned if interning is disabled.
+
+    Parameters
+    ----------
+    values: Iterable
+        The values
+
+    Returns
+    -------
+    SharedList
+        The shared list
+
+    """
+    if not is_interning_enabled():
+        return SharedList(values)
+    return get_value_table().share(values)
+
+
+def intern_values(data: Dict) -> Dict:
+    """
+    Intern the keys, and the values of interned properties, of a node or an edge,
+    using the value table of the current process.
+
+    The properties are returned as is, if interning is disabled.
+
+    Parameters
+    ----------
+    data: Dict
+        The node or edge properties
+
+    Returns
+    -------
+    Dict
+        The node or edge properties with interned keys and values
+
+    """
+    if not is_interning_enabled():
+        return data
+    return get_value_table().intern(data)
+
+
+def log_report(name: Optional[str] = None) -> None:
+    """
+    Log the report of the value table of the current process, if interning is enabled.
+
+    The value table is then discarded, so that it only holds the values of one source,
+    or graph, at a time. Values that were already interned stay shared.
+
+    Parameters
+    ----------
+    name: Optional[str]
+        The name of the source, or graph, that was loaded
+
+    """
+    global value_table
+    if value_table is None:
+        return
+    report = value_table.report()
+    log.info(
+        f"Interned {report['references']} values{f' for {name}' if name else ''}: "
+        f"{report['strings']} distinct strings, {report['lists']} shared lists, "
+        f"~{report['bytes_saved'] / (1 << 20):.1f} MiB saved"
+    )
+    value_table = None
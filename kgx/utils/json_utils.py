@@ -0,0 +1,248 @@
+import importlib
+import json
+import re
+from typing import Any, Iterable, List, Optional, Union
+
+from kgx.config import get_config, get_logger
+
+"""
+Encoding and decoding of JSON, with the fastest backend that is installed.
+
+``orjson`` is used when it is installed, then ``msgspec``, and then the ``json``
+module of the standard library. All backends encode to the same UTF-8 bytes:
+compact JSON has no spaces after separators, indented JSON is indented by the
+requested number of spaces, and floats are formatted as by ``repr``.
+
+"""
+
+log = get_logger()
+
+JSON_BACKENDS = ('orjson', 'msgspec', 'json')
+
+json_backend: Optional[str] = None
+_encoders: dict = {}
+_decoder: Any = None
+
+
+def get_json_backend() -> str:
+    """
+    Get the backend used to encode and decode JSON.
+
+    The backend is read from ``json-backend`` in the config, unless it has been set
+    with ``set_json_backend``. By default, the fastest backend that is installed is used.
+
+    Returns
+    -------
+    str
+        The JSON backend. One of ``orjson``, ``msgspec`` or ``json``
+
+    """
+    global json_backend
+    if json_backend is None:
+        set_json_backend(get_config().get('json-backend', 'auto'))
+    return json_backend # type: ignore
+
+
+def set_json_backend(backend: str) -> None:
+    """
+    Set the backend used to encode and decode JSON.
+
+    Parameters
+    ----------
+    backend: str
+        The JSON backend. One of ``orjson``, ``msgspec``, ``json``,
+        or ``auto`` for the fastest backend that is installed
+
+    """
+    global json_backend, _decoder
+    if backend == 'auto':
+        backend = next(x for x in JSON_BACKENDS if _is_installed(x))
+    elif backend not in JSON_BACKENDS:
+        raise ValueError(f"Unrecognized JSON backend '{backend}'; expected one of {', '.join(JSON_BACKENDS)} or auto")
+    elif not _is_installed(backend):
+        raise ImportError(f"JSON backend '{backend}' is not installed")
+    json_backend = backend
+    _encoders.clear()
+    _decoder = None
+    log.debug(f"Using '{backend}' to encode and decode JSON")
+
+
+def dumps(obj: Any, indent: Optional[int] = None, sort_keys: bool = False) -> bytes:
+    """
+    Encode an object as JSON.
+
+    Parameters
+    ----------
+    obj: Any
+        The object
+    indent: Optional[int]
+        The number of spaces to indent by, or ``None`` for compact JSON
+    sort_keys: bool
+        Whether to sort the keys of objects
+
+    Returns
+    -------
+    bytes
+        The JSON, encoded as UTF-8
+
+    """
+    backend = get_json_backend()
+    if backend == 'json':
+        separators = (',', ': ') if indent else (',', ':')
+        return json.dumps(obj, indent=indent, separators=separators, sort_keys=sort_keys, ensure_ascii=False, default=_default).encode('utf-8')
+    if backend == 'orjson' and indent:
+        data = _normalize_floats(_get_encoder(sort_keys, True)(obj))
+        # orjson indents by 2 spaces; JSON strings cannot contain a newline, so leading spaces are indentation
+        return data if indent == 2 else _LEADING_SPACES.sub(lambda m: b' ' * (len(m.group(0)) // 2 * indent), data)
+    data = _normalize_floats(_get_encoder(sort_keys)(obj))
+    if indent:
+        import msgspec
+        data = msgspec.json.format(data, indent=indent)
+    return data
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON.
+
+    Parameters
+    ----------
+    data: Union[bytes, str]
+        The JSON
+
+    Returns
+    -------
+    Any
+        The decoded object
+
+    """
+    backend = get_json_backend()
+    if backend == 'orjson':
+        import orjson
+        return orjson.loads(data)
+    if backend == 'msgspec':
+        global _decoder
+        if _decoder is None:
+            import msgspec
+            _decoder = msgspec.json.Decoder()
+        return _decoder.decode(data)
+    return json.loads(data)
+
+
+def decode_lines(lines: List[bytes]) -> List[Any]:
+    """
+    Decode a batch of JSON lines.
+
+    The lines are decoded together, as the elements of one JSON array,
+    which is much faster than decoding the lines one at a time. Blank lines
+    are ignored.
+
+    Parameters
+    ----------
+    lines: List[bytes]
+        The lines
+
+    Returns
+    -------
+    List[Any]
+        The decoded objects
+
+    """
+    lines = [x for x in lines if x.strip()]
+    try:
+        return loads(b'[' + b','.join(lines) + b']')
+    except Exception:
+        # decode the lines one at a time, to report the line that is not valid JSON
+        objects = []
+        for line in lines:
+            try:
+                objects.append(loads(line))
+            except Exception as e:
+                raise ValueError(f"Invalid JSON line: {line[:100]!r}") from e
+        return objects
+
+
+def encode_lines(objects: Iterable[Any]) -> bytes:
+    """
+    Encode a batch of objects as JSON lines.
+
+    Parameters
+    ----------
+    objects: Iterable[Any]
+        The objects
+
+    Returns
+    -------
+    bytes
+        The JSON lines, each terminated by a newline, encoded as UTF-8
+
+    """
+    if get_json_backend() == 'json':
+        encode_str = _get_json_encoder().encode
+        return ''.join([encode_str(x) + '\n' for x in objects]).encode('utf-8')
+    encode = _get_encoder(False)
+    return _normalize_floats(b''.join([encode(x) + b'\n' for x in objects]))
+
+
+def _get_encoder(sort_keys: bool, indent: bool = False) -> Any:
+    key = (sort_keys, indent)
+    if key not in _encoders:
+        backend = get_json_backend()
+        if backend == 'orjson':
+            import orjson
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            _encoders[key] = lambda x, option=option: orjson.dumps(x, default=_default, option=option)
+        else:
+            import msgspec
+            encoder = msgspec.json.Encoder(enc_hook=_default, order='sorted' if sort_keys else None)
+            _encoders[key] = encoder.encode
+    return _encoders[key]
+
+
+def _get_json_encoder() -> json.JSONEncoder:
+    if 'json' not in _encoders:
+        _encoders['json'] = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_default)
+    return _encoders['json']
+
+
+# a digit followed by an exponent, which is only formatted differently from repr in floats
+_EXPONENT = re.compile(rb'\de-?\d')
+# a JSON string, which is left as is, or a float with an exponent
+_FLOAT = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|(-?\d+(?:\.\d+)?)e(-?)(\d+)')
+_LEADING_SPACES = re.compile(rb'^ +', re.MULTILINE)
+
+
+def _normalize_floats(data: bytes) -> bytes:
+    # orjson and msgspec write 1e16 and 1e-7, where repr (and the json module) write 1e+16 and 1e-07
+    if not _EXPONENT.search(data):
+        return data
+    return _FLOAT.sub(_format_exponent, data)
+
+
+def _format_exponent(m: Any) -> bytes:
+    if m.group(1) is None:
+        return m.group(0)
+    return m.group(1) + b'e' + (m.group(2) or b'+') + m.group(3).rjust(2, b'0')
+
+
+def _default(obj: Any) -> Any:
+    # subclasses of list, like SharedList, and NumPy scalars
+    if isinstance(obj, (list, tuple, set)):
+        return list(obj)
+    if hasattr(obj, 'item'):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _is_installed(name: str) -> bool:
+    if name == 'json':
+        return True
+    try:
+        importlib.import_module(name)
+        return True
+    except ImportError:
+        return False
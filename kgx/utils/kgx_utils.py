@@ -1,20 +1,29 @@
+import hashlib
 import re
 import time
 import uuid
-from typing import List, Dict, Set, Optional, Any, Union
+from typing import List, Dict, Set, Optional, Any, Union, Tuple, Mapping, TYPE_CHECKING
 import stringcase
-from biolinkml.meta import TypeDefinitionName, ElementName, SlotDefinition, ClassDefinition, TypeDefinition, Element
-from bmt import Toolkit
 from cachetools import LRUCache
 from prefixcommons.curie_util import contract_uri
 from prefixcommons.curie_util import expand_uri
 
 from kgx.config import get_jsonld_context, get_logger, get_config
-from kgx.graph.base_graph import BaseGraph
+from kgx.graph.base_graph import BaseGraph, EdgeKey
+
+if TYPE_CHECKING:
+    # bmt and biolinkml are slow to import, and are only imported when first needed
+    from biolinkml.meta import Element
+    from bmt import Toolkit
 
 toolkit = None
 curie_lookup_service = None
 cache = None
+edge_key_scheme: Optional[str] = None
+
+EDGE_KEY_SCHEMES = {'string', 'tuple', 'hash'}
+predicate_hashes: Dict[str, int] = {}
+hashed_predicates: Dict[int, str] = {}
 
 log = get_logger()
 
@@ -143,7 +152,7 @@ def format_biolink_slots(s: str) -> str:
         return f"biolink:{formatted}"
 
 
-def contract(uri: str, prefix_maps: Optional[List[Dict]] = None, fallback: bool = True) -> str:
+def contract(uri: str, prefix_maps: Optional[List[Mapping]] = None, fallback: bool = True) -> str:
     """
     Contract a given URI to a CURIE, based on mappings from `prefix_maps`.
     If no prefix map is provided then will use defaults from prefixcommons-py.
@@ -154,7 +163,7 @@ def contract(uri: str, prefix_maps: Optional[List[Dict]] = None, fallback: bool
     ----------
     uri: str
         A URI
-    prefix_maps: Optional[List[Dict]]
+    prefix_maps: Optional[List[Mapping]]
         A list of prefix maps to use for mapping
     fallback: bool
         Determines whether to fallback to default prefix mappings, as determined
@@ -185,7 +194,7 @@ def contract(uri: str, prefix_maps: Optional[List[Dict]] = None, fallback: bool
     return curie
 
 
-def expand(curie: str, prefix_maps: Optional[List[dict]] = None, fallback: bool = True) -> str:
+def expand(curie: str, prefix_maps: Optional[List[Mapping]] = None, fallback: bool = True) -> str:
     """
     Expand a given CURIE to an URI, based on mappings from `prefix_map`.
 
@@ -195,7 +204,7 @@ def expand(curie: str, prefix_maps: Optional[List[dict]] = None, fallback: bool
     ----------
     curie: str
         A CURIE
-    prefix_maps: Optional[List[dict]]
+    prefix_maps: Optional[List[Mapping]]
         A list of prefix maps to use for mapping
     fallback: bool
         Determines whether to fallback to default prefix mappings, as determined
@@ -218,13 +227,14 @@ def expand(curie: str, prefix_maps: Optional[List[dict]] = None, fallback: bool
     return uri
 
 
-def get_toolkit(schema: Optional[str] = None) -> Toolkit:
+def get_toolkit(schema: Optional[str] = None) -> 'Toolkit':
     """
     Get an instance of bmt.Toolkit
     If there no instance defined, then one is instantiated and returned.
     """
     global toolkit
     if toolkit is None:
+        from bmt import Toolkit
         if not schema:
             config = get_config()
             schema = config['biolink-model']
@@ -232,10 +242,88 @@ def get_toolkit(schema: Optional[str] = None) -> Toolkit:
     return toolkit
 
 
-def generate_edge_key(s: str, edge_predicate: str, o: str) -> str:
+def get_edge_key_scheme() -> str:
+    """
+    Get the scheme used to generate edge keys.
+
+    The scheme is read from ``edge-key-scheme`` in the config, unless it
+    has been set with ``set_edge_key_scheme``. See ``generate_edge_key``.
+
+    Returns
+    -------
+    str
+        The edge key scheme
+
+    """
+    global edge_key_scheme
+    if edge_key_scheme is None:
+        scheme = get_config().get('edge-key-scheme', 'string')
+        set_edge_key_scheme(scheme)
+        return scheme
+    return edge_key_scheme
+
+
+def set_edge_key_scheme(scheme: str) -> None:
+    """
+    Set the scheme used to generate edge keys.
+
+    Edge keys generated with different schemes are not interchangeable,
+    so the scheme should be set before any graph is loaded.
+
+    Parameters
+    ----------
+    scheme: str
+        The edge key scheme. One of ``string``, ``tuple`` or ``hash``
+
+    """
+    global edge_key_scheme
+    if scheme not in EDGE_KEY_SCHEMES:
+        raise ValueError(f"Unrecognized edge key scheme '{scheme}'; expected one of {sorted(EDGE_KEY_SCHEMES)}")
+    edge_key_scheme = scheme
+
+
+def generate_edge_key(s: str, edge_predicate: str, o: str) -> EdgeKey:
     """
     Generates an edge key based on a given subject, predicate, and object.
 
+    The form of the key depends on the edge key scheme (see ``set_edge_key_scheme``),
+
+    - ``string``: the string ``{subject}-{predicate}-{object}`` (default)
+    - ``tuple``: the tuple ``(subject, predicate, object)``, which refers to the
+      strings of the subject, predicate and object instead of copying them
+    - ``hash``: a 64-bit hash of the predicate. Edge keys only need to be unique
+      between a given subject and object, so the key does not include them
+
+    The string form of a key can always be derived with ``format_edge_key``.
+
+    Parameters
+    ----------
+    s: str
+        Subject
+    edge_predicate: str
+        Edge label
+    o: str
+        Object
+
+    Returns
+    -------
+    kgx.graph.base_graph.EdgeKey
+        Edge key, a ``str``, a ``Tuple[str, str, str]`` or an ``int``
+
+    """
+    scheme = edge_key_scheme or get_edge_key_scheme()
+    if scheme == 'string':
+        return '{}-{}-{}'.format(s, edge_predicate, o)
+    elif scheme == 'tuple':
+        return s, edge_predicate, o
+    else:
+        return get_predicate_hash(edge_predicate)
+
+
+def format_edge_key(s: str, edge_predicate: str, o: str) -> str:
+    """
+    Generates the string form of an edge key, irrespective of the edge key scheme.
+
     Parameters
     ----------
     s: str
@@ -254,6 +342,36 @@ def generate_edge_key(s: str, edge_predicate: str, o: str) -> str:
     return '{}-{}-{}'.format(s, edge_predicate, o)
 
 
+def get_predicate_hash(edge_predicate: str) -> int:
+    """
+    Get the 64-bit hash of a predicate, as used by the ``hash`` edge key scheme.
+
+    Hashes are stable across processes. If two predicates have the same hash,
+    then the hash of the predicate seen last is incremented until it is unique.
+
+    Parameters
+    ----------
+    edge_predicate: str
+        Edge label
+
+    Returns
+    -------
+    int
+        The hash of the predicate
+
+    """
+    h = predicate_hashes.get(edge_predicate)
+    if h is None:
+        digest = hashlib.blake2b(str(edge_predicate).encode('utf-8'), digest_size=8).digest()
+        h = int.from_bytes(digest, 'big')
+        while h in hashed_predicates:
+            log.warning(f"Edge key hash collision between '{hashed_predicates[h]}' and '{edge_predicate}'")
+            h = (h + 1) % (1 << 64)
+        predicate_hashes[edge_predicate] = h
+        hashed_predicates[h] = edge_predicate
+    return h
+
+
 def get_curie_lookup_service():
     """
     Get an instance of kgx.curie_lookup_service.CurieLookupService
@@ -328,7 +446,7 @@ def get_prefix_prioritization_map() -> Dict[str, List]:
     return prefix_prioritization_map
 
 
-def get_biolink_element(name) -> Optional[Element]:
+def get_biolink_element(name) -> Optional['Element']:
     """
     Get Biolink element for a given name, where name can be a class, slot, or relation.
 
@@ -413,6 +531,8 @@ def get_type_for_property(p: str) -> str:
         The type for a given property
 
     """
+    from biolinkml.meta import TypeDefinitionName, ElementName, SlotDefinition, ClassDefinition, TypeDefinition
+
     toolkit = get_toolkit()
     e = toolkit.get_element(p)
     t = 'xsd:string'
@@ -473,7 +593,7 @@ def prepare_data_dict(d1: Dict, d2: Dict, preserve: bool = True) -> Dict:
                     # key is in data
                     if isinstance(d1[key], (list, set, tuple)):
                         # existing key has value type list
-                        new_data[key] = d1[key]
+                        new_data[key] = list(d1[key])
                         if isinstance(new_value, (list, set, tuple)):
                             new_data[key] += [x for x in new_value if x not in new_data[key]]
                         else:
@@ -500,7 +620,7 @@ def prepare_data_dict(d1: Dict, d2: Dict, preserve: bool = True) -> Dict:
                 # key is not multivalued; adding/replacing as-is
                 if key in d1:
                     if isinstance(d1[key], (list, set, tuple)):
-                        new_data[key] = d1[key]
+                        new_data[key] = list(d1[key])
                         if isinstance(new_value, (list, set, tuple)):
                             new_data[key] += [x for x in new_value]
                         else:
@@ -528,7 +648,7 @@ def prepare_data_dict(d1: Dict, d2: Dict, preserve: bool = True) -> Dict:
                 else:
                     if isinstance(d1[key], (list, set, tuple)):
                         # existing key has value type list
-                        new_data[key] = d1[key]
+                        new_data[key] = list(d1[key])
                         if isinstance(new_value, (list, set, tuple)):
                             new_data[key] += [x for x in new_value if x not in new_data[key]]
                         else:
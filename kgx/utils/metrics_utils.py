@@ -0,0 +1,438 @@
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from kgx.config import get_logger
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None # type: ignore
+
+"""
+Instrumentation of the stages of a KGX pipeline.
+
+A stage is recorded as a span, with a context manager. A span records its wall
+time, the records that it processed, the bytes that it read and wrote, and the
+peak resident memory of the process at its end. Counters record events, like
+nodes and edges that fail filters. Metrics are only recorded once they are
+enabled, so instrumented code costs little when they are not.
+
+"""
+
+log = get_logger()
+
+metrics = None
+
+
+class Span(object):
+    """
+    A stage of a pipeline, like parsing a file or saving a graph.
+
+    Parameters
+    ----------
+    name: str
+        The name of the stage. For example, ``parse``
+    attributes: Dict[str, Any]
+        Attributes of the stage. For example, the filename
+
+    """
+    # whether the span is recorded; a stage can skip counting its records when it is not
+    recording = True
+
+    def __init__(self, name: str, **attributes: Any):
+        self.name = name
+        self.attributes = attributes
+        self.records = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.parent: Optional[str] = None
+        self.start = 0.0
+        self.seconds = 0.0
+        self._start_time = 0.0
+        self._start_rss: Optional[int] = None
+
+    def add(self, records: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        """
+        Add to the records processed, and to the bytes read and written, by the stage.
+
+        Parameters
+        ----------
+        records: int
+            The number of records (nodes and edges)
+        bytes_read: int
+            The number of bytes read
+        bytes_written: int
+            The number of bytes written
+
+        """
+        self.records += records
+        self.bytes_read += bytes_read
+        self.bytes_written += bytes_written
+
+    def __enter__(self) -> 'Span':
+        self.start = time.time()
+        self._start_time = time.perf_counter()
+        self._start_rss = get_peak_rss()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.seconds = time.perf_counter() - self._start_time
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the span as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The name, attributes, start time, wall time, records, rate,
+            bytes read and written, and peak resident memory of the span
+        """
+        peak_rss = get_peak_rss()
+        return {
+            'name': self.name,
+            'attributes': self.attributes,
+            'parent': self.parent,
+            'pid': os.getpid(),
+            'start': self.start,
+            'seconds': self.seconds,
+            'records': self.records,
+            'records_per_second': self.records / self.seconds if self.seconds else None,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'peak_rss': peak_rss,
+            'peak_rss_increase': peak_rss - self._start_rss if peak_rss is not None and self._start_rss is not None else None,
+        }
+
+
+class _DisabledSpan(Span):
+    """
+    A span that records nothing, used when metrics are not enabled.
+    """
+    recording = False
+
+    def add(self, records: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        pass
+
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_disabled_span = _DisabledSpan('disabled')
+
+
+class Metrics(object):
+    """
+    The spans and counters recorded by a process.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self.listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._stack = threading.local()
+
+    def enable(self, enabled: bool = True) -> None:
+        """
+        Enable, or disable, the recording of metrics.
+
+        Parameters
+        ----------
+        enabled: bool
+            Whether metrics are recorded
+
+        """
+        self.enabled = enabled
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Add a function that is called with each span, as a dictionary, when it ends.
+        For example, to take a memory snapshot at the end of each stage.
+
+        Parameters
+        ----------
+        listener: Callable[[Dict[str, Any]], None]
+            The function
+
+        """
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def reset(self) -> None:
+        """
+        Remove all recorded spans and counters.
+        """
+        self.spans = []
+        self.counters = {}
+
+    def span(self, name: str, **attributes: Any) -> Span:
+        """
+        Get a span, to be used as a context manager, for a stage of a pipeline.
+
+        Parameters
+        ----------
+        name: str
+            The name of the stage
+        attributes: Any
+            Attributes of the stage
+
+        Returns
+        -------
+        kgx.utils.metrics_utils.Span
+            The span
+
+        """
+        if not self.enabled:
+            return _disabled_span
+        return _RecordedSpan(self, name, **attributes)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Add to a counter.
+
+        Parameters
+        ----------
+        name: str
+            The name of the counter
+        value: int
+            The value to add
+
+        """
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Export the spans and counters, to be merged into the metrics of another process.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The spans and counters
+        """
+        return {'spans': list(self.spans), 'counters': dict(self.counters)}
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """
+        Merge the spans and counters exported by another process.
+
+        Parameters
+        ----------
+        other: Dict[str, Any]
+            The spans and counters, from ``export``
+
+        """
+        self.spans.extend(other['spans'])
+        for k, v in other['counters'].items():
+            self.counters[k] = self.counters.get(k, 0) + v
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Get a report of the recorded metrics, with the totals of each stage.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The totals of each stage, the counters, and all spans
+        """
+        stages: Dict[str, Dict[str, Any]] = {}
+        for s in self.spans:
+            stage = stages.setdefault(s['name'], {
+                'count': 0, 'seconds': 0.0, 'records': 0, 'bytes_read': 0, 'bytes_written': 0, 'peak_rss': None
+            })
+            stage['count'] += 1
+            for k in ['seconds', 'records', 'bytes_read', 'bytes_written']:
+                stage[k] += s[k]
+            if s['peak_rss'] is not None:
+                stage['peak_rss'] = max(stage['peak_rss'] or 0, s['peak_rss'])
+        for stage in stages.values():
+            stage['records_per_second'] = stage['records'] / stage['seconds'] if stage['seconds'] else None
+        return {'stages': stages, 'counters': dict(self.counters), 'spans': list(self.spans)}
+
+    def write(self, filename: str) -> None:
+        """
+        Write the report of the recorded metrics as JSON.
+
+        Parameters
+        ----------
+        filename: str
+            The filename
+
+        """
+        with open(filename, 'w') as FH:
+            json.dump(self.report(), FH, indent=2, default=str)
+
+    def write_trace(self, filename: str) -> None:
+        """
+        Write the recorded spans and counters in the Chrome trace event format,
+        to be viewed in ``chrome://tracing`` or Perfetto.
+
+        Parameters
+        ----------
+        filename: str
+            The filename
+
+        """
+        events = []
+        for s in self.spans:
+            args = dict(s['attributes'])
+            args.update({k: s[k] for k in ['records', 'records_per_second', 'bytes_read', 'bytes_written', 'peak_rss'] if s[k]})
+            events.append({
+                'name': s['name'],
+                'cat': s['parent'] or s['name'],
+                'ph': 'X',
+                'ts': int(s['start'] * 1e6),
+                'dur': int(s['seconds'] * 1e6),
+                'pid': s['pid'],
+                'tid': s['pid'],
+                'args': args,
+            })
+        if events:
+            end = max(x['ts'] + x['dur'] for x in events)
+            events.extend([
+                {'name': k, 'ph': 'C', 'ts': end, 'pid': os.getpid(), 'args': {k: v}} for k, v in self.counters.items()
+            ])
+        with open(filename, 'w') as FH:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, FH, default=str)
+
+
+class _RecordedSpan(Span):
+    """
+    A span that is added to the metrics of the process when it ends.
+    """
+
+    def __init__(self, metrics: Metrics, name: str, **attributes: Any):
+        super().__init__(name, **attributes)
+        self.metrics = metrics
+
+    def __enter__(self) -> 'Span':
+        stack = self.metrics._stack.__dict__.setdefault('spans', [])
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        return super().__enter__()
+
+    def __exit__(self, *args: Any) -> None:
+        super().__exit__(*args)
+        self.metrics._stack.spans.pop()
+        span = self.as_dict()
+        self.metrics.spans.append(span)
+        for listener in self.metrics.listeners:
+            listener(span)
+
+
+def get_metrics() -> Metrics:
+    """
+    Get the metrics of the current process.
+    If there are no metrics, then they are instantiated and returned.
+
+    Returns
+    -------
+    kgx.utils.metrics_utils.Metrics
+        The metrics
+    """
+    global metrics
+    if metrics is None:
+        metrics = Metrics()
+    return metrics
+
+
+def span(name: str, **attributes: Any) -> Span:
+    """
+    Get a span, to be used as a context manager, for a stage of a pipeline,
+    from the metrics of the current process.
+
+    Parameters
+    ----------
+    name: str
+        The name of the stage. For example, ``parse``
+    attributes: Any
+        Attributes of the stage. For example, the filename
+
+    Returns
+    -------
+    kgx.utils.metrics_utils.Span
+        The span
+    """
+    return get_metrics().span(name, **attributes)
+
+
+def count(name: str, value: int = 1) -> None:
+    """
+    Add to a counter of the metrics of the current process.
+
+    Parameters
+    ----------
+    name: str
+        The name of the counter. For example, ``nodes_filtered``
+    value: int
+        The value to add
+
+    """
+    get_metrics().count(name, value)
+
+
+def run_with_metrics(f: Callable, *args: Any) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Call a function in a worker process, recording metrics.
+
+    Parameters
+    ----------
+    f: Callable
+        The function
+    args: Any
+        The arguments of the function
+
+    Returns
+    -------
+    Tuple[Any, Dict[str, Any]]
+        The result of the function, and the metrics recorded while it ran, to be
+        merged into the metrics of the parent process with ``Metrics.merge``
+    """
+    m = get_metrics()
+    # a forked worker has the metrics of its parent, at the time it was forked
+    m.reset()
+    m.enable()
+    result = f(*args)
+    return result, m.export()
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Get the peak resident memory of the current process, in bytes.
+
+    Returns
+    -------
+    Optional[int]
+        The peak resident memory, or ``None`` if it is not available
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, and bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def get_file_size(*filenames: str) -> int:
+    """
+    Get the total size, in bytes, of files that exist.
+
+    Parameters
+    ----------
+    filenames: str
+        The filenames
+
+    Returns
+    -------
+    int
+        The total size
+    """
+    return sum(os.path.getsize(x) for x in filenames if os.path.isfile(x))
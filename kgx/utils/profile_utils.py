@@ -0,0 +1,333 @@
+import cProfile
+import os
+import pstats
+import re
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from kgx.config import get_logger
+from kgx.utils.metrics_utils import get_metrics
+
+"""
+Profiling of KGX commands.
+
+In ``cpu`` mode, a command is profiled with ``cProfile``, and the profile is
+written as ``.pstats``, and as collapsed stacks for flame graph tools like
+``flamegraph.pl`` or speedscope. In ``memory`` mode, ``tracemalloc`` snapshots
+are taken at the end of each stage of the pipeline, that is, at the end of each
+span of ``kgx.utils.metrics_utils``, and the top allocation sites are reported.
+
+Sources that are parsed in worker processes are profiled separately, with one
+profile per source.
+
+"""
+
+log = get_logger()
+
+PROFILE_MODES = ('cpu', 'memory')
+
+# number of allocation sites reported at each stage
+PROFILE_TOP = 10
+# number of frames of a traceback recorded by tracemalloc
+PROFILE_FRAMES = 1
+# stacks with less than this fraction of the total time are left out of collapsed stacks
+COLLAPSED_MIN_FRACTION = 1e-4
+# stacks deeper than this are truncated in collapsed stacks
+COLLAPSED_MAX_DEPTH = 128
+
+profiler = None
+
+
+class Profiler(object):
+    """
+    A profiler of a command, or of a source that is parsed in a worker process.
+
+    Parameters
+    ----------
+    mode: str
+        The mode. One of ``cpu`` or ``memory``
+    prefix: str
+        The prefix of the filenames of the profile.
+        For example, ``kgx_merge`` for ``kgx_merge.pstats``
+
+    """
+
+    def __init__(self, mode: str, prefix: str):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unrecognized profile mode '{mode}'; expected one of {', '.join(PROFILE_MODES)}")
+        self.mode = mode
+        self.prefix = prefix
+        self.report: List[str] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def get_worker_prefix(self, name: str) -> str:
+        """
+        Get the prefix of the filenames of the profile of a source,
+        parsed in a worker process.
+
+        Parameters
+        ----------
+        name: str
+            The name of the source
+
+        Returns
+        -------
+        str
+            The prefix
+
+        """
+        return f"{self.prefix}_{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}"
+
+    def start(self) -> None:
+        """
+        Start profiling.
+        """
+        if self.mode == 'cpu':
+            # a profile that is inherited from a forked parent is replaced
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+            tracemalloc.start(PROFILE_FRAMES)
+            metrics = get_metrics()
+            metrics.enable()
+            metrics.add_listener(_on_span)
+
+    def snapshot(self, stage: str) -> None:
+        """
+        Take a memory snapshot at the end of a stage, and report the top
+        allocation sites, and the sites that allocated the most since the
+        previous stage.
+
+        Parameters
+        ----------
+        stage: str
+            The stage. For example, ``parse source=hgnc``
+
+        """
+        if self.mode != 'memory' or not tracemalloc.is_tracing():
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+            tracemalloc.Filter(False, '<unknown>'),
+        ])
+        current, peak = tracemalloc.get_traced_memory()
+        self.report.append(f"{stage}: current {current / 2 ** 20:.1f} MiB, peak {peak / 2 ** 20:.1f} MiB")
+        self.report.append("  top allocation sites:")
+        for s in snapshot.statistics('lineno')[:PROFILE_TOP]:
+            self.report.append(f"    {s.size / 2 ** 20:10.1f} MiB {s.count:10d} blocks  {_format_frame(s.traceback[0])}")
+        if self._snapshot is not None:
+            self.report.append("  allocated since the previous stage:")
+            for d in snapshot.compare_to(self._snapshot, 'lineno')[:PROFILE_TOP]:
+                self.report.append(f"    {d.size_diff / 2 ** 20:+10.1f} MiB {d.count_diff:+10d} blocks  {_format_frame(d.traceback[0])}")
+        self.report.append('')
+        self._snapshot = snapshot
+
+    def stop(self) -> List[str]:
+        """
+        Stop profiling, and write the profile.
+
+        Returns
+        -------
+        List[str]
+            The files that were written
+
+        """
+        filenames: List[str] = []
+        if self.mode == 'cpu':
+            if self._profile is None:
+                return filenames
+            self._profile.disable()
+            stats = pstats.Stats(self._profile)
+            self._profile = None
+            filenames.append(f"{self.prefix}.pstats")
+            stats.dump_stats(filenames[-1])
+            filenames.append(f"{self.prefix}.collapsed")
+            with open(filenames[-1], 'w') as FH:
+                for stack, value in sorted(get_collapsed_stacks(stats).items()):
+                    FH.write(f"{stack} {value}\n")
+        else:
+            if not tracemalloc.is_tracing():
+                return filenames
+            self.snapshot('end')
+            tracemalloc.stop()
+            self._snapshot = None
+            filenames.append(f"{self.prefix}.memory.txt")
+            with open(filenames[-1], 'w') as FH:
+                FH.write('\n'.join(self.report))
+        for f in filenames:
+            log.info(f"Profile written to {f}")
+        return filenames
+
+
+def get_profiler() -> Optional[Profiler]:
+    """
+    Get the profiler of the current process.
+
+    Returns
+    -------
+    Optional[kgx.utils.profile_utils.Profiler]
+        The profiler, or ``None`` if the process is not being profiled
+
+    """
+    return profiler
+
+
+def set_profiler(p: Optional[Profiler]) -> None:
+    """
+    Set the profiler of the current process.
+
+    Parameters
+    ----------
+    p: Optional[kgx.utils.profile_utils.Profiler]
+        The profiler, or ``None`` to stop profiling
+
+    """
+    global profiler
+    profiler = p
+
+
+def start_profiler(mode: str, prefix: str) -> Profiler:
+    """
+    Start profiling the current process.
+
+    Parameters
+    ----------
+    mode: str
+        The mode. One of ``cpu`` or ``memory``
+    prefix: str
+        The prefix of the filenames of the profile
+
+    Returns
+    -------
+    kgx.utils.profile_utils.Profiler
+        The profiler
+
+    """
+    p = Profiler(mode, prefix)
+    set_profiler(p)
+    p.start()
+    return p
+
+
+def stop_profiler() -> List[str]:
+    """
+    Stop profiling the current process, and write the profile.
+
+    Returns
+    -------
+    List[str]
+        The files that were written
+
+    """
+    p = get_profiler()
+    if p is None:
+        return []
+    set_profiler(None)
+    return p.stop()
+
+
+def run_with_profile(mode: str, prefix: str, f: Callable, *args: Any) -> Any:
+    """
+    Call a function in a worker process, with a profile of its own.
+
+    Parameters
+    ----------
+    mode: str
+        The mode. One of ``cpu`` or ``memory``
+    prefix: str
+        The prefix of the filenames of the profile
+    f: Callable
+        The function
+    args: Any
+        The arguments of the function
+
+    Returns
+    -------
+    Any
+        The result of the function
+
+    """
+    start_profiler(mode, prefix)
+    try:
+        return f(*args)
+    finally:
+        stop_profiler()
+
+
+def get_collapsed_stacks(stats: pstats.Stats) -> Dict[str, int]:
+    """
+    Get the collapsed stacks of a profile, for flame graph tools.
+
+    ``cProfile`` records callers and callees, and not whole stacks, so the time of
+    a function is divided between the stacks that it is called from in proportion
+    to the time of each call. Recursive calls, and stacks with less than
+    ``COLLAPSED_MIN_FRACTION`` of the total time, are left out.
+
+    Parameters
+    ----------
+    stats: pstats.Stats
+        The profile
+
+    Returns
+    -------
+    Dict[str, int]
+        The time, in microseconds, spent in each stack, with the
+        functions of a stack separated by ``;``
+
+    """
+    callees: Dict[Tuple, List[Tuple[Tuple, float]]] = {}
+    roots: Dict[Tuple, float] = {}
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items(): # type: ignore
+        # a function that was called before profiling started, or from outside
+        # of the profiled code, has calls without a caller
+        if nc > sum(x[0] for x in callers.values()):
+            roots[func] = max(ct - sum(x[3] for k, x in callers.items() if k != func), 0.0)
+        for caller, value in callers.items():
+            # the number of calls, primitive calls, total time and cumulative time of the calls from the caller
+            callees.setdefault(caller, []).append((func, value[3]))
+    min_time = sum(roots.values()) * COLLAPSED_MIN_FRACTION
+    stacks: Dict[str, int] = {}
+    for root, cumulative_time in roots.items():
+        todo: List[Tuple[Tuple, Tuple[str, ...], float]] = [(root, (_format_function(root),), cumulative_time)]
+        while todo:
+            func, stack, seconds = todo.pop()
+            cc, nc, tt, ct, callers = stats.stats[func] # type: ignore
+            share = seconds / ct if ct else 0.0
+            value = int(tt * share * 1e6)
+            if value and tt * share >= min_time:
+                key = ';'.join(stack)
+                stacks[key] = stacks.get(key, 0) + value
+            if len(stack) == COLLAPSED_MAX_DEPTH:
+                continue
+            for callee, callee_seconds in callees.get(func, []):
+                label = _format_function(callee)
+                if label in stack or callee_seconds * share < min_time:
+                    continue
+                todo.append((callee, stack + (label,), callee_seconds * share))
+    return stacks
+
+
+def _on_span(span: Dict[str, Any]) -> None:
+    p = get_profiler()
+    if p is not None:
+        attributes = ' '.join(f"{k}={v}" for k, v in span['attributes'].items() if v is not None)
+        p.snapshot(f"{span['name']} {attributes}".strip())
+
+
+def _format_function(func: Tuple[str, int, str]) -> str:
+    filename, line, name = func
+    if filename == '~':
+        # built-in functions
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(';', ',')
+
+
+def _format_frame(frame: tracemalloc.Frame) -> str:
+    return f"{frame.filename}:{frame.lineno}"
@@ -0,0 +1,511 @@
+import os
+import sys
+import threading
+import time
+from multiprocessing import current_process
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from kgx.config import get_config, get_logger
+
+"""
+Progress of long running stages, like parsing a file or writing a graph.
+
+Progress is counted in bytes, for files that are read, and in records, for nodes
+and edges that are iterated over. Updates are cheap: the time is only checked
+after a number of updates that adapts to the rate, so that progress can be
+updated for every record of a hot loop. On a terminal, progress is shown on one
+line of ``stderr``, with the rate and the estimated time to finish. Otherwise,
+it is logged every ``PROGRESS_LOG_INTERVAL`` seconds.
+
+Progress of worker processes is sent to the parent process, which shows the
+progress of all workers together. See ``WorkerProgress``.
+
+"""
+
+log = get_logger()
+
+# seconds between updates of progress on a terminal
+PROGRESS_INTERVAL = 0.5
+# seconds between updates of progress in a log
+PROGRESS_LOG_INTERVAL = 30.0
+# fraction of the interval between checks of the time
+PROGRESS_CHECK_FRACTION = 0.1
+
+progress_enabled: Optional[bool] = None
+_queue: Any = None
+
+
+class Progress(object):
+    """
+    Progress of a stage.
+
+    Parameters
+    ----------
+    label: str
+        The label of the stage. For example, ``Parsing nodes.tsv``
+    total: Optional[int]
+        The total number of bytes or records, if it is known
+    unit: str
+        The unit. One of ``bytes`` or ``records``
+
+    """
+    # whether progress is reported
+    enabled = True
+
+    def __init__(self, label: str, total: Optional[int] = None, unit: str = 'records'):
+        self.label = label
+        self.total = total
+        self.unit = unit
+        self.count = 0
+        self._start = time.monotonic()
+        self._last = self._start
+        self._next = 1
+        self._tty = sys.stderr.isatty()
+        self._interval = PROGRESS_INTERVAL if self._tty or _queue is not None else PROGRESS_LOG_INTERVAL
+        self._shown = False
+
+    def update(self, n: int = 1) -> None:
+        """
+        Add to the bytes or records processed.
+
+        Parameters
+        ----------
+        n: int
+            The number of bytes or records
+
+        """
+        self.count += n
+        if self.count >= self._next:
+            self._check()
+
+    def _check(self) -> None:
+        now = time.monotonic()
+        # check the time again after a fraction of the interval, at the current rate
+        rate = self.count / max(now - self._start, 1e-3)
+        self._next = self.count + max(1, int(rate * self._interval * PROGRESS_CHECK_FRACTION))
+        if now - self._last >= self._interval:
+            self._last = now
+            self._show(now)
+
+    def _show(self, now: float, done: bool = False) -> None:
+        if _queue is not None:
+            # a worker process, whose progress is shown by the parent process
+            _queue.put((os.getpid(), self.label, self.unit, self.count, self.total, now - self._start, done))
+            return
+        line = self.format(now - self._start)
+        if self._tty:
+            sys.stderr.write(f"\r{line}\033[K" + ('\n' if done else ''))
+            sys.stderr.flush()
+        elif not done:
+            log.info(line)
+        self._shown = True
+
+    def format(self, seconds: float) -> str:
+        """
+        Format the progress of the stage.
+
+        Parameters
+        ----------
+        seconds: float
+            The time since the start of the stage
+
+        Returns
+        -------
+        str
+            The progress
+
+        """
+        return format_progress(self.label, self.unit, self.count, self.total, seconds)
+
+    def close(self) -> None:
+        """
+        Finish the stage.
+        """
+        if self._shown or _queue is not None:
+            self._show(time.monotonic(), done=True)
+
+    def __enter__(self) -> 'Progress':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class _DisabledProgress(Progress):
+    """
+    Progress that is not reported, used when progress is not enabled.
+    """
+    enabled = False
+
+    def __init__(self):
+        super().__init__('disabled')
+
+    def update(self, n: int = 1) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+_disabled_progress = _DisabledProgress()
+
+
+class ProgressReader(object):
+    """
+    A binary file handle that counts the bytes read from it as progress.
+
+    Parameters
+    ----------
+    fh: IO
+        The file handle, in binary mode
+    progress: kgx.utils.progress_utils.Progress
+        The progress
+
+    """
+    # the mode of some file handles, like gzip.GzipFile, is not a string
+    mode = 'rb'
+
+    def __init__(self, fh: IO, progress: Progress):
+        self._fh = fh
+        self.progress = progress
+
+    def read(self, *args: Any) -> Any:
+        data = self._fh.read(*args)
+        self.progress.update(len(data))
+        return data
+
+    def read1(self, *args: Any) -> Any:
+        data = self._fh.read1(*args) # type: ignore
+        self.progress.update(len(data))
+        return data
+
+    def readinto(self, b: Any) -> int:
+        n = self._fh.readinto(b) # type: ignore
+        self.progress.update(n or 0)
+        return n
+
+    def readline(self, *args: Any) -> Any:
+        line = self._fh.readline(*args)
+        self.progress.update(len(line))
+        return line
+
+    def readlines(self, *args: Any) -> List:
+        lines = self._fh.readlines(*args)
+        self.progress.update(sum(len(x) for x in lines))
+        return lines
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self) -> Any:
+        line = next(self._fh)
+        self.progress.update(len(line))
+        return line
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fh, name)
+
+    def __enter__(self) -> 'ProgressReader':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        # the file handle is closed by its owner
+        self.progress.close()
+
+
+class WorkerProgress(object):
+    """
+    Progress of the worker processes of a ``Pool``, shown by the parent process.
+
+    Worker processes send their progress to the parent, which shows the total
+    of all workers. The ``initializer`` and ``initargs`` are to be passed to the
+    ``Pool``.
+
+    Parameters
+    ----------
+    label: str
+        The label of the stage. For example, ``Parsing sources``
+
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.initializer: Optional[Callable] = None
+        self.initargs: Tuple = ()
+        self._queue: Any = None
+        self._thread: Optional[threading.Thread] = None
+        self._progress: Dict[Tuple[int, str], Tuple] = {}
+
+    def __enter__(self) -> 'WorkerProgress':
+        if is_progress_enabled():
+            from multiprocessing import Queue
+            self._queue = Queue()
+            self.initializer = _set_worker_queue
+            self.initargs = (self._queue,)
+            self._thread = threading.Thread(target=self._receive, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._queue.close()
+            self._thread = None
+
+    def _receive(self) -> None:
+        with _WorkerTotal(self) as p:
+            while True:
+                message = self._queue.get()
+                if message is None:
+                    break
+                pid, label, unit, count, total, seconds, done = message
+                self._progress[(pid, label)] = (unit, count, total, seconds, done)
+                # shown at most once per interval
+                p.update()
+
+    def format(self) -> str:
+        """
+        Get the progress of all workers.
+
+        Returns
+        -------
+        str
+            The number of stages that are done, and the bytes and records
+            processed by all workers, with their rate and estimated time to finish
+
+        """
+        done = sum(1 for x in self._progress.values() if x[4])
+        parts = [f"{self.label}: {done}/{len(self._progress)} done"]
+        for unit in ['bytes', 'records']:
+            values = [x for x in self._progress.values() if x[0] == unit]
+            if not values:
+                continue
+            count = sum(x[1] for x in values)
+            # the total is only known if it is known for every stage
+            total = None if any(x[2] is None for x in values) else sum(x[2] for x in values)
+            # the stages of different workers run at the same time
+            seconds = max(x[3] for x in values)
+            parts.append(format_progress(None, unit, count, total, seconds))
+        return ', '.join(parts)
+
+
+class _WorkerTotal(Progress):
+    """
+    Progress of all worker processes, as shown by the parent process.
+    """
+
+    def __init__(self, workers: WorkerProgress):
+        super().__init__(workers.label)
+        self.workers = workers
+
+    def update(self, n: int = 1) -> None:
+        # updates are already sampled by the workers
+        now = time.monotonic()
+        if now - self._last >= self._interval:
+            self._last = now
+            self._show(now)
+
+    def format(self, seconds: float) -> str:
+        return self.workers.format()
+
+
+def get_progress_enabled() -> bool:
+    """
+    Get whether progress is reported.
+
+    This is read from ``progress`` in the config, unless it has been set with
+    ``set_progress_enabled``.
+
+    Returns
+    -------
+    bool
+        Whether progress is reported
+
+    """
+    global progress_enabled
+    if progress_enabled is None:
+        set_progress_enabled(bool(get_config().get('progress', True)))
+    return progress_enabled # type: ignore
+
+
+def set_progress_enabled(enabled: bool) -> None:
+    """
+    Set whether progress is reported. For example, to turn it off for batch jobs.
+
+    Parameters
+    ----------
+    enabled: bool
+        Whether progress is reported
+
+    """
+    global progress_enabled
+    progress_enabled = enabled
+
+
+def is_progress_enabled() -> bool:
+    """
+    Get whether progress is reported by the current process. Progress of a
+    daemon process, like the worker of a ``Pool``, is only reported if its
+    parent shows it with ``WorkerProgress``.
+
+    Returns
+    -------
+    bool
+        Whether progress is reported
+
+    """
+    if not get_progress_enabled():
+        return False
+    return _queue is not None or not current_process().daemon
+
+
+def progress(label: str, total: Optional[Union[int, Callable[[], int]]] = None, unit: str = 'records') -> Progress:
+    """
+    Get the progress of a stage, to be used as a context manager.
+
+    Parameters
+    ----------
+    label: str
+        The label of the stage. For example, ``Writing graph.nt``
+    total: Optional[Union[int, Callable[[], int]]]
+        The total number of bytes or records, if it is known. A function that
+        returns the total is only called if progress is reported
+    unit: str
+        The unit. One of ``bytes`` or ``records``
+
+    Returns
+    -------
+    kgx.utils.progress_utils.Progress
+        The progress
+
+    """
+    if not is_progress_enabled():
+        return _disabled_progress
+    return Progress(label, total() if callable(total) else total, unit)
+
+
+def iter_progress(iterable: Iterable, label: str, total: Optional[Union[int, Callable[[], int]]] = None, unit: str = 'records') -> Iterable:
+    """
+    Count the items of an iterable as progress, as they are iterated over.
+
+    Parameters
+    ----------
+    iterable: Iterable
+        The iterable. For example, the nodes of a graph
+    label: str
+        The label of the stage. For example, ``Writing graph_nodes.tsv``
+    total: Optional[Union[int, Callable[[], int]]]
+        The number of items, if it is known. A function that returns the
+        number of items is only called if progress is reported
+    unit: str
+        The unit of the items
+
+    Returns
+    -------
+    Iterable
+        The iterable, unchanged if progress is not reported
+
+    """
+    if not is_progress_enabled():
+        return iterable
+    return _iter_progress(iterable, progress(label, total, unit))
+
+
+def _iter_progress(iterable: Iterable, p: Progress) -> Iterator:
+    with p:
+        update = p.update
+        for x in iterable:
+            update()
+            yield x
+
+
+def read_progress(fh: IO, filename: str, compression: Optional[str] = None, total: Optional[int] = None) -> Union[IO, ProgressReader]:
+    """
+    Count the bytes read from a file handle as progress.
+
+    The total is the size of the file, unless the file is compressed, when
+    the bytes read are decompressed and the total is not known.
+
+    Parameters
+    ----------
+    fh: IO
+        The file handle, in binary mode
+    filename: str
+        The filename
+    compression: Optional[str]
+        The compression of the file
+    total: Optional[int]
+        The number of bytes that will be read, if it is known.
+        For example, the size of a member of an archive
+
+    Returns
+    -------
+    Union[IO, kgx.utils.progress_utils.ProgressReader]
+        The file handle, wrapped if progress is reported
+
+    """
+    if not is_progress_enabled():
+        return fh
+    if total is None and not compression and os.path.isfile(filename):
+        total = os.path.getsize(filename)
+    return ProgressReader(fh, Progress(f"Reading {os.path.basename(filename)}", total, 'bytes'))
+
+
+def format_progress(label: Optional[str], unit: str, count: int, total: Optional[int], seconds: float) -> str:
+    """
+    Format progress, with its rate and the estimated time to finish.
+
+    Parameters
+    ----------
+    label: Optional[str]
+        The label of the stage
+    unit: str
+        The unit. One of ``bytes`` or ``records``
+    count: int
+        The bytes or records processed
+    total: Optional[int]
+        The total number of bytes or records, if it is known
+    seconds: float
+        The time since the start of the stage
+
+    Returns
+    -------
+    str
+        The progress
+
+    """
+    rate = count / seconds if seconds else 0.0
+    if not total:
+        text = _format_value(count, unit)
+    elif unit == 'bytes':
+        text = f"{_format_value(count, unit)} of {_format_value(total, unit)} ({100 * count / total:.0f}%)"
+    else:
+        text = f"{count:,} of {_format_value(total, unit)} ({100 * count / total:.0f}%)"
+    text += f", {_format_value(rate, unit)}/s"
+    if total and rate and count < total:
+        text += f", ETA {_format_seconds((total - count) / rate)}"
+    return f"{label}: {text}" if label else text
+
+
+def _format_value(value: float, unit: str) -> str:
+    if unit == 'bytes':
+        for prefix in ['', 'Ki', 'Mi', 'Gi']:
+            if value < 1024:
+                break
+            value /= 1024
+        else:
+            prefix = 'Ti'
+        return f"{value:.1f} {prefix}B" if prefix else f"{value:.0f} B"
+    return f"{value:,.0f} {unit}"
+
+
+def _format_seconds(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+def _set_worker_queue(queue: Any) -> None:
+    global _queue
+    _queue = queue
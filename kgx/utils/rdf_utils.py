@@ -5,8 +5,8 @@ from rdflib import Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL, SKOS
 
 from kgx.config import get_logger
-from kgx.utils.graph_utils import get_category_via_superclass
-from kgx.utils.kgx_utils import get_curie_lookup_service, contract
+from kgx.utils.graph_utils import get_category_via_ontology, AncestorIndex, ANCESTOR_INDEX_CACHE
+from kgx.utils.kgx_utils import contract
 import uuid
 
 log = get_logger()
@@ -77,10 +77,42 @@ top_level_terms = {
 }
 
 
+def get_rdf_ancestor_index(rdfgraph: rdflib.Graph) -> AncestorIndex:
+    """
+    Get an ancestor index over the ``subClassOf`` relationships in rdfgraph.
+
+    The index is built once per graph and reused, until triples are
+    added to or removed from the graph.
+
+    Parameters
+    ----------
+    rdfgraph: rdflib.Graph
+        The graph
+
+    Returns
+    -------
+    kgx.utils.graph_utils.AncestorIndex
+        The ancestor index
+
+    """
+    signature = len(rdfgraph)
+    indexes = ANCESTOR_INDEX_CACHE.setdefault(rdfgraph, {})
+    if RDFS.subClassOf not in indexes or indexes[RDFS.subClassOf][0] != signature:
+        edges = (
+            (s, o) for s, o in rdfgraph.subject_objects(RDFS.subClassOf)
+            if isinstance(s, URIRef) and isinstance(o, URIRef)
+        )
+        indexes[RDFS.subClassOf] = (signature, AncestorIndex(edges))
+    return indexes[RDFS.subClassOf][1]
+
+
 def infer_category(iri: URIRef, rdfgraph:rdflib.Graph) -> Optional[List]:
     """
     Infer category for a given iri by traversing rdfgraph.
 
+    The traversal uses an ancestor index that is built once per graph.
+    See ``get_rdf_ancestor_index``.
+
     Parameters
     ----------
     iri: rdflib.term.URIRef
@@ -94,19 +126,22 @@ def infer_category(iri: URIRef, rdfgraph:rdflib.Graph) -> Optional[List]:
         A list of category corresponding to the given IRI
 
     """
-    closure = list(rdfgraph.transitive_objects(iri, URIRef(RDFS.subClassOf)))
+    index = get_rdf_ancestor_index(rdfgraph)
+    closure = [iri] + index.ancestors(iri)
     category = [top_level_terms[x] for x in closure if x in top_level_terms.keys()]
     if category:
         log.debug("Inferred category as {} based on transitive closure over 'subClassOf' relation".format(category))
     else:
-        subj = closure[-1]
-        if subj == iri:
+        roots = index.roots(iri)
+        if not roots:
             return category
+        subj = roots[-1]
         subject_curie: Optional[str] = contract(subj)
-        if subject_curie and '_' in subject_curie:
+        if not subject_curie:
+            return category
+        if '_' in subject_curie:
             fixed_curie = subject_curie.split(':', 1)[1].split('_', 1)[1]
             log.warning("Malformed CURIE {} will be fixed to {}".format(subject_curie, fixed_curie))
             subject_curie = fixed_curie
-        cls = get_curie_lookup_service()
-        category = list(get_category_via_superclass(cls.ontology_graph, subject_curie))
+        category = list(get_category_via_ontology(subject_curie))
     return category
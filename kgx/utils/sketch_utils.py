@@ -0,0 +1,521 @@
+import hashlib
+import heapq
+import math
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+"""
+Mergeable sketches for approximate statistics over high-cardinality values.
+
+All sketches use a fixed amount of memory and hash values with a stable 64-bit
+hash, so that sketches built in different processes can be merged. Statistics
+for many groups of values, like the values of a facet for each predicate, share
+one Count-Min sketch, so that each group only takes a small HyperLogLog sketch.
+
+"""
+
+MASK_64 = (1 << 64) - 1
+
+# HyperLogLog precision for each group of a GroupedFacetSketch (1 KiB, about 3% error)
+GROUP_PRECISION = 10
+# width of the Count-Min sketch shared by all groups of a GroupedFacetSketch
+GROUPED_WIDTH = 1 << 14
+
+
+def hash_value(value: Any) -> int:
+    """
+    Get a stable 64-bit hash for a value.
+
+    Unlike the builtin ``hash``, this hash is the same across processes.
+
+    Parameters
+    ----------
+    value: Any
+        The value
+
+    Returns
+    -------
+    int
+        A 64-bit hash
+
+    """
+    return int.from_bytes(hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def combine_hashes(h1: int, h2: int) -> int:
+    """
+    Combine two 64-bit hashes into a 64-bit hash, for a pair of values.
+
+    Parameters
+    ----------
+    h1: int
+        A 64-bit hash, as returned by ``hash_value``
+    h2: int
+        A 64-bit hash, as returned by ``hash_value``
+
+    Returns
+    -------
+    int
+        A 64-bit hash
+
+    """
+    # the finalizer of splitmix64
+    h = (h1 ^ (h2 * 0x9E3779B97F4A7C15)) & MASK_64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return h ^ (h >> 31)
+
+
+class HyperLogLog(object):
+    """
+    HyperLogLog sketch for estimating the number of distinct values.
+
+    Parameters
+    ----------
+    precision: int
+        Number of bits used to select a register. The sketch uses ``2 ** precision`` bytes
+        and the standard error is about ``1.04 / sqrt(2 ** precision)``
+
+    """
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 16:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 16, not {precision}")
+        self.precision = precision
+        self.m = 1 << precision
+        # a bytearray, rather than a numpy array, since registers are updated one at a time
+        self.registers = bytearray(self.m)
+
+    def add(self, h: int) -> None:
+        """
+        Add a hashed value.
+
+        Parameters
+        ----------
+        h: int
+            A 64-bit hash, as returned by ``hash_value``
+
+        """
+        index = h >> (64 - self.precision)
+        w = (h << self.precision) & MASK_64
+        rank = 64 - self.precision + 1 if w == 0 else 64 - w.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other: kgx.utils.sketch_utils.HyperLogLog
+            A sketch with the same precision
+
+        Returns
+        -------
+        kgx.utils.sketch_utils.HyperLogLog
+            This sketch
+
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        registers = np.frombuffer(self.registers, dtype=np.uint8)
+        np.maximum(registers, np.frombuffer(other.registers, dtype=np.uint8), out=registers)
+        return self
+
+    def count(self) -> int:
+        """
+        Get the estimated number of distinct values.
+
+        Returns
+        -------
+        int
+            The estimate
+
+        """
+        m = self.m
+        if m >= 128:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        else:
+            alpha = {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        registers = np.frombuffer(self.registers, dtype=np.uint8)
+        estimate = alpha * m * m / float(np.sum(np.power(2.0, -registers.astype(np.float64))))
+        zeros = int(np.count_nonzero(registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            # linear counting for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class CountMinSketch(object):
+    """
+    Count-Min sketch for estimating the frequency of values.
+
+    Parameters
+    ----------
+    width: int
+        Number of counters per row
+    depth: int
+        Number of rows
+
+    """
+
+    def __init__(self, width: int = 1024, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        # a row of 64-bit counters for each hash function
+        self.table = [array('q', bytes(8 * width)) for _ in range(depth)]
+
+    def _columns(self, h: int) -> List[int]:
+        """
+        Get the counter in each row for a hashed value, via double hashing.
+        """
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, h: int, count: int = 1) -> int:
+        """
+        Add a hashed value and get its new estimated frequency.
+
+        Parameters
+        ----------
+        h: int
+            A 64-bit hash, as returned by ``hash_value``
+        count: int
+            The number of occurrences to add
+
+        Returns
+        -------
+        int
+            The estimated frequency
+
+        """
+        estimate = -1
+        for row, c in zip(self.table, self._columns(h)):
+            row[c] += count
+            if estimate < 0 or row[c] < estimate:
+                estimate = row[c]
+        return estimate
+
+    def estimate(self, h: int) -> int:
+        """
+        Get the estimated frequency of a hashed value.
+
+        Parameters
+        ----------
+        h: int
+            A 64-bit hash, as returned by ``hash_value``
+
+        Returns
+        -------
+        int
+            The estimated frequency
+
+        """
+        return min(row[c] for row, c in zip(self.table, self._columns(h)))
+
+    def merge(self, other: 'CountMinSketch') -> 'CountMinSketch':
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other: kgx.utils.sketch_utils.CountMinSketch
+            A sketch with the same width and depth
+
+        Returns
+        -------
+        kgx.utils.sketch_utils.CountMinSketch
+            This sketch
+
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge Count-Min sketches with different dimensions")
+        for row, other_row in zip(self.table, other.table):
+            counters = np.frombuffer(row, dtype=np.int64)
+            counters += np.frombuffer(other_row, dtype=np.int64)
+        return self
+
+
+class FacetSketch(object):
+    """
+    Approximate statistics for the values of a facet: the number of distinct
+    values, and the ``k`` most frequent values with their estimated counts.
+
+    Parameters
+    ----------
+    k: int
+        Number of most frequent values to keep track of
+    precision: int
+        HyperLogLog precision
+    width: int
+        Count-Min sketch width
+    depth: int
+        Count-Min sketch depth
+
+    """
+
+    def __init__(self, k: int = 10, precision: int = 12, width: int = 1024, depth: int = 4):
+        self.k = k
+        self.distinct = HyperLogLog(precision)
+        self.frequency = CountMinSketch(width, depth)
+        self.top: Dict[Any, int] = {}
+
+    def add(self, value: Any, count: int = 1) -> None:
+        """
+        Add a value.
+
+        Parameters
+        ----------
+        value: Any
+            The value
+        count: int
+            The number of occurrences to add
+
+        """
+        self._add(value, hash_value(value), count)
+
+    def _add(self, value: Any, h: int, count: int) -> None:
+        """
+        Add a value, with its hash.
+        """
+        self.distinct.add(h)
+        _offer(self.top, self.k, value, self.frequency.add(h, count))
+
+    def merge(self, other: 'FacetSketch') -> 'FacetSketch':
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other: kgx.utils.sketch_utils.FacetSketch
+            The sketch to merge
+
+        Returns
+        -------
+        kgx.utils.sketch_utils.FacetSketch
+            This sketch
+
+        """
+        self.distinct.merge(other.distinct)
+        self.frequency.merge(other.frequency)
+        candidates = set(self.top) | set(other.top)
+        self.top = _most_frequent(self.k, {x: self.frequency.estimate(hash_value(x)) for x in candidates})
+        return self
+
+    def most_common(self) -> List[Tuple[Any, int]]:
+        """
+        Get the most frequent values, in descending order of their estimated count.
+
+        Returns
+        -------
+        List[Tuple[Any, int]]
+            A list of (value, estimated count)
+
+        """
+        return sorted(self.top.items(), key=lambda x: (-x[1], str(x[0])))
+
+    def as_dict(self) -> Dict:
+        """
+        Get the sketch as a stats dictionary.
+
+        Returns
+        -------
+        Dict
+            A dictionary with the estimated number of distinct values and the
+            most frequent values with their estimated counts
+
+        """
+        return {
+            'distinct_values': self.distinct.count(),
+            'top_values': {v: {'count': c} for v, c in self.most_common()}
+        }
+
+
+class _GroupSketch(object):
+    """
+    The distinct values, and the most frequent values, of a group of a GroupedFacetSketch.
+    """
+    __slots__ = ('key', 'distinct', 'top')
+
+    def __init__(self, key: int, precision: int):
+        self.key = key
+        self.distinct = HyperLogLog(precision)
+        self.top: Dict[Any, int] = {}
+
+
+class GroupedFacetSketch(object):
+    """
+    Approximate statistics for the values of a facet, for each group of nodes or edges,
+    like a category or a predicate, and for all groups together.
+
+    The frequencies of the values of all groups are estimated with one Count-Min sketch,
+    keyed by the group and the value, so that each group only takes a small HyperLogLog
+    sketch and its ``k`` most frequent values.
+
+    Parameters
+    ----------
+    k: int
+        Number of most frequent values to keep track of, for each group
+    precision: int
+        HyperLogLog precision, for all groups together
+    group_precision: int
+        HyperLogLog precision, for each group
+    width: int
+        Count-Min sketch width, shared by all groups
+    depth: int
+        Count-Min sketch depth
+    total: bool
+        Whether to keep track of the values of all groups together
+
+    """
+
+    def __init__(self, k: int = 10, precision: int = 12, group_precision: int = GROUP_PRECISION, width: int = GROUPED_WIDTH, depth: int = 4, total: bool = True):
+        self.k = k
+        self.group_precision = group_precision
+        self.total = FacetSketch(k, precision, depth=depth) if total else None
+        self.frequency = CountMinSketch(width, depth)
+        self.groups: Dict[Any, _GroupSketch] = {}
+
+    def add(self, group: Any, value: Any, count: int = 1) -> None:
+        """
+        Add a value of a group.
+
+        Parameters
+        ----------
+        group: Any
+            The group. For example, a predicate
+        value: Any
+            The value
+        count: int
+            The number of occurrences to add
+
+        """
+        h = hash_value(value)
+        if self.total:
+            self.total._add(value, h, count)
+        g = self.groups.get(group)
+        if g is None:
+            g = self.groups[group] = _GroupSketch(hash_value(group), self.group_precision)
+        g.distinct.add(h)
+        estimate = self.frequency.add(combine_hashes(g.key, h), count)
+        _offer(g.top, self.k, value, estimate)
+
+    def merge(self, other: 'GroupedFacetSketch') -> 'GroupedFacetSketch':
+        """
+        Merge another sketch into this sketch.
+
+        Parameters
+        ----------
+        other: kgx.utils.sketch_utils.GroupedFacetSketch
+            A sketch with the same dimensions
+
+        Returns
+        -------
+        kgx.utils.sketch_utils.GroupedFacetSketch
+            This sketch
+
+        """
+        if self.total and other.total:
+            self.total.merge(other.total)
+        self.frequency.merge(other.frequency)
+        for group, other_group in other.groups.items():
+            g = self.groups.get(group)
+            if g is None:
+                self.groups[group] = g = _GroupSketch(other_group.key, self.group_precision)
+            g.distinct.merge(other_group.distinct)
+            candidates = set(g.top) | set(other_group.top)
+            g.top = _most_frequent(self.k, {x: self._estimate(g, x) for x in candidates})
+        return self
+
+    def _estimate(self, g: _GroupSketch, value: Any) -> int:
+        """
+        Get the estimated frequency of a value of a group.
+        """
+        return self.frequency.estimate(combine_hashes(g.key, hash_value(value)))
+
+    def most_common(self, group: Any) -> List[Tuple[Any, int]]:
+        """
+        Get the most frequent values of a group, in descending order of their estimated count.
+
+        Parameters
+        ----------
+        group: Any
+            The group
+
+        Returns
+        -------
+        List[Tuple[Any, int]]
+            A list of (value, estimated count)
+
+        """
+        g = self.groups[group]
+        estimates = {x: self._estimate(g, x) for x in g.top}
+        return sorted(estimates.items(), key=lambda x: (-x[1], str(x[0])))
+
+    def as_dict(self, group: Any) -> Dict:
+        """
+        Get the sketch of a group as a stats dictionary.
+
+        Parameters
+        ----------
+        group: Any
+            The group
+
+        Returns
+        -------
+        Dict
+            A dictionary with the estimated number of distinct values and the
+            most frequent values with their estimated counts
+
+        """
+        return {
+            'distinct_values': self.groups[group].distinct.count(),
+            'top_values': {v: {'count': c} for v, c in self.most_common(group)}
+        }
+
+
+def merge_sketches(sketches: List[FacetSketch]) -> Optional[FacetSketch]:
+    """
+    Merge a list of sketches into a new sketch.
+
+    Parameters
+    ----------
+    sketches: List[kgx.utils.sketch_utils.FacetSketch]
+        The sketches to merge
+
+    Returns
+    -------
+    Optional[kgx.utils.sketch_utils.FacetSketch]
+        The merged sketch, or ``None`` if there are no sketches
+
+    """
+    merged = None
+    for s in sketches:
+        if merged is None:
+            merged = FacetSketch(s.k, s.distinct.precision, s.frequency.width, s.frequency.depth)
+        merged.merge(s)
+    return merged
+
+
+def _offer(top: Dict[Any, int], k: int, value: Any, estimate: int) -> None:
+    """
+    Offer a value as a candidate for the ``k`` most frequent values.
+    """
+    if value in top or len(top) < k:
+        top[value] = estimate
+    else:
+        smallest = min(top, key=lambda x: top[x])
+        if estimate > top[smallest]:
+            del top[smallest]
+            top[value] = estimate
+
+
+def _most_frequent(k: int, estimates: Dict[Any, int]) -> Dict[Any, int]:
+    """
+    Get the ``k`` most frequent values from their estimated counts.
+    """
+    return dict(heapq.nlargest(k, estimates.items(), key=lambda x: x[1]))
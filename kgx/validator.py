@@ -1,18 +1,28 @@
+import io
+import json
 import re
 from enum import Enum
-from typing import Tuple, List, TextIO, Optional, Dict, Set
+from itertools import islice
+from collections import deque
+from multiprocessing import Pool
+from multiprocessing.pool import Pool as PoolType
+from typing import Tuple, List, TextIO, Optional, Dict, Set, Iterable, Any, Callable, Union
 
-import click
-import validators
+from cachetools import LRUCache, cached
 
 from kgx.config import get_jsonld_context, get_logger
-from kgx.graph.base_graph import BaseGraph
+from kgx.graph.base_graph import BaseGraph, EdgeKey
 from kgx.utils.kgx_utils import get_toolkit, snakecase_to_sentencecase, sentencecase_to_snakecase, \
     camelcase_to_sentencecase
 from kgx.prefix_manager import PrefixManager
+from kgx.utils.metrics_utils import span
+from kgx.utils.progress_utils import iter_progress, progress
 
 log = get_logger()
 
+# number of nodes or edges that are validated per task, when validating in parallel
+CHUNK_SIZE = 10000
+
 
 class ErrorType(Enum):
     """
@@ -56,13 +66,20 @@ class ValidationError(object):
         The error message
     message_level: kgx.validator.MessageLevel
         The message level
+    template: Optional[str]
+        The error message without any entity specific parts, with a ``{value}``
+        placeholder for the offending value. Defaults to ``message``
+    value: Any
+        The offending value, if any
 
     """
-    def __init__(self, entity: str, error_type: ErrorType, message: str, message_level: MessageLevel):
+    def __init__(self, entity: str, error_type: ErrorType, message: str, message_level: MessageLevel, template: Optional[str] = None, value: Any = None):
         self.entity = entity
         self.error_type = error_type
         self.message = message
         self.message_level = message_level
+        self.template = template
+        self.value = value
 
     def __str__(self):
         return f"[{self.message_level.name}][{self.error_type.name}] {self.entity} - {self.message}"
@@ -76,6 +93,64 @@ class ValidationError(object):
         }
 
 
+# the node, or the (subject, object) of the edge, that is failing validation
+Entity = Union[str, Tuple[str, str]]
+
+
+def _format_entity(entity: Entity) -> str:
+    """
+    Format a node, or the (subject, object) of an edge, as an entity of a ValidationError.
+    """
+    if isinstance(entity, tuple):
+        return f"{entity[0]}-{entity[1]}"
+    return entity
+
+
+def _format_message(message: str, value: Any = None, detail: Any = None) -> str:
+    """
+    Format an error message, with its offending value and entity specific part.
+    """
+    if value is None and detail is None:
+        return message
+    return message.format(value=value, detail=detail)
+
+
+class ErrorList(list):
+    """
+    A list of validation errors, that the checks of ``Validator`` add errors to.
+    """
+
+    def add_error(self, entity: Entity, error_type: ErrorType, message_level: MessageLevel, template: str, value: Any = None, message: Optional[str] = None, detail: Any = None) -> None:
+        """
+        Add an error.
+
+        Parameters
+        ----------
+        entity: Union[str, Tuple[str, str]]
+            The node, or the (subject, object) of the edge, that is failing validation
+        error_type: kgx.validator.ErrorType
+            The nature of the error
+        message_level: kgx.validator.MessageLevel
+            The message level
+        template: str
+            The error message without any entity specific parts, with a ``{value}``
+            placeholder for the offending value
+        value: Any
+            The offending value, if any
+        message: Optional[str]
+            The error message, with a ``{value}`` placeholder for the offending value,
+            and a ``{detail}`` placeholder for an entity specific part. Defaults to ``template``
+        detail: Any
+            The entity specific part of the error message, if any
+
+        """
+        self.append(ValidationError(_format_entity(entity), error_type, _format_message(message or template, value, detail), message_level, template, value))
+
+
+# where the checks of Validator add errors to
+ErrorCollector = Union[ErrorList, 'ErrorAggregator']
+
+
 class Validator(object):
     """
     Class for validating a property graph.
@@ -121,6 +196,23 @@ class Validator(object):
             prefixes.add('biolink')
         return prefixes
 
+    @staticmethod
+    @cached(LRUCache(maxsize=1))
+    def get_default_prefixes() -> set:
+        """
+        Get all prefixes from the default Biolink Model JSON-LD context.
+
+        Unlike ``get_all_prefixes``, the prefixes are computed once
+        and reused for every subsequent call.
+
+        Returns
+        -------
+        set
+            A set of prefixes
+
+        """
+        return Validator.get_all_prefixes()
+
     @staticmethod
     def get_required_node_properties() -> list:
         """
@@ -166,7 +258,7 @@ class Validator(object):
         print(required_properties)
         return required_properties
 
-    def validate(self, graph: BaseGraph) -> list:
+    def validate(self, graph: BaseGraph, processes: int = 1, aggregator: Optional['ErrorAggregator'] = None) -> list:
         """
         Validate nodes and edges in a graph.
         TODO: Support strict mode
@@ -175,6 +267,10 @@ class Validator(object):
         ----------
         graph: kgx.graph.base_graph.BaseGraph
             The graph to validate
+        processes: int
+            Number of processes to use
+        aggregator: Optional[kgx.validator.ErrorAggregator]
+            If given, errors are added to this aggregator, as they are found, instead of being returned
 
         Returns
         -------
@@ -182,11 +278,21 @@ class Validator(object):
             A list of errors for a given graph
 
         """
-        node_errors = self.validate_nodes(graph)
-        edge_errors = self.validate_edges(graph)
+        with span('validate', processes=processes) as s:
+            # nodes and edges are validated by the same worker processes
+            pool = Pool(processes=processes) if processes > 1 else None
+            try:
+                node_errors = self.validate_nodes(graph, processes, aggregator, pool)
+                edge_errors = self.validate_edges(graph, processes, aggregator, pool)
+            finally:
+                if pool:
+                    pool.close()
+                    pool.join()
+            if s.recording:
+                s.add(records=graph.number_of_nodes() + graph.number_of_edges())
         return node_errors + edge_errors
 
-    def validate_nodes(self, graph: BaseGraph) -> list:
+    def validate_nodes(self, graph: BaseGraph, processes: int = 1, aggregator: Optional['ErrorAggregator'] = None, pool: Optional[PoolType] = None) -> list:
         """
         Validate all the nodes in a graph.
 
@@ -196,10 +302,21 @@ class Validator(object):
         - Node property value type
         - Node categories
 
+        Nodes are validated in chunks of ``CHUNK_SIZE`` across worker
+        processes, if ``processes`` is more than 1. At most ``2 * processes``
+        chunks are in flight at a time.
+
         Parameters
         ----------
         graph: kgx.graph.base_graph.BaseGraph
             The graph to validate
+        processes: int
+            Number of processes to use
+        aggregator: Optional[kgx.validator.ErrorAggregator]
+            If given, errors are added to this aggregator, as they are found, instead of being returned
+        pool: Optional[multiprocessing.pool.Pool]
+            The pool of worker processes to use. A pool is created
+            for this call, if ``processes`` is more than 1 and none is given
 
         Returns
         -------
@@ -207,17 +324,21 @@ class Validator(object):
             A list of errors for a given graph
 
         """
-        errors = []
-        with click.progressbar(graph.nodes(data=True), label='Validating nodes in graph') as bar:
-            for n, data in bar:
-                e1 = Validator.validate_node_properties(n, data, self.required_node_properties)
-                e2 = Validator.validate_node_property_types(n, data)
-                e3 = Validator.validate_node_property_values(n, data)
-                e4 = Validator.validate_categories(n, data)
-                errors += e1 + e2 + e3 + e4
+        errors = ErrorList()
+        collector: ErrorCollector = aggregator if aggregator else errors
+        if processes > 1:
+            options = _get_aggregator_options(aggregator)
+            tasks = ((chunk, self.required_node_properties, options) for chunk in _chunks(graph.nodes(data=True), CHUNK_SIZE))
+            with progress('Validating nodes in graph', graph.number_of_nodes) as p:
+                for size, e, records in _imap(_validate_node_chunk, tasks, processes, pool):
+                    _add_partial(collector, e, records)
+                    p.update(size)
+        else:
+            for n, data in iter_progress(graph.nodes(data=True), 'Validating nodes in graph', graph.number_of_nodes):
+                Validator.validate_node(n, data, self.required_node_properties, collector)
         return errors
 
-    def validate_edges(self, graph: BaseGraph) -> list:
+    def validate_edges(self, graph: BaseGraph, processes: int = 1, aggregator: Optional['ErrorAggregator'] = None, pool: Optional[PoolType] = None) -> list:
         """
         Validate all the edges in a graph.
 
@@ -227,10 +348,21 @@ class Validator(object):
         - Edge property value type
         - Edge label
 
+        Edges are validated in chunks of ``CHUNK_SIZE`` across worker
+        processes, if ``processes`` is more than 1. At most ``2 * processes``
+        chunks are in flight at a time.
+
         Parameters
         ----------
         graph: kgx.graph.base_graph.BaseGraph
             The graph to validate
+        processes: int
+            Number of processes to use
+        aggregator: Optional[kgx.validator.ErrorAggregator]
+            If given, errors are added to this aggregator, as they are found, instead of being returned
+        pool: Optional[multiprocessing.pool.Pool]
+            The pool of worker processes to use. A pool is created
+            for this call, if ``processes`` is more than 1 and none is given
 
         Returns
         -------
@@ -238,18 +370,84 @@ class Validator(object):
             A list of errors for a given graph
 
         """
-        errors = []
-        with click.progressbar(graph.edges(data=True), label='Validate edges in graph') as bar:
-            for u, v, data in bar:
-                e1 = Validator.validate_edge_properties(u, v, data, self.required_edge_properties)
-                e2 = Validator.validate_edge_property_types(u, v, data)
-                e3 = Validator.validate_edge_property_values(u, v, data)
-                e4 = Validator.validate_edge_predicate(u, v, data)
-                errors += e1 + e2 + e3 + e4
+        errors = ErrorList()
+        collector: ErrorCollector = aggregator if aggregator else errors
+        if processes > 1:
+            options = _get_aggregator_options(aggregator)
+            tasks = ((chunk, self.required_edge_properties, options) for chunk in _chunks(graph.edges(data=True), CHUNK_SIZE))
+            with progress('Validating edges in graph', graph.number_of_edges) as p:
+                for size, e, records in _imap(_validate_edge_chunk, tasks, processes, pool):
+                    _add_partial(collector, e, records)
+                    p.update(size)
+        else:
+            for u, v, data in iter_progress(graph.edges(data=True), 'Validating edges in graph', graph.number_of_edges):
+                Validator.validate_edge(u, v, data, self.required_edge_properties, collector)
         return errors
 
     @staticmethod
-    def validate_node_properties(node: str, data: dict, required_properties: list) -> list:
+    def validate_node(node: str, data: dict, required_properties: list, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
+        """
+        Run all the checks for a given node.
+
+        Parameters
+        ----------
+        node: str
+            Node identifier
+        data: dict
+            Node properties
+        required_properties: list
+            Required node properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
+
+        Returns
+        -------
+        ErrorCollector
+            A list of errors for a given node, or ``errors`` with them added, if given
+
+        """
+        if errors is None:
+            errors = ErrorList()
+        Validator.validate_node_properties(node, data, required_properties, errors)
+        Validator.validate_node_property_types(node, data, errors)
+        Validator.validate_node_property_values(node, data, errors)
+        Validator.validate_categories(node, data, errors)
+        return errors
+
+    @staticmethod
+    def validate_edge(subject: str, object: str, data: dict, required_properties: list, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
+        """
+        Run all the checks for a given edge.
+
+        Parameters
+        ----------
+        subject: str
+            Subject identifier
+        object: str
+            Object identifier
+        data: dict
+            Edge properties
+        required_properties: list
+            Required edge properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
+
+        Returns
+        -------
+        ErrorCollector
+            A list of errors for a given edge, or ``errors`` with them added, if given
+
+        """
+        if errors is None:
+            errors = ErrorList()
+        Validator.validate_edge_properties(subject, object, data, required_properties, errors)
+        Validator.validate_edge_property_types(subject, object, data, errors)
+        Validator.validate_edge_property_values(subject, object, data, errors)
+        Validator.validate_edge_predicate(subject, object, data, errors)
+        return errors
+
+    @staticmethod
+    def validate_node_properties(node: str, data: dict, required_properties: list, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Checks if all the required node properties exist for a given node.
 
@@ -261,23 +459,25 @@ class Validator(object):
             Node properties
         required_properties: list
             Required node properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given node
+        ErrorCollector
+            A list of errors for a given node, or ``errors`` with them added, if given
 
         """
-        errors = []
+        if errors is None:
+            errors = ErrorList()
         for p in required_properties:
             if p not in data:
                 error_type = ErrorType.MISSING_NODE_PROPERTY
-                message = f"Required node property '{p}' missing"
-                errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+                errors.add_error(node, error_type, MessageLevel.ERROR, "Required node property '{value}' missing", p)
         return errors
 
     @staticmethod
-    def validate_edge_properties(subject: str, object: str, data: dict, required_properties: list) -> list:
+    def validate_edge_properties(subject: str, object: str, data: dict, required_properties: list, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Checks if all the required edge properties exist for a given edge.
 
@@ -291,30 +491,32 @@ class Validator(object):
             Edge properties
         required_properties: list
             Required edge properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given edge
+        ErrorCollector
+            A list of errors for a given edge, or ``errors`` with them added, if given
 
         """
-        errors = []
+        if errors is None:
+            errors = ErrorList()
+        template = "Required edge property '{value}' missing"
         for p in required_properties:
             if p not in data:
                 if p == 'association_id':
                     # check for 'id' property instead
                     if 'id' not in data:
                         error_type = ErrorType.MISSING_EDGE_PROPERTY
-                        message = f"Required edge property '{p}' missing"
-                        errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+                        errors.add_error((subject, object), error_type, MessageLevel.ERROR, template, p)
                 else:
                     error_type = ErrorType.MISSING_EDGE_PROPERTY
-                    message = f"Required edge property '{p}' missing"
-                    errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+                    errors.add_error((subject, object), error_type, MessageLevel.ERROR, template, p)
         return errors
 
     @staticmethod
-    def validate_node_property_types(node: str, data: dict) -> list:
+    def validate_node_property_types(node: str, data: dict, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Checks if node properties have the expected value type.
 
@@ -324,48 +526,73 @@ class Validator(object):
             Node identifier
         data: dict
             Node properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given node
+        ErrorCollector
+            A list of errors for a given node, or ``errors`` with them added, if given
 
         """
-        toolkit = get_toolkit()
-        errors = []
+        if errors is None:
+            errors = ErrorList()
         error_type = ErrorType.INVALID_NODE_PROPERTY_VALUE_TYPE
         if not isinstance(node, str):
-            message = "Node property 'id' expected to be of type 'string'"
-            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+            errors.add_error(node, error_type, MessageLevel.ERROR, "Node property 'id' expected to be of type 'string'")
 
         for key, value in data.items():
-            element = toolkit.get_element(key)
-            if element:
-                if hasattr(element, 'typeof'):
-                    if element.typeof == 'string' and not isinstance(value, str):
-                        message = f"Node property '{key}' expected to be of type '{element.typeof}'"
-                        errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
-                    elif element.typeof == 'uriorcurie' and not isinstance(value, str) and not validators.url(value):
-                        message = f"Node property '{key}' expected to be of type 'uri' or 'CURIE'"
-                        errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
-                    elif element.typeof == 'double' and not isinstance(value, (int, float)):
-                        message = f"Node property '{key}' expected to be of type '{element.typeof}'"
-                        errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
-                    else:
-                        log.warning("Skipping validation for Node property '{}'. Expected type '{}' vs Actual type '{}'".format(key, element.typeof, type(value)))
-                if hasattr(element, 'multivalued'):
-                    if element.multivalued:
-                        if not isinstance(value, list):
-                            message = f"Multi-valued node property '{key}' expected to be of type '{list}'"
-                            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
-                    else:
-                        if isinstance(value, (list, set, tuple)):
-                            message = f"Single-valued node property '{key}' expected to be of type '{str}'"
-                            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+            for message in Validator.get_node_property_type_messages(key, type(value)):
+                errors.add_error(node, error_type, MessageLevel.ERROR, message)
         return errors
 
     @staticmethod
-    def validate_edge_property_types(subject: str, object: str, data: dict) -> list:
+    @cached(LRUCache(maxsize=4096))
+    def get_node_property_type_messages(key: str, value_type: type) -> Tuple[str, ...]:
+        """
+        Get the error messages for a node property that has a value of a given type.
+
+        The verdict only depends on the property and the type of its value,
+        and is thus memoized.
+
+        Parameters
+        ----------
+        key: str
+            The node property
+        value_type: type
+            The type of the value
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The error messages, if any
+
+        """
+        toolkit = get_toolkit()
+        messages = []
+        element = toolkit.get_element(key)
+        if element:
+            if hasattr(element, 'typeof'):
+                if element.typeof == 'string' and not issubclass(value_type, str):
+                    messages.append(f"Node property '{key}' expected to be of type '{element.typeof}'")
+                elif element.typeof == 'uriorcurie' and not issubclass(value_type, str):
+                    # a value that is not a string is never a valid URL
+                    messages.append(f"Node property '{key}' expected to be of type 'uri' or 'CURIE'")
+                elif element.typeof == 'double' and not issubclass(value_type, (int, float)):
+                    messages.append(f"Node property '{key}' expected to be of type '{element.typeof}'")
+                else:
+                    log.warning("Skipping validation for Node property '{}'. Expected type '{}' vs Actual type '{}'".format(key, element.typeof, value_type))
+            if hasattr(element, 'multivalued'):
+                if element.multivalued:
+                    if not issubclass(value_type, list):
+                        messages.append(f"Multi-valued node property '{key}' expected to be of type '{list}'")
+                else:
+                    if issubclass(value_type, (list, set, tuple)):
+                        messages.append(f"Single-valued node property '{key}' expected to be of type '{str}'")
+        return tuple(messages)
+
+    @staticmethod
+    def validate_edge_property_types(subject: str, object: str, data: dict, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Checks if edge properties have the expected value type.
 
@@ -377,51 +604,75 @@ class Validator(object):
             Object identifier
         data: dict
             Edge properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given edge
+        ErrorCollector
+            A list of errors for a given edge, or ``errors`` with them added, if given
 
         """
-        toolkit = get_toolkit()
-        errors = []
+        if errors is None:
+            errors = ErrorList()
         error_type = ErrorType.INVALID_EDGE_PROPERTY_VALUE_TYPE
         if not isinstance(subject, str):
-            message = "'subject' of an edge expected to be of type 'string'"
-            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            errors.add_error((subject, object), error_type, MessageLevel.ERROR, "'subject' of an edge expected to be of type 'string'")
         if not isinstance(object, str):
-            message = "'object' of an edge expected to be of type 'string'"
-            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            errors.add_error((subject, object), error_type, MessageLevel.ERROR, "'object' of an edge expected to be of type 'string'")
 
         for key, value in data.items():
-            element = toolkit.get_element(key)
-            if element:
-                if hasattr(element, 'typeof'):
-                    if element.typeof == 'string' and not isinstance(value, str):
-                        message = f"Edge property '{key}' expected to be of type 'string'"
-                        errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
-                    elif element.typeof == 'uriorcurie' and not isinstance(value, str) and not validators.url(value):
-                        message = f"Edge property '{key}' expected to be of type 'uri' or 'CURIE'"
-                        errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
-                    elif element.typeof == 'double' and not isinstance(value, (int, float)):
-                        message = f"Edge property '{key}' expected to be of type 'double'"
-                        errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
-                    else:
-                        log.warning("Skipping validation for Edge property '{}'. Expected type '{}' vs Actual type '{}'".format(key, element.typeof, type(value)))
-                if hasattr(element, 'multivalued'):
-                    if element.multivalued:
-                        if not isinstance(value, list):
-                            message = f"Multi-valued edge property '{key}' expected to be of type 'list'"
-                            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
-                    else:
-                        if isinstance(value, (list, set, tuple)):
-                            message = f"Single-valued edge property '{key}' expected to be of type 'str'"
-                            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            for message in Validator.get_edge_property_type_messages(key, type(value)):
+                errors.add_error((subject, object), error_type, MessageLevel.ERROR, message)
         return errors
 
     @staticmethod
-    def validate_node_property_values(node: str, data: dict) -> list:
+    @cached(LRUCache(maxsize=4096))
+    def get_edge_property_type_messages(key: str, value_type: type) -> Tuple[str, ...]:
+        """
+        Get the error messages for an edge property that has a value of a given type.
+
+        The verdict only depends on the property and the type of its value,
+        and is thus memoized.
+
+        Parameters
+        ----------
+        key: str
+            The edge property
+        value_type: type
+            The type of the value
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The error messages, if any
+
+        """
+        toolkit = get_toolkit()
+        messages = []
+        element = toolkit.get_element(key)
+        if element:
+            if hasattr(element, 'typeof'):
+                if element.typeof == 'string' and not issubclass(value_type, str):
+                    messages.append(f"Edge property '{key}' expected to be of type 'string'")
+                elif element.typeof == 'uriorcurie' and not issubclass(value_type, str):
+                    # a value that is not a string is never a valid URL
+                    messages.append(f"Edge property '{key}' expected to be of type 'uri' or 'CURIE'")
+                elif element.typeof == 'double' and not issubclass(value_type, (int, float)):
+                    messages.append(f"Edge property '{key}' expected to be of type 'double'")
+                else:
+                    log.warning("Skipping validation for Edge property '{}'. Expected type '{}' vs Actual type '{}'".format(key, element.typeof, value_type))
+            if hasattr(element, 'multivalued'):
+                if element.multivalued:
+                    if not issubclass(value_type, list):
+                        messages.append(f"Multi-valued edge property '{key}' expected to be of type 'list'")
+                else:
+                    if issubclass(value_type, (list, set, tuple)):
+                        messages.append(f"Single-valued edge property '{key}' expected to be of type 'str'")
+        return tuple(messages)
+
+    @staticmethod
+    def validate_node_property_values(node: str, data: dict, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Validate a node property's value.
 
@@ -431,27 +682,30 @@ class Validator(object):
             Node identifier
         data: dict
             Node properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given node
+        ErrorCollector
+            A list of errors for a given node, or ``errors`` with them added, if given
 
         """
-        errors = []
+        if errors is None:
+            errors = ErrorList()
         error_type = ErrorType.INVALID_NODE_PROPERTY_VALUE
         if not PrefixManager.is_curie(node):
-            message = f"Node property 'id' expected to be of type 'CURIE'"
-            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+            errors.add_error(node, error_type, MessageLevel.ERROR, "Node property 'id' expected to be of type 'CURIE'")
         else:
             prefix = PrefixManager.get_prefix(node)
-            if prefix and prefix not in Validator.get_all_prefixes():
-                message = f"Node property 'id' has a value '{node}' with a CURIE prefix '{prefix}' is not represented in Biolink Model JSON-LD context"
-                errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+            if prefix and prefix not in Validator.get_default_prefixes():
+                message = "Node property 'id' has a value '{detail}' with a CURIE prefix '{value}' is not represented in Biolink Model JSON-LD context"
+                template = "Node property 'id' has a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                errors.add_error(node, error_type, MessageLevel.ERROR, template, prefix, message, node)
         return errors
 
     @staticmethod
-    def validate_edge_property_values(subject: str, object: str, data: dict) -> list:
+    def validate_edge_property_values(subject: str, object: str, data: dict, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Validate an edge property's value.
 
@@ -463,47 +717,57 @@ class Validator(object):
             Object identifier
         data: dict
             Edge properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given edge
+        ErrorCollector
+            A list of errors for a given edge, or ``errors`` with them added, if given
 
         """
-        errors = []
+        if errors is None:
+            errors = ErrorList()
         error_type = ErrorType.INVALID_EDGE_PROPERTY_VALUE
-        prefixes = Validator.get_all_prefixes()
+        prefixes = Validator.get_default_prefixes()
+        entity = (subject, object)
 
         if PrefixManager.is_curie(subject):
             prefix = PrefixManager.get_prefix(subject)
             if prefix and prefix not in prefixes:
-                message = f"Edge property 'subject' has a value '{subject}' with a CURIE prefix '{prefix}' that is not represented in Biolink Model JSON-LD context"
-                errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+                message = "Edge property 'subject' has a value '{detail}' with a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                template = "Edge property 'subject' has a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                errors.add_error(entity, error_type, MessageLevel.ERROR, template, prefix, message, subject)
         else:
-            message = f"Edge property 'subject' has a value '{subject}' which is not a proper CURIE"
-            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            message = "Edge property 'subject' has a value '{detail}' which is not a proper CURIE"
+            template = "Edge property 'subject' has a value which is not a proper CURIE"
+            errors.add_error(entity, error_type, MessageLevel.ERROR, template, None, message, subject)
 
         if PrefixManager.is_curie(object):
             prefix = PrefixManager.get_prefix(object)
             if prefix not in prefixes:
-                message = f"Edge property 'object' has a value '{object}' with a CURIE prefix '{prefix}' that is not represented in Biolink Model JSON-LD context"
-                errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+                message = "Edge property 'object' has a value '{detail}' with a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                template = "Edge property 'object' has a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                errors.add_error(entity, error_type, MessageLevel.ERROR, template, prefix, message, object)
         else:
-            message = f"Edge property 'object' has a value '{object}' which is not a proper CURIE"
-            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            message = "Edge property 'object' has a value '{detail}' which is not a proper CURIE"
+            template = "Edge property 'object' has a value which is not a proper CURIE"
+            errors.add_error(entity, error_type, MessageLevel.ERROR, template, None, message, object)
         if 'relation' in data:
-            if PrefixManager.is_curie(data['relation']):
-                prefix = PrefixManager.get_prefix(data['relation'])
+            relation = data['relation']
+            if PrefixManager.is_curie(relation):
+                prefix = PrefixManager.get_prefix(relation)
                 if prefix not in prefixes:
-                    message = f"Edge property 'relation' has a value '{data['relation']}' with a CURIE prefix '{prefix}' that is not represented in Biolink Model JSON-LD context"
-                    errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+                    message = "Edge property 'relation' has a value '{detail}' with a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                    template = "Edge property 'relation' has a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+                    errors.add_error(entity, error_type, MessageLevel.ERROR, template, prefix, message, relation)
             else:
-                message = f"Edge property 'relation' has a value '{data['relation']}' which is not a proper CURIE"
-                errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+                template = "Edge property 'relation' has a value '{value}' which is not a proper CURIE"
+                errors.add_error(entity, error_type, MessageLevel.ERROR, template, relation)
         return errors
 
     @staticmethod
-    def validate_categories(node: str, data: dict) -> list:
+    def validate_categories(node: str, data: dict, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Validate ``category`` field of a given node.
 
@@ -513,47 +777,69 @@ class Validator(object):
             Node identifier
         data: dict
             Node properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given node
+        ErrorCollector
+            A list of errors for a given node, or ``errors`` with them added, if given
 
         """
-        toolkit = get_toolkit()
+        if errors is None:
+            errors = ErrorList()
         error_type = ErrorType.INVALID_CATEGORY
-        errors = []
         categories = data.get('category')
         if categories is None:
-            message = "Node does not have a 'category' property"
-            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+            errors.add_error(node, error_type, MessageLevel.ERROR, "Node does not have a 'category' property")
         elif not isinstance(categories, list):
-            message = f"Node property 'category' expected to be of type {list}"
-            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+            errors.add_error(node, error_type, MessageLevel.ERROR, f"Node property 'category' expected to be of type {list}")
         else:
             for category in categories:
-                if PrefixManager.is_curie(category):
-                    category = PrefixManager.get_reference(category)
-                m = re.match(r"^([A-Z][a-z\d]+)+$", category)
-                if not m:
-                    # category is not CamelCase
-                    error_type = ErrorType.INVALID_CATEGORY
-                    message = f"Category '{category}' is not in CamelCase form"
-                    errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
-                formatted_category = camelcase_to_sentencecase(category)
-                if not toolkit.is_category(formatted_category):
-                    message = f"Category '{category}' not in Biolink Model"
-                    errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
-                else:
-                    c = toolkit.get_element(formatted_category.lower())
-                    if c:
-                        if category != c.name and category in c.aliases:
-                            message = f"Category {category} is actually an alias for {c.name}; Should replace '{category}' with '{c.name}'"
-                            errors.append(ValidationError(node, error_type, message, MessageLevel.ERROR))
+                for message in Validator.get_category_messages(category):
+                    errors.add_error(node, error_type, MessageLevel.ERROR, message)
         return errors
 
     @staticmethod
-    def validate_edge_predicate(subject: str, object: str, data: dict) -> list:
+    @cached(LRUCache(maxsize=4096))
+    def get_category_messages(category: str) -> Tuple[str, ...]:
+        """
+        Get the error messages for a category.
+
+        The verdict for a category is the same for every node,
+        and is thus memoized.
+
+        Parameters
+        ----------
+        category: str
+            The category
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The error messages, if any
+
+        """
+        toolkit = get_toolkit()
+        messages = []
+        if PrefixManager.is_curie(category):
+            category = PrefixManager.get_reference(category)
+        m = re.match(r"^([A-Z][a-z\d]+)+$", category)
+        if not m:
+            # category is not CamelCase
+            messages.append(f"Category '{category}' is not in CamelCase form")
+        formatted_category = camelcase_to_sentencecase(category)
+        if not toolkit.is_category(formatted_category):
+            messages.append(f"Category '{category}' not in Biolink Model")
+        else:
+            c = toolkit.get_element(formatted_category.lower())
+            if c:
+                if category != c.name and category in c.aliases:
+                    messages.append(f"Category {category} is actually an alias for {c.name}; Should replace '{category}' with '{c.name}'")
+        return tuple(messages)
+
+    @staticmethod
+    def validate_edge_predicate(subject: str, object: str, data: dict, errors: Optional[ErrorCollector] = None) -> ErrorCollector:
         """
         Validate ``edge_predicate`` field of a given edge.
 
@@ -565,49 +851,73 @@ class Validator(object):
             Object identifier
         data: dict
             Edge properties
+        errors: Optional[ErrorCollector]
+            The errors to add to (a new list, by default)
 
         Returns
         -------
-        list
-            A list of errors for a given edge
+        ErrorCollector
+            A list of errors for a given edge, or ``errors`` with them added, if given
 
         """
-        toolkit = get_toolkit()
+        if errors is None:
+            errors = ErrorList()
         error_type = ErrorType.INVALID_EDGE_PREDICATE
-        errors = []
         edge_predicate = data.get('predicate')
         if edge_predicate is None:
-            message = "Edge does not have an 'predicate' property"
-            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            errors.add_error((subject, object), error_type, MessageLevel.ERROR, "Edge does not have an 'predicate' property")
         elif not isinstance(edge_predicate, str):
-            message = f"Edge property 'edge_predicate' expected to be of type 'string'"
-            errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            errors.add_error((subject, object), error_type, MessageLevel.ERROR, "Edge property 'edge_predicate' expected to be of type 'string'")
         else:
-            if PrefixManager.is_curie(edge_predicate):
-                edge_predicate = PrefixManager.get_reference(edge_predicate)
-            m = re.match(r"^([a-z_][^A-Z\s]+_?[a-z_][^A-Z\s]+)+$", edge_predicate)
-            if m:
-                p = toolkit.get_element(snakecase_to_sentencecase(edge_predicate))
-                if p is None:
-                    message = f"Edge label '{edge_predicate}' not in Biolink Model"
-                    errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
-                elif edge_predicate != p.name and edge_predicate in p.aliases:
-                    message = f"Edge label '{edge_predicate}' is actually an alias for {p.name}; Should replace {edge_predicate} with {p.name}"
-                    errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
-            else:
-                message = f"Edge label '{edge_predicate}' is not in snake_case form"
-                errors.append(ValidationError(f"{subject}-{object}", error_type, message, MessageLevel.ERROR))
+            for message in Validator.get_edge_predicate_messages(edge_predicate):
+                errors.add_error((subject, object), error_type, MessageLevel.ERROR, message)
         return errors
 
     @staticmethod
-    def report(errors: List[ValidationError]) -> List:
+    @cached(LRUCache(maxsize=4096))
+    def get_edge_predicate_messages(edge_predicate: str) -> Tuple[str, ...]:
+        """
+        Get the error messages for an edge predicate.
+
+        The verdict for a predicate is the same for every edge,
+        and is thus memoized.
+
+        Parameters
+        ----------
+        edge_predicate: str
+            The edge predicate
+
+        Returns
+        -------
+        Tuple[str, ...]
+            The error messages, if any
+
+        """
+        toolkit = get_toolkit()
+        messages = []
+        if PrefixManager.is_curie(edge_predicate):
+            edge_predicate = PrefixManager.get_reference(edge_predicate)
+        m = re.match(r"^([a-z_][^A-Z\s]+_?[a-z_][^A-Z\s]+)+$", edge_predicate)
+        if m:
+            p = toolkit.get_element(snakecase_to_sentencecase(edge_predicate))
+            if p is None:
+                messages.append(f"Edge label '{edge_predicate}' not in Biolink Model")
+            elif edge_predicate != p.name and edge_predicate in p.aliases:
+                messages.append(f"Edge label '{edge_predicate}' is actually an alias for {p.name}; Should replace {edge_predicate} with {p.name}")
+        else:
+            messages.append(f"Edge label '{edge_predicate}' is not in snake_case form")
+        return tuple(messages)
+
+    @staticmethod
+    def report(errors: Union[List[ValidationError], 'ErrorAggregator']) -> List:
         """
         Prepare error report.
 
         Parameters
         ----------
-        errors: List[ValidationError]
-            List of kgx.validator.ValidationError
+        errors: Union[List[ValidationError], kgx.validator.ErrorAggregator]
+            List of kgx.validator.ValidationError, or an aggregator
+            in which case the report has one entry per distinct error
 
         Returns
         -------
@@ -615,20 +925,355 @@ class Validator(object):
             A list of formatted errors
 
         """
+        if isinstance(errors, ErrorAggregator):
+            return errors.report()
         return [str(x) for x in errors]
 
     @staticmethod
-    def write_report(errors: List[ValidationError], outstream: TextIO) -> None:
+    def write_report(errors: Union[List[ValidationError], 'ErrorAggregator'], outstream: TextIO) -> None:
         """
         Write error report to a file
 
         Parameters
         ----------
-        errors: List[ValidationError]
-            List of kgx.validator.ValidationError
+        errors: Union[List[ValidationError], kgx.validator.ErrorAggregator]
+            List of kgx.validator.ValidationError, or an aggregator
         outstream: TextIO
             The stream to write to
 
         """
         for x in Validator.report(errors):
             outstream.write(f"{x}\n")
+
+
+class ErrorAggregator(object):
+    """
+    Aggregates validation errors, using a bounded amount of memory.
+
+    Errors are counted by their error type, message level, message template and
+    offending value, along with a sample of the entities that have the error.
+    Up to ``max_messages`` distinct errors are kept. Errors beyond that are only
+    counted by their error type and message level.
+
+    Optionally, every error is also written as a JSON line to ``records``,
+    as it is added.
+
+    Parameters
+    ----------
+    max_messages: int
+        Maximum number of distinct errors to keep
+    sample_size: int
+        Number of entities to keep as a sample, for each distinct error
+    records: Optional[TextIO]
+        The stream to write every error to, as JSON lines
+
+    """
+
+    def __init__(self, max_messages: int = 10000, sample_size: int = 5, records: Optional[TextIO] = None):
+        self.max_messages = max_messages
+        self.sample_size = sample_size
+        self.records = records
+        self.total = 0
+        self.counts: Dict[Tuple[ErrorType, MessageLevel, str, Any], int] = {}
+        self.samples: Dict[Tuple[ErrorType, MessageLevel, str, Any], List[str]] = {}
+        self.overflow_counts: Dict[Tuple[ErrorType, MessageLevel], int] = {}
+
+    def add(self, error: ValidationError) -> None:
+        """
+        Add an error.
+
+        Parameters
+        ----------
+        error: kgx.validator.ValidationError
+            The error
+
+        """
+        self.total += 1
+        if self.records:
+            self.records.write(f"{json.dumps(error.as_dict())}\n")
+        if error.template:
+            key = (error.error_type, error.message_level, error.template, error.value)
+        else:
+            key = (error.error_type, error.message_level, error.message, None)
+        self._count(key, error.entity)
+
+    def add_error(self, entity: Entity, error_type: ErrorType, message_level: MessageLevel, template: str, value: Any = None, message: Optional[str] = None, detail: Any = None) -> None:
+        """
+        Add an error, without building a ``ValidationError`` for it,
+        unless it is written to ``records``.
+
+        Parameters
+        ----------
+        entity: Union[str, Tuple[str, str]]
+            The node, or the (subject, object) of the edge, that is failing validation
+        error_type: kgx.validator.ErrorType
+            The nature of the error
+        message_level: kgx.validator.MessageLevel
+            The message level
+        template: str
+            The error message without any entity specific parts, with a ``{value}``
+            placeholder for the offending value
+        value: Any
+            The offending value, if any
+        message: Optional[str]
+            The error message, with a ``{value}`` placeholder for the offending value,
+            and a ``{detail}`` placeholder for an entity specific part. Defaults to ``template``
+        detail: Any
+            The entity specific part of the error message, if any
+
+        """
+        self.total += 1
+        if self.records:
+            error = ValidationError(_format_entity(entity), error_type, _format_message(message or template, value, detail), message_level, template, value)
+            self.records.write(f"{json.dumps(error.as_dict())}\n")
+        self._count((error_type, message_level, template, value), entity)
+
+    def _count(self, key: Tuple[ErrorType, MessageLevel, str, Any], entity: Entity) -> None:
+        """
+        Count an error, and keep its entity if the sample for the error is not full yet.
+        """
+        if key in self.counts:
+            self.counts[key] += 1
+            if len(self.samples[key]) < self.sample_size:
+                self.samples[key].append(_format_entity(entity))
+        elif len(self.counts) < self.max_messages:
+            self.counts[key] = 1
+            self.samples[key] = [_format_entity(entity)]
+        else:
+            overflow_key = key[:2]
+            self.overflow_counts[overflow_key] = self.overflow_counts.get(overflow_key, 0) + 1
+
+    def merge(self, other: 'ErrorAggregator') -> None:
+        """
+        Merge the errors of another aggregator into this one.
+
+        Parameters
+        ----------
+        other: kgx.validator.ErrorAggregator
+            The other aggregator
+
+        """
+        self.total += other.total
+        for key, count in other.counts.items():
+            if key in self.counts:
+                self.counts[key] += count
+                sample = self.samples[key]
+                sample.extend(other.samples[key][:self.sample_size - len(sample)])
+            elif len(self.counts) < self.max_messages:
+                self.counts[key] = count
+                self.samples[key] = other.samples[key][:self.sample_size]
+            else:
+                overflow_key = key[:2]
+                self.overflow_counts[overflow_key] = self.overflow_counts.get(overflow_key, 0) + count
+        for overflow_key, count in other.overflow_counts.items():
+            self.overflow_counts[overflow_key] = self.overflow_counts.get(overflow_key, 0) + count
+
+    def add_all(self, errors: List[ValidationError]) -> None:
+        """
+        Add a list of errors.
+
+        Parameters
+        ----------
+        errors: List[kgx.validator.ValidationError]
+            The errors
+
+        """
+        for e in errors:
+            self.add(e)
+
+    def summary(self) -> List[Dict]:
+        """
+        Get the aggregated errors, most frequent first.
+
+        Returns
+        -------
+        List[Dict]
+            A list of aggregated errors, each with a message, a count and a sample of entities
+
+        """
+        summary = []
+        for key, count in sorted(self.counts.items(), key=lambda x: -x[1]):
+            error_type, level, template, value = key
+            summary.append({
+                'error_type': error_type.name,
+                'message_level': level.name,
+                'message': template.format(value=value) if value is not None else template,
+                'value': value,
+                'count': count,
+                'sample': self.samples[key]
+            })
+        for (error_type, level), count in sorted(self.overflow_counts.items(), key=lambda x: -x[1]):
+            summary.append({
+                'error_type': error_type.name,
+                'message_level': level.name,
+                'message': 'other errors',
+                'value': None,
+                'count': count,
+                'sample': []
+            })
+        return summary
+
+    def report(self) -> List[str]:
+        """
+        Prepare a report of the aggregated errors, most frequent first.
+
+        Returns
+        -------
+        List[str]
+            A list of formatted errors
+
+        """
+        lines = []
+        for x in self.summary():
+            line = f"[{x['message_level']}][{x['error_type']}] {x['message']} ({x['count']})"
+            if x['sample']:
+                line += f" - {', '.join(str(e) for e in x['sample'])}"
+            lines.append(line)
+        return lines
+
+
+class ValidationGraph(BaseGraph):
+    """
+    A write-only graph that validates nodes and edges as they are added
+    instead of storing them.
+
+    Parameters
+    ----------
+    validator: kgx.validator.Validator
+        The validator
+    callback: Optional[Callable[[List[kgx.validator.ValidationError]], None]]
+        A function that is called with the errors for each node and edge that fails validation
+    aggregator: Optional[kgx.validator.ErrorAggregator]
+        The aggregator to add errors to directly, instead of calling ``callback``
+
+    """
+
+    def __init__(self, validator: Validator, callback: Optional[Callable[[List[ValidationError]], None]] = None, aggregator: Optional['ErrorAggregator'] = None):
+        super().__init__()
+        self.validator = validator
+        self.callback = callback
+        self.aggregator = aggregator
+
+    def add_node(self, node: str, **kwargs: Any) -> None:
+        data = kwargs['data'] if 'data' in kwargs else kwargs
+        if self.aggregator:
+            Validator.validate_node(node, data, self.validator.required_node_properties, self.aggregator)
+            return
+        errors = ErrorList()
+        Validator.validate_node(node, data, self.validator.required_node_properties, errors)
+        if errors and self.callback:
+            self.callback(errors)
+
+    def add_edge(self, subject_node: str, object_node: str, edge_key: Optional[EdgeKey] = None, **kwargs: Any) -> None:
+        data = kwargs['data'] if 'data' in kwargs else kwargs
+        if self.aggregator:
+            Validator.validate_edge(subject_node, object_node, data, self.validator.required_edge_properties, self.aggregator)
+            return
+        errors = ErrorList()
+        Validator.validate_edge(subject_node, object_node, data, self.validator.required_edge_properties, errors)
+        if errors and self.callback:
+            self.callback(errors)
+
+    def has_node(self, node: str) -> bool:
+        return False
+
+
+def _chunks(iterable: Iterable, size: int) -> Iterable[List]:
+    """
+    Split an iterable into lists of at most ``size`` elements.
+    """
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def _imap(f, tasks: Iterable[Tuple], processes: int, pool: Optional[PoolType] = None) -> Iterable:
+    """
+    Apply ``f`` on each task in a pool of worker processes, in order.
+
+    Tasks are only read from ``tasks`` while fewer than ``2 * processes`` of them are
+    in flight, so that only those chunks are held in memory. A pool is created for
+    the tasks, and closed once they are done, unless ``pool`` is given.
+    """
+    own_pool = pool is None
+    if pool is None:
+        pool = Pool(processes=processes)
+    try:
+        pending: deque = deque()
+        for task in tasks:
+            pending.append(pool.apply_async(f, (task,)))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        if own_pool:
+            pool.close()
+            pool.join()
+
+
+def _get_aggregator_options(aggregator: Optional[ErrorAggregator]) -> Optional[Tuple[int, int, bool]]:
+    """
+    Get the options for the partial aggregators of worker processes, that mirror ``aggregator``.
+    """
+    if aggregator is None:
+        return None
+    return aggregator.max_messages, aggregator.sample_size, aggregator.records is not None
+
+
+def _get_partial_collector(options: Optional[Tuple[int, int, bool]]) -> ErrorCollector:
+    """
+    Get the collector for the errors of a chunk, in a worker process.
+    """
+    if options is None:
+        return ErrorList()
+    max_messages, sample_size, records = options
+    return ErrorAggregator(max_messages, sample_size, io.StringIO() if records else None)
+
+
+def _get_partial_result(size: int, errors: ErrorCollector) -> Tuple[int, ErrorCollector, Optional[str]]:
+    """
+    Get the result for a chunk, in a worker process, with the records of
+    a partial aggregator as text, as streams are not picklable.
+    """
+    records = None
+    if isinstance(errors, ErrorAggregator) and errors.records:
+        records = errors.records.getvalue()  # type: ignore
+        errors.records = None
+    return size, errors, records
+
+
+def _add_partial(collector: ErrorCollector, errors: ErrorCollector, records: Optional[str]) -> None:
+    """
+    Add the errors for a chunk, from a worker process, to ``collector``.
+    """
+    if isinstance(collector, ErrorAggregator) and isinstance(errors, ErrorAggregator):
+        collector.merge(errors)
+        if collector.records and records:
+            collector.records.write(records)
+    else:
+        collector.extend(errors)  # type: ignore
+
+
+def _validate_node_chunk(task: Tuple[List, list, Optional[Tuple[int, int, bool]]]) -> Tuple[int, ErrorCollector, Optional[str]]:
+    """
+    Validate a chunk of (node, data) tuples.
+    """
+    chunk, required_properties, options = task
+    errors = _get_partial_collector(options)
+    for n, data in chunk:
+        Validator.validate_node(n, data, required_properties, errors)
+    return _get_partial_result(len(chunk), errors)
+
+
+def _validate_edge_chunk(task: Tuple[List, list, Optional[Tuple[int, int, bool]]]) -> Tuple[int, ErrorCollector, Optional[str]]:
+    """
+    Validate a chunk of (subject, object, data) tuples.
+    """
+    chunk, required_properties, options = task
+    errors = _get_partial_collector(options)
+    for u, v, data in chunk:
+        Validator.validate_edge(u, v, data, required_properties, errors)
+    return _get_partial_result(len(chunk), errors)
@@ -12,7 +12,10 @@ LICENSE = 'BSD'
 with open("requirements.txt", "r") as FH:
     REQUIREMENTS = FH.readlines()
 
-EXTRAS = {}
+EXTRAS = {
+    'compression': ['zstandard>=0.15.0', 'lz4>=3.0.0'],
+    'json': ['orjson>=3.0.0'],
+}
 
 setup(
     name=NAME,
@@ -26,7 +29,7 @@ setup(
     long_description_content_type='text/markdown',
     license=LICENSE,
     packages=find_packages(exclude=["*.tests", "*.tests.*", "tests.*", "tests"]),
-    package_data={'kgx': ["config.yml"]},
+    package_data={'kgx': ["config.yml", "contexts/*.jsonld"]},
     keywords='knowledge-graph Neo4j RDF NCATS NCATS-Translator Biolink-Model',
     classifiers=[
         'Intended Audience :: Science/Research',
@@ -0,0 +1,2 @@
+#!/bin/sh
+neo4j-admin import --delimiter=, '--array-delimiter=|' --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0010.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0011.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0012.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0013.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0014.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0015.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0016.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0017.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0018.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0019.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0020.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0021.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0022.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0023.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0024.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0025.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0026.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0027.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0028.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0029.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0030.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0031.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0032.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0033.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0034.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0035.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0036.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0037.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0038.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0039.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0040.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0041.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0042.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0043.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0044.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0045.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0046.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0047.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0048.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0049.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0050.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0051.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0052.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0053.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0054.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0055.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0056.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0057.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0058.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0059.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0060.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0061.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0062.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0063.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0064.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0065.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0066.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0067.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0068.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0069.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0070.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0071.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0072.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0073.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0074.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0075.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0076.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0077.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0078.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0079.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0080.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0081.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0082.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0083.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0084.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0085.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0086.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0087.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Gene_0088.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_CellularComponent_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_CellularComponent_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_CellularComponent_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_CellularComponent_0003.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0010.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0011.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0012.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0013.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0014.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0015.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0016.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0017.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0018.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0019.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0020.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0021.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0022.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0023.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0024.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0025.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0026.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0027.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0028.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0029.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0030.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0031.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0032.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0033.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0034.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0035.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0036.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0037.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0038.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0039.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0040.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0041.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0042.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0043.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0044.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0045.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0046.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0047.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0048.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0049.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0050.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0051.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0052.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0053.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0054.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0055.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0056.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0057.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0058.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0059.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0060.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0061.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0062.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0063.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0064.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0065.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0066.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0067.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0068.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0069.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0070.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_BiologicalProcess_0071.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_MolecularActivity_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_MolecularActivity_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_MolecularActivity_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_MolecularActivity_0003.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Pathway_0010.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_AnatomicalEntity_0009.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0010.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0011.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0012.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0013.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0014.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0015.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0016.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0017.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0018.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0019.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0020.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0021.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0022.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0023.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0024.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0025.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0026.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0027.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0028.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0029.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0030.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0031.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0032.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0033.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0034.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0035.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0036.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0037.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0038.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0039.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0040.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0041.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0042.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0043.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0044.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0045.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0046.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0047.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0048.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0049.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0050.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0051.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0052.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0053.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0054.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_PhenotypicFeature_0055.csv.gz --nodes=/root/package/tests/target/export_neo4j_shards/export_nodes_header.csv,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_nodes_biolink_Disease_0010.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0010.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0011.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0012.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0013.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0014.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0015.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0016.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0017.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0018.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0019.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0020.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0021.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0022.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0023.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0024.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0025.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0026.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0027.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0028.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0029.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0030.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0031.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0032.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0033.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0034.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0035.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0036.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0037.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0038.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0039.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0040.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0041.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0042.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0043.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0044.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0045.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0046.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0047.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0048.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0049.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0050.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0051.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0052.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0053.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0054.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0055.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0056.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0057.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0058.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0059.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0060.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0061.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0062.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0063.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0064.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0065.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0066.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0067.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0068.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0069.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0070.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0071.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0072.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0073.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0074.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0075.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0076.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0077.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0078.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0079.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0080.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0081.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_interacts_with_0082.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_part_of_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_part_of_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_part_of_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_part_of_0003.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0010.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0011.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0012.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0013.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0014.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0015.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0016.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0017.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0018.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0019.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0020.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0021.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0022.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0023.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0024.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0025.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0026.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0027.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0028.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0029.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0030.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0031.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0032.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0033.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0034.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0035.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0036.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0037.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0038.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0039.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0040.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0041.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0042.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0043.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0044.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0045.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0046.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0047.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0048.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0049.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0050.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0051.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0052.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0053.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0054.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0055.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0056.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0057.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0058.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0059.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0060.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0061.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0062.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0063.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0064.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0065.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0066.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0067.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0068.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0069.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0070.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0071.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0072.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0073.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0074.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0075.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0076.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0077.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0078.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0079.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0080.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0081.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0082.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0083.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0084.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0085.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0086.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0087.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_related_to_0088.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_orthologous_to_0006.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_expressed_in_0009.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0010.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0011.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0012.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0013.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0014.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0015.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0016.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0017.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0018.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0019.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0020.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0021.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0022.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0023.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0024.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0025.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0026.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0027.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0028.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0029.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0030.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0031.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0032.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0033.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0034.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0035.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0036.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0037.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0038.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0039.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0040.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0041.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0042.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0043.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0044.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0045.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0046.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0047.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0048.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0049.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0050.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0051.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0052.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0053.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0054.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0055.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0056.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0057.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0058.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0059.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0060.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_has_phenotype_0061.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_contributes_to_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_contributes_to_0001.csv.gz --relationships=/root/package/tests/target/export_neo4j_shards/export_edges_header.csv,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0000.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0001.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0002.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0003.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0004.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0005.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0006.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0007.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0008.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0009.csv.gz,/root/package/tests/target/export_neo4j_shards/export_edges_biolink_involved_in_0010.csv.gz
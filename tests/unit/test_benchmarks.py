@@ -0,0 +1,51 @@
+import os
+import shutil
+
+from benchmarks.suite import compare, get_benchmarks, prepare_data, get_data_path, run_benchmark
+from benchmarks.synthetic import SyntheticGraph
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+target_dir = os.path.join(cwd, '../target')
+
+
+def test_synthetic_graph():
+    g = SyntheticGraph(1000, seed=1)
+    nodes = list(g.nodes())
+    edges = list(g.edges())
+    assert len(nodes) == 200
+    assert len(edges) == 1000
+    assert nodes == list(SyntheticGraph(1000, seed=1).nodes())
+    assert edges == list(SyntheticGraph(1000, seed=1).edges())
+    assert edges != list(SyntheticGraph(1000, seed=2).edges())
+
+    ids = {x['id'] for x in nodes}
+    assert len(ids) == len(nodes)
+    assert all(x['subject'] in ids and x['object'] in ids for x in edges)
+    assert any(x['predicate'] == 'biolink:same_as' for x in edges)
+    assert any(len(x['provided_by']) > 1 for x in nodes)
+    same_as = [x for x in nodes if 'same_as' in x]
+    assert same_as and all(y in ids for x in same_as for y in x['same_as'])
+
+
+def test_run_benchmark():
+    data_dir = os.path.join(target_dir, 'benchmarks')
+    shutil.rmtree(data_dir, ignore_errors=True)
+    info = prepare_data(data_dir, 100, formats=['tsv', 'jsonl'])
+    assert info['edges'] == 100
+    assert info['formats']['jsonl']['error'] is None
+
+    path = get_data_path(data_dir, 100, 0)
+    benchmarks = {x.name: x for x in get_benchmarks(['tsv', 'jsonl'])}
+    result = run_benchmark(benchmarks['parse:jsonl'], path)
+    assert result['error'] is None
+    assert result['records'] == info['nodes'] + info['edges']
+    assert result['seconds'] > 0
+
+    result = run_benchmark(benchmarks['summarize_graph'], path)
+    assert result['error'] is None
+
+    base = {'results': {'parse:jsonl': {'seconds': 1.0, 'peak_memory': 100}}}
+    head = {'results': {'parse:jsonl': {'seconds': 1.5, 'peak_memory': 100}}}
+    lines, regressions = compare(base, head)
+    assert regressions == ['parse:jsonl']
+    assert compare(base, base)[1] == []
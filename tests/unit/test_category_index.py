@@ -0,0 +1,31 @@
+import numpy as np
+
+from kgx.utils.category_index import CategoryIndex
+
+
+def test_category_index():
+    index = CategoryIndex({'biolink:Gene', 'biolink:Disease'})
+    index.add('HGNC:1', ['biolink:Gene'])
+    index.add('MONDO:1', ['biolink:Disease', 'biolink:NamedThing'])
+    index.add('HGNC:1', 'biolink:Disease')
+    index.add('CHEBI:1', ['biolink:ChemicalSubstance'])
+    assert len(index) == 3
+    assert 'HGNC:1' in index
+    assert 'HGNC:2' not in index
+
+    positions = index.lookup(['HGNC:1', 'MONDO:1', 'CHEBI:1', 'HGNC:2'])
+    assert list(positions) == [0, 1, 2, -1]
+    assert list(index.has_category(positions, index.mask({'biolink:Gene'}))) == [True, False, False, False]
+    assert list(index.has_category(positions, index.mask({'biolink:Disease'}))) == [True, True, False, False]
+    assert not index.has_category(positions, index.mask({'biolink:NamedThing'})).any()
+
+
+def test_category_index_growth():
+    categories = [f"biolink:Category{i}" for i in range(100)]
+    index = CategoryIndex(categories)
+    assert index.words == 2
+    for i in range(5000):
+        index.add(f"X:{i}", [categories[i % 100]])
+    positions = index.lookup([f"X:{i}" for i in range(5000)])
+    matches = index.has_category(positions, index.mask(['biolink:Category99']))
+    assert list(np.flatnonzero(matches)) == list(range(99, 5000, 100))
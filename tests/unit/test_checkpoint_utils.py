@@ -0,0 +1,122 @@
+import os
+import shutil
+
+import pytest
+
+from kgx.graph.nx_graph import NxGraph
+from kgx.utils.checkpoint_utils import MergeCheckpoint, get_fingerprint, get_source_fingerprint, read_snapshot, run_with_snapshot, write_snapshot
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
+target_dir = os.path.join(cwd, '../target')
+
+
+def get_graph():
+    g = NxGraph()
+    g.add_node('HGNC:11603', name='TBX4', category=['biolink:Gene'])
+    g.add_node('MONDO:0005002', name='COPD', category=['biolink:Disease'])
+    g.add_edge('HGNC:11603', 'MONDO:0005002', 'HGNC:11603-biolink:related_to-MONDO:0005002', predicate='biolink:related_to')
+    return g
+
+
+@pytest.fixture
+def directory():
+    d = os.path.join(target_dir, 'checkpoint_test')
+    shutil.rmtree(d, ignore_errors=True)
+    return d
+
+
+@pytest.fixture
+def source():
+    return {'input': {'format': 'tsv', 'filename': [os.path.join(resource_dir, 'graph_nodes.tsv')]}}
+
+
+def test_snapshot(directory):
+    filename = os.path.join(directory, 'graph.pickle')
+    write_snapshot(get_graph(), filename)
+    assert not os.path.exists(f"{filename}.tmp")
+    g = read_snapshot(filename)
+    assert g.number_of_nodes() == 2
+    assert g.number_of_edges() == 1
+    assert g.get_node('HGNC:11603')['name'] == 'TBX4'
+
+
+def test_run_with_snapshot(directory):
+    filename = os.path.join(directory, 'graph.pickle')
+    g = run_with_snapshot(filename, get_graph)
+    assert g.number_of_nodes() == 2
+    assert read_snapshot(filename).number_of_nodes() == 2
+
+
+def test_fingerprint(source):
+    assert get_fingerprint({'a': 1, 'b': [1, 2]}) == get_fingerprint({'b': [1, 2], 'a': 1})
+    assert get_fingerprint({'a': 1}) != get_fingerprint({'a': 2})
+    other = {'input': {'format': 'tsv', 'filename': [os.path.join(resource_dir, 'graph_edges.tsv')]}}
+    assert get_source_fingerprint(source) != get_source_fingerprint(other)
+
+
+def test_source(directory, source):
+    c = MergeCheckpoint(directory, {'output_directory': 'target'})
+    c.reset()
+    assert not c.is_source_parsed('graph', source)
+    assert c.get_source('graph', source) is None
+    run_with_snapshot(c.get_source_snapshot('graph'), get_graph)
+    c.add_source('graph', source)
+
+    c = MergeCheckpoint(directory, {'output_directory': 'target'})
+    assert c.load()
+    assert c.is_source_parsed('graph', source)
+    assert c.get_source('graph', source).number_of_nodes() == 2
+    # a source that has changed is parsed again
+    changed = {'input': dict(source['input'], format='csv')}
+    assert not c.is_source_parsed('graph', changed)
+    assert c.get_source('graph', changed) is None
+
+
+def test_merged(directory, source):
+    sources = {'graph': source}
+    operations = [{'name': 'a', 'args': {}}, {'name': 'b', 'args': {}}]
+    c = MergeCheckpoint(directory)
+    c.reset()
+    assert c.get_merged(sources, operations) is None
+    assert c.get_completed_operations() == 0
+    c.add_merged(get_graph(), sources)
+    c.add_destination('tsv', {'format': 'tsv'})
+    assert c.is_destination_written('tsv', {'format': 'tsv'})
+    c.add_merged(get_graph(), sources, operations[:1])
+    # destinations are written again after the merged graph changes
+    assert not c.is_destination_written('tsv', {'format': 'tsv'})
+    # each snapshot has a new filename, and the previous one is deleted
+    assert not os.path.exists(os.path.join(directory, 'merged-0.pickle'))
+    assert os.path.exists(os.path.join(directory, 'merged-1.pickle'))
+
+    c = MergeCheckpoint(directory)
+    assert c.load()
+    assert c.get_merged(sources, operations).number_of_nodes() == 2
+    assert c.get_completed_operations() == 1
+    # an operation that was applied has changed
+    assert c.get_merged(sources, [{'name': 'c', 'args': {}}] + operations[1:]) is None
+    # a source has changed
+    assert c.get_merged({'other': source}, operations) is None
+
+
+def test_destination(directory):
+    c = MergeCheckpoint(directory)
+    c.reset()
+    c.add_destination('tsv', {'format': 'tsv', 'filename': ['merged']})
+    c = MergeCheckpoint(directory)
+    assert c.load()
+    assert c.is_destination_written('tsv', {'format': 'tsv', 'filename': ['merged']})
+    assert not c.is_destination_written('tsv', {'format': 'tsv', 'filename': ['other']})
+    assert not c.is_destination_written('json', {'format': 'json'})
+
+
+def test_load(directory):
+    assert not MergeCheckpoint(directory).load()
+    c = MergeCheckpoint(directory, {'output_directory': 'target'})
+    c.reset()
+    c.add_destination('tsv', {'format': 'tsv'})
+    # a checkpoint of a merge with another configuration is discarded
+    c = MergeCheckpoint(directory, {'output_directory': 'other'})
+    assert not c.load()
+    assert not c.is_destination_written('tsv', {'format': 'tsv'})
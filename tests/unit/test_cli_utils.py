@@ -1,13 +1,19 @@
 import json
 import os
 import pprint
+import shutil
+import subprocess
+import sys
 from time import sleep
 
 import pytest
-from kgx.cli.cli_utils import validate, neo4j_upload, neo4j_download, transform, merge
+import yaml
+from click.testing import CliRunner
+from kgx.cli.cli_utils import validate, neo4j_upload, neo4j_download, transform, merge, order_node_files
 
 from kgx import PandasTransformer, JsonTransformer, RdfTransformer, NtTransformer
-from kgx.cli import get_transformer, get_file_types, graph_summary
+from kgx.cli import cli, get_transformer, get_file_types, graph_summary
+from kgx.utils.metrics_utils import get_metrics
 from tests import clean_slate, check_container, CONTAINER_NAME, DEFAULT_NEO4J_URL, DEFAULT_NEO4J_USERNAME, DEFAULT_NEO4J_PASSWORD
 
 cwd = os.path.abspath(os.path.dirname(__file__))
@@ -68,6 +74,33 @@ def test_validate():
     assert len(errors) == 0
 
 
+def test_validate_stream():
+    inputs = [
+        os.path.join(resource_dir, 'test_nodes.tsv'),
+        os.path.join(resource_dir, 'test_edges.tsv'),
+    ]
+    output = os.path.join(target_dir, 'validation.log')
+    validate(inputs, 'tsv', None, output)
+    expected = sorted(open(output).read().splitlines())
+    stream_output = os.path.join(target_dir, 'validation_stream.log')
+    summary = validate(inputs, 'tsv', None, stream_output, stream=True)
+    assert sorted(open(stream_output).read().splitlines()) == expected
+    assert sum(x['count'] for x in summary) == len(expected)
+
+
+def test_validate_summary():
+    inputs = [
+        os.path.join(resource_dir, 'test_nodes.tsv'),
+        os.path.join(resource_dir, 'test_edges.tsv'),
+    ]
+    output = os.path.join(target_dir, 'validation_summary.log')
+    error_records = os.path.join(target_dir, 'validation_errors.jsonl')
+    errors = validate(inputs, 'tsv', None, output, summary=True, error_records=error_records)
+    records = [json.loads(x) for x in open(error_records)]
+    assert sum(x['count'] for x in errors) == len(records)
+    assert len(open(output).read().splitlines()) == len(errors)
+
+
 @pytest.mark.skipif(not check_container(), reason=f'Container {CONTAINER_NAME} is not running')
 def test_neo4j_upload(clean_slate):
     inputs = [
@@ -134,6 +167,29 @@ def test_transform1():
     assert len(data['edges']) == 532
 
 
+def test_transform_columns():
+    # load only some of the node and edge properties
+    inputs = [
+        os.path.join(resource_dir, 'graph_nodes.tsv'),
+        os.path.join(resource_dir, 'graph_edges.tsv')
+    ]
+    output = os.path.join(target_dir, 'graph_columns.json')
+    transform(
+        inputs=inputs,
+        input_format='tsv',
+        output=output,
+        output_format='json',
+        node_projection=['name'],
+        edge_projection=['relation']
+    )
+    data = json.load(open(output, 'r'))
+    assert len(data['nodes']) == 512
+    assert len(data['edges']) == 532
+    # provided_by is set from the name of the source
+    assert {k for n in data['nodes'] for k in n} == {'id', 'category', 'name', 'provided_by'}
+    assert {k for e in data['edges'] for k in e} == {'id', 'subject', 'predicate', 'object', 'relation', 'provided_by'}
+
+
 def test_transform2():
     # transform from a test transform yaml
     transform_config = os.path.join(resource_dir, 'test-transform.yaml')
@@ -158,3 +214,100 @@ def test_merge2():
     merge(merge_config=merge_config, destination=['merged-graph-json'])
     assert os.path.join(target_dir, 'merged-graph.json')
 
+
+
+def test_cli_import_is_lazy():
+    """
+    Importing the command line should not import transformers and their dependencies.
+    """
+    code = "import sys, kgx.cli; print(sorted(m for m in ['pandas', 'rdflib', 'bmt', 'networkx'] if m in sys.modules))"
+    output = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+    assert output.strip() == '[]'
+    assert get_transformer('tsv') is PandasTransformer
+
+
+def test_order_node_files():
+    inputs = ['a_edges.jsonl', 'a_nodes.jsonl', 'b_edges.jsonl', 'b_nodes.jsonl']
+    assert order_node_files(inputs, 'jsonl') == ['a_nodes.jsonl', 'b_nodes.jsonl', 'a_edges.jsonl', 'b_edges.jsonl']
+
+
+def test_transform_metrics():
+    inputs = [
+        os.path.join(resource_dir, 'graph_nodes.tsv'),
+        os.path.join(resource_dir, 'graph_edges.tsv')
+    ]
+    output = os.path.join(target_dir, 'graph_metrics.json')
+    metrics = os.path.join(target_dir, 'transform_metrics.json')
+    runner = CliRunner()
+    result = runner.invoke(cli, ['transform', *inputs, '--input-format', 'tsv', '--output', output, '--output-format', 'json', '--metrics', metrics])
+    get_metrics().enable(False)
+    get_metrics().reset()
+    assert result.exit_code == 0
+    report = json.load(open(metrics))
+    assert report['stages']['parse']['count'] == 2
+    assert report['stages']['parse']['records'] == 512 + 532
+    assert report['stages']['parse']['bytes_read'] == sum(os.path.getsize(x) for x in inputs)
+    assert report['stages']['save']['records'] == 512 + 532
+    assert report['stages']['save']['bytes_written'] == os.path.getsize(output)
+
+
+def test_transform_profile():
+    inputs = [
+        os.path.join(resource_dir, 'graph_nodes.tsv'),
+        os.path.join(resource_dir, 'graph_edges.tsv')
+    ]
+    output = os.path.join(target_dir, 'graph_profile.json')
+    prefix = os.path.join(target_dir, 'transform_profile')
+    runner = CliRunner()
+    result = runner.invoke(cli, ['--profile', 'cpu', '--profile-output', prefix, 'transform', *inputs, '--input-format', 'tsv', '--output', output, '--output-format', 'json'])
+    assert result.exit_code == 0
+    assert os.path.exists(f"{prefix}.pstats")
+    assert os.path.exists(f"{prefix}.collapsed")
+
+
+def test_merge_resume():
+    output_directory = os.path.join(target_dir, 'merge_resume')
+    shutil.rmtree(output_directory, ignore_errors=True)
+    cfg = {
+        'configuration': {'output_directory': output_directory},
+        'merged_graph': {
+            'source': {
+                'graph': {'input': {'format': 'tsv', 'filename': [
+                    os.path.join(resource_dir, 'graph_nodes.tsv'),
+                    os.path.join(resource_dir, 'graph_edges.tsv'),
+                ]}},
+                'valid': {'input': {'format': 'json', 'filename': [os.path.join(resource_dir, 'valid.json')]}},
+            },
+            'operations': [
+                {'name': 'kgx.operations.missing.operation', 'args': {}},
+            ],
+            'destination': {
+                'merged-graph-json': {'format': 'json', 'filename': ['merged-graph.json']},
+            },
+        },
+    }
+    merge_config = os.path.join(target_dir, 'merge-resume.yaml')
+    with open(merge_config, 'w') as FH:
+        yaml.dump(cfg, FH)
+    with pytest.raises(ModuleNotFoundError):
+        merge(merge_config=merge_config, resume=True)
+    manifest = os.path.join(output_directory, 'checkpoint', 'manifest.json')
+    with open(manifest) as FH:
+        checkpoint = json.load(FH)
+    assert set(checkpoint['sources']) == {'graph', 'valid'}
+    assert checkpoint['merged']['operations'] == []
+    assert checkpoint['destinations'] == {}
+
+    cfg['merged_graph']['operations'] = [{
+        'name': 'kgx.operations.summarize_graph.generate_graph_stats',
+        'args': {'graph_name': 'Merged Graph', 'filename': os.path.join(output_directory, 'merged-graph_stats.yaml')},
+    }]
+    with open(merge_config, 'w') as FH:
+        yaml.dump(cfg, FH)
+    merged_graph = merge(merge_config=merge_config, resume=True)
+    assert merged_graph.number_of_nodes() == 518
+    assert os.path.isfile(os.path.join(output_directory, 'merged-graph.json'))
+    with open(manifest) as FH:
+        checkpoint = json.load(FH)
+    assert len(checkpoint['merged']['operations']) == 1
+    assert list(checkpoint['destinations']) == ['merged-graph-json']
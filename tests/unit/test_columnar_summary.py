@@ -0,0 +1,45 @@
+import json
+import os
+
+from kgx import PandasTransformer
+from kgx.operations.columnar_summary import ColumnarSummary
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
+
+
+def get_graph():
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, 'graph_nodes.tsv'))
+    t.parse(os.path.join(resource_dir, 'graph_edges.tsv'))
+    return t.graph
+
+
+def load_expected(filename):
+    # expected output, from the summary implementations that preceded ColumnarSummary
+    with open(os.path.join(resource_dir, filename)) as FH:
+        return json.load(FH)
+
+
+def test_columnar_summary():
+    graph = get_graph()
+    summary = ColumnarSummary(graph, node_facet_properties=['provided_by'], edge_facet_properties=['relation'])
+
+    stats = summary.graph_stats('Test Graph')
+    assert stats == load_expected('graph_stats.json')
+    assert stats['node_stats']['total_nodes'] == 512
+    assert stats['edge_stats']['total_edges'] == 532
+
+
+def test_columnar_knowledge_map():
+    graph = get_graph()
+    summary = ColumnarSummary(graph)
+
+    knowledge_map = summary.knowledge_map('Test Graph')
+    # id prefixes and relations are collected as sets, in no particular order
+    knowledge_map['knowledge_map']['nodes']['id_prefixes'] = sorted(knowledge_map['knowledge_map']['nodes']['id_prefixes'])
+    for edge in knowledge_map['knowledge_map']['edges']:
+        edge['relations'] = sorted(edge['relations'])
+    assert knowledge_map == load_expected('graph_knowledge_map.json')
+    assert knowledge_map['knowledge_map']['nodes']['count'] == 512
+    assert sum(x['count'] for x in knowledge_map['knowledge_map']['edges']) == 532
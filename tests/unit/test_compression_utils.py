@@ -0,0 +1,61 @@
+import importlib
+import os
+import shutil
+
+import pytest
+
+from kgx.utils.compression_utils import get_extension, open_file, strip_extension, get_codec
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+target_dir = os.path.join(cwd, '../target')
+
+
+def available(compression, threads):
+    codec = get_codec(compression)
+    try:
+        importlib.import_module(codec['module'])
+        return True
+    except ImportError:
+        return threads > 1 and shutil.which(codec['command'](threads)[0]) is not None
+
+
+@pytest.mark.parametrize('compression', ['gz', 'bz2', 'xz', 'zstd', 'lz4'])
+@pytest.mark.parametrize('threads', [1, 2])
+def test_open_file(compression, threads):
+    if not available(compression, threads):
+        pytest.skip(f"no module or command for '{compression}'")
+    os.makedirs(target_dir, exist_ok=True)
+    filename = os.path.join(target_dir, f"compressed-{threads}.txt.{get_extension(compression)}")
+    lines = [f"line {i}\tvalue {i}\n" for i in range(10000)]
+    with open_file(filename, 'w', compression, threads=threads) as FH:
+        FH.write(''.join(lines))
+    with open_file(filename, 'rb', compression, threads=threads) as FH:
+        assert FH.read() == ''.join(lines).encode('utf-8')
+    with open_file(filename, 'r', compression, threads=threads) as FH:
+        assert FH.readline() == lines[0]
+
+
+def test_open_file_uncompressed():
+    os.makedirs(target_dir, exist_ok=True)
+    filename = os.path.join(target_dir, 'uncompressed.txt')
+    with open_file(filename, 'w') as FH:
+        FH.write('text\n')
+    with open_file(filename, 'rb') as FH:
+        assert FH.read() == b'text\n'
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError):
+        open_file('graph.json.rar', 'rb', 'rar')
+    with pytest.raises(ValueError):
+        open_file('graph.json.gz', 'a', 'gz')
+
+
+@pytest.mark.parametrize('query', [
+    ('graph.ttl.gz', 'gz', 'graph.ttl'),
+    ('graph.nt.zst', 'zstd', 'graph.nt'),
+    ('graph.nt', 'gz', 'graph.nt'),
+    ('graph.nt.gz', None, 'graph.nt.gz'),
+])
+def test_strip_extension(query):
+    assert strip_extension(query[0], query[1]) == query[2]
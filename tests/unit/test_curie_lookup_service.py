@@ -1,6 +1,14 @@
+import os
+import pickle
+
 import pytest
 
-from kgx.curie_lookup_service import CurieLookupService
+import kgx.curie_lookup_service
+from kgx.curie_lookup_service import CurieLookupService, OntologyIndex
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
+target_dir = os.path.join(cwd, '../target')
 
 
 @pytest.mark.parametrize('query', [
@@ -21,3 +29,71 @@ def test_curie_lookup_with_custom():
     assert len(cls.ontologies) > 0
     assert 'XYZ:123' in cls.curie_map
     assert cls.curie_map['XYZ:123'] == 'custom entry'
+
+
+def test_ontology_index():
+    index_directory = os.path.join(target_dir, 'ontology-index')
+    ontology = os.path.join(resource_dir, 'goslim_generic.owl')
+    index = OntologyIndex(ontology, index_directory)
+    assert os.path.basename(index.filename) == f"{OntologyIndex.get_ontology_hash(ontology)}.sqlite"
+    assert 'GO:0008150' in index
+    assert index['GO:0008150'] == 'biological_process'
+    assert 'GO:0000000' not in index
+    assert index.get_labels(['GO:0008150', 'GO:0005575', 'GO:0000000']) == {
+        'GO:0008150': 'biological_process',
+        'GO:0005575': 'cellular_component'
+    }
+    assert index.get_superclasses(['GO:0008289', 'GO:0008150']) == {'GO:0008289': ['GO:0003674']}
+    assert ('GO:0008289', 'GO:0003674') in set(index.get_subclass_edges())
+    mtime = os.path.getmtime(index.filename)
+
+    # the existing index is used, without parsing the ontology
+    index = pickle.loads(pickle.dumps(index))
+    assert index['GO:0008150'] == 'biological_process'
+    assert OntologyIndex(ontology, index_directory).filename == index.filename
+    assert os.path.getmtime(index.filename) == mtime
+
+
+def test_curie_lookup_with_index():
+    cls = CurieLookupService(
+        curie_map={'GO:0008150': 'custom_process'},
+        ontologies={'GO': os.path.join(resource_dir, 'goslim_generic.owl')},
+        index_directory=os.path.join(target_dir, 'ontology-index')
+    )
+    assert cls.curie_map['GO:0005575'] == 'cellular_component'
+    assert cls.curie_map['GO:0008150'] == 'custom_process'
+    assert cls.get_labels(['GO:0008150', 'GO:0005575', 'XYZ:123']) == {
+        'GO:0008150': 'custom_process',
+        'GO:0005575': 'cellular_component'
+    }
+    assert cls.ontology_graph.nodes()['GO:0005575']['name'] == 'cellular_component'
+
+
+def test_remote_ontology_index(monkeypatch):
+    index_directory = os.path.join(target_dir, 'remote-ontology-index')
+    ontology = f"file://{os.path.join(resource_dir, 'goslim_generic.owl')}"
+    version = 'v1'
+    monkeypatch.setattr(kgx.curie_lookup_service, 'get_remote_version', lambda url: version)
+    index = OntologyIndex(ontology, index_directory)
+    assert os.path.basename(index.filename) == f"{OntologyIndex.get_ontology_hash(ontology)}.sqlite"
+    assert index.get_version() == 'v1'
+    assert index['GO:0008150'] == 'biological_process'
+
+    # an expired index is only rebuilt if the ontology has changed
+    os.utime(index.filename, (0, 0))
+    index = OntologyIndex(ontology, index_directory)
+    assert index.get_version() == 'v1'
+    assert os.path.getmtime(index.filename) > 0
+
+    version = 'v2'
+    assert OntologyIndex(ontology, index_directory).get_version() == 'v1'
+    os.utime(index.filename, (0, 0))
+    index = OntologyIndex(ontology, index_directory)
+    assert index.get_version() == 'v2'
+    assert index['GO:0008150'] == 'biological_process'
+
+    # the existing index is used if the ontology cannot be reached
+    version = None
+    os.utime(index.filename, (0, 0))
+    index = OntologyIndex(ontology, index_directory)
+    assert index.get_version() == 'v2'
@@ -1,7 +1,7 @@
 import pytest
 
 from kgx.graph.nx_graph import NxGraph
-from kgx.utils.graph_utils import get_parents, get_ancestors, curie_lookup
+from kgx.utils.graph_utils import get_parents, get_ancestors, curie_lookup, AncestorIndex, get_ancestor_index
 
 
 def get_graph():
@@ -31,6 +31,34 @@ def test_get_ancestors():
     assert parents == query[1]
 
 
+def test_ancestor_index():
+    graph = get_graph()
+    index = get_ancestor_index(graph, relations=['biolink:sub_class_of'])
+    assert index.ancestors('E') == ['D', 'C', 'B', 'A']
+    assert index.ancestors('A') == []
+    assert index.ancestors('X') == []
+    assert index.is_ancestor('A', 'E')
+    assert not index.is_ancestor('E', 'A')
+    assert not index.is_ancestor('E', 'F')
+    assert index.roots('F') == ['A']
+    assert index.nearest_ancestor('E', lambda x: x in {'B', 'A'}) == ['D', 'C', 'B']
+    assert index.nearest_ancestor('E', lambda x: False) is None
+
+    # the index is reused until the graph changes
+    assert get_ancestor_index(graph, relations=['biolink:sub_class_of']) is index
+    assert set(get_ancestor_index(graph).ancestors('D')) == {'A', 'B', 'C'}
+    graph.add_edge('A', 'Z', **{'predicate': 'biolink:sub_class_of'})
+    index = get_ancestor_index(graph, relations=['biolink:sub_class_of'])
+    assert index.ancestors('E') == ['D', 'C', 'B', 'A', 'Z']
+
+
+def test_ancestor_index_with_cycle():
+    index = AncestorIndex([('A', 'B'), ('B', 'C'), ('C', 'A'), ('D', 'A')])
+    assert set(index.ancestors('D')) == {'A', 'B', 'C'}
+    assert set(index.ancestors('A')) == {'A', 'B', 'C'}
+    assert index.is_ancestor('A', 'C')
+
+
 @pytest.mark.skip(reason="To be implemented")
 def test_get_category_via_superclass():
     pass
@@ -0,0 +1,71 @@
+import copy
+import pickle
+
+import pytest
+
+from kgx.utils import intern_utils
+from kgx.utils.intern_utils import ValueTable, SharedList, get_value_table, intern_values, log_report
+
+
+@pytest.fixture
+def interning(monkeypatch):
+    monkeypatch.setattr(intern_utils, 'interning', True)
+    monkeypatch.setattr(intern_utils, 'value_table', None)
+
+
+def test_value_table():
+    vt = ValueTable()
+    n1 = vt.intern({'id': 'HGNC:1', 'category': ['biolink:Gene'], 'provided_by': ['test'], 'name': 'gene 1'})
+    n2 = vt.intern({'id': 'HGNC:2', 'category': ['biolink:' + 'Gene'], 'provided_by': ['test'], 'name': 'gene 2'})
+    assert n1['category'] == ['biolink:Gene']
+    assert n1['category'] is n2['category']
+    assert n1['provided_by'] is n2['provided_by']
+    assert n1['category'][0] is n2['category'][0]
+
+    report = vt.report()
+    assert report['lists'] == 2
+    assert report['bytes_saved'] > 0
+
+
+def test_shared_list():
+    vt = ValueTable()
+    shared = vt.share(['biolink:Gene', 'biolink:NamedThing'])
+    assert isinstance(shared, list)
+    for f in [lambda x: x.append('x'), lambda x: x.extend(['x']), lambda x: x.remove('biolink:Gene'), lambda x: x.sort()]:
+        with pytest.raises(TypeError):
+            f(shared)
+    with pytest.raises(TypeError):
+        shared += ['x']
+    assert shared == ['biolink:Gene', 'biolink:NamedThing']
+
+    # copies share the same immutable list; list() makes a modifiable copy
+    assert copy.deepcopy(shared) is shared
+    modified = list(shared)
+    modified.append('x')
+    assert shared == ['biolink:Gene', 'biolink:NamedThing']
+
+
+def test_intern_values_disabled(monkeypatch):
+    monkeypatch.setattr(intern_utils, 'interning', False)
+    n = {'id': 'HGNC:1', 'category': ['biolink:Gene']}
+    assert intern_values(n) is n
+    unpickled = pickle.loads(pickle.dumps(SharedList(['biolink:Gene'])))
+    assert unpickled == ['biolink:Gene']
+
+
+def test_shared_list_pickle(interning):
+    n = intern_values({'id': 'HGNC:1', 'category': ['biolink:Gene']})
+    unpickled = pickle.loads(pickle.dumps(n))
+    assert isinstance(unpickled['category'], SharedList)
+    assert unpickled['category'] is get_value_table().share(['biolink:Gene'])
+
+
+def test_log_report(interning):
+    n1 = intern_values({'id': 'HGNC:1', 'category': ['biolink:Gene']})
+    vt = get_value_table()
+    log_report('test')
+    # the value table only holds the values of one source
+    assert get_value_table() is not vt
+    n2 = intern_values({'id': 'HGNC:2', 'category': ['biolink:Gene']})
+    assert n2['category'] == n1['category']
+    assert n2['category'] is not n1['category']
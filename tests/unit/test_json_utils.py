@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from kgx.utils import json_utils
+from kgx.utils.json_utils import decode_lines, dumps, encode_lines, loads, set_json_backend
+
+
+@pytest.fixture(params=json_utils.JSON_BACKENDS)
+def backend(request):
+    if not json_utils._is_installed(request.param):
+        pytest.skip(f"{request.param} is not installed")
+    previous = json_utils.json_backend
+    set_json_backend(request.param)
+    yield request.param
+    json_utils.json_backend = previous
+    json_utils._encoders.clear()
+    json_utils._decoder = None
+
+
+def test_dumps_loads(backend):
+    obj = {'id': 'HGNC:11603', 'name': 'TBX4', 'category': ['biolink:Gene'], 'score': 1.5, 'negated': False}
+    assert loads(dumps(obj)) == obj
+    assert loads(dumps(obj, indent=4, sort_keys=True)) == obj
+    assert b'\n' not in dumps(obj)
+    assert dumps({'b': 1, 'a': 2}, sort_keys=True).index(b'"a"') < dumps({'b': 1, 'a': 2}, sort_keys=True).index(b'"b"')
+
+
+def test_dumps_indent(backend):
+    # every backend indents by the same number of spaces
+    assert dumps({'a': [1]}, indent=4) == b'{\n    "a": [\n        1\n    ]\n}'
+
+
+def test_same_output(backend):
+    # every backend writes the same JSON as the json module of the standard library
+    obj = {'id': 'X:1', 'name': 'café "1e5"', 'score': [1.5, 1e16, 1e-7], 'empty': [], 'data': {'negated': None}}
+    assert dumps(obj) == b'{"id":"X:1","name":"caf\xc3\xa9 \\"1e5\\"","score":[1.5,1e+16,1e-07],"empty":[],"data":{"negated":null}}'
+    assert dumps(obj, indent=4, sort_keys=True) == json.dumps(obj, indent=4, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    assert encode_lines([obj]) == dumps(obj) + b'\n'
+
+
+def test_default_backend():
+    # the fastest backend that is installed
+    assert json_utils.get_json_backend() == next(x for x in json_utils.JSON_BACKENDS if json_utils._is_installed(x))
+
+
+def test_lines(backend):
+    objects = [{'id': f"X:{i}", 'name': 'café'} for i in range(10)]
+    data = encode_lines(objects)
+    assert data.count(b'\n') == 10
+    lines = data.splitlines(keepends=True)
+    assert decode_lines(lines + [b'\n']) == objects
+
+
+def test_decode_lines_invalid(backend):
+    with pytest.raises(ValueError) as e:
+        decode_lines([b'{"id": "X:1"}\n', b'{"id": \n'])
+    assert 'Invalid JSON line' in str(e.value)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        set_json_backend('simplejson')
@@ -1,6 +1,10 @@
 import os
 
+import pytest
+
 from kgx import JsonlTransformer
+from kgx.transformers import jsonl_transformer
+from kgx.transformers.jsonl_transformer import get_line_ranges, read_line_range
 
 cwd = os.path.abspath(os.path.dirname(__file__))
 resource_dir = os.path.join(cwd, '../resources')
@@ -26,6 +30,20 @@ def test_jsonl_load():
     assert e1['relation'] == 'RO:0003304'
 
 
+def test_jsonl_load_properties():
+    jlt = JsonlTransformer()
+    jlt.parse(os.path.join(resource_dir, 'valid_nodes.jsonl'), input_format='jsonl', properties={'provided_by'})
+    jlt.parse(os.path.join(resource_dir, 'valid_edges.jsonl'), input_format='jsonl')
+
+    n1 = jlt.graph.nodes()['HGNC:11603']
+    assert 'name' not in n1
+    assert 'biolink:Gene' in n1['category']
+
+    e1 = list(jlt.graph.get_edge('HGNC:11603', 'MONDO:0005002').values())[0]
+    assert e1['predicate'] == 'biolink:related_to'
+    assert 'relation' not in e1
+
+
 def test_jsonl_save1():
     jlt = JsonlTransformer()
     jlt.parse(os.path.join(resource_dir, 'valid_nodes.jsonl'), input_format='jsonl')
@@ -54,4 +72,46 @@ def test_jsonl_save1():
     jlt3.parse(os.path.join(target_dir, 'valid-export_edges.jsonl.gz'), compression='gz')
 
     assert jlt3.graph.number_of_nodes() == 6
-    assert jlt3.graph.number_of_edges() == 5
\ No newline at end of file
+    assert jlt3.graph.number_of_edges() == 5
+
+
+@pytest.mark.parametrize('compression', ['bz2', 'xz'])
+def test_jsonl_save_compressed(compression):
+    jlt = JsonlTransformer()
+    jlt.parse(os.path.join(resource_dir, 'valid_nodes.jsonl'), input_format='jsonl')
+    jlt.parse(os.path.join(resource_dir, 'valid_edges.jsonl'), input_format='jsonl')
+    jlt.save(os.path.join(target_dir, 'valid-export'), compression=compression)
+
+    jlt2 = JsonlTransformer()
+    jlt2.parse(os.path.join(target_dir, f"valid-export_nodes.jsonl.{compression}"), compression=compression)
+    jlt2.parse(os.path.join(target_dir, f"valid-export_edges.jsonl.{compression}"), compression=compression)
+    assert jlt2.graph.number_of_nodes() == 6
+    assert jlt2.graph.number_of_edges() == 5
+
+
+@pytest.mark.parametrize('size', [1, 100, 1 << 20])
+def test_read_line_range(size):
+    filename = os.path.join(resource_dir, 'valid_edges.jsonl')
+    with open(filename, 'rb') as FH:
+        lines = FH.readlines()
+        ranges = get_line_ranges(filename, size)
+        assert [x for start, end in ranges for x in read_line_range(FH, start, end)] == lines
+
+
+@pytest.mark.parametrize('edge_filters', [{}, {'subject_category': {'biolink:Gene'}, 'relation': {'RO:0004013'}}])
+def test_jsonl_load_parallel(monkeypatch, edge_filters):
+    monkeypatch.setattr(jsonl_transformer, 'JSONL_RANGE_SIZE', 100)
+    graphs = []
+    for processes in [1, 2]:
+        jlt = JsonlTransformer()
+        for k, v in edge_filters.items():
+            jlt.set_edge_filter(k, v)
+        jlt.parse(os.path.join(resource_dir, 'valid_nodes.jsonl'), input_format='jsonl', processes=processes)
+        jlt.parse(os.path.join(resource_dir, 'valid_edges.jsonl'), input_format='jsonl', processes=processes)
+        graphs.append(jlt.graph)
+
+    serial, parallel = graphs
+    assert list(parallel.nodes(data=True)) == list(serial.nodes(data=True))
+    assert list(parallel.edges(data=True)) == list(serial.edges(data=True))
+    if edge_filters:
+        assert parallel.number_of_edges() == 2
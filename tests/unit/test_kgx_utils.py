@@ -1,10 +1,18 @@
+import hashlib
+import os
+
 import pytest
 from bmt import Toolkit
 
+from kgx import PandasTransformer
 from kgx.curie_lookup_service import CurieLookupService
 from kgx.utils.kgx_utils import get_toolkit, get_curie_lookup_service, get_prefix_prioritization_map, \
     get_biolink_element, get_biolink_ancestors, generate_edge_key, contract, expand, camelcase_to_sentencecase, \
-    snakecase_to_sentencecase, sentencecase_to_snakecase, sentencecase_to_camelcase, generate_uuid, prepare_data_dict
+    snakecase_to_sentencecase, sentencecase_to_snakecase, sentencecase_to_camelcase, generate_uuid, prepare_data_dict, \
+    format_edge_key, get_edge_key_scheme, set_edge_key_scheme, get_predicate_hash, predicate_hashes, hashed_predicates
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
 
 
 def test_get_toolkit():
@@ -47,6 +55,45 @@ def test_generate_edge_key():
     assert key == 'S:CURIE-related_to-O:CURIE'
 
 
+
+@pytest.mark.parametrize('scheme', ['string', 'tuple', 'hash'])
+def test_edge_key_scheme(scheme):
+    default_scheme = get_edge_key_scheme()
+    set_edge_key_scheme(scheme)
+    try:
+        k1 = generate_edge_key('S:CURIE', 'biolink:related_to', 'O:CURIE')
+        k2 = generate_edge_key('S:CURIE', 'biolink:interacts_with', 'O:CURIE')
+        assert k1 == generate_edge_key('S:CURIE', 'biolink:related_to', 'O:CURIE')
+        assert k1 != k2
+        assert format_edge_key('S:CURIE', 'biolink:related_to', 'O:CURIE') == 'S:CURIE-biolink:related_to-O:CURIE'
+
+        t = PandasTransformer()
+        t.parse(os.path.join(resource_dir, 'test_nodes.tsv'), input_format='tsv')
+        t.parse(os.path.join(resource_dir, 'test_edges.tsv'), input_format='tsv')
+        key = generate_edge_key('CURIE:123', 'biolink:related_to', 'CURIE:456')
+        assert t.graph.has_edge('CURIE:123', 'CURIE:456', key)
+    finally:
+        set_edge_key_scheme(default_scheme)
+
+
+def test_edge_key_hash_collision():
+    digest = hashlib.blake2b(b'biolink:collides_with', digest_size=8).digest()
+    h = int.from_bytes(digest, 'big')
+    # another predicate with the same hash
+    hashed_predicates[h] = 'biolink:other'
+    try:
+        h2 = get_predicate_hash('biolink:collides_with')
+        assert h2 == h + 1
+        assert get_predicate_hash('biolink:collides_with') == h2
+    finally:
+        del hashed_predicates[h]
+        del hashed_predicates[h2]
+        del predicate_hashes['biolink:collides_with']
+
+    with pytest.raises(ValueError):
+        set_edge_key_scheme('md5')
+
+
 def test_camelcase_to_sentencecase():
     s = camelcase_to_sentencecase('NamedThing')
     assert s == 'named thing'
@@ -0,0 +1,111 @@
+import json
+import os
+
+import pytest
+
+from kgx.utils.metrics_utils import Metrics, get_file_size, get_metrics, run_with_metrics, span
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
+target_dir = os.path.join(cwd, '../target')
+
+
+@pytest.fixture
+def metrics():
+    m = Metrics()
+    m.enable()
+    return m
+
+
+def test_span(metrics):
+    with metrics.span('parse', filename='graph_nodes.tsv') as s:
+        assert s.recording
+        s.add(records=10, bytes_read=100)
+        s.add(records=5)
+    assert len(metrics.spans) == 1
+    span = metrics.spans[0]
+    assert span['name'] == 'parse'
+    assert span['attributes'] == {'filename': 'graph_nodes.tsv'}
+    assert span['records'] == 15
+    assert span['bytes_read'] == 100
+    assert span['seconds'] >= 0
+    assert span['parent'] is None
+
+
+def test_nested_span(metrics):
+    with metrics.span('merge'):
+        with metrics.span('operation'):
+            pass
+    assert [(x['name'], x['parent']) for x in metrics.spans] == [('operation', 'merge'), ('merge', None)]
+
+
+def test_disabled():
+    m = Metrics()
+    with m.span('parse') as s:
+        assert not s.recording
+        s.add(records=10)
+    m.count('nodes_filtered')
+    assert m.spans == []
+    assert m.counters == {}
+
+
+def test_report(metrics):
+    for i in range(2):
+        with metrics.span('parse') as s:
+            s.add(records=10, bytes_read=100)
+    with metrics.span('save') as s:
+        s.add(records=20, bytes_written=300)
+    metrics.count('edges_filtered', 3)
+    metrics.count('edges_filtered')
+    report = metrics.report()
+    assert report['stages']['parse']['count'] == 2
+    assert report['stages']['parse']['records'] == 20
+    assert report['stages']['parse']['bytes_read'] == 200
+    assert report['stages']['save']['bytes_written'] == 300
+    assert report['counters'] == {'edges_filtered': 4}
+    assert len(report['spans']) == 3
+
+
+def test_merge(metrics):
+    worker = Metrics()
+    worker.enable()
+    with worker.span('parse') as s:
+        s.add(records=10)
+    worker.count('nodes_filtered', 2)
+    metrics.count('nodes_filtered')
+    metrics.merge(worker.export())
+    assert [x['name'] for x in metrics.spans] == ['parse']
+    assert metrics.counters == {'nodes_filtered': 3}
+
+
+def test_run_with_metrics():
+    def f(x):
+        with span('parse') as s:
+            s.add(records=x)
+        return x * 2
+    result, exported = run_with_metrics(f, 5)
+    assert result == 10
+    assert [x['records'] for x in exported['spans']] == [5]
+    get_metrics().enable(False)
+    get_metrics().reset()
+
+
+def test_write(metrics):
+    with metrics.span('parse', source='test') as s:
+        s.add(records=10)
+    metrics.count('nodes_filtered')
+    filename = os.path.join(target_dir, 'metrics.json')
+    metrics.write(filename)
+    report = json.load(open(filename))
+    assert report['stages']['parse']['records'] == 10
+    trace_filename = os.path.join(target_dir, 'trace.json')
+    metrics.write_trace(trace_filename)
+    events = json.load(open(trace_filename))['traceEvents']
+    assert [x['ph'] for x in events] == ['X', 'C']
+    assert events[0]['args']['source'] == 'test'
+    assert events[0]['args']['records'] == 10
+
+
+def test_get_file_size():
+    filename = os.path.join(resource_dir, 'graph_nodes.tsv')
+    assert get_file_size(filename, os.path.join(resource_dir, 'missing.tsv')) == os.path.getsize(filename)
@@ -1,9 +1,14 @@
+import io
 import os
 import numpy as np
 import pandas as pd
+import tarfile
+
 import pytest
 
 from kgx import PandasTransformer
+from kgx.utils.compression_utils import open_file
+from kgx.utils.intern_utils import SharedList
 
 cwd = os.path.abspath(os.path.dirname(__file__))
 resource_dir = os.path.join(cwd, '../resources')
@@ -59,6 +64,113 @@ def test_export(query):
         assert os.path.exists(os.path.join(target_dir, query[3][1]))
 
 
+@pytest.mark.parametrize('query', [
+    ('tsv', 'tar'),
+    ('csv', 'tar.bz2'),
+    ('tsv:neo4j', 'tar.gz'),
+    ('tsv', 'tar.xz'),
+])
+def test_export_compressed(query):
+    """
+    Nodes and edges are written directly to an archive,
+    without leaving plain files next to it.
+    """
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, 'test_nodes.tsv'), input_format='tsv')
+    t.parse(os.path.join(resource_dir, 'test_edges.tsv'), input_format='tsv')
+
+    output_dir = os.path.join(target_dir, 'export_compressed')
+    os.makedirs(output_dir, exist_ok=True)
+    for f in os.listdir(output_dir):
+        os.remove(os.path.join(output_dir, f))
+    t.save(filename=os.path.join(output_dir, 'export'), output_format=query[0], compression=query[1])
+    assert os.listdir(output_dir) == [f"export.{query[1]}"]
+
+    extension = query[0].split(':')[0]
+    with tarfile.open(os.path.join(output_dir, f"export.{query[1]}")) as tar:
+        assert sorted(tar.getnames()) == [f"export_edges.{extension}", f"export_nodes.{extension}"]
+        nodes = tar.extractfile(f"export_nodes.{extension}").read().decode('utf-8').splitlines()
+        edges = tar.extractfile(f"export_edges.{extension}").read().decode('utf-8').splitlines()
+    assert len(nodes) == 4
+    assert len(edges) == 2
+
+    if query[0] == 'tsv':
+        t2 = PandasTransformer()
+        t2.parse(os.path.join(output_dir, f"export.{query[1]}"), input_format='tsv', compression=query[1])
+        assert t2.graph.number_of_nodes() == 3
+        assert t2.graph.number_of_edges() == 1
+
+
+@pytest.mark.parametrize('query', [
+    ('tsv:neo4j', None, 1),
+    ('csv:neo4j', 'gz', 2),
+])
+def test_export_neo4j_shards(query):
+    """
+    A sharded Neo4j export has the same rows as an export to one file.
+    """
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, 'graph_nodes.tsv'), input_format='tsv')
+    t.parse(os.path.join(resource_dir, 'graph_edges.tsv'), input_format='tsv')
+    extension = query[0].split(':')[0]
+    delimiter = ',' if extension == 'csv' else '\t'
+    nodes = list(t.format_neo4j_nodes(delimiter))
+    edges = list(t.format_neo4j_edges(delimiter))
+
+    output_dir = os.path.join(target_dir, 'export_neo4j_shards')
+    os.makedirs(output_dir, exist_ok=True)
+    for f in os.listdir(output_dir):
+        os.remove(os.path.join(output_dir, f))
+    t.save(os.path.join(output_dir, 'export'), output_format=query[0], compression=query[1], shard_size=2, processes=query[2])
+
+    files = os.listdir(output_dir)
+    assert f"export_nodes_header.{extension}" in files
+    assert f"export_edges_header.{extension}" in files
+    assert f"export_nodes_biolink_Gene_0000.{extension}{'.gz' if query[1] else ''}" in files
+    with open(os.path.join(output_dir, 'export_import.sh')) as FH:
+        command = FH.read()
+    assert 'neo4j-admin import' in command
+    assert '--relationships=' in command
+
+    for kind, lines in [('nodes', nodes), ('edges', edges)]:
+        with open(os.path.join(output_dir, f"export_{kind}_header.{extension}"), 'rb') as FH:
+            assert FH.read().decode('utf-8') == lines[0]
+        shards = [x for x in files if x.startswith(f"export_{kind}_") and 'header' not in x]
+        rows = []
+        for x in shards:
+            with open_file(os.path.join(output_dir, x), 'rb', query[1]) as FH:
+                shard = FH.read().decode('utf-8').split('\n')[:-1]
+            assert 0 < len(shard) <= 2
+            rows.extend(shard)
+        assert sorted(rows) == sorted([x[:-1] for x in lines[1:]])
+
+
+
+@pytest.mark.parametrize('compression', ['gz', 'xz'])
+def test_export_compressed_files(compression):
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, 'test_nodes.tsv'), input_format='tsv')
+    t.parse(os.path.join(resource_dir, 'test_edges.tsv'), input_format='tsv')
+    t.save(filename=os.path.join(target_dir, 'export'), output_format='tsv', compression=compression)
+
+    t2 = PandasTransformer()
+    t2.parse(os.path.join(target_dir, f"export_nodes.tsv.{compression}"), input_format='tsv', compression=compression)
+    t2.parse(os.path.join(target_dir, f"export_edges.tsv.{compression}"), input_format='tsv', compression=compression)
+    assert t2.graph.number_of_nodes() == 3
+    assert t2.graph.number_of_edges() == 1
+    assert t2.graph.nodes()['CURIE:123']['description'] == t.graph.nodes()['CURIE:123']['description']
+
+
+def test_write_lines():
+    lines = [f"{i}\n" for i in range(25)]
+    text = io.StringIO()
+    assert PandasTransformer.write_lines(text, lines, batch_size=10) == 25
+    assert text.getvalue() == ''.join(lines)
+    binary = io.BytesIO()
+    assert PandasTransformer.write_lines(binary, iter(lines), batch_size=10) == 25
+    assert binary.getvalue() == ''.join(lines).encode('utf-8')
+
+
 @pytest.mark.parametrize('query', [
     (os.path.join(resource_dir, 'test.tar'), 'tsv', 'tar', 3, 1),
     (os.path.join(resource_dir, 'test.tar.gz'), 'tsv', 'tar.gz', 3, 1)
@@ -70,6 +182,61 @@ def test_load_compressed(query):
     assert t.graph.number_of_edges() == query[4]
 
 
+
+def test_load_compressed_with_filters():
+    """
+    Edges in an archive are filtered on the category
+    of their nodes, even if edges precede nodes in the archive.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    filename = os.path.join(target_dir, 'test_edges_first.tar')
+    with tarfile.open(filename, 'w') as tar:
+        tar.add(os.path.join(resource_dir, 'test_edges.tsv'), arcname='test_edges.tsv')
+        tar.add(os.path.join(resource_dir, 'test_nodes.tsv'), arcname='test_nodes.tsv')
+
+    t = PandasTransformer()
+    t.set_edge_filter('subject_category', {'biolink:Gene'})
+    t.parse(filename, input_format='tsv', compression='tar')
+    assert t.graph.number_of_nodes() == 2
+    assert t.graph.number_of_edges() == 1
+
+    t = PandasTransformer()
+    t.set_edge_filter('object_category', {'biolink:Gene'})
+    t.parse(filename, input_format='tsv', compression='tar')
+    assert t.graph.number_of_edges() == 0
+
+
+def test_check_category_filters():
+    t = PandasTransformer()
+    t.set_edge_filter('subject_category', {'biolink:Gene'})
+    t.load_node({'id': 'A', 'category': ['biolink:Gene']})
+    # nodes that are in the graph, but not in the category index
+    t.graph.add_node('B', category=['biolink:Gene'])
+    t.graph.add_node('C', category=['biolink:Disease'])
+    df = pd.DataFrame({'subject': ['A', 'B', 'C', 'D'], 'predicate': 'biolink:related_to', 'object': 'A'})
+    assert 'A' in t.get_category_index() and 'B' not in t.get_category_index()
+    assert list(t.check_category_filters(df)) == [True, True, False, False]
+
+
+def test_load_properties():
+    t = PandasTransformer()
+    t.set_node_properties({'name'})
+    t.set_edge_properties({'provided_by'})
+    t.set_edge_filter('relation', {'biolink:related_to'})
+    t.parse(os.path.join(resource_dir, 'test.tar'), input_format='tsv', compression='tar')
+    assert t.graph.number_of_nodes() == 3
+    assert t.graph.number_of_edges() == 1
+
+    n = t.graph.nodes()['CURIE:123']
+    assert n['name'] == 'Gene 123'
+    assert n['category'] == ['biolink:Gene']
+    assert 'description' not in n
+
+    e = list(t.graph.get_edge('CURIE:123', 'CURIE:456').values())[0]
+    assert e['provided_by'] == ['test']
+    assert e['relation'] == 'biolink:related_to'
+    assert 'publications' not in e
+
 @pytest.mark.parametrize('query', [
     ({'id': 'A', 'name': 'Node A'}, {'id': 'A', 'name': 'Node A'}),
     ({'id': 'A', 'name': 'Node A', 'description': None}, {'id': 'A', 'name': 'Node A'}),
@@ -94,6 +261,21 @@ def test_build_export_row(query):
         assert d[k] == v
 
 
+def test_build_export_row_cache():
+    """
+    A cached value is only used for the shared list it was sanitized from,
+    even when another list gets the same id.
+    """
+    cache: dict = {}
+    d = PandasTransformer._build_export_row({'category': SharedList(['biolink:Gene'])}, cache)
+    assert d['category'] == 'biolink:Gene'
+    value = SharedList(['biolink:Disease'])
+    # as if value had the id of a list that is no longer in use
+    cache = {k[:2] + (id(value),): v for k, v in cache.items()}
+    d = PandasTransformer._build_export_row({'category': value}, cache)
+    assert d['category'] == 'biolink:Disease'
+
+
 @pytest.mark.parametrize('query', [
     (('category', 'biolink:Gene'), ['biolink:Gene']),
     (('publications', 'PMID:123|PMID:456|PMID:789'), ['PMID:123', 'PMID:456', 'PMID:789']),
@@ -1,6 +1,10 @@
 import pytest
 
+import pickle
+
 from kgx import PrefixManager
+from kgx.config import get_jsonld_context
+from kgx.prefix_manager import PrefixMap, get_prefix_map
 
 
 @pytest.mark.parametrize('query', [
@@ -83,3 +87,45 @@ def test_prefix_manager_contract(query):
     pm = PrefixManager()
     assert pm.contract(query[0]) == query[1]
 
+
+
+@pytest.mark.parametrize('name', [
+    'monarch_context',
+    'obo_context'
+])
+def test_get_jsonld_context(name):
+    context = get_jsonld_context(name)
+    assert context
+    assert '@context' not in context
+
+
+def test_shared_prefix_map():
+    pm1 = PrefixManager(prefix_map=get_prefix_map('monarch_context'))
+    pm2 = PrefixManager(prefix_map=get_prefix_map('monarch_context'))
+    assert pm1.compiled is pm2.compiled is get_prefix_map('monarch_context')
+    assert pm1.prefix_map['biolink'] == 'https://w3id.org/biolink/vocab/'
+    with pytest.raises(TypeError):
+        pm1.prefix_map['biolink'] = 'https://example.org/'
+
+
+def test_update_prefix_map():
+    pm1 = PrefixManager(prefix_map=get_prefix_map('monarch_context'))
+    pm2 = PrefixManager(prefix_map=get_prefix_map('monarch_context'))
+    pm1.update_prefix_map({'EX': 'https://example.org/EX_'})
+    assert pm1.prefix_map['EX'] == 'https://example.org/EX_'
+    assert pm1.reverse_prefix_map['https://example.org/EX_'] == 'EX'
+    assert 'EX' not in pm2.prefix_map
+    assert 'EX' not in get_prefix_map('monarch_context').prefix_map
+
+
+def test_pickle_prefix_map():
+    pm = PrefixManager(prefix_map=get_prefix_map('monarch_context'))
+    assert pickle.loads(pickle.dumps(get_prefix_map('monarch_context'))) is get_prefix_map('monarch_context')
+    assert len(pickle.dumps(pm)) < 200
+    assert pickle.loads(pickle.dumps(pm)).compiled is get_prefix_map('monarch_context')
+
+    m = PrefixMap.compile({'EX': 'https://example.org/EX_'})
+    assert pickle.loads(pickle.dumps(m)).prefix_map == m.prefix_map
+
+    pm.update_prefix_map({'EX': 'https://example.org/EX_'})
+    assert pickle.loads(pickle.dumps(pm)).prefix_map['EX'] == 'https://example.org/EX_'
@@ -0,0 +1,68 @@
+import os
+import pstats
+
+from kgx.utils.metrics_utils import get_metrics, span
+from kgx.utils.profile_utils import Profiler, get_collapsed_stacks, get_profiler, run_with_profile, start_profiler, stop_profiler
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+target_dir = os.path.join(cwd, '../target')
+
+
+def fibonacci(n):
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def allocate(n):
+    with span('parse', source='test'):
+        data = [str(x) for x in range(n)]
+    return len(data)
+
+
+def test_cpu_profile():
+    prefix = os.path.join(target_dir, 'profile_cpu')
+    start_profiler('cpu', prefix)
+    fibonacci(15)
+    assert stop_profiler() == [f"{prefix}.pstats", f"{prefix}.collapsed"]
+    assert get_profiler() is None
+    stats = pstats.Stats(f"{prefix}.pstats")
+    assert any(x[2] == 'fibonacci' for x in stats.stats)
+    lines = open(f"{prefix}.collapsed").read().splitlines()
+    assert any('fibonacci (test_profile_utils.py' in x for x in lines)
+    # recursive calls are left out of stacks
+    assert all(x.count('fibonacci') <= 1 for x in lines)
+
+
+def test_get_collapsed_stacks():
+    p = Profiler('cpu', os.path.join(target_dir, 'profile_stacks'))
+    p.start()
+    fibonacci(12)
+    p._profile.disable()
+    stats = pstats.Stats(p._profile)
+    stacks = get_collapsed_stacks(stats)
+    assert stacks
+    assert all(isinstance(v, int) and v > 0 for v in stacks.values())
+    assert sum(stacks.values()) <= stats.total_tt * 1e6 + len(stacks)
+
+
+def test_memory_profile():
+    prefix = os.path.join(target_dir, 'profile_memory')
+    start_profiler('memory', prefix)
+    allocate(10000)
+    assert stop_profiler() == [f"{prefix}.memory.txt"]
+    get_metrics().enable(False)
+    get_metrics().reset()
+    report = open(f"{prefix}.memory.txt").read()
+    assert report.startswith('parse source=test: current')
+    assert 'top allocation sites' in report
+    assert 'end: current' in report
+    assert 'allocated since the previous stage' in report
+
+
+def test_run_with_profile():
+    prefix = os.path.join(target_dir, 'profile')
+    p = Profiler('cpu', prefix)
+    worker_prefix = p.get_worker_prefix('Test Graph/1')
+    assert worker_prefix == f"{prefix}_Test_Graph_1"
+    assert run_with_profile('cpu', worker_prefix, fibonacci, 10) == 55
+    assert get_profiler() is None
+    assert os.path.exists(f"{worker_prefix}.pstats")
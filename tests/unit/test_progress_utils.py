@@ -0,0 +1,86 @@
+import os
+from multiprocessing import Pool
+
+import pytest
+
+from kgx.utils import progress_utils
+from kgx.utils.progress_utils import Progress, WorkerProgress, format_progress, iter_progress, progress, read_progress, \
+    set_progress_enabled
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
+
+
+@pytest.fixture
+def enabled():
+    previous = progress_utils.progress_enabled
+    set_progress_enabled(True)
+    yield
+    set_progress_enabled(previous)
+
+
+def _count_bytes(filename):
+    with open(filename, 'rb') as FH, read_progress(FH, filename) as FH:
+        while FH.read(1024):
+            pass
+    return os.path.getsize(filename)
+
+
+def test_format_progress():
+    assert format_progress('Writing graph.nt', 'records', 1500, 10000, 2.0) == 'Writing graph.nt: 1,500 of 10,000 records (15%), 750 records/s, ETA 0:00:11'
+    assert format_progress(None, 'bytes', 3 << 30, 10 << 30, 20.0) == '3.0 GiB of 10.0 GiB (30%), 153.6 MiB/s, ETA 0:00:46'
+    assert format_progress('Reading graph.nt.gz', 'bytes', 512, None, 1.0) == 'Reading graph.nt.gz: 512 B, 512 B/s'
+
+
+def test_progress_is_sampled(enabled):
+    checks = []
+
+    class CountingProgress(Progress):
+        def _check(self):
+            checks.append(self.count)
+            super()._check()
+
+    with CountingProgress('test', 100000) as p:
+        for i in range(100000):
+            p.update()
+    assert p.count == 100000
+    # the time is only checked after a number of updates that grows with the rate
+    assert len(checks) < 1000
+
+
+def test_disabled():
+    previous = progress_utils.progress_enabled
+    set_progress_enabled(False)
+    items = [1, 2, 3]
+    assert iter_progress(items, 'test') is items
+    assert not progress('test').enabled
+    set_progress_enabled(previous)
+
+
+def test_iter_progress(enabled):
+    total = []
+    assert list(iter_progress(range(10), 'test', lambda: total.append(10) or 10)) == list(range(10))
+    assert total == [10]
+
+
+def test_read_progress(enabled):
+    filename = os.path.join(resource_dir, 'graph_nodes.tsv')
+    with open(filename, 'rb') as FH, read_progress(FH, filename) as reader:
+        assert reader.progress.total == os.path.getsize(filename)
+        lines = [reader.readline()]
+        lines.extend(reader)
+        assert reader.progress.count == sum(len(x) for x in lines) == os.path.getsize(filename)
+
+
+def test_worker_progress(enabled):
+    filenames = [os.path.join(resource_dir, x) for x in ['graph_nodes.tsv', 'graph_edges.tsv']]
+    with WorkerProgress('Reading files') as worker_progress:
+        pool = Pool(processes=2, initializer=worker_progress.initializer, initargs=worker_progress.initargs)
+        sizes = pool.map(_count_bytes, filenames)
+        # workers send all of their progress before they exit
+        pool.close()
+        pool.join()
+    label = worker_progress.format()
+    size = sum(sizes)
+    assert label.startswith(f"Reading files: 2/2 done, ")
+    assert f"{size / 1024:.1f} KiB of {size / 1024:.1f} KiB (100%)" in label
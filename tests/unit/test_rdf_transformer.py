@@ -285,6 +285,12 @@ def test_save3():
     (
             {'category': {'biolink:Protein'}}, {'predicate': {'biolink:interacts_with'}}, 4, 1
     ),
+    (
+            None, {'predicate': {'biolink:interacts_with'}}, 7, 1
+    ),
+    (
+            {'provided_by': {'Test Dataset'}}, None, 2, 0
+    ),
 ])
 def test_filters(query):
     rt = RdfTransformer()
@@ -0,0 +1,82 @@
+import pytest
+
+from kgx.utils.sketch_utils import HyperLogLog, CountMinSketch, FacetSketch, GroupedFacetSketch, hash_value, merge_sketches
+
+
+@pytest.mark.parametrize('n', [10, 1000, 50000])
+def test_hyperloglog(n):
+    hll = HyperLogLog()
+    for i in range(n):
+        hll.add(hash_value(f"PMID:{i}"))
+        hll.add(hash_value(f"PMID:{i}"))
+    assert abs(hll.count() - n) <= max(1, 0.05 * n)
+
+
+def test_hyperloglog_merge():
+    h1 = HyperLogLog()
+    h2 = HyperLogLog()
+    for i in range(2000):
+        h1.add(hash_value(i))
+        h2.add(hash_value(i + 1000))
+    assert abs(h1.merge(h2).count() - 3000) <= 150
+
+    with pytest.raises(ValueError):
+        h1.merge(HyperLogLog(precision=10))
+
+
+def test_count_min_sketch():
+    cms = CountMinSketch()
+    for i in range(100):
+        cms.add(hash_value('a'))
+    cms.add(hash_value('b'), 5)
+    assert cms.estimate(hash_value('a')) >= 100
+    assert cms.estimate(hash_value('b')) >= 5
+    other = CountMinSketch()
+    other.add(hash_value('b'), 5)
+    assert cms.merge(other).estimate(hash_value('b')) >= 10
+
+
+def test_facet_sketch():
+    s1 = FacetSketch(k=2)
+    s2 = FacetSketch(k=2)
+    for i in range(1000):
+        s1.add(f"PMID:{i}")
+        s2.add(f"PMID:{i + 500}")
+    for i in range(50):
+        s1.add('infores:a')
+        s2.add('infores:b')
+    s2.add('infores:a', 20)
+
+    merged = merge_sketches([s1, s2])
+    assert [x[0] for x in merged.most_common()] == ['infores:a', 'infores:b']
+    stats = merged.as_dict()
+    assert abs(stats['distinct_values'] - 1502) <= 75
+    assert stats['top_values']['infores:a']['count'] >= 70
+    assert merge_sketches([]) is None
+
+
+def test_grouped_facet_sketch():
+    s1 = GroupedFacetSketch(k=2)
+    s2 = GroupedFacetSketch(k=2)
+    for i in range(1000):
+        s1.add('biolink:treats', f"PMID:{i}")
+        s2.add('biolink:treats', f"PMID:{i + 500}")
+        s2.add('biolink:causes', f"PMID:{i}")
+    for i in range(50):
+        s1.add('biolink:treats', 'infores:a')
+        s2.add('biolink:causes', 'infores:b')
+    s2.add('biolink:treats', 'infores:a', 20)
+
+    s1.merge(s2)
+    assert sorted(s1.groups) == ['biolink:causes', 'biolink:treats']
+    assert s1.most_common('biolink:treats')[0] == ('infores:a', 70)
+    stats = s1.as_dict('biolink:treats')
+    assert abs(stats['distinct_values'] - 1501) <= 100
+    assert stats['top_values']['infores:a']['count'] == 70
+    assert s1.as_dict('biolink:causes')['top_values']['infores:b']['count'] == 50
+    # all groups together
+    total = s1.total.as_dict()
+    assert abs(total['distinct_values'] - 1502) <= 75
+    assert list(total['top_values']) == ['infores:a', 'infores:b']
+
+    assert GroupedFacetSketch(total=False).total is None
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+from kgx.cli.cli_utils import get_transformer
+from kgx.operations.columnar_summary import ColumnarSummary
+from kgx.operations.streaming_summary import StreamingSummary, summarize_files
+from kgx.operations.summarize_graph import summarize_graph
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
+target_dir = os.path.join(cwd, '../target')
+
+
+@pytest.mark.parametrize('query', [
+    (['test_nodes.tsv', 'test_edges.tsv'], 'tsv', None),
+    (['valid_nodes.jsonl', 'valid_edges.jsonl'], 'jsonl', None),
+    (['test.tar.gz'], 'tsv', 'tar.gz'),
+    (['valid.json'], 'json', None),
+])
+@pytest.mark.parametrize('processes', [1, 2])
+def test_summarize_files(query, processes):
+    inputs = [os.path.join(resource_dir, x) for x in query[0]]
+    t = get_transformer(query[1])()
+    for f in inputs:
+        t.parse(f, input_format=query[1], compression=query[2])
+    expected = ColumnarSummary(t.graph, ['provided_by'], ['provided_by']).graph_stats('Graph')
+
+    summary = summarize_files(inputs, query[1], query[2], ['provided_by'], ['provided_by'], processes=processes)
+    assert summary.graph_stats('Graph') == expected
+
+
+def test_summarize_files_dangling_edges():
+    os.makedirs(target_dir, exist_ok=True)
+    inputs = [os.path.join(target_dir, 'dangling_nodes.tsv'), os.path.join(target_dir, 'dangling_edges.tsv')]
+    with open(inputs[0], 'w') as FH:
+        FH.write('id\tname\tcategory\nHGNC:11603\tTBX4\tbiolink:Gene\nMONDO:0005002\tCOPD\tbiolink:Disease\n')
+    with open(inputs[1], 'w') as FH:
+        FH.write('id\tsubject\tpredicate\tobject\trelation\n')
+        FH.write('e1\tHGNC:11603\tbiolink:related_to\tMONDO:0005002\tRO:0003304\n')
+        FH.write('e2\tHGNC:11603\tbiolink:related_to\tMONDO:0005148\tRO:0003304\n')
+    t = get_transformer('tsv')()
+    for f in inputs:
+        t.parse(f, input_format='tsv')
+    expected = ColumnarSummary(t.graph).graph_stats('Graph')
+    assert expected['node_stats']['total_nodes'] == 3
+
+    stats = summarize_files(inputs, 'tsv').graph_stats('Graph')
+    assert stats == expected
+    assert stats['node_stats']['count_by_category']['unknown']['count'] == 1
+
+
+def test_merge():
+    s1 = StreamingSummary(edge_facet_properties=['provided_by'])
+    s1.add_node('A', {'id': 'A', 'category': ['biolink:Gene']})
+    s1.add_node('B', {'id': 'B'})
+    s2 = StreamingSummary(edge_facet_properties=['provided_by'])
+    s2.add_node('B', {'id': 'B', 'category': ['biolink:Disease', 'biolink:NamedThing']})
+    s1.merge(s2)
+
+    s3 = StreamingSummary(edge_facet_properties=['provided_by'], node_categories=s1.node_categories)
+    s3.add_edge('A', 'B', {'predicate': 'biolink:related_to', 'provided_by': ['S1']})
+    s3.add_edge('A', 'C', {'provided_by': ['S2']})
+    s1.merge(s3)
+
+    stats = s1.graph_stats('Graph')
+    # C is only referenced by an edge
+    assert stats['node_stats']['total_nodes'] == 3
+    assert stats['node_stats']['node_categories'] == ['biolink:Disease', 'biolink:Gene', 'biolink:NamedThing']
+    assert stats['node_stats']['count_by_category']['unknown']['count'] == 1
+    assert stats['edge_stats']['total_edges'] == 2
+    assert stats['edge_stats']['predicates'] == ['biolink:related_to']
+    assert stats['edge_stats']['count_by_predicates']['unknown'] == {'count': 1}
+    assert stats['edge_stats']['count_by_spo']['biolink:Gene-biolink:related_to-biolink:Disease'] == {
+        'count': 1,
+        'provided_by': {'S1': {'count': 1}}
+    }
+    assert stats['edge_stats']['count_by_spo']['biolink:Gene-unknown-unknown'] == {
+        'count': 1,
+        'provided_by': {'S2': {'count': 1}}
+    }
+    assert stats['edge_stats']['provided_by'] == ['S1', 'S2']
+
+
+def test_approximate_summary():
+    t = get_transformer('tsv')()
+    for f in ['test_nodes.tsv', 'test_edges.tsv']:
+        t.parse(os.path.join(resource_dir, f), input_format='tsv')
+    expected = ColumnarSummary(t.graph, ['provided_by'], ['provided_by']).graph_stats('Graph')
+    stats = summarize_graph(t.graph, 'Graph', ['provided_by'], ['provided_by'], approximate=True, top_k=100)
+
+    # few distinct values are tracked exactly
+    assert stats['node_stats']['total_nodes'] == expected['node_stats']['total_nodes']
+    for category, counts in expected['node_stats']['count_by_category'].items():
+        approximate_counts = stats['node_stats']['count_by_category'][category]
+        assert approximate_counts['count'] == counts['count']
+        if 'provided_by' in counts:
+            assert approximate_counts['provided_by']['top_values'] == counts['provided_by']
+            assert approximate_counts['provided_by']['distinct_values'] == len(counts['provided_by'])
+    for predicate, counts in expected['edge_stats']['count_by_predicates'].items():
+        if 'provided_by' in counts:
+            assert stats['edge_stats']['count_by_predicates'][predicate]['provided_by']['top_values'] == counts['provided_by']
+    assert sorted(stats['edge_stats']['provided_by']['top_values']) == expected['edge_stats']['provided_by']
+
+
+def test_approximate_summary_merge():
+    s1 = StreamingSummary(['publications'], ['publications'], approximate=True, top_k=1)
+    s2 = StreamingSummary(['publications'], ['publications'], approximate=True, top_k=1)
+    for i in range(1000):
+        s1.add_node(f"A:{i}", {'category': ['biolink:Gene'], 'publications': [f"PMID:{i}", 'PMID:0']})
+        s2.add_node(f"B:{i}", {'category': ['biolink:Gene'], 'publications': [f"PMID:{i + 1000}"]})
+    s1.merge(s2)
+    stats = s1.node_stats()
+    assert stats['total_nodes'] == 2000
+    gene_stats = stats['count_by_category']['biolink:Gene']['publications']
+    assert abs(gene_stats['distinct_values'] - 2000) <= 100
+    assert list(gene_stats['top_values']) == ['PMID:0']
+    assert gene_stats['top_values']['PMID:0']['count'] >= 1001
+    # the totals are estimated with a larger sketch than each category
+    assert stats['publications']['top_values'] == gene_stats['top_values']
+    assert abs(stats['publications']['distinct_values'] - 2000) <= 50
@@ -120,3 +120,21 @@ def test_summarize_graph(query):
         assert v == stats['node_stats'][k]
     for k, v in query[1]['edge_stats'].items():
         assert v == stats['edge_stats'][k]
+
+
+def test_summarize_graph_with_facets():
+    g = get_graphs()[0]
+    stats = summarize_graph(g, node_facet_properties=['provided_by'], edge_facet_properties=['provided_by'])
+    node_stats = stats['node_stats']
+    assert node_stats['provided_by'] == ['unknown']
+    assert node_stats['count_by_category']['biolink:NamedThing']['provided_by'] == {'unknown': {'count': 3}}
+
+    edge_stats = stats['edge_stats']
+    assert edge_stats['provided_by'] == ['Graph 1', 'unknown']
+    assert edge_stats['count_by_predicates']['biolink:sub_class_of']['provided_by'] == {
+        'Graph 1': {'count': 1},
+        'unknown': {'count': 1}
+    }
+    spo = edge_stats['count_by_spo']['biolink:NamedThing-biolink:sub_class_of-biolink:NamedThing']
+    assert spo['count'] == 2
+    assert spo['provided_by'] == {'Graph 1': {'count': 1}, 'unknown': {'count': 1}}
@@ -1,6 +1,14 @@
+import io
+import os
+
 import pytest
 
-from kgx import Validator
+import kgx.validator
+from kgx import Validator, PandasTransformer
+from kgx.validator import ErrorAggregator, ValidationError, ErrorType, MessageLevel
+
+cwd = os.path.abspath(os.path.dirname(__file__))
+resource_dir = os.path.join(cwd, '../resources')
 
 
 @pytest.mark.parametrize('prefix', [
@@ -125,4 +133,90 @@ def test_validate_categories(query):
 ])
 def test_validate_edge_label(query):
     e = Validator.validate_edge_predicate(query[0], query[1], query[2])
-    assert (len(e) == 0) == query[3]
\ No newline at end of file
+    assert (len(e) == 0) == query[3]
+
+
+def test_get_category_messages():
+    assert Validator.get_category_messages('biolink:Gene') == ()
+    messages = Validator.get_category_messages('GENE')
+    assert len(messages) > 0
+    assert Validator.get_category_messages('GENE') is messages
+
+
+def test_validate_in_parallel(monkeypatch):
+    t = PandasTransformer()
+    t.parse(os.path.join(resource_dir, 'graph_nodes.tsv'), input_format='tsv')
+    t.parse(os.path.join(resource_dir, 'graph_edges.tsv'), input_format='tsv')
+    validator = Validator()
+    expected = [x.as_dict() for x in validator.validate(t.graph)]
+    # validate nodes and edges in several chunks, across worker processes
+    monkeypatch.setattr(kgx.validator, 'CHUNK_SIZE', 50)
+    assert t.graph.number_of_nodes() > 4 * kgx.validator.CHUNK_SIZE
+    assert t.graph.number_of_edges() > 4 * kgx.validator.CHUNK_SIZE
+    errors = [x.as_dict() for x in validator.validate(t.graph, processes=2)]
+    assert errors == expected
+
+
+def _square(x):
+    return x * x
+
+
+def test_imap_in_flight():
+    read = []
+
+    def tasks():
+        for i in range(20):
+            read.append(i)
+            yield i
+
+    results = kgx.validator._imap(_square, tasks(), 2)
+    assert next(results) == 0
+    # at most 2 * processes tasks are read ahead of the results
+    assert len(read) == 4
+    assert list(results) == [x * x for x in range(1, 20)]
+
+
+def test_error_aggregator():
+    records = io.StringIO()
+    aggregator = ErrorAggregator(max_messages=2, sample_size=2, records=records)
+    template = "Node property 'id' has a CURIE prefix '{value}' that is not represented in Biolink Model JSON-LD context"
+    for i in range(3):
+        message = f"Node property 'id' has a value 'X:{i}' with a CURIE prefix 'X' is not represented in Biolink Model JSON-LD context"
+        aggregator.add(ValidationError(f"X:{i}", ErrorType.INVALID_NODE_PROPERTY_VALUE, message, MessageLevel.ERROR, template, 'X'))
+    aggregator.add(ValidationError('A:1', ErrorType.NO_CATEGORY, "Node does not have a 'category' property", MessageLevel.ERROR))
+    aggregator.add(ValidationError('A:1', ErrorType.INVALID_CATEGORY, "Category 'Y' not in Biolink Model", MessageLevel.ERROR))
+    assert aggregator.total == 5
+    assert len(records.getvalue().splitlines()) == 5
+    assert aggregator.summary()[0] == {
+        'error_type': 'INVALID_NODE_PROPERTY_VALUE',
+        'message_level': 'ERROR',
+        'message': "Node property 'id' has a CURIE prefix 'X' that is not represented in Biolink Model JSON-LD context",
+        'value': 'X',
+        'count': 3,
+        'sample': ['X:0', 'X:1']
+    }
+    assert Validator.report(aggregator) == [
+        "[ERROR][INVALID_NODE_PROPERTY_VALUE] Node property 'id' has a CURIE prefix 'X' that is not represented in Biolink Model JSON-LD context (3) - X:0, X:1",
+        "[ERROR][NO_CATEGORY] Node does not have a 'category' property (1) - A:1",
+        "[ERROR][INVALID_CATEGORY] other errors (1)",
+    ]
+
+
+def test_error_aggregator_merge():
+    template = "Required edge property '{value}' missing"
+    records = io.StringIO()
+    aggregator = ErrorAggregator(max_messages=2, sample_size=2, records=records)
+    partial = ErrorAggregator(max_messages=2, sample_size=2)
+    aggregator.add_error(('A:1', 'B:1'), ErrorType.MISSING_EDGE_PROPERTY, MessageLevel.ERROR, template, 'predicate')
+    for i in range(2):
+        partial.add_error((f"A:{i}", 'B:2'), ErrorType.MISSING_EDGE_PROPERTY, MessageLevel.ERROR, template, 'predicate')
+    partial.add_error('C:1', ErrorType.NO_CATEGORY, MessageLevel.ERROR, "Node does not have a 'category' property")
+    partial.add_error('C:2', ErrorType.INVALID_CATEGORY, MessageLevel.ERROR, "Category 'Y' not in Biolink Model")
+    aggregator.merge(partial)
+    assert aggregator.total == 5
+    assert records.getvalue() == '{"entity": "A:1-B:1", "error_type": "MISSING_EDGE_PROPERTY", "message": "Required edge property \'predicate\' missing", "message_level": "ERROR"}\n'
+    assert Validator.report(aggregator) == [
+        "[ERROR][MISSING_EDGE_PROPERTY] Required edge property 'predicate' missing (3) - A:1-B:1, A:0-B:2",
+        "[ERROR][NO_CATEGORY] Node does not have a 'category' property (1) - C:1",
+        "[ERROR][INVALID_CATEGORY] other errors (1)",
+    ]